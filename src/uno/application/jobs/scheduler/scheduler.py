@@ -4,10 +4,12 @@ This module provides the Scheduler class which manages scheduled jobs
 and ensures they're executed at the appropriate times.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Any, Dict, List, Optional, Set, Union, Tuple, cast
 import asyncio
+import heapq
 import logging
+import time
 import uuid
 
 from uno.jobs.queue.job import Job
@@ -38,6 +40,7 @@ class Scheduler:
         queue_name: str = "scheduled",
         timezone: str = "UTC",
         check_interval: int = 60,
+        resync_interval: Optional[int] = None,
         missed_threshold: int = 300,
         lock_timeout: int = 300,
         metrics_enabled: bool = True,
@@ -46,11 +49,26 @@ class Scheduler:
     ):
         """Initialize a scheduler.
         
+        The scheduler keeps the next run time of every active schedule in an
+        in-memory heap and sleeps until the earliest one is due, instead of
+        polling storage. Changes made through this scheduler update the heap
+        directly; changes made elsewhere are applied by calling
+        ``notify_schedule_changed`` (for example from a Postgres
+        LISTEN/NOTIFY or Redis keyspace notification listener), and the
+        heap is also reloaded from storage every ``resync_interval`` seconds.
+        No such listener ships with the scheduler yet, so by default the
+        heap is reloaded every ``check_interval`` seconds, which picks up
+        schedules changed by other processes as promptly as polling did.
+        
         Args:
             storage: Storage backend for persisting schedules and jobs
             queue_name: Name of the queue for scheduled jobs
             timezone: Default timezone for schedules
-            check_interval: Seconds between scheduler ticks
+            check_interval: Seconds to wait before retrying a schedule that
+                storage does not report as due yet
+            resync_interval: Seconds between full reloads of the schedule
+                heap from storage; None uses check_interval, and 0 disables
+                reloading to rely on notifications only
             missed_threshold: Seconds after which a job is considered missed
             lock_timeout: Seconds until a scheduler lock expires
             metrics_enabled: Whether to collect metrics
@@ -61,6 +79,9 @@ class Scheduler:
         self.queue_name = queue_name
         self.timezone = timezone
         self.check_interval = check_interval
+        self.resync_interval: Optional[int] = (
+            check_interval if resync_interval is None else resync_interval or None
+        )
         self.missed_threshold = missed_threshold
         self.lock_timeout = lock_timeout
         self.metrics_enabled = metrics_enabled
@@ -73,6 +94,13 @@ class Scheduler:
         self.shutdown_event = asyncio.Event()
         self.lock = AsyncLock()
         
+        # Next run times of active schedules; heap entries whose time no
+        # longer matches _schedule_times are stale and skipped
+        self._schedule_times: Dict[str, float] = {}
+        self._schedule_heap: List[Tuple[float, str]] = []
+        self._last_sync: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        
         # Tasks
         self.main_task: Optional[asyncio.Task] = None
         self.metrics_task: Optional[asyncio.Task] = None
@@ -174,6 +202,7 @@ class Scheduler:
         
         self.logger.info(f"Resuming scheduler {self.instance_id}")
         self.paused = False
+        self._wakeup.set()
         return True
     
     async def schedule(
@@ -260,6 +289,7 @@ class Scheduler:
         )
         
         self.logger.info(f"Scheduled task '{task}' with ID '{schedule_id}'")
+        await self.notify_schedule_changed(schedule_id)
         return schedule_id
     
     async def get_schedule(self, schedule_id: str) -> Optional[Dict[str, Any]]:
@@ -379,6 +409,7 @@ class Scheduler:
         
         if success:
             self.logger.info(f"Updated schedule '{schedule_id}'")
+            await self.notify_schedule_changed(schedule_id)
         else:
             self.logger.warning(f"Failed to update schedule '{schedule_id}'")
         
@@ -419,6 +450,7 @@ class Scheduler:
         
         if success:
             self.logger.info(f"Deleted schedule '{schedule_id}'")
+            self._track_schedule(schedule_id, None)
         else:
             self.logger.warning(f"Failed to delete schedule '{schedule_id}'")
         
@@ -731,32 +763,159 @@ class Scheduler:
         
         return stats
     
+    async def notify_schedule_changed(self, schedule_id: str) -> None:
+        """Apply a change to a schedule made in storage.
+        
+        Storage change listeners call this when a schedule is created,
+        updated or deleted, so the scheduler wakes up for the schedule's new
+        next run time without polling.
+        
+        Args:
+            schedule_id: The ID of the schedule that changed
+        """
+        if not self.running:
+            # The schedules are loaded from storage when the scheduler starts
+            return
+        
+        schedule = await self.storage.get_schedule(schedule_id)
+        self._track_schedule(schedule_id, schedule)
+    
+    def _track_schedule(self, schedule_id: str, schedule: Optional[Dict[str, Any]]) -> None:
+        """Record the next run time of a schedule.
+        
+        Args:
+            schedule_id: The ID of the schedule
+            schedule: The schedule data, or None if it was deleted
+        """
+        next_run = None
+        if schedule is not None and schedule.get("status", "active") == "active":
+            next_run = _to_timestamp(schedule.get("next_run"))
+        
+        if next_run is None:
+            self._schedule_times.pop(schedule_id, None)
+        else:
+            self._set_next_run(schedule_id, next_run)
+    
+    def _set_next_run(self, schedule_id: str, next_run: float) -> None:
+        """Set the time a schedule is next due and wake the scheduler if it is earlier.
+        
+        Args:
+            schedule_id: The ID of the schedule
+            next_run: The next run time as a POSIX timestamp
+        """
+        if self._schedule_times.get(schedule_id) == next_run:
+            return
+        
+        earliest = self._next_run_time()
+        self._schedule_times[schedule_id] = next_run
+        heapq.heappush(self._schedule_heap, (next_run, schedule_id))
+        
+        if earliest is None or next_run < earliest:
+            self._wakeup.set()
+    
+    def _next_run_time(self) -> Optional[float]:
+        """Get the earliest next run time of the tracked schedules.
+        
+        Returns:
+            The earliest next run time, or None if no schedule is tracked
+        """
+        heap = self._schedule_heap
+        while heap and self._schedule_times.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+    
+    def _pop_due_schedules(self, now: float) -> List[str]:
+        """Remove and return the schedules due at the given time.
+        
+        Args:
+            now: The current POSIX timestamp
+            
+        Returns:
+            IDs of the due schedules
+        """
+        due = []
+        while True:
+            next_run = self._next_run_time()
+            if next_run is None or next_run > now:
+                return due
+            
+            _, schedule_id = heapq.heappop(self._schedule_heap)
+            del self._schedule_times[schedule_id]
+            due.append(schedule_id)
+    
+    async def _load_schedules(self) -> None:
+        """Reload the next run times of all active schedules from storage."""
+        schedules = await self.storage.list_schedules(status="active")
+        
+        self._schedule_times.clear()
+        self._schedule_heap.clear()
+        for schedule in schedules:
+            schedule_id = schedule.get("id")
+            if schedule_id is not None:
+                self._track_schedule(schedule_id, schedule)
+        
+        self._last_sync = time.monotonic()
+        self.logger.debug(f"Loaded {len(self._schedule_times)} active schedules")
+    
+    def _seconds_until_wakeup(self) -> Optional[float]:
+        """Get how long the scheduler can sleep.
+        
+        Returns:
+            Seconds until the next schedule is due or the next resync,
+            whichever is sooner, or None to sleep until notified
+        """
+        timeouts = []
+        
+        next_run = self._next_run_time()
+        if next_run is not None and not self.paused:
+            timeouts.append(next_run - time.time())
+        
+        if self.resync_interval is not None and self._last_sync is not None:
+            timeouts.append(self._last_sync + self.resync_interval - time.monotonic())
+        
+        return max(0.0, min(timeouts)) if timeouts else None
+    
     async def _scheduler_loop(self) -> None:
         """Main scheduler loop.
         
-        This method periodically checks for due jobs and enqueues them.
+        This method sleeps until the earliest tracked schedule is due,
+        enqueues the due jobs and reschedules them.
         """
         while self.running and not self.shutdown_event.is_set():
             try:
-                if not self.paused:
+                resync_due = self.resync_interval is not None and (
+                    self._last_sync is None
+                    or time.monotonic() - self._last_sync >= self.resync_interval
+                )
+                if self._last_sync is None or resync_due:
+                    await self._load_schedules()
+                
+                now = time.time()
+                next_run = self._next_run_time()
+                if not self.paused and next_run is not None and next_run <= now:
                     # Try to acquire the scheduler lock
                     async with self.storage.create_lock(
                         f"scheduler:lock",
                         timeout=self.lock_timeout,
                         owner=self.instance_id,
                     ):
-                        # Process due jobs
-                        await self._process_due_jobs()
+                        await self._run_due_schedules(now)
+                    continue
                 
-                # Wait for the next check interval or until shutdown
+                # Sleep until the next schedule is due, a schedule changes
+                # or shutdown
+                self._wakeup.clear()
+                wakeup = asyncio.create_task(self._wakeup.wait())
+                shutdown = asyncio.create_task(self.shutdown_event.wait())
                 try:
-                    await asyncio.wait_for(
-                        self.shutdown_event.wait(),
-                        timeout=self.check_interval
+                    await asyncio.wait(
+                        {wakeup, shutdown},
+                        timeout=self._seconds_until_wakeup(),
+                        return_when=asyncio.FIRST_COMPLETED,
                     )
-                except asyncio.TimeoutError:
-                    # Check interval elapsed, continue the loop
-                    pass
+                finally:
+                    wakeup.cancel()
+                    shutdown.cancel()
             
             except Exception as e:
                 self.logger.error(f"Error in scheduler loop: {e}")
@@ -770,22 +929,50 @@ class Scheduler:
                 # Wait a bit before retrying
                 await asyncio.sleep(5)
     
-    async def _process_due_jobs(self, limit: int = 100) -> None:
+    async def _run_due_schedules(self, now: float, limit: int = 100) -> None:
+        """Enqueue the jobs of due schedules and track their next run times.
+        
+        Args:
+            now: The current POSIX timestamp
+            limit: Maximum number of due jobs to process at once
+        """
+        due_ids = self._pop_due_schedules(now)
+        processed = await self._process_due_jobs(limit=limit)
+        
+        for schedule_id in due_ids:
+            if schedule_id in processed:
+                continue
+            
+            schedule = await self.storage.get_schedule(schedule_id)
+            self._track_schedule(schedule_id, schedule)
+            
+            # Storage did not report this schedule as due although it had
+            # room to, so retry it later rather than spinning on it
+            next_run = self._schedule_times.get(schedule_id)
+            if next_run is not None and next_run <= now and len(processed) < limit:
+                self._set_next_run(schedule_id, now + self.check_interval)
+    
+    async def _process_due_jobs(self, limit: int = 100) -> Set[str]:
         """Process jobs that are due for execution.
         
         Args:
             limit: Maximum number of due jobs to process
+            
+        Returns:
+            IDs of the schedules whose jobs were processed
         """
         # Get due jobs from storage
         due_jobs = await self.storage.get_due_jobs(limit=limit)
         
         if not due_jobs:
-            return
+            return set()
         
         self.logger.debug(f"Found {len(due_jobs)} due jobs")
         
         # Process each due job
+        processed: Set[str] = set()
         for schedule_id, job_data in due_jobs:
+            processed.add(schedule_id)
             try:
                 # Create and enqueue the job
                 job = Job(**job_data)
@@ -809,6 +996,9 @@ class Scheduler:
                     self._stats["triggered_by_type"].get(schedule_type, 0) + 1
                 )
                 
+                # Storage has advanced the schedule's next run time
+                self._track_schedule(schedule_id, schedule)
+                
                 self.logger.debug(f"Triggered job {job_id} for schedule {schedule_id}")
             
             except Exception as e:
@@ -819,6 +1009,8 @@ class Scheduler:
                 self._stats["errors"][error_type] = (
                     self._stats["errors"].get(error_type, 0) + 1
                 )
+        
+        return processed
     
     async def _metrics_loop(self) -> None:
         """Metrics collection loop.
@@ -846,4 +1038,22 @@ class Scheduler:
             
             except Exception as e:
                 self.logger.error(f"Error in metrics loop: {e}")
-                await asyncio.sleep(60)  # Wait a bit before retrying
\ No newline at end of file
+                await asyncio.sleep(60)  # Wait a bit before retrying
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    """Convert a stored run time to a POSIX timestamp.
+    
+    Args:
+        value: A datetime, an ISO 8601 string or None; naive values are UTC
+        
+    Returns:
+        The timestamp, or None if there is no run time
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return value.timestamp()
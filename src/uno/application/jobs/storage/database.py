@@ -3,7 +3,7 @@ import asyncio
 from datetime import datetime, timedelta
 import uuid
 
-from sqlalchemy import Table, Column, String, DateTime, Integer, JSON, Boolean, ForeignKey
+from sqlalchemy import Table, Column, String, DateTime, Integer, JSON, Boolean, ForeignKey, Index
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.sql.expression import and_, or_
@@ -62,6 +62,16 @@ class DatabaseJobStorage(JobStorageProtocol):
             Column('is_scheduled', Boolean, nullable=False, default=False),
             Column('metadata', JSON, nullable=True),
             Column('tags', JSON, nullable=True),
+            # Covers the dequeue claim so workers scan the queue in
+            # priority order without visiting the table
+            Index(
+                'ix_jobs_dequeue',
+                'queue_name',
+                'status',
+                'priority',
+                'created_at',
+                postgresql_include=['scheduled_at'],
+            ),
         )
 
         # Define the schedules table
@@ -255,56 +265,96 @@ class DatabaseJobStorage(JobStorageProtocol):
         Returns:
             Result with the dequeued job, or None if no job is available.
         """
+        batch_result = await self.dequeue_batch(queue_name, 1, statuses)
+        if not batch_result.is_success:
+            return batch_result
+        
+        jobs = batch_result.value
+        return Result.success(jobs[0] if jobs else None)
+    
+    async def dequeue_batch(
+        self,
+        queue_name: str,
+        count: int,
+        statuses: Optional[List[JobStatus]] = None,
+    ) -> Result[List[Job]]:
+        """Dequeue up to ``count`` jobs from the specified queue in one round-trip.
+        
+        Jobs are selected and marked as running by a single
+        ``UPDATE ... RETURNING`` statement whose candidate rows are locked
+        with ``FOR UPDATE SKIP LOCKED``. Concurrent workers, in this process
+        or any other, therefore never claim the same job and never wait on
+        rows another worker is claiming. The claim is committed only once
+        every returned row has been converted to a job, and rolled back on
+        any failure.
+        
+        Args:
+            queue_name: The name of the queue to dequeue from.
+            count: The maximum number of jobs to dequeue.
+            statuses: Optional list of statuses to filter by. Defaults to [JobStatus.PENDING].
+            
+        Returns:
+            Result with the dequeued jobs in priority order, empty if no job is available.
+        """
         if statuses is None:
             statuses = [JobStatus.PENDING]
         
+        if count < 1:
+            return Result.success([])
+        
         try:
-            async with self._lock:
-                session = await self._get_session()
-                
-                # Construct the query to find the highest priority job matching criteria
-                status_values = [s.value for s in statuses]
-                
-                query = (
-                    select([self.jobs_table])
-                    .where(
-                        and_(
-                            self.jobs_table.c.queue_name == queue_name,
-                            self.jobs_table.c.status.in_(status_values),
-                            or_(
-                                self.jobs_table.c.scheduled_at.is_(None),
-                                self.jobs_table.c.scheduled_at <= datetime.utcnow(),
-                            ),
-                        )
-                    )
-                    .order_by(
-                        self.jobs_table.c.priority.asc(),  # Lower priority value = higher priority
-                        self.jobs_table.c.created_at.asc(),  # Older jobs first (FIFO)
+            now = datetime.utcnow()
+            status_values = [s.value for s in statuses]
+            
+            # Highest priority jobs matching criteria, skipping rows that
+            # another worker has already locked
+            claimable = (
+                select(self.jobs_table.c.id)
+                .where(
+                    and_(
+                        self.jobs_table.c.queue_name == queue_name,
+                        self.jobs_table.c.status.in_(status_values),
+                        or_(
+                            self.jobs_table.c.scheduled_at.is_(None),
+                            self.jobs_table.c.scheduled_at <= now,
+                        ),
                     )
-                    .limit(1)
                 )
-                
-                result = await session.execute(query)
-                job_data = result.fetchone()
-                
-                if not job_data:
-                    return Result.success(None)
-                    
-                job_dict = dict(job_data)
-                job = self._job_from_row(job_dict)
-                
-                # Update the job status to RUNNING
-                job.status = JobStatus.RUNNING
-                job.started_at = datetime.utcnow()
-                job.updated_at = datetime.utcnow()
-                
-                update_result = await self.update_job(job)
-                if not update_result.is_success:
-                    return update_result
-                    
-                return Result.success(job)
+                .order_by(
+                    self.jobs_table.c.priority.asc(),  # Lower priority value = higher priority
+                    self.jobs_table.c.created_at.asc(),  # Older jobs first (FIFO)
+                )
+                .limit(count)
+                .with_for_update(skip_locked=True)
+            )
+            
+            claim_query = (
+                self.jobs_table.update()
+                .where(self.jobs_table.c.id.in_(claimable))
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    started_at=now,
+                    updated_at=now,
+                )
+                .returning(*self.jobs_table.c)
+            )
+            
+            session = await self._get_session()
+            try:
+                result = await session.execute(claim_query)
+                jobs = [self._job_from_row(dict(row)) for row in result.mappings()]
+                await session.commit()
+            except Exception:
+                # Release the row locks without marking any job as running
+                await session.rollback()
+                raise
+            
+            # RETURNING does not preserve the order of the claim
+            jobs.sort(key=lambda job: (job.priority.value, job.created_at))
+            
+            return Result.success(jobs)
         except Exception as e:
-            return Result.failure(f"Failed to dequeue job from database: {str(e)}")
+            return Result.failure(f"Failed to dequeue jobs from database: {str(e)}")
     
     async def get_queue_length(self, queue_name: str, statuses: Optional[List[JobStatus]] = None) -> Result[int]:
         """Get the length of a queue with jobs in the specified statuses.
@@ -4,7 +4,7 @@ import json
 import uuid
 from datetime import datetime, timedelta
 
-import aioredis
+from redis import asyncio as aioredis
 
 from uno.core.errors.result import Result
 from uno.jobs.queue.job import Job
@@ -14,6 +14,61 @@ from uno.jobs.scheduler.schedules import Schedule, ScheduleDefinition
 from uno.jobs.storage.base import JobStorageProtocol
 
 
+# Atomically claims candidate jobs read from the priority queues of a queue,
+# marking each one running and returning its hash. Every key the script
+# touches is declared in KEYS, so it runs on Redis Cluster and under script
+# key tracking; a candidate taken by another worker, or rescheduled, since it
+# was read is skipped.
+#
+# KEYS: the priority queue sorted sets, highest priority first, followed by
+#       the pending status index, the running status index, the queue's
+#       ready-signal set and the job hash of each candidate
+# ARGV: the maximum score (now), the number of priority queues, the running
+#       status value, the claim timestamp and the claiming worker ID (may be
+#       empty), followed by the priority queue index and job ID of each
+#       candidate
+_DEQUEUE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local queue_count = tonumber(ARGV[2])
+local pending_key = KEYS[queue_count + 1]
+local running_key = KEYS[queue_count + 2]
+local ready_key = KEYS[queue_count + 3]
+local claimed = {}
+
+for i = 1, #KEYS - queue_count - 3 do
+    local queue_key = KEYS[tonumber(ARGV[4 + 2 * i])]
+    local job_id = ARGV[5 + 2 * i]
+    local job_key = KEYS[queue_count + 3 + i]
+    local score = redis.call('ZSCORE', queue_key, job_id)
+    if score and tonumber(score) <= now then
+        redis.call('ZREM', queue_key, job_id)
+        redis.call('ZREM', ready_key, job_id)
+        -- Queue entries whose job no longer exists are discarded
+        if redis.call('EXISTS', job_key) == 1 then
+            redis.call('HSET', job_key, 'status', ARGV[3], 'started_at', ARGV[4], 'updated_at', ARGV[4])
+            if ARGV[5] ~= '' then
+                redis.call('HSET', job_key, 'worker_id', ARGV[5])
+            end
+            redis.call('SREM', pending_key, job_id)
+            redis.call('SADD', running_key, job_id)
+            claimed[#claimed + 1] = redis.call('HGETALL', job_key)
+        end
+    end
+end
+
+-- Once the queue has no more due jobs, pending wake-up signals are stale
+local due = 0
+for i = 1, queue_count do
+    due = due + redis.call('ZCOUNT', KEYS[i], '-inf', ARGV[1])
+end
+if due == 0 then
+    redis.call('DEL', ready_key)
+end
+
+return claimed
+"""
+
+
 class RedisJobStorage(JobStorageProtocol):
     """Redis-backed job storage implementation optimized for high throughput."""
 
@@ -22,11 +77,14 @@ class RedisJobStorage(JobStorageProtocol):
         
         Args:
             redis_url: The Redis connection URL.
-            prefix: Prefix for Redis keys to avoid collisions.
+            prefix: Prefix for Redis keys to avoid collisions. On Redis
+                Cluster, use a hash tag such as ``{uno:jobs}`` so that the
+                keys claimed together live in one slot.
         """
         self._redis_url = redis_url
         self._prefix = prefix
         self._redis: Optional[aioredis.Redis] = None
+        self._dequeue_script = None
         self._lock = asyncio.Lock()
         
     async def initialize(self) -> None:
@@ -37,12 +95,14 @@ class RedisJobStorage(JobStorageProtocol):
                 encoding="utf-8",
                 decode_responses=True
             )
+            self._dequeue_script = self._redis.register_script(_DEQUEUE_SCRIPT)
     
     async def close(self) -> None:
         """Close the Redis connection."""
         if self._redis is not None:
             await self._redis.close()
             self._redis = None
+            self._dequeue_script = None
     
     def _get_job_key(self, job_id: str) -> str:
         """Get the Redis key for a job.
@@ -67,6 +127,22 @@ class RedisJobStorage(JobStorageProtocol):
         """
         return f"{self._prefix}:queue:{queue_name}:{priority.value}"
     
+    def _get_queue_ready_key(self, queue_name: str) -> str:
+        """Get the Redis key for a queue's ready-signal set.
+        
+        A job's ID is added whenever it becomes pending, waking a worker
+        blocked in ``dequeue_blocking``. The set holds each pending job at
+        most once; claimed jobs are removed from it and it is deleted once
+        the queue has no due jobs.
+        
+        Args:
+            queue_name: The queue name.
+            
+        Returns:
+            The Redis key.
+        """
+        return f"{self._prefix}:queue:{queue_name}:ready"
+    
     def _get_schedule_key(self, schedule_id: str) -> str:
         """Get the Redis key for a schedule.
         
@@ -144,6 +220,7 @@ class RedisJobStorage(JobStorageProtocol):
             "is_scheduled": int(job.is_scheduled),
             "metadata": json.dumps(job.metadata or {}),
             "tags": json.dumps(list(job.tags) if job.tags else []),
+            "worker_id": job.worker_id or "",
         }
     
     def _deserialize_job(self, data: dict) -> Job:
@@ -199,6 +276,7 @@ class RedisJobStorage(JobStorageProtocol):
             is_scheduled=is_scheduled,
             metadata=metadata,
             tags=tags,
+            worker_id=data.get("worker_id") or None,
         )
     
     def _serialize_schedule(self, schedule_def: ScheduleDefinition) -> dict:
@@ -314,6 +392,7 @@ class RedisJobStorage(JobStorageProtocol):
                     queue_key = self._get_queue_key(job.queue_name, job.priority)
                     score = job.created_at.timestamp()  # Use created_at timestamp as score for FIFO
                     pipeline.zadd(queue_key, {job.id: score})
+                    pipeline.zadd(self._get_queue_ready_key(job.queue_name), {job.id: score})
                     
                 # Add to the status index
                 status_key = self._get_status_index_key(job.status)
@@ -408,6 +487,7 @@ class RedisJobStorage(JobStorageProtocol):
                         new_queue_key = self._get_queue_key(job.queue_name, job.priority)
                         score = datetime.utcnow().timestamp()
                         pipeline.zadd(new_queue_key, {job.id: score})
+                        pipeline.zadd(self._get_queue_ready_key(job.queue_name), {job.id: score})
                 
                 await pipeline.execute()
                 
@@ -497,68 +577,195 @@ class RedisJobStorage(JobStorageProtocol):
         Returns:
             Result with the dequeued job, or None if no job is available.
         """
+        batch_result = await self.dequeue_batch(queue_name, 1, statuses)
+        if not batch_result.is_success:
+            return batch_result
+        
+        jobs = batch_result.value
+        return Result.success(jobs[0] if jobs else None)
+    
+    async def dequeue_batch(
+        self,
+        queue_name: str,
+        count: int,
+        statuses: Optional[List[JobStatus]] = None,
+    ) -> Result[List[Job]]:
+        """Dequeue up to ``count`` jobs from the specified queue as a batch.
+        
+        The highest priority due jobs across all priority queues are read in
+        one pipelined round-trip and claimed by a server-side script that
+        marks them running atomically, so concurrent workers in any process
+        never claim the same job.
+        
+        Args:
+            queue_name: The name of the queue to dequeue from.
+            count: The maximum number of jobs to dequeue.
+            statuses: Optional list of statuses to filter by. Defaults to [JobStatus.PENDING].
+            
+        Returns:
+            Result with the dequeued jobs in priority order, empty if no job is available.
+        """
         if statuses is None:
             statuses = [JobStatus.PENDING]
             
         if JobStatus.PENDING not in statuses:
-            return Result.success(None)  # Only pending jobs can be dequeued
+            return Result.success([])  # Only pending jobs can be dequeued
             
         try:
-            await self.initialize()
+            jobs = await self._claim_jobs(queue_name, count)
+            return Result.success(jobs)
+        except Exception as e:
+            return Result.failure(f"Failed to dequeue jobs from Redis: {str(e)}")
+    
+    async def dequeue_blocking(
+        self,
+        queue_name: str,
+        count: int = 1,
+        timeout: float = 5.0,
+        poll_interval: float = 1.0,
+    ) -> Result[List[Job]]:
+        """Dequeue up to ``count`` jobs, waiting for jobs to become available.
+        
+        Between attempts the caller blocks on the queue's ready-signal set,
+        so a newly enqueued job wakes it immediately. The wait is capped at
+        ``poll_interval`` so jobs scheduled for later are picked up once due.
+        
+        Args:
+            queue_name: The name of the queue to dequeue from.
+            count: The maximum number of jobs to dequeue.
+            timeout: The maximum time to wait, in seconds.
+            poll_interval: The maximum time to block between attempts, in seconds.
             
-            now = datetime.utcnow().timestamp()
+        Returns:
+            Result with the dequeued jobs, empty if none became available in time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        ready_key = self._get_queue_ready_key(queue_name)
+        
+        try:
+            while True:
+                jobs = await self._claim_jobs(queue_name, count)
+                if jobs:
+                    return Result.success(jobs)
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return Result.success([])
+                
+                await self._redis.bzpopmin(ready_key, timeout=min(remaining, poll_interval))
+        except Exception as e:
+            return Result.failure(f"Failed to dequeue jobs from Redis: {str(e)}")
+    
+    async def dequeue(
+        self,
+        queue_name: str,
+        worker_id: str,
+        priority_levels: Optional[List[Priority]] = None,
+        batch_size: int = 1
+    ) -> List[Job]:
+        """Get the next job(s) from a queue.
+        
+        This is the entry point used by ``JobQueue.dequeue``, letting a
+        worker claim a whole batch at once. The worker's ID is recorded on
+        each claimed job.
+        
+        Args:
+            queue_name: The name of the queue
+            worker_id: The ID of the worker
+            priority_levels: Optional list of priority levels to consider
+            batch_size: Maximum number of jobs to dequeue
             
-            # Try each priority queue in order (highest to lowest)
-            for priority in sorted(Priority, key=lambda p: p.value):
-                queue_key = self._get_queue_key(queue_name, priority)
-                
-                # Get the first job ID with score <= now (not scheduled for the future)
-                # This is an atomic operation in Redis
-                async with self._lock:
-                    job_ids_with_scores = await self._redis.zrangebyscore(
-                        queue_key, 
-                        min="-inf", 
-                        max=now, 
-                        start=0, 
-                        num=1, 
-                        withscores=True
-                    )
-                    
-                    if not job_ids_with_scores:
-                        continue  # No jobs in this priority queue
-                        
-                    job_id, score = job_ids_with_scores[0]
-                    
-                    # Get the job data
-                    job_result = await self.get_job(job_id)
-                    if not job_result.is_success:
-                        continue  # Skip this job if we can't get its data
-                        
-                    job = job_result.value
-                    if job is None:
-                        # Job ID exists in queue but not in storage, remove it
-                        await self._redis.zrem(queue_key, job_id)
-                        continue
-                        
-                    # Update the job status to RUNNING
-                    job.status = JobStatus.RUNNING
-                    job.started_at = datetime.utcnow()
-                    job.updated_at = datetime.utcnow()
-                    
-                    # Remove the job from the pending queue
-                    await self._redis.zrem(queue_key, job_id)
-                    
-                    # Update the job data
-                    update_result = await self.update_job(job)
-                    if not update_result.is_success:
-                        return update_result
-                    
-                    return Result.success(job)
+        Returns:
+            List of jobs (may be empty if queue is empty)
             
-            # No jobs found in any priority queue
-            return Result.success(None)
-        except Exception as e:
-            return Result.failure(f"Failed to dequeue job from Redis: {str(e)}")
+        Raises:
+            Exception: If job dequeuing fails
+        """
+        return await self._claim_jobs(queue_name, batch_size, priority_levels, worker_id)
+    
+    async def _claim_jobs(
+        self,
+        queue_name: str,
+        count: int,
+        priorities: Optional[List[Priority]] = None,
+        worker_id: Optional[str] = None,
+        max_attempts: int = 3,
+    ) -> List[Job]:
+        """Claim up to ``count`` due jobs with the dequeue script.
+        
+        The highest priority due jobs are read as candidates in one pipelined
+        round-trip and claimed by the script, which declares their keys.
+        Candidates lost to a concurrent worker are replaced by reading again,
+        up to ``max_attempts`` times.
+        
+        Args:
+            queue_name: The name of the queue to dequeue from.
+            count: The maximum number of jobs to claim.
+            priorities: Optional priority levels to consider. Defaults to all.
+            worker_id: Optional ID of the claiming worker, recorded on each job.
+            max_attempts: The maximum number of claim attempts.
+            
+        Returns:
+            The claimed jobs, highest priority first.
+        """
+        if count < 1:
+            return []
+        
+        await self.initialize()
+        
+        if priorities is None:
+            priorities = list(Priority)
+        
+        queue_keys = [
+            self._get_queue_key(queue_name, priority)
+            for priority in sorted(priorities, key=lambda p: p.value)
+        ]
+        status_keys = [
+            self._get_status_index_key(JobStatus.PENDING),
+            self._get_status_index_key(JobStatus.RUNNING),
+            self._get_queue_ready_key(queue_name),
+        ]
+        
+        jobs: List[Job] = []
+        for _ in range(max_attempts):
+            now = datetime.utcnow()
+            wanted = count - len(jobs)
+            
+            pipeline = self._redis.pipeline(transaction=False)
+            for queue_key in queue_keys:
+                pipeline.zrangebyscore(queue_key, "-inf", now.timestamp(), start=0, num=wanted)
+            candidates = [
+                (index, job_id)
+                for index, job_ids in enumerate(await pipeline.execute(), start=1)
+                for job_id in job_ids
+            ][:wanted]
+            
+            keys = queue_keys + status_keys
+            keys += [self._get_job_key(job_id) for _, job_id in candidates]
+            args = [
+                now.timestamp(),
+                len(queue_keys),
+                JobStatus.RUNNING.value,
+                now.isoformat(),
+                worker_id or "",
+            ]
+            for index, job_id in candidates:
+                args += [index, job_id]
+            
+            claimed = await self._dequeue_script(keys=keys, args=args)
+            
+            # Each claimed job is returned as a flat list of hash fields and values
+            jobs += [
+                self._deserialize_job(dict(zip(fields[::2], fields[1::2])))
+                for fields in claimed
+            ]
+            
+            # Stop unless candidates were lost to another worker
+            if len(claimed) == len(candidates) or len(jobs) >= count:
+                break
+        
+        return jobs
     
     async def get_queue_length(self, queue_name: str, statuses: Optional[List[JobStatus]] = None) -> Result[int]:
         """Get the length of a queue with jobs in the specified statuses.
@@ -1103,6 +1310,10 @@ class RedisJobStorage(JobStorageProtocol):
                         # Remove temporary key
                         pipeline.delete(temp_key)
                 
+                pipeline.zadd(
+                    self._get_queue_ready_key(queue_name),
+                    {"resumed": datetime.utcnow().timestamp()},
+                )
                 await pipeline.execute()
                 
                 return Result.success(True)
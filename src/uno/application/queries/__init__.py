@@ -147,6 +147,12 @@ from uno.queries.executor import (
     get_query_executor,
     cache_query_result,
 )
+from uno.queries.id_sets import (
+    IdBitmap,
+    IdDictionary,
+    QueryMatchMatrix,
+    get_id_dictionary,
+)
 from uno.queries.optimized_queries import OptimizedQuery, OptimizedModelQuery, QueryHints
 from uno.queries.common_patterns import CommonQueryPatterns, QueryPattern
 
@@ -239,6 +245,10 @@ __all__ = [
     'QueryExecutor',
     'get_query_executor',
     'cache_query_result',
+    'IdBitmap',
+    'IdDictionary',
+    'QueryMatchMatrix',
+    'get_id_dictionary',
     
     # Optimized Queries
     'OptimizedQuery',
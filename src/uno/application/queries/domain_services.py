@@ -13,7 +13,7 @@ from uno.queries.domain_repositories import (
 from uno.queries.errors import QueryExecutionError, QueryPathError, QueryNotFoundError
 from uno.queries.filter_manager import UnoFilterManager, get_filter_manager
 from uno.queries.executor import QueryExecutor, get_query_executor
-from uno.enums import Include, Match
+from uno.enums import Include, Match, SQLOperation
 
 
 class QueryPathService(UnoEntityService[QueryPath]):
@@ -27,6 +27,49 @@ class QueryPathService(UnoEntityService[QueryPath]):
         """
         super().__init__(repository)
         self.repository = repository
+        self.query_executor = get_query_executor()
+
+    async def save(self, entity: QueryPath) -> Optional[QueryPath]:
+        """Save a query path and invalidate what was built from it.
+        
+        Args:
+            entity: The query path to save.
+            
+        Returns:
+            The saved query path, or None if it could not be saved.
+        """
+        saved = await super().save(entity)
+        if saved is not None:
+            await self.query_executor.invalidate_query_path(saved.id)
+        return saved
+
+    async def delete(self, entity: QueryPath) -> bool:
+        """Delete a query path and invalidate what was built from it.
+        
+        Args:
+            entity: The query path to delete.
+            
+        Returns:
+            True if the query path was deleted, False otherwise.
+        """
+        deleted = await super().delete(entity)
+        if deleted:
+            await self.query_executor.invalidate_query_path(entity.id)
+        return deleted
+
+    async def delete_by_id(self, id: str) -> bool:
+        """Delete a query path by ID and invalidate what was built from it.
+        
+        Args:
+            id: The ID of the query path to delete.
+            
+        Returns:
+            True if the query path was deleted, False otherwise.
+        """
+        deleted = await super().delete_by_id(id)
+        if deleted:
+            await self.query_executor.invalidate_query_path(id)
+        return deleted
 
     async def find_by_attribute_id(self, attribute_id: str) -> Result[List[QueryPath]]:
         """Find query paths by attribute ID.
@@ -538,6 +581,50 @@ class QueryService(UnoEntityService[Query]):
                 original_exception=str(type(e).__name__),
             ))
 
+    async def check_records_match_queries(
+        self, query_ids: List[str], record_ids: List[str], force_refresh: bool = False
+    ) -> Result[Dict[str, Dict[str, bool]]]:
+        """Check which of many records match each of many queries.
+        
+        Each query is executed once for all records rather than once per
+        (query, record) pair.
+        
+        Args:
+            query_ids: The IDs of the queries to check against.
+            record_ids: The IDs of the records to check.
+            force_refresh: If True, bypass cache and force fresh checks.
+            
+        Returns:
+            Success with a dictionary of {query_id: {record_id: matched}},
+            or Failure if a query cannot be loaded or executed.
+        """
+        try:
+            queries = []
+            for query_id in query_ids:
+                query_result = await self.get_with_values(query_id)
+                if query_result.is_failure:
+                    return Failure(QueryNotFoundError(f"Query with ID {query_id} not found"))
+                queries.append(query_result.value)
+            
+            match_result = await self.query_executor.check_records_match_queries(
+                queries, record_ids, session=None, force_refresh=force_refresh
+            )
+            
+            if match_result.is_failure:
+                return Failure(match_result.error)
+            
+            matrix = match_result.value
+            if matrix.errors:
+                return Failure(next(iter(matrix.errors.values())))
+            
+            return Success(matrix.to_dict())
+        except Exception as e:
+            return Failure(QueryExecutionError(
+                reason=str(e),
+                operation="check_records",
+                original_exception=str(type(e).__name__),
+            ))
+
     async def invalidate_cache(self, meta_type_id: Optional[str] = None) -> Result[int]:
         """Invalidate the query cache.
         
@@ -564,6 +651,32 @@ class QueryService(UnoEntityService[Query]):
         except Exception as e:
             return Failure(str(e))
 
+    async def apply_record_change(
+        self, meta_type_id: str, record_id: str, operation: SQLOperation = SQLOperation.UPDATE
+    ) -> Result[Dict[str, int]]:
+        """Incrementally maintain cached query results after a record change.
+        
+        Rather than invalidating every cached query for the meta type, the
+        changed record is re-checked against each cached query and the cached
+        results are patched in place.
+        
+        Args:
+            meta_type_id: The meta type of the changed record.
+            record_id: The ID of the changed record.
+            operation: The write operation that changed the record.
+            
+        Returns:
+            Success with counts of patched, unchanged and invalidated entries,
+            or Failure if an error occurs.
+        """
+        try:
+            stats = await self.query_executor.apply_record_change(
+                meta_type_id, record_id, operation
+            )
+            return Success(stats)
+        except Exception as e:
+            return Failure(str(e))
+
     async def create_filter_manager(self, model_class: Type[Any]) -> Result[UnoFilterManager]:
         """Create a filter manager for a model class.
         
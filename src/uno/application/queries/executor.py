@@ -28,6 +28,7 @@ from typing import (
     cast,
     Awaitable,
     Callable,
+    Iterable,
 )
 
 from sqlalchemy import (
@@ -40,10 +41,19 @@ from sqlalchemy import (
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from uno.database.enhanced_session import enhanced_async_session
-from uno.enums import Include, Match
+from uno.enums import Include, Match, SQLOperation
 from uno.queries.models import QueryModel
 from uno.core.errors.result import Result, Success, Failure
 from uno.core.caching import QueryCache, get_cache_manager
+from uno.core.singleflight import SingleFlight
+from uno.queries.id_sets import (
+    IdBitmap,
+    IdCollection,
+    QueryMatchMatrix,
+    get_id_dictionary,
+    to_id_list,
+)
+from uno.queries.templates import QueryTemplateCache
 from uno.queries.errors import (
     QueryExecutionError,
     QueryPathError,
@@ -53,6 +63,22 @@ from uno.queries.errors import (
 )
 
 
+# Selectivity assumed for a query condition without historical statistics
+DEFAULT_CONDITION_SELECTIVITY = 0.1
+
+# Row count assumed for a meta type table without planner statistics
+DEFAULT_TABLE_ROW_ESTIMATE = 1000
+
+# Largest candidate ID set pushed into sibling branches as a bound parameter
+MAX_PUSHDOWN_IDS = 10000
+
+# Maximum number of historical result sizes retained for cost estimation
+MAX_CARDINALITY_HISTORY = 10000
+
+# Seconds a pg_class row estimate is reused before it is read again
+TABLE_ROW_ESTIMATE_TTL = 300
+
+
 class QueryExecutor:
     """
     Executor for QueryModel instances.
@@ -67,6 +93,8 @@ class QueryExecutor:
         logger: Optional[logging.Logger] = None,
         cache_enabled: bool = True,
         cache_ttl: int = 300,
+        use_id_bitmaps: bool = False,
+        template_cache_size: int = 1000,
     ):  # 5 minutes default TTL
         """
         Initialize the query executor.
@@ -75,10 +103,29 @@ class QueryExecutor:
             logger: Optional logger
             cache_enabled: Whether to enable result caching
             cache_ttl: Time-to-live for cached results in seconds
+            use_id_bitmaps: Whether to combine and cache record IDs as compact
+                bitmaps instead of Python sets, for meta types with many records
+            template_cache_size: Maximum number of parameterized SQL templates
+                kept for query path execution
         """
         self.logger = logger or logging.getLogger(__name__)
         self.cache_enabled = cache_enabled
         self.cache_ttl = cache_ttl
+        self.use_id_bitmaps = use_id_bitmaps
+
+        # Cardinality statistics for cost-based sub-query ordering
+        self._cardinality_history: Dict[str, int] = {}  # {query_key: result size}
+        self._table_row_estimates: Dict[str, Tuple[Optional[float], float]] = {}  # {meta_type_id: (rows, read_at)}
+
+        # Parameterized SQL for query paths, reused across executions
+        self._template_cache = QueryTemplateCache(max_size=template_cache_size)
+
+        # Concurrent cache misses for the same query share one execution
+        self._single_flight: SingleFlight[str, Result[IdCollection]] = SingleFlight(self.logger)
+
+        # Queries with cached results, for incremental maintenance on writes
+        self._cached_queries: Dict[str, Query] = {}  # {cache_key: query}
+        self._cached_query_keys_by_meta_type: Dict[str, Set[str]] = {}
 
         # Use the advanced caching system
         self._query_cache_name = "query_results"
@@ -138,6 +185,45 @@ class QueryExecutor:
                 for k in sorted_keys[:200]:  # Remove oldest 20%
                     del cache_dict[k]
 
+    def _new_id_set(
+        self, meta_type_id: Optional[str], record_ids: Iterable[str]
+    ) -> IdCollection:
+        """
+        Build an ID collection in the representation configured for this executor.
+
+        Args:
+            meta_type_id: The meta type the record IDs belong to
+            record_ids: The record IDs
+
+        Returns:
+            An IdBitmap when bitmaps are enabled, otherwise a set
+        """
+        if self.use_id_bitmaps and meta_type_id:
+            return IdBitmap.from_ids(get_id_dictionary(meta_type_id), record_ids)
+        return set(record_ids)
+
+    def _intersect_ids(self, left: IdCollection, right: IdCollection) -> IdCollection:
+        """Intersect two ID collections, preferring the bitmap representation."""
+        if isinstance(right, IdBitmap) and not isinstance(left, IdBitmap):
+            left, right = right, left
+        if isinstance(left, IdBitmap):
+            return left & right
+        return set(left) & set(right)
+
+    def _union_ids(self, left: IdCollection, right: IdCollection) -> IdCollection:
+        """Union two ID collections, preferring the bitmap representation."""
+        if isinstance(right, IdBitmap) and not isinstance(left, IdBitmap):
+            left, right = right, left
+        if isinstance(left, IdBitmap):
+            return left | right
+        return set(left) | set(right)
+
+    def _id_result(self, ids: IdCollection) -> IdCollection:
+        """Return bitmaps as-is and any other collection as a list."""
+        if isinstance(ids, IdBitmap):
+            return ids
+        return list(ids)
+
     async def get_query_cache(self) -> QueryCache:
         """
         Get or create the query results cache.
@@ -237,6 +323,35 @@ class QueryExecutor:
         Returns:
             Result containing a list of matching record IDs or an error
         """
+        result = await self.execute_query_ids(query, session, force_refresh)
+
+        if result.is_failure:
+            return result
+
+        return Success(to_id_list(result.value))
+
+    async def execute_query_ids(
+        self,
+        query: Query,
+        session: Optional[AsyncSession] = None,
+        force_refresh: bool = False,
+    ) -> Result[IdCollection]:
+        """
+        Execute a query and return matching record IDs in compact form.
+
+        When ``use_id_bitmaps`` is enabled the IDs are returned, and cached, as
+        an IdBitmap, which callers can combine with other results without
+        converting to lists. Otherwise this returns the same list as
+        ``execute_query``.
+
+        Args:
+            query: The query to execute
+            session: Optional database session
+            force_refresh: If True, bypass the cache and force a fresh query
+
+        Returns:
+            Result containing the matching record IDs or an error
+        """
         if not self.cache_enabled or force_refresh:
             # Skip cache if disabled or forcing refresh
             return await self._execute_query_fresh(query, session)
@@ -264,8 +379,45 @@ class QueryExecutor:
                 if cached_result is not None:
                     return Success(cached_result)
 
-        # Cache miss or error, execute the query
+        if session is not None:
+            # A caller's session cannot be shared with concurrent callers,
+            # which may be in other transactions
+            return await self._execute_and_cache_query(query, session, cache_key)
+
+        # Cache miss or error, execute the query once for all concurrent
+        # callers, each load opening its own session
+        return await self._single_flight.do(
+            cache_key, lambda: self._execute_and_cache_query(query, None, cache_key)
+        )
+
+    async def _execute_and_cache_query(
+        self,
+        query: Query,
+        session: Optional[AsyncSession],
+        cache_key: str,
+    ) -> Result[IdCollection]:
+        """
+        Execute a query and cache its matching record IDs.
+
+        Args:
+            query: The query to execute
+            session: Optional database session
+            cache_key: The query's cache key
+
+        Returns:
+            Result containing the matching record IDs or an error
+        """
+        start = time.monotonic()
         result = await self._execute_query_fresh(query, session)
+        compute_time = time.monotonic() - start
+
+        async def refresh() -> IdCollection:
+            # The caller's session may be closed by the time the entry is
+            # refreshed, so the refresh opens its own
+            refreshed = await self._execute_query_fresh(query, None)
+            if refreshed.is_failure:
+                raise refreshed.error
+            return refreshed.value
 
         # Cache successful results
         if result.is_success:
@@ -274,11 +426,9 @@ class QueryExecutor:
                 query_cache = await self.get_query_cache()
                 tags = [f"meta_type:{query.query_meta_type_id}"]
 
-                # Add tags for dependent meta types from query paths
-                query_paths = set()
-                for qv in query.query_values or []:
-                    if qv.query_path_id:
-                        query_paths.add(qv.query_path_id)
+                # Add tags for dependent meta types from query paths,
+                # including those of sub-queries
+                query_paths = self._collect_path_ids(query)
 
                 if query_paths:
                     # Get path information for tagging
@@ -288,16 +438,25 @@ class QueryExecutor:
                                 path = await tmp_session.get(QueryPath, path_id)
                                 if path and path.target_meta_type_id:
                                     tags.append(f"meta_type:{path.target_meta_type_id}")
+                                    tags.append(f"path_target:{path.target_meta_type_id}")
                     else:
                         for path_id in query_paths:
                             path = await session.get(QueryPath, path_id)
                             if path and path.target_meta_type_id:
                                 tags.append(f"meta_type:{path.target_meta_type_id}")
+                                tags.append(f"path_target:{path.target_meta_type_id}")
 
-                # Store in cache with tags for efficient invalidation
+                # Store in cache with tags for efficient invalidation, and
+                # refresh stale or nearly expired entries in the background
                 await query_cache.set(
-                    key=cache_key, result=result.value, tags=tags, ttl=self.cache_ttl
+                    key=cache_key,
+                    result=result.value,
+                    tags=tags,
+                    ttl=self.cache_ttl,
+                    refresh_func=refresh,
+                    compute_time=compute_time,
                 )
+                self._register_cached_query(cache_key, query)
 
             except Exception as e:
                 self.logger.warning(f"Error storing in modern cache: {e}")
@@ -310,11 +469,62 @@ class QueryExecutor:
 
         return result
 
+    def _collect_path_ids(
+        self, query: Query, _seen: Optional[Set[str]] = None
+    ) -> Set[str]:
+        """
+        Collect the query path IDs used by a query and its sub-queries.
+
+        Args:
+            query: The query to analyze
+
+        Returns:
+            Set of query path IDs
+        """
+        seen = _seen if _seen is not None else set()
+        if query.id:
+            if query.id in seen:
+                return set()
+            seen.add(query.id)
+
+        path_ids = {qv.query_path_id for qv in query.query_values or [] if qv.query_path_id}
+        for sq in query.sub_queries or []:
+            path_ids |= self._collect_path_ids(sq, seen)
+        return path_ids
+
+    def _register_cached_query(self, cache_key: str, query: Query) -> None:
+        """
+        Remember a query whose result is cached, for incremental maintenance.
+
+        Args:
+            cache_key: The query's cache key
+            query: The query
+        """
+        self._cached_queries[cache_key] = query
+        self._cached_query_keys_by_meta_type.setdefault(
+            query.query_meta_type_id, set()
+        ).add(cache_key)
+
+    def _unregister_cached_query(self, cache_key: str) -> None:
+        """
+        Forget a query whose cached result is gone.
+
+        Args:
+            cache_key: The query's cache key
+        """
+        query = self._cached_queries.pop(cache_key, None)
+        if query is not None:
+            keys = self._cached_query_keys_by_meta_type.get(query.query_meta_type_id)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._cached_query_keys_by_meta_type[query.query_meta_type_id]
+
     async def _execute_query_fresh(
         self,
         query: Query,
         session: Optional[AsyncSession] = None,
-    ) -> Result[List[str]]:
+    ) -> Result[IdCollection]:
         """
         Execute a query without using the cache.
 
@@ -323,14 +533,14 @@ class QueryExecutor:
             session: Optional database session
 
         Returns:
-            Result containing a list of matching record IDs or an error
+            Result containing the matching record IDs or an error
         """
         # Create a session if not provided
         if session is None:
             async with enhanced_async_session() as session:
-                return await self._execute_query(query, session)
+                return await self._execute_query_ids(query, session)
         else:
-            return await self._execute_query(query, session)
+            return await self._execute_query_ids(query, session)
 
     async def _execute_query(
         self,
@@ -347,11 +557,42 @@ class QueryExecutor:
         Returns:
             Result containing a list of matching record IDs or an error
         """
+        result = await self._execute_query_ids(query, session)
+
+        if result.is_failure:
+            return result
+
+        return Success(to_id_list(result.value))
+
+    async def _execute_query_ids(
+        self,
+        query: Query,
+        session: AsyncSession,
+        candidate_ids: Optional[List[str]] = None,
+    ) -> Result[IdCollection]:
+        """
+        Implementation of query execution returning an ID collection.
+
+        Args:
+            query: The query to execute
+            session: Database session
+            candidate_ids: Optional IDs the result will be intersected with by
+                the caller; when the query supports it, they are bound into the
+                generated SQL so that only candidate records are matched
+
+        Returns:
+            Result containing the matching record IDs or an error
+        """
         try:
             # If no query values or sub-queries, return empty list
             if not query.query_values and not query.sub_queries:
                 return Success([])
 
+            if candidate_ids is not None and not self._supports_candidate_pushdown(
+                query
+            ):
+                candidate_ids = None
+
             # Get IDs that match query values
             value_ids = await self._execute_query_values(
                 query.id,
@@ -359,6 +600,8 @@ class QueryExecutor:
                 query.include_values,
                 query.match_values,
                 session,
+                meta_type_id=query.query_meta_type_id,
+                candidate_ids=candidate_ids,
             )
 
             # Get IDs that match sub-queries
@@ -368,6 +611,7 @@ class QueryExecutor:
                 query.include_queries,
                 query.match_queries,
                 session,
+                candidate_ids=candidate_ids,
             )
 
             # Combine results based on query configuration
@@ -377,6 +621,10 @@ class QueryExecutor:
                 query.match_values,
             )
 
+            # Restricted results say nothing about the query's real cardinality
+            if candidate_ids is None:
+                self._record_cardinality(query, len(result_ids))
+
             return Success(result_ids)
 
         except QueryPathError as e:
@@ -397,6 +645,147 @@ class QueryExecutor:
                 )
             )
 
+    def _supports_candidate_pushdown(self, query: Query) -> bool:
+        """
+        Determine if candidate IDs can be bound into a query's SQL.
+
+        Restricting every leaf to the candidates yields exactly the unrestricted
+        result intersected with the candidates, except where query values and
+        sub-queries are combined: an empty side is treated as "no constraint"
+        by ``_combine_results``, and restriction can empty one side.
+
+        Args:
+            query: The query to analyze
+
+        Returns:
+            True if candidate IDs can be pushed into the query, False otherwise
+        """
+        if query.query_values and query.sub_queries:
+            return False
+
+        return all(
+            self._supports_candidate_pushdown(sq)
+            for sq in query.sub_queries or []
+            if sq.id != query.id
+        )
+
+    def _record_cardinality(self, query: Query, size: int) -> None:
+        """
+        Record the result size of a query for cost-based ordering.
+
+        Args:
+            query: The executed query
+            size: The number of matching records
+        """
+        key = self._generate_query_cache_key(query)
+        self._cardinality_history.pop(key, None)
+        self._cardinality_history[key] = size
+
+        # Drop the oldest statistics once the history is full
+        if len(self._cardinality_history) > MAX_CARDINALITY_HISTORY:
+            oldest = next(iter(self._cardinality_history))
+            del self._cardinality_history[oldest]
+
+    async def _get_table_row_estimate(
+        self, meta_type_id: str, session: AsyncSession
+    ) -> Optional[float]:
+        """
+        Get the planner's row estimate for a meta type table from pg_class.
+
+        Estimates are reused for ``TABLE_ROW_ESTIMATE_TTL`` seconds so that
+        they follow the table as it grows.
+
+        Args:
+            meta_type_id: The meta type (table) name
+            session: Database session
+
+        Returns:
+            The estimated number of rows, or None if unavailable
+        """
+        cached = self._table_row_estimates.get(meta_type_id)
+        if cached is not None and time.monotonic() - cached[1] < TABLE_ROW_ESTIMATE_TTL:
+            return cached[0]
+
+        estimate: Optional[float] = None
+        try:
+            result = await session.execute(
+                text(
+                    "SELECT reltuples FROM pg_class "
+                    "WHERE oid = to_regclass(:table_name)"
+                ),
+                {"table_name": meta_type_id},
+            )
+            reltuples = result.scalar()
+            # reltuples is -1 for tables that have never been analyzed
+            if reltuples is not None and reltuples >= 0:
+                estimate = float(reltuples)
+        except Exception as e:
+            self.logger.debug(f"Row estimate unavailable for {meta_type_id}: {e}")
+
+        self._table_row_estimates[meta_type_id] = (estimate, time.monotonic())
+        return estimate
+
+    async def _estimate_query_cardinality(
+        self, query: Query, session: AsyncSession
+    ) -> float:
+        """
+        Estimate the number of records a query will match.
+
+        The last observed result size of the query is used when available.
+        Otherwise the meta type's pg_class row estimate is scaled by a fixed
+        selectivity per condition.
+
+        Args:
+            query: The query to estimate
+            session: Database session
+
+        Returns:
+            The estimated number of matching records
+        """
+        observed = self._cardinality_history.get(self._generate_query_cache_key(query))
+        if observed is not None:
+            return float(observed)
+
+        conditions = len(query.query_values or []) + len(query.sub_queries or [])
+        if conditions == 0:
+            return 0.0
+
+        rows = await self._get_table_row_estimate(query.query_meta_type_id, session)
+        if rows is None:
+            rows = DEFAULT_TABLE_ROW_ESTIMATE
+
+        if query.match_values == Match.AND:
+            selectivity = DEFAULT_CONDITION_SELECTIVITY**conditions
+        else:
+            selectivity = min(1.0, DEFAULT_CONDITION_SELECTIVITY * conditions)
+
+        return rows * selectivity
+
+    async def _execute_branches(
+        self,
+        queries: List[Query],
+        session: AsyncSession,
+        candidate_ids: Optional[List[str]] = None,
+    ) -> List[Result[IdCollection]]:
+        """
+        Execute independent sub-query branches.
+
+        Branches run sequentially on the caller's session, so that they see
+        the same transaction, including its uncommitted writes.
+
+        Args:
+            queries: The branches to execute
+            session: The caller's database session
+            candidate_ids: Optional candidate IDs bound into each branch
+
+        Returns:
+            One result per branch, in order
+        """
+        return [
+            await self._execute_query_ids(sq, session, candidate_ids)
+            for sq in queries
+        ]
+
     async def _execute_query_values(
         self,
         query_id: str,
@@ -404,7 +793,9 @@ class QueryExecutor:
         include: Include,
         match: Match,
         session: AsyncSession,
-    ) -> List[str]:
+        meta_type_id: Optional[str] = None,
+        candidate_ids: Optional[List[str]] = None,
+    ) -> IdCollection:
         """
         Execute query values and return matching record IDs.
 
@@ -424,15 +815,19 @@ class QueryExecutor:
             include: Whether to include or exclude matching records
             match: Whether to match all or any values
             session: Database session
+            meta_type_id: The meta type of the matched records, used to select
+                the ID dictionary when bitmaps are enabled
+            candidate_ids: Optional IDs to restrict the matched records to
 
         Returns:
-            List of matching record IDs
+            List of matching record IDs, or an IdBitmap when bitmaps are enabled
         """
+        restrict = candidate_ids is not None
         if not query_values:
             return []
 
         # Get results for each query value
-        value_results: List[Set[str]] = []
+        value_results: List[IdCollection] = []
 
         # Optimization: Batch-load all query paths in a single database query
         # This reduces the number of round-trips to the database
@@ -446,6 +841,9 @@ class QueryExecutor:
         )
         paths = {path.id: path for path in paths_result.scalars().all()}
 
+        if meta_type_id is None and paths:
+            meta_type_id = next(iter(paths.values())).source_meta_type_id
+
         # Optimization: Check for single value equality with standard ID pattern
         # This is one of the most common query patterns and can be highly optimized
         if (
@@ -463,23 +861,32 @@ class QueryExecutor:
                 # Use direct foreign key lookup when possible
                 if "(:s)" in path.cypher_path and "(t:" in path.cypher_path:
                     # This looks like a direct relationship - try optimized SQL
-                    optimized_query = f"""
+                    optimized_query = self._template_cache.get_or_build(
+                        self._template_key(path, "fast_direct", "", qv, restrict),
+                        lambda: f"""
                     SELECT DISTINCT s.id
                     FROM {path.source_meta_type_id} s
                     JOIN {path.target_meta_type_id} t ON s.{qv.query_path_id.replace('_id', '')}_id = t.id
                     WHERE t.id = :value_id
-                    """
+                    {self._candidate_filter("s.id", restrict)}
+                    """,
+                    )
                     try:
                         # Try the optimized query approach
+                        params = {"value_id": value_ids[0]}
+                        if restrict:
+                            params["candidate_ids"] = candidate_ids
                         result = await session.execute(
-                            text(optimized_query),
-                            {"value_id": value_ids[0]},
+                            optimized_query,
+                            params,
+                        )
+                        result_ids = self._new_id_set(
+                            meta_type_id, (row[0] for row in result.fetchall())
                         )
-                        result_ids = {row[0] for row in result.fetchall()}
                         self.logger.debug(
                             f"Used optimized direct-join query for {qv.id}, found {len(result_ids)} matches"
                         )
-                        return list(result_ids)
+                        return self._id_result(result_ids)
                     except Exception as e:
                         # If the optimized approach fails, log and fall back to standard path
                         self.logger.debug(
@@ -508,25 +915,14 @@ class QueryExecutor:
             # Build lookup condition based on the lookup type
             lookup_condition = self._build_lookup_condition(qv.lookup, value_ids)
 
-            # Optimize query based on strategy
-            if query_strategy == "direct":
-                # For small value sets with equality conditions, use direct join
-                cypher_query = self._build_direct_join_query(path, qv, value_ids)
-            elif query_strategy == "exists":
-                # For exclusion patterns, use EXISTS for better performance
-                cypher_query = self._build_exists_query(
-                    path, qv, lookup_condition, value_ids
-                )
-            elif query_strategy == "standard":
-                # Standard path-based query using cypher
-                cypher_query = self._build_standard_cypher_query(
-                    path, qv, lookup_condition, value_ids
-                )
-            else:
-                # Fallback to standard query
-                cypher_query = self._build_standard_cypher_query(
-                    path, qv, lookup_condition, value_ids
-                )
+            # Get the parameterized statement for this path and strategy,
+            # building the SQL only the first time it is needed
+            cypher_query = self._template_cache.get_or_build(
+                self._template_key(path, query_strategy, lookup_condition, qv, restrict),
+                lambda: self._build_value_query(
+                    query_strategy, path, qv, lookup_condition, value_ids, restrict
+                ),
+            )
 
             self.logger.debug(
                 f"Executing {query_strategy} query for path {path.cypher_path} with {len(value_ids)} values"
@@ -539,14 +935,18 @@ class QueryExecutor:
                 # Add additional parameters if needed
                 if query_strategy == "direct" and len(value_ids) == 1:
                     query_params["value_id"] = value_ids[0]
+                if restrict:
+                    query_params["candidate_ids"] = candidate_ids
 
                 result = await session.execute(
-                    text(cypher_query),
+                    cypher_query,
                     query_params,
                 )
 
                 # Get result IDs as a set
-                result_ids = {row[0] for row in result.fetchall()}
+                result_ids = self._new_id_set(
+                    meta_type_id, (row[0] for row in result.fetchall())
+                )
                 self.logger.debug(
                     f"Found {len(result_ids)} matching records for query value {qv.id}"
                 )
@@ -579,23 +979,27 @@ class QueryExecutor:
 
         # Optimization: For OR with single result set, return directly
         if match == Match.OR and len(value_results) == 1:
-            return list(value_results[0])
+            return self._id_result(value_results[0])
 
         # Combine results based on match type
         if match == Match.AND:
-            # Return intersection of all results
+            # Return intersection of all results, smallest first so that the
+            # intermediate results shrink as quickly as possible
+            value_results.sort(key=len)
             result = value_results[0]
             for r in value_results[1:]:
-                result &= r
+                if not result:
+                    break
+                result = self._intersect_ids(result, r)
 
-            return list(result)
+            return self._id_result(result)
         else:
             # Return union of all results
-            result = set()
+            result = self._new_id_set(meta_type_id, ())
             for r in value_results:
-                result |= r
+                result = self._union_ids(result, r)
 
-            return list(result)
+            return self._id_result(result)
 
     def _choose_query_strategy(
         self, query_value: QueryValue, path: QueryPath, value_ids: List[str]
@@ -681,8 +1085,100 @@ class QueryExecutor:
         # Return the lookup condition or default to equality
         return lookup_conditions.get(lookup, "t.id IN $value_ids$")
 
+    def _template_key(
+        self,
+        path: QueryPath,
+        strategy: str,
+        lookup_condition: str,
+        query_value: QueryValue,
+        restrict: bool,
+    ) -> Tuple[Any, ...]:
+        """
+        Build the template cache key for a query value's SQL.
+
+        The key contains everything the generated SQL depends on; value IDs
+        are bound parameters and are not part of it.
+
+        Args:
+            path: The query path
+            strategy: The query strategy
+            lookup_condition: The lookup condition
+            query_value: The query value
+            restrict: Whether the SQL is restricted to candidate IDs
+
+        Returns:
+            The template cache key
+        """
+        return (
+            path.id,
+            path.cypher_path,
+            path.source_meta_type_id,
+            path.target_meta_type_id,
+            strategy,
+            lookup_condition,
+            query_value.include,
+            restrict,
+        )
+
+    def _build_value_query(
+        self,
+        query_strategy: str,
+        path: QueryPath,
+        query_value: QueryValue,
+        lookup_condition: str,
+        value_ids: List[str],
+        restrict: bool = False,
+    ) -> str:
+        """
+        Build the SQL for a query value using the given strategy.
+
+        Args:
+            query_strategy: The query strategy
+            path: The query path
+            query_value: The query value
+            lookup_condition: The lookup condition
+            value_ids: The value IDs to filter by
+            restrict: Whether to restrict results to the bound candidate IDs
+
+        Returns:
+            The SQL query string
+        """
+        # Optimize query based on strategy
+        if query_strategy == "direct":
+            # For small value sets with equality conditions, use direct join
+            return self._build_direct_join_query(path, query_value, value_ids, restrict)
+        elif query_strategy == "exists":
+            # For exclusion patterns, use EXISTS for better performance
+            return self._build_exists_query(
+                path, query_value, lookup_condition, value_ids, restrict
+            )
+        else:
+            # Standard path-based query using cypher
+            return self._build_standard_cypher_query(
+                path, query_value, lookup_condition, value_ids, restrict
+            )
+
+    def _candidate_filter(self, column: str, restrict: bool) -> str:
+        """
+        Build the SQL condition restricting a column to the bound candidate IDs.
+
+        Args:
+            column: The ID column to restrict
+            restrict: Whether the query is restricted to candidate IDs
+
+        Returns:
+            The SQL condition, or an empty string if unrestricted
+        """
+        if not restrict:
+            return ""
+        return f"AND {column} = ANY(:candidate_ids)"
+
     def _build_direct_join_query(
-        self, path: QueryPath, query_value: QueryValue, value_ids: List[str]
+        self,
+        path: QueryPath,
+        query_value: QueryValue,
+        value_ids: List[str],
+        restrict: bool = False,
     ) -> str:
         """
         Build a direct join query for a single value.
@@ -691,6 +1187,7 @@ class QueryExecutor:
             path: The query path
             query_value: The query value
             value_ids: The value IDs to filter by (assuming a single value)
+            restrict: Whether to restrict results to the bound candidate IDs
 
         Returns:
             The SQL query string
@@ -706,6 +1203,7 @@ class QueryExecutor:
         FROM {path.source_meta_type_id} s
         JOIN {path.target_meta_type_id} t ON s.{rel_field}_id = t.id
         WHERE t.id = :value_id
+        {self._candidate_filter("s.id", restrict)}
         """
 
         return join_query
@@ -716,6 +1214,7 @@ class QueryExecutor:
         query_value: QueryValue,
         lookup_condition: str,
         value_ids: List[str],
+        restrict: bool = False,
     ) -> str:
         """
         Build an EXISTS-based query for exclusion patterns.
@@ -725,6 +1224,7 @@ class QueryExecutor:
             query_value: The query value
             lookup_condition: The lookup condition
             value_ids: The value IDs to filter by
+            restrict: Whether to restrict results to the bound candidate IDs
 
         Returns:
             The SQL query string
@@ -742,6 +1242,7 @@ class QueryExecutor:
             $subq$, $value_ids$:=$value_ids_param$) AS (id TEXT)
             WHERE id = {path.source_meta_type_id}.id
         )
+        {self._candidate_filter("id", restrict)}
         """
 
         return exists_query
@@ -752,6 +1253,7 @@ class QueryExecutor:
         query_value: QueryValue,
         lookup_condition: str,
         value_ids: List[str],
+        restrict: bool = False,
     ) -> str:
         """
         Build a standard cypher-based query.
@@ -761,6 +1263,7 @@ class QueryExecutor:
             query_value: The query value
             lookup_condition: The lookup condition
             value_ids: The value IDs to filter by
+            restrict: Whether to restrict results to the bound candidate IDs
 
         Returns:
             The SQL query string
@@ -778,6 +1281,7 @@ class QueryExecutor:
         SELECT id 
         FROM {path.source_meta_type_id}
         WHERE id IN (SELECT id FROM matched_ids)
+        {self._candidate_filter("id", restrict)}
         """
 
         # Convert to include/exclude based on query value configuration
@@ -788,6 +1292,7 @@ class QueryExecutor:
             WHERE id NOT IN (
                 SELECT id FROM matched_ids
             )
+            {self._candidate_filter("id", restrict)}
             """
 
         return cypher_query
@@ -799,14 +1304,16 @@ class QueryExecutor:
         include: Include,
         match: Match,
         session: AsyncSession,
-    ) -> List[str]:
+        candidate_ids: Optional[List[str]] = None,
+    ) -> IdCollection:
         """
         Execute sub-queries and return matching record IDs.
 
         Optimized implementation with:
-        - Parallel execution for independent sub-queries
+        - Cost-based ordering from cardinality estimates
+        - Parallel execution of independent sub-queries on pooled sessions
         - Early termination for AND conditions
-        - Result size optimization for large queries
+        - Candidate pushdown from the most selective AND branch
 
         Args:
             query_id: The query ID
@@ -814,6 +1321,7 @@ class QueryExecutor:
             include: Whether to include or exclude matching records
             match: Whether to match all or any sub-queries
             session: Database session
+            candidate_ids: Optional IDs to restrict the matched records to
 
         Returns:
             List of matching record IDs
@@ -827,15 +1335,15 @@ class QueryExecutor:
         if not valid_sub_queries:
             return []
 
-        # Optimization: For AND match, execute sequentially with early termination
-        # For OR match, execute in parallel
+        # Optimization: For AND match, execute the most selective branch first
+        # and push its IDs into the others; for OR match, union the branches
         if match == Match.AND:
             return await self._execute_and_subqueries(
-                query_id, valid_sub_queries, session
+                query_id, valid_sub_queries, session, candidate_ids
             )
         else:
             return await self._execute_or_subqueries(
-                query_id, valid_sub_queries, session
+                query_id, valid_sub_queries, session, candidate_ids
             )
 
     async def _execute_and_subqueries(
@@ -843,32 +1351,43 @@ class QueryExecutor:
         query_id: str,
         sub_queries: List[Query],
         session: AsyncSession,
-    ) -> List[str]:
+        candidate_ids: Optional[List[str]] = None,
+    ) -> IdCollection:
         """
-        Execute sub-queries with AND logic, optimized with early termination.
+        Execute sub-queries with AND logic, ordered by estimated cardinality.
+
+        Sub-queries run in order of increasing estimate on the caller's
+        session. The IDs matched so far are bound into each following
+        sub-query, and execution stops as soon as the intersection is empty.
 
         Args:
             query_id: The query ID
             sub_queries: The sub-queries to execute (no self-references)
             session: Database session
+            candidate_ids: Optional IDs to restrict the matched records to
 
         Returns:
             List of matching record IDs
         """
-        # For AND logic, we can optimize by executing sequentially
-        # and terminating early if any sub-query returns empty results
-        current_result: Optional[Set[str]] = None
+        # Order sub-queries by estimated result size so that the most
+        # selective one provides the candidates for the others
+        estimates = [
+            await self._estimate_query_cardinality(sq, session) for sq in sub_queries
+        ]
+        remaining = [
+            sq
+            for _, _, sq in sorted(
+                zip(estimates, range(len(sub_queries)), sub_queries),
+                key=lambda item: (item[0], item[1]),
+            )
+        ]
 
-        # Sort sub-queries by estimated complexity to execute simpler ones first
-        # This increases chances of early termination
-        sorted_queries = sorted(
-            sub_queries,
-            key=lambda sq: len(sq.query_values or []) + len(sq.sub_queries or []),
-        )
+        current_result: Optional[IdCollection] = None
 
-        for sq in sorted_queries:
-            # Execute sub-query
-            result = await self._execute_query(sq, session)
+        # Execute sequentially until one sub-query succeeds
+        while remaining and current_result is None:
+            sq = remaining.pop(0)
+            result = await self._execute_query_ids(sq, session, candidate_ids)
 
             if result.is_failure:
                 self.logger.warning(
@@ -876,87 +1395,89 @@ class QueryExecutor:
                 )
                 continue
 
-            # Get result IDs as a set
-            result_ids = set(result.value)
+            current_result = result.value
 
-            # If result is empty, we can return empty set immediately
-            if not result_ids:
-                self.logger.debug(
-                    f"Early termination for AND sub-queries: sub-query {sq.id} returned no results"
+        # If result is empty, we can return empty set immediately
+        if not current_result:
+            self.logger.debug(
+                f"Early termination for AND sub-queries of {query_id}: no results"
+            )
+            return []
+
+        if not remaining:
+            return self._id_result(current_result)
+
+        for sq in remaining:
+            # Push the candidates into the next branch unless they are too
+            # many to bind efficiently, in which case it runs unrestricted
+            pushdown_ids = (
+                to_id_list(current_result)
+                if len(current_result) <= MAX_PUSHDOWN_IDS
+                else candidate_ids
+            )
+            result = await self._execute_query_ids(sq, session, pushdown_ids)
+
+            if result.is_failure:
+                self.logger.warning(
+                    f"Error executing sub-query {sq.id}: {result.error}"
                 )
-                return []
+                continue
 
-            # If this is our first result, use it directly
-            if current_result is None:
-                current_result = result_ids
-            else:
-                # Otherwise, intersect with current result
-                current_result &= result_ids
+            # Intersect with current result
+            current_result = self._intersect_ids(current_result, result.value)
 
-                # Early termination if intersection becomes empty
-                if not current_result:
-                    self.logger.debug(
-                        f"Early termination for AND sub-queries: intersection is empty after sub-query {sq.id}"
-                    )
-                    return []
+            # Early termination if intersection becomes empty
+            if not current_result:
+                self.logger.debug(
+                    f"Early termination for AND sub-queries: intersection is empty after sub-query {sq.id}"
+                )
+                return []
 
         # Return final result
-        return list(current_result or set())
+        return self._id_result(current_result)
 
     async def _execute_or_subqueries(
         self,
         query_id: str,
         sub_queries: List[Query],
         session: AsyncSession,
-    ) -> List[str]:
+        candidate_ids: Optional[List[str]] = None,
+    ) -> IdCollection:
         """
-        Execute sub-queries with OR logic, optimized with parallel execution.
+        Execute sub-queries with OR logic.
 
         Args:
             query_id: The query ID
             sub_queries: The sub-queries to execute (no self-references)
             session: Database session
+            candidate_ids: Optional IDs to restrict the matched records to
 
         Returns:
             List of matching record IDs
         """
-        # For OR logic, execute sub-queries in parallel for better performance
-        result_futures = []
-
-        # Launch all sub-queries concurrently
-        for sq in sub_queries:
-            # Create a task for each sub-query
-            future = asyncio.create_task(self._execute_query(sq, session))
-            result_futures.append((sq.id, future))
+        results = await self._execute_branches(sub_queries, session, candidate_ids)
 
         # Collect results
-        union_results = set()
-
-        # Wait for all tasks to complete
-        for sq_id, future in result_futures:
-            try:
-                result = await future
-
-                if result.is_failure:
-                    self.logger.warning(
-                        f"Error executing sub-query {sq_id}: {result.error}"
-                    )
-                    continue
+        union_results: IdCollection = set()
 
-                # Add to union
-                union_results.update(result.value)
+        for sq, result in zip(sub_queries, results):
+            if result.is_failure:
+                self.logger.warning(
+                    f"Error executing sub-query {sq.id}: {result.error}"
+                )
+                continue
 
-            except Exception as e:
-                self.logger.error(f"Unexpected error executing sub-query {sq_id}: {e}")
+            # Add to union
+            union_results = self._union_ids(union_results, result.value)
 
-        return list(union_results)
+        return self._id_result(union_results)
 
     def _combine_results(
         self,
-        value_ids: List[str],
-        subquery_ids: List[str],
+        value_ids: IdCollection,
+        subquery_ids: IdCollection,
         match: Match,
-    ) -> List[str]:
+    ) -> IdCollection:
         """
         Combine results from query values and sub-queries.
 
@@ -966,26 +1487,23 @@ class QueryExecutor:
             match: Whether to match all or any
 
         Returns:
-            Combined list of record IDs
+            Combined record IDs, as a list or as an IdBitmap when either
+            input is a bitmap
         """
-        # Convert to sets for set operations
-        value_set = set(value_ids)
-        subquery_set = set(subquery_ids)
-
         # If either set is empty, return the other
-        if not value_set:
-            return list(subquery_set)
+        if not value_ids:
+            return self._id_result(subquery_ids)
 
-        if not subquery_set:
-            return list(value_set)
+        if not subquery_ids:
+            return self._id_result(value_ids)
 
         # Combine based on match type
         if match == Match.AND:
             # Return intersection
-            return list(value_set & subquery_set)
+            return self._id_result(self._intersect_ids(value_ids, subquery_ids))
         else:
             # Return union
-            return list(value_set | subquery_set)
+            return self._id_result(self._union_ids(value_ids, subquery_ids))
 
     async def check_record_matches_query(
         self,
@@ -1064,6 +1582,168 @@ class QueryExecutor:
 
         return result
 
+    async def check_records_match_queries(
+        self,
+        queries: List[Query],
+        record_ids: List[str],
+        session: Optional[AsyncSession] = None,
+        force_refresh: bool = False,
+    ) -> Result[QueryMatchMatrix]:
+        """
+        Check which of many records match each of many queries.
+
+        Instead of one round trip per (query, record) pair, each query is
+        executed once for all of its uncached records, with the record IDs
+        bound as a single ``= ANY(:candidate_ids)`` parameter of every query
+        path statement. Queries that cannot be restricted this way are
+        executed once without restriction and intersected with the records.
+        The record match cache is consulted for every record first, and the
+        result for each checked record is stored in it afterwards.
+
+        Args:
+            queries: The queries to check against
+            record_ids: The record IDs to check
+            session: Optional database session
+            force_refresh: If True, bypass the cache and force fresh checks
+
+        Returns:
+            Result containing a QueryMatchMatrix with one row per query; queries
+            that failed to execute are listed in the matrix's ``errors``
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        matrix = QueryMatchMatrix(
+            [query.id or self._generate_query_cache_key(query) for query in queries],
+            record_ids,
+        )
+        if not queries or not record_ids:
+            return Success(matrix)
+
+        use_cache = self.cache_enabled and not force_refresh
+        record_cache = None
+        if use_cache:
+            try:
+                record_cache = await self.get_record_cache()
+            except Exception as e:
+                self.logger.warning(f"Error accessing record match cache: {e}")
+
+        try:
+            if session is None:
+                async with enhanced_async_session() as session:
+                    await self._fill_match_matrix(
+                        matrix, queries, session, record_cache
+                    )
+            else:
+                await self._fill_match_matrix(matrix, queries, session, record_cache)
+        except Exception as e:
+            self.logger.exception(f"Error checking records against queries: {e}")
+            return Failure(
+                QueryExecutionError(
+                    reason=str(e),
+                    original_exception=str(type(e).__name__),
+                )
+            )
+
+        return Success(matrix)
+
+    async def _fill_match_matrix(
+        self,
+        matrix: QueryMatchMatrix,
+        queries: List[Query],
+        session: AsyncSession,
+        record_cache: Optional[QueryCache],
+    ) -> None:
+        """
+        Fill a match matrix, one query row at a time.
+
+        Args:
+            matrix: The matrix to fill
+            queries: The queries, in row order
+            session: Database session
+            record_cache: The record match cache, or None to bypass it
+        """
+        for row, query in enumerate(queries):
+            # Serve what we can from the record match cache, with a single
+            # lookup for all records
+            pending = matrix.record_ids
+            if record_cache is not None:
+                cache_keys = {
+                    record_id: self._generate_record_cache_key(query, record_id)
+                    for record_id in matrix.record_ids
+                }
+                try:
+                    cached = await record_cache.get_many(cache_keys.values())
+                except Exception as e:
+                    self.logger.warning(f"Error reading record match cache: {e}")
+                    cached = {}
+
+                pending = []
+                for record_id, cache_key in cache_keys.items():
+                    is_match = cached.get(cache_key)
+                    if is_match is None:
+                        pending.append(record_id)
+                    elif is_match:
+                        matrix.set(row, record_id)
+
+            if not pending:
+                continue
+
+            # One execution per query for all pending records, chunked so the
+            # bound ID array stays within the pushdown limit. A query that
+            # cannot be restricted would ignore the chunk and return every
+            # match each time, so it runs once over all pending records.
+            if self._supports_candidate_pushdown(query):
+                chunks = [
+                    pending[start : start + MAX_PUSHDOWN_IDS]
+                    for start in range(0, len(pending), MAX_PUSHDOWN_IDS)
+                ]
+            else:
+                chunks = [pending]
+
+            matched: Set[str] = set()
+            failed = False
+            for chunk in chunks:
+                result = await self._execute_query_ids(
+                    query, session, candidate_ids=chunk
+                )
+                if result.is_failure:
+                    matrix.errors[row] = result.error
+                    failed = True
+                    break
+
+                ids = result.value
+                if isinstance(ids, list):
+                    ids = set(ids)
+                matched.update(
+                    record_id for record_id in chunk if record_id in ids
+                )
+
+            if failed:
+                continue
+
+            for record_id in matched:
+                matrix.set(row, record_id)
+
+            if record_cache is not None:
+                meta_type_tag = f"meta_type:{query.query_meta_type_id}"
+                cache_keys = {
+                    record_id: self._generate_record_cache_key(query, record_id)
+                    for record_id in pending
+                }
+                try:
+                    await record_cache.set_many(
+                        {
+                            cache_key: record_id in matched
+                            for record_id, cache_key in cache_keys.items()
+                        },
+                        tags={
+                            cache_key: [meta_type_tag, f"record:{record_id}"]
+                            for record_id, cache_key in cache_keys.items()
+                        },
+                        ttl=self.cache_ttl,
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Error storing record matches in cache: {e}")
+
     async def _check_record_matches_fresh(
         self,
         query: Query,
@@ -1093,7 +1773,7 @@ class QueryExecutor:
                 # Fall back to full query execution
 
         # Execute the full query and check if the record is in the results
-        result = await self.execute_query(query, session, force_refresh=True)
+        result = await self.execute_query_ids(query, session, force_refresh=True)
 
         if result.is_failure:
             return result
@@ -1906,6 +2586,161 @@ class QueryExecutor:
             )
             return 0
 
+    async def apply_record_change(
+        self,
+        meta_type_id: str,
+        record_id: str,
+        operation: SQLOperation = SQLOperation.UPDATE,
+        session: Optional[AsyncSession] = None,
+    ) -> Dict[str, int]:
+        """
+        Incrementally maintain cached query results after a record changes.
+
+        Instead of dropping every cached result for the meta type, the changed
+        record is re-checked against each simple cached query over that meta
+        type with a direct EXISTS check and the cached IDs are patched. Queries
+        that cannot be checked directly (sub-queries or many values), expired
+        entries, and queries whose paths traverse records of the meta type
+        (including self-referencing paths) are invalidated.
+
+        Args:
+            meta_type_id: The meta type of the changed record
+            record_id: The ID of the changed record
+            operation: The write operation (INSERT, UPDATE, DELETE or TRUNCATE)
+            session: Optional database session
+
+        Returns:
+            Counts of patched, unchanged and invalidated cache entries
+        """
+        stats = {"patched": 0, "unchanged": 0, "invalidated": 0}
+
+        if operation == SQLOperation.TRUNCATE:
+            stats["invalidated"] = await self.invalidate_cache_for_meta_type(
+                meta_type_id
+            )
+            return stats
+
+        try:
+            query_cache = await self.get_query_cache()
+
+            # Record match checks involving the record are stale
+            await self.invalidate_cache_for_record(record_id)
+
+            # Queries that traverse this meta type cannot be patched per record
+            invalidated_keys = await query_cache.get_keys_for_tag(
+                f"path_target:{meta_type_id}"
+            )
+            stats["invalidated"] += await query_cache.invalidate(
+                tag=f"path_target:{meta_type_id}"
+            )
+            for key in invalidated_keys:
+                self._unregister_cached_query(key)
+
+            for cache_key in list(
+                self._cached_query_keys_by_meta_type.get(meta_type_id, ())
+            ):
+                entry = await query_cache.cache.get(cache_key)
+                if entry is None:
+                    self._unregister_cached_query(cache_key)
+                    continue
+
+                query = self._cached_queries[cache_key]
+                metadata = entry.get("metadata", {})
+                remaining_ttl = None
+                if metadata.get("expires_at") is not None:
+                    remaining_ttl = metadata["expires_at"] - time.time()
+                    if remaining_ttl <= 0:
+                        # Expired entries are still served until the stale TTL
+                        # runs out, so they must not survive the write
+                        await self._drop_cached_query(query_cache, cache_key)
+                        stats["invalidated"] += 1
+                        continue
+
+                if operation == SQLOperation.DELETE:
+                    is_match = False
+                elif not self._can_use_optimized_check(query):
+                    # Checking one record against a query with sub-queries or
+                    # many values re-runs the whole query, so recompute it on
+                    # next access instead of on every write
+                    await self._drop_cached_query(query_cache, cache_key)
+                    stats["invalidated"] += 1
+                    continue
+                else:
+                    match_result = await self._check_record_direct(
+                        query, record_id, session
+                    )
+                    if match_result.is_failure:
+                        await self._drop_cached_query(query_cache, cache_key)
+                        stats["invalidated"] += 1
+                        continue
+                    is_match = match_result.value
+
+                result_ids = entry.get("result")
+                if (record_id in result_ids) == is_match:
+                    stats["unchanged"] += 1
+                    continue
+
+                await query_cache.set(
+                    key=cache_key,
+                    result=self._patch_ids(result_ids, record_id, is_match),
+                    tags=metadata.get("tags", []),
+                    ttl=remaining_ttl,
+                )
+                await query_cache.invalidate(key=f"count:{cache_key}")
+                if query.id:
+                    self._legacy_result_cache.pop(query.id, None)
+                stats["patched"] += 1
+
+            self.logger.debug(
+                f"Maintained query cache for {operation} of {meta_type_id} record {record_id}: {stats}"
+            )
+            return stats
+
+        except Exception as e:
+            self.logger.warning(
+                f"Error maintaining query cache for record {record_id}, invalidating meta type {meta_type_id}: {e}"
+            )
+            stats["invalidated"] += await self.invalidate_cache_for_meta_type(
+                meta_type_id
+            )
+            return stats
+
+    async def _drop_cached_query(self, query_cache: QueryCache, cache_key: str) -> None:
+        """
+        Invalidate a cached query result and stop maintaining it.
+
+        Args:
+            query_cache: The query result cache
+            cache_key: The query's cache key
+        """
+        query = self._cached_queries.get(cache_key)
+        await query_cache.invalidate(key=cache_key)
+        await query_cache.invalidate(key=f"count:{cache_key}")
+        if query is not None and query.id:
+            self._legacy_result_cache.pop(query.id, None)
+        self._unregister_cached_query(cache_key)
+
+    def _patch_ids(
+        self, ids: IdCollection, record_id: str, is_member: bool
+    ) -> IdCollection:
+        """
+        Add a record ID to, or remove it from, a cached ID collection.
+
+        Args:
+            ids: The cached IDs
+            record_id: The record ID
+            is_member: Whether the record now matches the query
+
+        Returns:
+            The patched ID collection
+        """
+        if isinstance(ids, IdBitmap):
+            record = IdBitmap.from_ids(ids.dictionary, [record_id])
+            return ids | record if is_member else ids - record
+        if is_member:
+            return [*ids, record_id]
+        return [existing for existing in ids if existing != record_id]
+
     async def invalidate_cache_for_record(self, record_id: str) -> int:
         """
         Invalidate all cached record match checks for a specific record.
@@ -2002,6 +2837,45 @@ class QueryExecutor:
 
             return count
 
+    async def invalidate_query_path(self, path_id: str) -> int:
+        """
+        Invalidate the SQL templates and cached results built from a query path.
+
+        This is called when a query path is updated or deleted, since the
+        templates generated from its cypher path and the results of queries
+        using it are no longer valid.
+
+        Args:
+            path_id: The QueryPath ID
+
+        Returns:
+            Number of templates and cache entries invalidated
+        """
+        count = self._template_cache.invalidate_path(path_id)
+
+        cache_keys = [
+            cache_key
+            for cache_key, query in self._cached_queries.items()
+            if path_id in self._collect_path_ids(query)
+        ]
+        for cache_key in cache_keys:
+            self._unregister_cached_query(cache_key)
+
+        if cache_keys:
+            try:
+                query_cache = await self.get_query_cache()
+                for cache_key in cache_keys:
+                    count += await query_cache.invalidate(key=cache_key)
+            except Exception as e:
+                self.logger.warning(
+                    f"Error invalidating cached results for query path {path_id}: {e}"
+                )
+
+        self.logger.debug(
+            f"Invalidated {count} templates and cache entries for query path: {path_id}"
+        )
+        return count
+
     async def clear_cache(self) -> int:
         """
         Clear all query caches.
@@ -2023,6 +2897,8 @@ class QueryExecutor:
             count4 = len(self._legacy_record_match_cache)
             self._legacy_result_cache.clear()
             self._legacy_record_match_cache.clear()
+            self._cached_queries.clear()
+            self._cached_query_keys_by_meta_type.clear()
 
             total = count1 + count2 + count3 + count4
             self.logger.debug(f"Cleared {total} cache entries")
@@ -2054,6 +2930,15 @@ class QueryExecutor:
                 "result_size": len(self._legacy_result_cache),
                 "record_match_size": len(self._legacy_record_match_cache),
             },
+            "cardinality": {
+                "history_size": len(self._cardinality_history),
+                "table_row_estimates": {
+                    meta_type_id: rows
+                    for meta_type_id, (rows, _) in self._table_row_estimates.items()
+                },
+            },
+            "templates": self._template_cache.get_stats(),
+            "single_flight": self._single_flight.get_stats(),
         }
 
         try:
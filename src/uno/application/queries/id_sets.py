@@ -0,0 +1,409 @@
+# SPDX-FileCopyrightText: 2024-present Richard Dahl <richard@dahl.us>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compact record ID sets for query execution.
+
+Query execution combines the record IDs returned by each query value and
+sub-query with intersections and unions. For meta types with millions of
+records, building and combining Python ``set[str]`` objects dominates both
+CPU time and memory.
+
+This module maps record IDs (ULIDs) to dense integer ordinals through a
+per-meta-type ``IdDictionary`` and represents a set of records as a bitmap
+stored in a single Python integer. Intersections, unions and differences are
+then performed word-at-a-time by the interpreter's big-integer routines,
+and a bitmap can be serialized to a compressed byte string for caching.
+"""
+
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+
+# Maximum number of meta types with a process-wide dictionary; the least
+# recently used dictionary is dropped beyond this
+MAX_ID_DICTIONARIES = 256
+
+# Number of record IDs after which a meta type's dictionary is replaced by an
+# empty one, so that IDs of deleted records do not accumulate forever
+MAX_DICTIONARY_IDS = 1_000_000
+
+
+# Bit positions set in each possible byte value, used to decode bitmaps
+_BYTE_BITS: List[tuple] = [
+    tuple(bit for bit in range(8) if value & (1 << bit)) for value in range(256)
+]
+
+
+class IdDictionary:
+    """
+    Mapping between record IDs and dense integer ordinals for one meta type.
+
+    Ordinals are assigned on first use and never reused, so a bitmap built
+    against a dictionary remains valid for as long as it references it, even
+    after ``get_id_dictionary`` has replaced the dictionary of its meta type.
+    """
+
+    def __init__(self, meta_type_id: str):
+        """
+        Initialize the dictionary.
+
+        Args:
+            meta_type_id: The meta type whose record IDs are mapped
+        """
+        self.meta_type_id = meta_type_id
+        self._ordinals: Dict[str, int] = {}
+        self._ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def ordinal(self, record_id: str) -> int:
+        """
+        Get the ordinal for a record ID, assigning one if necessary.
+
+        Args:
+            record_id: The record ID
+
+        Returns:
+            The ordinal of the record ID
+        """
+        ordinal = self._ordinals.get(record_id)
+        if ordinal is None:
+            ordinal = len(self._ids)
+            self._ordinals[record_id] = ordinal
+            self._ids.append(record_id)
+        return ordinal
+
+    def lookup(self, record_id: str) -> Optional[int]:
+        """
+        Get the ordinal for a record ID without assigning one.
+
+        Args:
+            record_id: The record ID
+
+        Returns:
+            The ordinal, or None if the record ID has never been seen
+        """
+        return self._ordinals.get(record_id)
+
+    def record_id(self, ordinal: int) -> str:
+        """
+        Get the record ID for an ordinal.
+
+        Args:
+            ordinal: The ordinal
+
+        Returns:
+            The record ID
+        """
+        return self._ids[ordinal]
+
+
+class IdBitmap:
+    """
+    Immutable set of record IDs stored as a bitmap over an IdDictionary.
+
+    Bit ``n`` of ``bits`` is set when the record with ordinal ``n`` is a
+    member of the set. Set operations between bitmaps of the same dictionary
+    are single big-integer operations.
+    """
+
+    __slots__ = ("dictionary", "bits")
+
+    def __init__(self, dictionary: IdDictionary, bits: int = 0):
+        """
+        Initialize the bitmap.
+
+        Args:
+            dictionary: The dictionary the ordinals refer to
+            bits: The bitmap as an integer
+        """
+        self.dictionary = dictionary
+        self.bits = bits
+
+    @classmethod
+    def from_ids(cls, dictionary: IdDictionary, record_ids: Iterable[str]) -> "IdBitmap":
+        """
+        Build a bitmap from record IDs.
+
+        Args:
+            dictionary: The dictionary to map record IDs with
+            record_ids: The record IDs
+
+        Returns:
+            The bitmap containing the record IDs
+        """
+        ordinals = [dictionary.ordinal(record_id) for record_id in record_ids]
+        if not ordinals:
+            return cls(dictionary)
+
+        # Set bits in a byte buffer and convert once, which is linear in the
+        # bitmap size rather than quadratic like repeated ``bits |= 1 << n``
+        buffer = bytearray(max(ordinals) // 8 + 1)
+        for ordinal in ordinals:
+            buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+        return cls(dictionary, int.from_bytes(buffer, "little"))
+
+    def _coerce(self, other: Union["IdBitmap", Iterable[str]]) -> int:
+        """Get the bits of another ID collection in this dictionary."""
+        if isinstance(other, IdBitmap):
+            if other.dictionary is self.dictionary:
+                return other.bits
+            other = other.to_list()
+        return IdBitmap.from_ids(self.dictionary, other).bits
+
+    def __and__(self, other: Union["IdBitmap", Iterable[str]]) -> "IdBitmap":
+        return IdBitmap(self.dictionary, self.bits & self._coerce(other))
+
+    def __or__(self, other: Union["IdBitmap", Iterable[str]]) -> "IdBitmap":
+        return IdBitmap(self.dictionary, self.bits | self._coerce(other))
+
+    def __sub__(self, other: Union["IdBitmap", Iterable[str]]) -> "IdBitmap":
+        return IdBitmap(self.dictionary, self.bits & ~self._coerce(other))
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, record_id: object) -> bool:
+        if not isinstance(record_id, str):
+            return False
+        ordinal = self.dictionary.lookup(record_id)
+        return ordinal is not None and bool((self.bits >> ordinal) & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IdBitmap):
+            if other.dictionary is self.dictionary:
+                return self.bits == other.bits
+            return set(self) == set(other)
+        if isinstance(other, (set, frozenset)):
+            return set(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def ordinals(self) -> Iterator[int]:
+        """
+        Iterate over the ordinals in the bitmap in ascending order.
+
+        Returns:
+            Iterator of ordinals
+        """
+        if not self.bits:
+            return
+        data = self.bits.to_bytes((self.bits.bit_length() + 7) // 8, "little")
+        for index, byte in enumerate(data):
+            if byte:
+                base = index << 3
+                for bit in _BYTE_BITS[byte]:
+                    yield base + bit
+
+    def __iter__(self) -> Iterator[str]:
+        record_id = self.dictionary.record_id
+        return (record_id(ordinal) for ordinal in self.ordinals())
+
+    def to_list(self) -> List[str]:
+        """
+        Convert the bitmap to a list of record IDs.
+
+        Returns:
+            List of record IDs
+        """
+        ids = self.dictionary._ids
+        return [ids[ordinal] for ordinal in self.ordinals()]
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the bitmap to a compressed byte string.
+
+        Returns:
+            The compressed bitmap
+        """
+        data = self.bits.to_bytes((self.bits.bit_length() + 7) // 8, "little")
+        return zlib.compress(data, 1)
+
+    @classmethod
+    def from_bytes(cls, dictionary: IdDictionary, data: bytes) -> "IdBitmap":
+        """
+        Deserialize a bitmap produced by ``to_bytes``.
+
+        Args:
+            dictionary: The dictionary the bitmap was built against
+            data: The compressed bitmap
+
+        Returns:
+            The bitmap
+        """
+        return cls(dictionary, int.from_bytes(zlib.decompress(data), "little"))
+
+    def __reduce__(self):
+        # Pickle as the meta type and record IDs rather than dragging the
+        # whole dictionary along; ordinals are only meaningful to the
+        # dictionary instance that assigned them
+        return (
+            _restore_bitmap,
+            (self.dictionary.meta_type_id, self.to_list()),
+        )
+
+    def __repr__(self) -> str:
+        return f"IdBitmap(meta_type={self.dictionary.meta_type_id!r}, size={len(self)})"
+
+
+def _restore_bitmap(meta_type_id: str, record_ids: List[str]) -> IdBitmap:
+    """Restore a pickled bitmap against the process-wide dictionary."""
+    return IdBitmap.from_ids(get_id_dictionary(meta_type_id), record_ids)
+
+
+class QueryMatchMatrix:
+    """
+    Compact boolean matrix of query/record matches.
+
+    Row ``i`` corresponds to ``query_keys[i]`` and column ``j`` to
+    ``record_ids[j]``. Each row is stored as an integer whose bit ``j`` is set
+    when record ``j`` matches query ``i``. Rows of queries that failed to
+    evaluate are recorded in ``errors`` and contain no matches.
+    """
+
+    __slots__ = ("query_keys", "record_ids", "rows", "errors", "_columns")
+
+    def __init__(self, query_keys: List[str], record_ids: List[str]):
+        """
+        Initialize an empty matrix.
+
+        Args:
+            query_keys: Identifiers of the queries, one per row
+            record_ids: The record IDs, one per column
+        """
+        self.query_keys = list(query_keys)
+        self.record_ids = list(record_ids)
+        self.rows: List[int] = [0] * len(self.query_keys)
+        self.errors: Dict[int, Exception] = {}
+        self._columns = {record_id: j for j, record_id in enumerate(self.record_ids)}
+
+    @property
+    def shape(self) -> tuple:
+        return (len(self.query_keys), len(self.record_ids))
+
+    def set(self, row: int, record_id: str, is_match: bool = True) -> None:
+        """
+        Set whether a record matches the query of a row.
+
+        Args:
+            row: The row index
+            record_id: The record ID
+            is_match: Whether the record matches
+        """
+        bit = 1 << self._columns[record_id]
+        if is_match:
+            self.rows[row] |= bit
+        else:
+            self.rows[row] &= ~bit
+
+    def __getitem__(self, index: tuple) -> bool:
+        row, column = index
+        if isinstance(column, str):
+            column = self._columns[column]
+        return bool((self.rows[row] >> column) & 1)
+
+    def matching_records(self, row: int) -> List[str]:
+        """
+        Get the records matching the query of a row.
+
+        Args:
+            row: The row index
+
+        Returns:
+            List of matching record IDs
+        """
+        bits = self.rows[row]
+        return [
+            record_id
+            for j, record_id in enumerate(self.record_ids)
+            if (bits >> j) & 1
+        ]
+
+    def matching_queries(self, record_id: str) -> List[str]:
+        """
+        Get the queries a record matches.
+
+        Args:
+            record_id: The record ID
+
+        Returns:
+            List of query identifiers
+        """
+        column = self._columns[record_id]
+        return [
+            query_key
+            for query_key, bits in zip(self.query_keys, self.rows)
+            if (bits >> column) & 1
+        ]
+
+    def to_dict(self) -> Dict[str, Dict[str, bool]]:
+        """
+        Convert the matrix to nested dictionaries.
+
+        Returns:
+            Dictionary of {query_key: {record_id: matched}}
+        """
+        return {
+            query_key: {
+                record_id: bool((bits >> j) & 1)
+                for j, record_id in enumerate(self.record_ids)
+            }
+            for query_key, bits in zip(self.query_keys, self.rows)
+        }
+
+
+# Type of the ID collections produced during query execution
+IdCollection = Union[List[str], Set[str], IdBitmap]
+
+
+# Process-wide dictionaries, one per meta type, in least recently used order
+_id_dictionaries: "OrderedDict[str, IdDictionary]" = OrderedDict()
+
+
+def get_id_dictionary(meta_type_id: str) -> IdDictionary:
+    """
+    Get the ID dictionary for a meta type, creating it if necessary.
+
+    A dictionary holding more than ``MAX_DICTIONARY_IDS`` record IDs is
+    replaced by an empty one, and only the ``MAX_ID_DICTIONARIES`` most
+    recently used dictionaries are kept. Bitmaps built against a replaced or
+    dropped dictionary keep it alive and stay valid.
+
+    Args:
+        meta_type_id: The meta type ID
+
+    Returns:
+        The ID dictionary for the meta type
+    """
+    dictionary = _id_dictionaries.get(meta_type_id)
+    if dictionary is None or len(dictionary) > MAX_DICTIONARY_IDS:
+        dictionary = _id_dictionaries[meta_type_id] = IdDictionary(meta_type_id)
+        while len(_id_dictionaries) > MAX_ID_DICTIONARIES:
+            _id_dictionaries.popitem(last=False)
+    _id_dictionaries.move_to_end(meta_type_id)
+    return dictionary
+
+
+def to_id_list(ids: IdCollection) -> List[str]:
+    """
+    Convert any ID collection to a list of record IDs.
+
+    Args:
+        ids: The ID collection
+
+    Returns:
+        List of record IDs
+    """
+    if isinstance(ids, IdBitmap):
+        return ids.to_list()
+    if isinstance(ids, list):
+        return ids
+    return list(ids)
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2024-present Richard Dahl <richard@dahl.us>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+SQL template cache for query path execution.
+
+The QueryExecutor turns each query value into SQL built from the value's
+QueryPath, the chosen execution strategy and the lookup condition. The SQL
+only depends on those inputs, with the value IDs passed as bound parameters,
+so it can be built once and reused.
+
+Reusing the same ``TextClause`` avoids re-formatting and re-parsing the SQL on
+every call, and keeps the statement text byte-for-byte stable. Drivers that
+prepare statements server-side and cache them by text (the asyncpg dialect
+does this per connection, psycopg after a threshold of executions) then
+prepare each template once per connection, so Postgres parses and plans
+cypher path queries once instead of on every evaluation.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+
+@dataclass
+class QueryTemplate:
+    """
+    A parameterized SQL statement built for a query path.
+
+    Attributes:
+        key: The template cache key
+        sql: The SQL text
+        statement: The parsed SQLAlchemy statement
+        created_at: Timestamp when the template was built
+        hits: Number of times the template was reused
+    """
+
+    key: Hashable
+    sql: str
+    statement: TextClause
+    created_at: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+class QueryTemplateCache:
+    """
+    Bounded LRU cache of parameterized SQL templates.
+
+    Keys are tuples starting with the QueryPath ID, followed by whatever else
+    the SQL depends on (strategy, lookup condition, include/exclude, ...).
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize the template cache.
+
+        Args:
+            max_size: Maximum number of templates to keep
+        """
+        self.max_size = max_size
+        self._templates: "OrderedDict[Hashable, QueryTemplate]" = OrderedDict()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], str]) -> TextClause:
+        """
+        Get the statement for a key, building it on a cache miss.
+
+        Args:
+            key: The template key
+            builder: Function returning the SQL text for the key
+
+        Returns:
+            The parsed statement
+        """
+        template = self._templates.get(key)
+        if template is not None:
+            self._templates.move_to_end(key)
+            template.hits += 1
+            self._hits += 1
+            return template.statement
+
+        self._misses += 1
+        sql = builder()
+        template = QueryTemplate(key=key, sql=sql, statement=text(sql))
+        self._templates[key] = template
+
+        if len(self._templates) > self.max_size:
+            self._templates.popitem(last=False)
+            self._evictions += 1
+
+        return template.statement
+
+    def get(self, key: Hashable) -> Optional[QueryTemplate]:
+        """
+        Get a template without affecting statistics or recency.
+
+        Args:
+            key: The template key
+
+        Returns:
+            The template, or None if not cached
+        """
+        return self._templates.get(key)
+
+    def invalidate_path(self, path_id: str) -> int:
+        """
+        Remove all templates built for a query path.
+
+        Args:
+            path_id: The QueryPath ID
+
+        Returns:
+            Number of templates removed
+        """
+        keys = [
+            key
+            for key in self._templates
+            if isinstance(key, tuple) and key and key[0] == path_id
+        ]
+        for key in keys:
+            del self._templates[key]
+        return len(keys)
+
+    def clear(self) -> int:
+        """
+        Remove all templates.
+
+        Returns:
+            Number of templates removed
+        """
+        count = len(self._templates)
+        self._templates.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get template cache statistics.
+
+        Returns:
+            Dictionary of template cache statistics
+        """
+        total = self._hits + self._misses
+        return {
+            "size": len(self._templates),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "evictions": self._evictions,
+        }
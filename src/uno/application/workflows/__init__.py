@@ -52,6 +52,11 @@ from uno.workflows.engine import (
     WorkflowEventModel,
 )
 
+from uno.workflows.trigger_index import (
+    WorkflowTriggerIndex,
+    WorkflowDefinitionChangedEvent,
+)
+
 from uno.workflows.errors import (
     WorkflowErrorCode,
     WorkflowNotFoundError,
@@ -90,6 +95,8 @@ from uno.workflows.conditions import (
     QueryMatchEvaluator,
     CustomEvaluator,
     CompositeEvaluator,
+    ConditionPlan,
+    compile_conditions,
     get_evaluator,
     register_evaluator,
     get_evaluator_registry,
@@ -193,6 +200,8 @@ __all__ = [
     # Engine components
     "WorkflowEngine",
     "WorkflowEventHandler",
+    "WorkflowTriggerIndex",
+    "WorkflowDefinitionChangedEvent",
     "PostgresWorkflowEventListener",
     "WorkflowEventModel",
     # Action Executors
@@ -215,6 +224,8 @@ __all__ = [
     "QueryMatchEvaluator",
     "CustomEvaluator",
     "CompositeEvaluator",
+    "ConditionPlan",
+    "compile_conditions",
     "get_evaluator",
     "register_evaluator",
     "get_evaluator_registry",
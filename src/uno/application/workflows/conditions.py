@@ -26,6 +26,7 @@ from typing import (
     Union,
     Type,
     Protocol,
+    Awaitable,
     runtime_checkable,
 )
 from enum import Enum, auto
@@ -52,7 +53,13 @@ from uno.workflows.entities import WorkflowCondition
 class ConditionError(UnoError):
     """Error raised when there's an issue evaluating a condition."""
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        error_code: str = WorkflowErrorCode.WORKFLOW_CONDITION_FAILED,
+        **context: Any,
+    ):
+        super().__init__(message=message, error_code=error_code, **context)
 
 
 class LogicalOperator(str, Enum):
@@ -135,6 +142,123 @@ class ConditionEvaluator(Protocol):
         ...
 
 
+# A compiled condition: called with the event payload (new values for
+# updates) and the evaluation time, returns whether the condition holds
+CompiledPredicate = Callable[[Dict[str, Any], datetime], bool]
+
+
+def _condition_payload(event: WorkflowEventModel) -> Dict[str, Any]:
+    """Get the payload that conditions are evaluated against."""
+    payload = event.payload
+    if event.operation in ["update", "UPDATE"]:
+        # For updates, check against the new values
+        payload = payload.get("new", payload)
+    return payload
+
+
+def compile_path(path: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile a dotted field path into a getter.
+
+    The path is split once, so each lookup is a sequence of ``dict.get``
+    calls. Missing keys and non-dict intermediate values resolve to None.
+
+    Args:
+        path: The field path, e.g. ``"customer.address.country"``
+
+    Returns:
+        Function returning the value at the path in a payload
+    """
+    if "." not in path:
+        return lambda data: data.get(path)
+
+    parts = tuple(path.split("."))
+
+    def get(data: Dict[str, Any]) -> Any:
+        current = data
+        for part in parts:
+            if not isinstance(current, dict):
+                return None
+            current = current.get(part)
+            if current is None:
+                return None
+        return current
+
+    return get
+
+
+def _is_empty(value: Any) -> bool:
+    return value == "" or value == [] or value == {}
+
+
+def compile_comparison(operator: Any, expected_value: Any) -> Callable[[Any], bool]:
+    """
+    Compile a comparison operator and its expected value into a test.
+
+    Null and empty checks receive the actual value as-is; every other
+    comparison is False for a missing (None) value.
+
+    Args:
+        operator: The ComparisonOperator
+        expected_value: The value to compare against
+
+    Returns:
+        Function testing an actual value
+
+    Raises:
+        ConditionError: If the operator or its value is invalid
+    """
+    if operator == ComparisonOperator.IS_NULL:
+        return lambda actual: actual is None
+    if operator == ComparisonOperator.IS_NOT_NULL:
+        return lambda actual: actual is not None
+    if operator == ComparisonOperator.IS_EMPTY:
+        return _is_empty
+    if operator == ComparisonOperator.IS_NOT_EMPTY:
+        return lambda actual: not _is_empty(actual)
+
+    if operator == ComparisonOperator.EQUAL:
+        test = lambda actual: actual == expected_value
+    elif operator == ComparisonOperator.NOT_EQUAL:
+        test = lambda actual: actual != expected_value
+    elif operator == ComparisonOperator.GREATER_THAN:
+        test = lambda actual: actual > expected_value
+    elif operator == ComparisonOperator.GREATER_THAN_OR_EQUAL:
+        test = lambda actual: actual >= expected_value
+    elif operator == ComparisonOperator.LESS_THAN:
+        test = lambda actual: actual < expected_value
+    elif operator == ComparisonOperator.LESS_THAN_OR_EQUAL:
+        test = lambda actual: actual <= expected_value
+    elif operator == ComparisonOperator.IN:
+        test = lambda actual: actual in expected_value
+    elif operator == ComparisonOperator.NOT_IN:
+        test = lambda actual: actual not in expected_value
+    elif operator == ComparisonOperator.CONTAINS:
+        test = lambda actual: expected_value in actual
+    elif operator == ComparisonOperator.NOT_CONTAINS:
+        test = lambda actual: expected_value not in actual
+    elif operator == ComparisonOperator.STARTS_WITH:
+        prefix = str(expected_value)
+        test = lambda actual: str(actual).startswith(prefix)
+    elif operator == ComparisonOperator.ENDS_WITH:
+        suffix = str(expected_value)
+        test = lambda actual: str(actual).endswith(suffix)
+    elif operator == ComparisonOperator.MATCHES:
+        pattern = re.compile(expected_value)
+        test = lambda actual: pattern.match(str(actual)) is not None
+    elif operator == ComparisonOperator.BETWEEN:
+        if not (isinstance(expected_value, list) and len(expected_value) == 2):
+            raise ConditionError(
+                f"Between operator requires a list of two values, got: {expected_value}"
+            )
+        min_val, max_val = expected_value
+        test = lambda actual: min_val <= actual <= max_val
+    else:
+        raise ConditionError(f"Unsupported operator: {operator}")
+
+    return lambda actual: actual is not None and test(actual)
+
+
 class FieldValueEvaluator:
     """Evaluator for field value conditions."""
 
@@ -150,112 +274,43 @@ class FieldValueEvaluator:
     ) -> Result[bool]:
         """Evaluate a field value condition."""
         try:
-            config = condition.condition_config
-            if not config or not config.get("field"):
-                return Failure(
-                    ConditionError("Field value condition missing field configuration")
-                )
-
-            field = config["field"]
-            operator = config.get("operator", ComparisonOperator.EQUAL)
-            expected_value = config.get("value")
-
-            # Support for nested field paths using dot notation
-            payload = event.payload
-            if event.operation in ["update", "UPDATE"]:
-                # For updates, check against the new values
-                payload = payload.get("new", payload)
-
-            # Get the actual value using field path
-            actual_value = self._get_value_from_path(payload, field)
-
-            # Special operators that check for null/empty
-            if operator == ComparisonOperator.IS_NULL:
-                return Success(actual_value is None)
-
-            if operator == ComparisonOperator.IS_NOT_NULL:
-                return Success(actual_value is not None)
-
-            if operator == ComparisonOperator.IS_EMPTY:
-                return Success(
-                    actual_value == "" or actual_value == [] or actual_value == {}
-                )
-
-            if operator == ComparisonOperator.IS_NOT_EMPTY:
-                return Success(
-                    not (actual_value == "" or actual_value == [] or actual_value == {})
-                )
-
-            # If the field doesn't exist or is null, return False for all other operators
-            if actual_value is None:
-                return Success(False)
-
-            # Perform the comparison based on the operator
-            if operator == ComparisonOperator.EQUAL:
-                result = actual_value == expected_value
-            elif operator == ComparisonOperator.NOT_EQUAL:
-                result = actual_value != expected_value
-            elif operator == ComparisonOperator.GREATER_THAN:
-                result = actual_value > expected_value
-            elif operator == ComparisonOperator.GREATER_THAN_OR_EQUAL:
-                result = actual_value >= expected_value
-            elif operator == ComparisonOperator.LESS_THAN:
-                result = actual_value < expected_value
-            elif operator == ComparisonOperator.LESS_THAN_OR_EQUAL:
-                result = actual_value <= expected_value
-            elif operator == ComparisonOperator.IN:
-                result = actual_value in expected_value
-            elif operator == ComparisonOperator.NOT_IN:
-                result = actual_value not in expected_value
-            elif operator == ComparisonOperator.CONTAINS:
-                result = expected_value in actual_value
-            elif operator == ComparisonOperator.NOT_CONTAINS:
-                result = expected_value not in actual_value
-            elif operator == ComparisonOperator.STARTS_WITH:
-                result = str(actual_value).startswith(str(expected_value))
-            elif operator == ComparisonOperator.ENDS_WITH:
-                result = str(actual_value).endswith(str(expected_value))
-            elif operator == ComparisonOperator.MATCHES:
-                result = bool(re.match(expected_value, str(actual_value)))
-            elif operator == ComparisonOperator.BETWEEN:
-                if isinstance(expected_value, list) and len(expected_value) == 2:
-                    min_val, max_val = expected_value
-                    result = min_val <= actual_value <= max_val
-                else:
-                    return Failure(
-                        ConditionError(
-                            f"Between operator requires a list of two values, got: {expected_value}"
-                        )
-                    )
-            else:
-                return Failure(ConditionError(f"Unsupported operator: {operator}"))
-
-            return Success(result)
+            predicate = self.compile(condition)
+            return Success(predicate(_condition_payload(event), None))
 
+        except ConditionError as e:
+            return Failure(e)
         except Exception as e:
             self.logger.exception(f"Error evaluating field value condition: {e}")
             return Failure(
                 ConditionError(f"Error evaluating field value condition: {str(e)}")
             )
 
-    def _get_value_from_path(self, data: Dict[str, Any], path: str) -> Any:
-        """Get a value from a nested object using dot notation."""
-        if "." not in path:
-            return data.get(path)
+    def compile(self, condition: WorkflowCondition) -> CompiledPredicate:
+        """Compile a field value condition into a predicate."""
+        return self.compile_config(condition.condition_config)
 
-        # Handle dot notation for nested fields
-        parts = path.split(".")
-        current = data
+    def compile_config(self, config: Optional[Dict[str, Any]]) -> CompiledPredicate:
+        """
+        Compile a field value condition configuration into a predicate.
 
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-                if current is None:
-                    return None
-            else:
-                return None
+        The field path is split and the operator resolved once, so evaluating
+        the predicate does no parsing.
 
-        return current
+        Raises:
+            ConditionError: If the configuration is invalid
+        """
+        if not config or not config.get("field"):
+            raise ConditionError("Field value condition missing field configuration")
+
+        get_value = compile_path(config["field"])
+        test = compile_comparison(
+            config.get("operator", ComparisonOperator.EQUAL), config.get("value")
+        )
+        return lambda payload, now: test(get_value(payload))
+
+    def _get_value_from_path(self, data: Dict[str, Any], path: str) -> Any:
+        """Get a value from a nested object using dot notation."""
+        return compile_path(path)(data)
 
 
 class TimeBasedEvaluator:
@@ -285,134 +340,132 @@ class TimeBasedEvaluator:
     ) -> Result[bool]:
         """Evaluate a time-based condition."""
         try:
-            config = condition.condition_config
-            if not config or not config.get("operator"):
-                return Failure(
-                    ConditionError(
-                        "Time-based condition missing operator configuration"
-                    )
-                )
-
-            operator = config.get("operator")
+            predicate = self.compile(condition)
 
             # Get current time in UTC
-            now = datetime.now(timezone.utc)
-
-            # Override business hours if provided
-            if config.get("business_hours"):
-                self.business_hours = config.get("business_hours")
-
-            # Handle different time operations
-            if operator == TimeOperator.BEFORE:
-                # Time before a specific datetime
-                target_time = self._parse_datetime(config.get("datetime"))
-                if not target_time:
-                    return Failure(
-                        ConditionError("Before operator requires a datetime value")
-                    )
+            return Success(predicate(event.payload, datetime.now(timezone.utc)))
 
-                return Success(now < target_time)
+        except ConditionError as e:
+            return Failure(e)
+        except Exception as e:
+            self.logger.exception(f"Error evaluating time-based condition: {e}")
+            return Failure(
+                ConditionError(f"Error evaluating time-based condition: {str(e)}")
+            )
 
-            elif operator == TimeOperator.AFTER:
-                # Time after a specific datetime
-                target_time = self._parse_datetime(config.get("datetime"))
-                if not target_time:
-                    return Failure(
-                        ConditionError("After operator requires a datetime value")
-                    )
+    def compile(self, condition: WorkflowCondition) -> CompiledPredicate:
+        """Compile a time-based condition into a predicate."""
+        return self.compile_config(condition.condition_config)
 
-                return Success(now > target_time)
+    def compile_config(self, config: Optional[Dict[str, Any]]) -> CompiledPredicate:
+        """
+        Compile a time-based condition configuration into a predicate.
 
-            elif operator == TimeOperator.BETWEEN:
-                # Time between two datetimes
-                start_time = self._parse_datetime(config.get("start_datetime"))
-                end_time = self._parse_datetime(config.get("end_datetime"))
+        Datetimes are parsed and intervals converted once, so evaluating the
+        predicate only compares against the evaluation time.
 
-                if not start_time or not end_time:
-                    return Failure(
-                        ConditionError(
-                            "Between operator requires start_datetime and end_datetime values"
-                        )
-                    )
+        Raises:
+            ConditionError: If the configuration is invalid
+        """
+        if not config or not config.get("operator"):
+            raise ConditionError("Time-based condition missing operator configuration")
 
-                return Success(start_time <= now <= end_time)
+        operator = config.get("operator")
 
-            elif operator == TimeOperator.ON_WEEKDAY:
-                # Check if current day is one of the specified weekdays
-                weekdays = config.get("weekdays", [])
-                if not weekdays:
-                    return Failure(
-                        ConditionError("On-weekday operator requires weekdays value")
-                    )
+        # Handle different time operations
+        if operator == TimeOperator.BEFORE:
+            # Time before a specific datetime
+            target_time = self._parse_datetime(config.get("datetime"))
+            if not target_time:
+                raise ConditionError("Before operator requires a datetime value")
 
-                current_weekday = now.weekday()
-                return Success(current_weekday in weekdays)
+            return lambda payload, now: now < target_time
 
-            elif operator == TimeOperator.IN_BUSINESS_HOURS:
-                # Check if current time is within business hours
-                return Success(self._is_business_hours(now))
+        elif operator == TimeOperator.AFTER:
+            # Time after a specific datetime
+            target_time = self._parse_datetime(config.get("datetime"))
+            if not target_time:
+                raise ConditionError("After operator requires a datetime value")
 
-            elif operator == TimeOperator.RECURRING:
-                # Check if current time matches a recurring schedule
-                interval = config.get("interval", 1)
-                unit = config.get("unit", TimeUnit.DAYS)
-                reference_time = self._parse_datetime(config.get("reference_datetime"))
+            return lambda payload, now: now > target_time
 
-                if not reference_time:
-                    return Failure(
-                        ConditionError(
-                            "Recurring operator requires reference_datetime value"
-                        )
-                    )
+        elif operator == TimeOperator.BETWEEN:
+            # Time between two datetimes
+            start_time = self._parse_datetime(config.get("start_datetime"))
+            end_time = self._parse_datetime(config.get("end_datetime"))
 
-                # Calculate the time elapsed since the reference time
-                elapsed = now - reference_time
-
-                # Convert the interval to timedelta based on the unit
-                if unit == TimeUnit.SECONDS:
-                    interval_delta = timedelta(seconds=interval)
-                elif unit == TimeUnit.MINUTES:
-                    interval_delta = timedelta(minutes=interval)
-                elif unit == TimeUnit.HOURS:
-                    interval_delta = timedelta(hours=interval)
-                elif unit == TimeUnit.DAYS:
-                    interval_delta = timedelta(days=interval)
-                elif unit == TimeUnit.WEEKS:
-                    interval_delta = timedelta(weeks=interval)
-                elif unit == TimeUnit.MONTHS:
-                    # Approximate months as 30.44 days
-                    interval_delta = timedelta(days=30.44 * interval)
-                elif unit == TimeUnit.YEARS:
-                    # Approximate years as 365.25 days
-                    interval_delta = timedelta(days=365.25 * interval)
-                else:
-                    return Failure(ConditionError(f"Unsupported time unit: {unit}"))
+            if not start_time or not end_time:
+                raise ConditionError(
+                    "Between operator requires start_datetime and end_datetime values"
+                )
 
-                # Check if the elapsed time is a multiple of the interval
-                # Allow for a small tolerance to account for processing delays
-                tolerance = timedelta(seconds=60)  # 1 minute tolerance
+            return lambda payload, now: start_time <= now <= end_time
 
-                # Calculate how many intervals have passed
-                intervals_passed = (
-                    elapsed.total_seconds() / interval_delta.total_seconds()
-                )
-                # Check if it's close to a whole number of intervals
-                is_on_interval = (
-                    abs(intervals_passed - round(intervals_passed))
-                    * interval_delta.total_seconds()
-                    <= tolerance.total_seconds()
-                )
+        elif operator == TimeOperator.ON_WEEKDAY:
+            # Check if current day is one of the specified weekdays
+            weekdays = frozenset(config.get("weekdays", []))
+            if not weekdays:
+                raise ConditionError("On-weekday operator requires weekdays value")
+
+            return lambda payload, now: now.weekday() in weekdays
 
-                return Success(is_on_interval)
+        elif operator == TimeOperator.IN_BUSINESS_HOURS:
+            # Check if current time is within business hours, which the
+            # condition may override
+            is_business_hours = self._compile_business_hours(
+                config.get("business_hours") or self.business_hours
+            )
+            return lambda payload, now: is_business_hours(now)
+
+        elif operator == TimeOperator.RECURRING:
+            # Check if current time matches a recurring schedule
+            interval = config.get("interval", 1)
+            unit = config.get("unit", TimeUnit.DAYS)
+            reference_time = self._parse_datetime(config.get("reference_datetime"))
+
+            if not reference_time:
+                raise ConditionError(
+                    "Recurring operator requires reference_datetime value"
+                )
 
+            # Convert the interval to timedelta based on the unit
+            if unit == TimeUnit.SECONDS:
+                interval_delta = timedelta(seconds=interval)
+            elif unit == TimeUnit.MINUTES:
+                interval_delta = timedelta(minutes=interval)
+            elif unit == TimeUnit.HOURS:
+                interval_delta = timedelta(hours=interval)
+            elif unit == TimeUnit.DAYS:
+                interval_delta = timedelta(days=interval)
+            elif unit == TimeUnit.WEEKS:
+                interval_delta = timedelta(weeks=interval)
+            elif unit == TimeUnit.MONTHS:
+                # Approximate months as 30.44 days
+                interval_delta = timedelta(days=30.44 * interval)
+            elif unit == TimeUnit.YEARS:
+                # Approximate years as 365.25 days
+                interval_delta = timedelta(days=365.25 * interval)
             else:
-                return Failure(ConditionError(f"Unsupported time operator: {operator}"))
+                raise ConditionError(f"Unsupported time unit: {unit}")
 
-        except Exception as e:
-            self.logger.exception(f"Error evaluating time-based condition: {e}")
-            return Failure(
-                ConditionError(f"Error evaluating time-based condition: {str(e)}")
-            )
+            interval_seconds = interval_delta.total_seconds()
+
+            # Allow for a small tolerance to account for processing delays
+            tolerance_seconds = timedelta(seconds=60).total_seconds()
+
+            def is_on_interval(payload: Dict[str, Any], now: datetime) -> bool:
+                # Check if the elapsed time is close to a whole number of intervals
+                intervals_passed = (
+                    now - reference_time
+                ).total_seconds() / interval_seconds
+                return (
+                    abs(intervals_passed - round(intervals_passed)) * interval_seconds
+                    <= tolerance_seconds
+                )
+
+            return is_on_interval
+
+        raise ConditionError(f"Unsupported time operator: {operator}")
 
     def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
         """Parse a datetime string to a datetime object with UTC timezone."""
@@ -453,18 +506,21 @@ class TimeBasedEvaluator:
 
     def _is_business_hours(self, dt: datetime) -> bool:
         """Check if the given datetime is within business hours."""
-        # Check if it's a business day
-        if dt.weekday() not in self.business_hours.get(
-            "weekdays", [0, 1, 2, 3, 4]
-        ):  # Default M-F
-            return False
+        return self._compile_business_hours(self.business_hours)(dt)
+
+    def _compile_business_hours(
+        self, business_hours: Dict[str, Any]
+    ) -> Callable[[datetime], bool]:
+        """Compile a business hours definition into a datetime test."""
+        weekdays = frozenset(business_hours.get("weekdays", [0, 1, 2, 3, 4]))  # Default M-F
+        start_time = business_hours.get("start", time(9, 0))
+        end_time = business_hours.get("end", time(17, 0))
 
-        # Check if it's within business hours
-        current_time = dt.time()
-        start_time = self.business_hours.get("start", time(9, 0))
-        end_time = self.business_hours.get("end", time(17, 0))
+        def is_business_hours(dt: datetime) -> bool:
+            # Check if it's a business day within business hours
+            return dt.weekday() in weekdays and start_time <= dt.time() <= end_time
 
-        return start_time <= current_time <= end_time
+        return is_business_hours
 
 
 class RoleBasedEvaluator:
@@ -650,58 +706,74 @@ class QueryMatchEvaluator:
         This leverages the graph database for complex queries that involve
         many joins, returning the IDs of matching records.
         """
+        return (await self.evaluate_batch(condition, [event], context))[0]
+
+    async def evaluate_batch(
+        self,
+        condition: WorkflowCondition,
+        events: List[WorkflowEventModel],
+        context: Dict[str, Any],
+    ) -> List[Result[bool]]:
+        """
+        Evaluate a query match condition against a batch of events.
+
+        The records of all events are checked against the query with a single
+        call to the QueryService, which executes the query once for the batch.
+        """
         try:
             # If no query is associated, return an error
             if not condition.query_id:
-                return Failure(
-                    ConditionError(
-                        "Query match condition requires a query_id but none was provided"
+                return [
+                    Failure(
+                        ConditionError(
+                            "Query match condition requires a query_id but none was provided"
+                        )
                     )
-                )
-
-            # Get payload data
-            payload = event.payload
-            if event.operation in ["update", "UPDATE"]:
-                # For updates, check against the new values
-                payload = payload.get("new", payload)
+                ] * len(events)
 
-            # Get record ID from payload
-            record_id = payload.get("id")
-            if not record_id:
+            # Get record IDs from payloads
+            record_ids = [_condition_payload(event).get("id") for event in events]
+            if not all(record_ids):
                 self.logger.warning("No record ID found in event payload")
-                return Success(False)
 
-            # Get the query
-            query = await Query.get(condition.query_id)
-            if not query:
-                return Failure(
-                    ConditionError(f"Query with ID {condition.query_id} not found")
-                )
+            checked = [record_id for record_id in record_ids if record_id]
+            if not checked:
+                return [Success(False)] * len(events)
+
+            # Import here to avoid circular imports
+            from uno.queries.domain_provider import get_query_service
 
-            # Use the QueryExecutor to check if the record matches the query
+            # Use the QueryService to check which records match the query
             # This leverages the graph database for complex queries
-            match_result = await query.check_record_match(record_id)
+            match_result = await get_query_service().check_records_match(
+                [condition.query_id], checked
+            )
 
             if match_result.is_failure:
-                return Failure(
-                    ConditionError(f"Error executing query match: {match_result.error}")
-                )
+                return [
+                    Failure(
+                        ConditionError(f"Error executing query match: {match_result.error}")
+                    )
+                ] * len(events)
 
-            # Return the match result (True if the record matches, False otherwise)
-            matched = match_result.value
+            # True if the record matches, False otherwise
+            matches = match_result.value.get(condition.query_id, {})
             self.logger.debug(
-                f"Query match condition: record {record_id} {'matches' if matched else 'does not match'} query {condition.query_id}"
+                f"Query match condition: {sum(1 for matched in matches.values() if matched)} "
+                f"of {len(checked)} records match query {condition.query_id}"
             )
-            return Success(matched)
+            return [
+                Success(bool(record_id and matches.get(record_id, False)))
+                for record_id in record_ids
+            ]
 
         except Exception as e:
             self.logger.exception(f"Error evaluating query match condition: {e}")
-            return Failure(
-                ConditionError(f"Error evaluating query match condition: {str(e)}")
-            )
-
-        # Fallback - assume no match
-        return Success(False)
+            return [
+                Failure(
+                    ConditionError(f"Error evaluating query match condition: {str(e)}")
+                )
+            ] * len(events)
 
 
 class CustomEvaluator:
@@ -788,6 +860,118 @@ class CompositeEvaluator:
         context: Dict[str, Any],
     ) -> Result[bool]:
         """Evaluate a composite condition."""
+        try:
+            predicate = self.compile(condition)
+        except ConditionError as e:
+            return Failure(e)
+        except Exception as e:
+            self.logger.exception(f"Error compiling composite condition: {e}")
+            predicate = None
+
+        if predicate is not None:
+            try:
+                return Success(
+                    predicate(_condition_payload(event), datetime.now(timezone.utc))
+                )
+            except Exception as e:
+                self.logger.exception(f"Error evaluating composite condition: {e}")
+                return Failure(
+                    ConditionError(f"Error evaluating composite condition: {str(e)}")
+                )
+
+        # Some subconditions can only be evaluated asynchronously
+        return await self._evaluate_interpreted(condition, event, context)
+
+    def compile(self, condition: WorkflowCondition) -> Optional[CompiledPredicate]:
+        """Compile a composite condition into a predicate."""
+        return self.compile_config(condition.condition_config)
+
+    def compile_config(
+        self, config: Optional[Dict[str, Any]]
+    ) -> Optional[CompiledPredicate]:
+        """
+        Compile a composite condition configuration into a predicate.
+
+        Subconditions are compiled recursively. As when interpreting, a
+        subcondition that is invalid, has no evaluator or fails to evaluate
+        counts as not met.
+
+        Returns:
+            The predicate, or None if a subcondition cannot be compiled
+
+        Raises:
+            ConditionError: If the composite condition itself is invalid
+        """
+        config = config or {}
+
+        # Get the logical operator
+        operator = config.get("operator", LogicalOperator.AND)
+
+        # Get subconditions
+        subconditions = config.get("conditions", [])
+        if not subconditions:
+            raise ConditionError("Composite condition has no subconditions")
+
+        # For NOT operator, there should be only one subcondition
+        if operator == LogicalOperator.NOT and len(subconditions) != 1:
+            raise ConditionError("NOT operator should have exactly one subcondition")
+
+        if operator not in (LogicalOperator.AND, LogicalOperator.OR, LogicalOperator.NOT):
+            raise ConditionError(f"Unsupported logical operator: {operator}")
+
+        predicates: List[CompiledPredicate] = []
+        for subcond in subconditions:
+            condition_type = subcond.get("type", WorkflowConditionType.FIELD_VALUE)
+            evaluator = self.condition_evaluators.get(condition_type)
+            if not evaluator:
+                self.logger.warning(
+                    f"No evaluator found for condition type: {condition_type}"
+                )
+                predicates.append(lambda payload, now: False)
+                continue
+
+            compile_config = getattr(evaluator, "compile_config", None)
+            if compile_config is None:
+                return None
+
+            try:
+                predicate = compile_config(subcond.get("config", {}))
+            except ConditionError as e:
+                self.logger.warning(f"Failed to evaluate subcondition: {e}")
+                predicates.append(lambda payload, now: False)
+                continue
+
+            if predicate is None:
+                return None
+            predicates.append(self._guard(predicate))
+
+        if operator == LogicalOperator.AND:
+            return lambda payload, now: all(p(payload, now) for p in predicates)
+        if operator == LogicalOperator.OR:
+            return lambda payload, now: any(p(payload, now) for p in predicates)
+
+        negated = predicates[0]
+        return lambda payload, now: not negated(payload, now)
+
+    def _guard(self, predicate: CompiledPredicate) -> CompiledPredicate:
+        """Treat a subcondition that raises as not met."""
+
+        def guarded(payload: Dict[str, Any], now: datetime) -> bool:
+            try:
+                return predicate(payload, now)
+            except Exception as e:
+                self.logger.warning(f"Failed to evaluate subcondition: {e}")
+                return False
+
+        return guarded
+
+    async def _evaluate_interpreted(
+        self,
+        condition: WorkflowCondition,
+        event: WorkflowEventModel,
+        context: Dict[str, Any],
+    ) -> Result[bool]:
+        """Evaluate a composite condition by evaluating each subcondition."""
         try:
             config = condition.condition_config
 
@@ -910,6 +1094,204 @@ def get_evaluator(
     return _registry.get(condition_type)
 
 
+# Evaluates a condition that could not be compiled; None means no evaluator
+AsyncConditionEvaluator = Callable[
+    [WorkflowCondition, WorkflowEventModel, Dict[str, Any]],
+    Awaitable[Optional[Result[bool]]],
+]
+
+
+class ConditionPlan:
+    """
+    A workflow's conditions compiled for repeated evaluation.
+
+    Conditions with a compilable evaluator (field value, time-based and
+    composites of those) become predicates built once, when the workflow is
+    loaded. Other conditions are evaluated through their async evaluator.
+    As when interpreting, conditions are checked in order and evaluation stops
+    at the first condition that fails or is not met.
+    """
+
+    def __init__(
+        self,
+        conditions: List[WorkflowCondition],
+        fallback: Optional[AsyncConditionEvaluator] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Compile a workflow's conditions.
+
+        Args:
+            conditions: The workflow's conditions, in evaluation order
+            fallback: Evaluator for conditions without a registered evaluator
+            logger: Optional logger
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.conditions = conditions
+        self._fallback = fallback
+        self._steps: List[tuple] = [self._compile(c) for c in conditions]
+
+    @property
+    def is_compiled(self) -> bool:
+        """Whether every condition was compiled into a predicate."""
+        return all(predicate is not None for _, predicate, _ in self._steps)
+
+    def _compile(self, condition: WorkflowCondition) -> tuple:
+        """Compile a condition into a (condition, predicate, error) step."""
+        evaluator = get_evaluator(condition.condition_type)
+        compile_condition = getattr(evaluator, "compile", None)
+        if compile_condition is None:
+            return (condition, None, None)
+
+        try:
+            return (condition, compile_condition(condition), None)
+        except ConditionError as e:
+            return (condition, None, e)
+        except Exception as e:
+            self.logger.exception(f"Error compiling condition {condition.id}: {e}")
+            return (condition, None, None)
+
+    async def _evaluate_async_batch(
+        self,
+        condition: WorkflowCondition,
+        events: List[WorkflowEventModel],
+        context: Dict[str, Any],
+    ) -> List[Optional[Result[bool]]]:
+        """Evaluate a condition that was not compiled against events, in one
+        call when its evaluator supports batches."""
+        evaluate_batch = getattr(get_evaluator(condition.condition_type), "evaluate_batch", None)
+        if evaluate_batch is not None:
+            return await evaluate_batch(condition, events, context)
+        return [await self._evaluate_async(condition, event, context) for event in events]
+
+    async def _evaluate_async(
+        self,
+        condition: WorkflowCondition,
+        event: WorkflowEventModel,
+        context: Dict[str, Any],
+    ) -> Optional[Result[bool]]:
+        """Evaluate a condition that was not compiled."""
+        evaluator = get_evaluator(condition.condition_type)
+        if evaluator:
+            return await evaluator.evaluate(condition, event, context)
+        if self._fallback:
+            return await self._fallback(condition, event, context)
+        self.logger.warning(
+            f"No handler or evaluator registered for condition type: {condition.condition_type}"
+        )
+        return None
+
+    def _run_predicate(
+        self,
+        condition: WorkflowCondition,
+        predicate: CompiledPredicate,
+        payload: Dict[str, Any],
+        now: datetime,
+    ) -> Result[bool]:
+        """Run a compiled predicate, converting errors to a Failure."""
+        try:
+            return Success(bool(predicate(payload, now)))
+        except Exception as e:
+            self.logger.exception(f"Error evaluating condition {condition.id}: {e}")
+            return Failure(
+                ConditionError(
+                    f"Error evaluating {condition.condition_type} condition: {str(e)}"
+                )
+            )
+
+    async def evaluate(
+        self, event: WorkflowEventModel, context: Dict[str, Any]
+    ) -> Result[bool]:
+        """
+        Evaluate the conditions against an event.
+
+        Args:
+            event: The event
+            context: The execution context
+
+        Returns:
+            Result containing True if all conditions are met
+        """
+        return (await self.evaluate_batch([event], context))[0]
+
+    async def evaluate_batch(
+        self, events: List[WorkflowEventModel], context: Dict[str, Any]
+    ) -> List[Result[bool]]:
+        """
+        Evaluate the conditions against a batch of events.
+
+        Each condition is applied to all events still undecided before moving
+        on to the next, and the evaluation time is taken once for the batch.
+        Evaluators with an ``evaluate_batch`` method are called once per
+        condition for all undecided events.
+
+        Args:
+            events: The events
+            context: The execution context, shared by all events
+
+        Returns:
+            One Result per event, True if all conditions are met
+        """
+        results: List[Optional[Result[bool]]] = [None] * len(events)
+        pending = list(range(len(events)))
+        payloads = [_condition_payload(event) for event in events]
+        now = datetime.now(timezone.utc)
+
+        for condition, predicate, error in self._steps:
+            if not pending:
+                break
+
+            if error is None and predicate is None:
+                async_results = dict(
+                    zip(
+                        pending,
+                        await self._evaluate_async_batch(
+                            condition, [events[index] for index in pending], context
+                        ),
+                    )
+                )
+
+            still_pending = []
+            for index in pending:
+                if error is not None:
+                    result = Failure(error)
+                elif predicate is not None:
+                    result = self._run_predicate(
+                        condition, predicate, payloads[index], now
+                    )
+                else:
+                    result = async_results[index]
+                    if result is None:
+                        still_pending.append(index)
+                        continue
+
+                if result.is_failure:
+                    results[index] = result
+                elif not result.value:
+                    # If any condition fails, the workflow should not execute
+                    self.logger.debug(
+                        f"Condition {condition.id} ({condition.name or condition.condition_type}) not met"
+                    )
+                    results[index] = Success(False)
+                else:
+                    still_pending.append(index)
+            pending = still_pending
+
+        for index in pending:
+            results[index] = Success(True)
+
+        return results
+
+
+def compile_conditions(
+    conditions: List[WorkflowCondition],
+    fallback: Optional[AsyncConditionEvaluator] = None,
+    logger: Optional[logging.Logger] = None,
+) -> ConditionPlan:
+    """Compile a workflow's conditions into a ConditionPlan."""
+    return ConditionPlan(conditions, fallback, logger)
+
+
 # Add a new condition type for composite conditions
 class ExtendedWorkflowConditionType(str, Enum):
     """Extended condition types including composite conditions."""
@@ -11,6 +11,7 @@ from uuid import uuid4
 from datetime import datetime
 
 from uno.core.errors.result import Result, Success, Failure
+from uno.domain.events import get_event_bus
 from uno.domain.service import UnoEntityService
 from uno.workflows.entities import (
     WorkflowDef,
@@ -38,6 +39,7 @@ from uno.workflows.models import (
     WorkflowStatus,
     WorkflowExecutionStatus,
 )
+from uno.workflows.trigger_index import WorkflowDefinitionChangedEvent
 
 
 class WorkflowServiceError(Exception):
@@ -45,6 +47,112 @@ class WorkflowServiceError(Exception):
     pass
 
 
+async def _publish_definition_change(
+    result: Result[Any], workflow_id: Optional[str], change_type: str
+) -> None:
+    """
+    Publish a WorkflowDefinitionChangedEvent for a successful change.
+    
+    Args:
+        result: The result of the change
+        workflow_id: The ID of the changed workflow
+        change_type: Description of the change
+    """
+    if result.is_failure:
+        return
+    await _publish_workflow_change(workflow_id, change_type)
+
+
+async def _publish_workflow_change(workflow_id: Optional[str], change_type: str) -> None:
+    """
+    Publish a WorkflowDefinitionChangedEvent.
+    
+    Args:
+        workflow_id: The ID of the changed workflow
+        change_type: Description of the change
+    """
+    await get_event_bus().publish(
+        WorkflowDefinitionChangedEvent(
+            aggregate_id=workflow_id,
+            workflow_id=workflow_id,
+            change_type=change_type,
+        )
+    )
+
+
+T = TypeVar("T")
+
+
+class WorkflowComponentService(UnoEntityService[T]):
+    """
+    Service for the components of a workflow definition.
+    
+    Saving or deleting a trigger, condition, action or recipient publishes
+    a WorkflowDefinitionChangedEvent for its workflow, so that the trigger
+    index of the WorkflowEngine reloads the workflow.
+    """
+    
+    # Name of the component in published change types
+    component_name = "component"
+    
+    async def save(self, entity: T) -> Optional[T]:
+        """
+        Save a component and publish the change of its workflow.
+        
+        Args:
+            entity: The component to save
+            
+        Returns:
+            The saved component, or None if it could not be saved
+        """
+        saved = await super().save(entity)
+        if saved is not None:
+            await _publish_workflow_change(
+                saved.workflow_id, f"{self.component_name}_updated"
+            )
+        return saved
+    
+    async def delete(self, entity: T) -> bool:
+        """
+        Delete a component and publish the change of its workflow.
+        
+        Args:
+            entity: The component to delete
+            
+        Returns:
+            True if the component was deleted, False otherwise
+        """
+        deleted = await super().delete(entity)
+        if deleted:
+            await _publish_workflow_change(
+                entity.workflow_id, f"{self.component_name}_deleted"
+            )
+        return deleted
+    
+    async def delete_by_id(self, id: str) -> bool:
+        """
+        Delete a component by ID and publish the change of its workflow.
+        
+        Args:
+            id: The ID of the component to delete
+            
+        Returns:
+            True if the component was deleted, False otherwise
+        """
+        try:
+            entity = await self.repository.get(id)
+        except Exception as e:
+            self.logger.error(f"Error retrieving entity by ID: {str(e)}")
+            return False
+        
+        deleted = await super().delete_by_id(id)
+        if deleted and entity is not None:
+            await _publish_workflow_change(
+                entity.workflow_id, f"{self.component_name}_deleted"
+            )
+        return deleted
+
+
 class WorkflowDefService(UnoEntityService[WorkflowDef]):
     """Service for workflow definition entities."""
     
@@ -108,6 +216,8 @@ class WorkflowDefService(UnoEntityService[WorkflowDef]):
                 status=status,
                 version=version
             )
+            if result.is_success:
+                await _publish_definition_change(result, result.value.id, "created")
             return result
         except Exception as e:
             self.logger.error(f"Error creating workflow: {e}")
@@ -218,6 +328,7 @@ class WorkflowDefService(UnoEntityService[WorkflowDef]):
             
             # Save changes
             update_result = await self.update(workflow)
+            await _publish_definition_change(update_result, workflow_id, "activated")
             return update_result
         except Exception as e:
             self.logger.error(f"Error activating workflow: {e}")
@@ -247,15 +358,18 @@ class WorkflowDefService(UnoEntityService[WorkflowDef]):
             
             # Save changes
             update_result = await self.update(workflow)
+            await _publish_definition_change(update_result, workflow_id, "deactivated")
             return update_result
         except Exception as e:
             self.logger.error(f"Error deactivating workflow: {e}")
             return Failure(WorkflowServiceError(f"Error deactivating workflow: {str(e)}"))
 
 
-class WorkflowTriggerService(UnoEntityService[WorkflowTrigger]):
+class WorkflowTriggerService(WorkflowComponentService[WorkflowTrigger]):
     """Service for workflow trigger entities."""
     
+    component_name = "trigger"
+    
     def __init__(
         self, 
         repository: Optional[WorkflowTriggerRepository] = None,
@@ -317,6 +431,7 @@ class WorkflowTriggerService(UnoEntityService[WorkflowTrigger]):
                 priority=priority,
                 is_active=is_active
             )
+            await _publish_definition_change(result, workflow_id, "trigger_created")
             return result
         except Exception as e:
             self.logger.error(f"Error creating workflow trigger: {e}")
@@ -340,9 +455,11 @@ class WorkflowTriggerService(UnoEntityService[WorkflowTrigger]):
             return Failure(WorkflowServiceError(f"Error finding triggers: {str(e)}"))
 
 
-class WorkflowConditionService(UnoEntityService[WorkflowCondition]):
+class WorkflowConditionService(WorkflowComponentService[WorkflowCondition]):
     """Service for workflow condition entities."""
     
+    component_name = "condition"
+    
     def __init__(
         self, 
         repository: Optional[WorkflowConditionRepository] = None,
@@ -407,6 +524,7 @@ class WorkflowConditionService(UnoEntityService[WorkflowCondition]):
                 description=description,
                 order=order
             )
+            await _publish_definition_change(result, workflow_id, "condition_created")
             return result
         except Exception as e:
             self.logger.error(f"Error creating workflow condition: {e}")
@@ -430,9 +548,11 @@ class WorkflowConditionService(UnoEntityService[WorkflowCondition]):
             return Failure(WorkflowServiceError(f"Error finding conditions: {str(e)}"))
 
 
-class WorkflowActionService(UnoEntityService[WorkflowAction]):
+class WorkflowActionService(WorkflowComponentService[WorkflowAction]):
     """Service for workflow action entities."""
     
+    component_name = "action"
+    
     def __init__(
         self, 
         repository: Optional[WorkflowActionRepository] = None,
@@ -503,6 +623,7 @@ class WorkflowActionService(UnoEntityService[WorkflowAction]):
                 is_active=is_active,
                 retry_policy=retry_policy
             )
+            await _publish_definition_change(result, workflow_id, "action_created")
             return result
         except Exception as e:
             self.logger.error(f"Error creating workflow action: {e}")
@@ -570,9 +691,11 @@ class WorkflowActionService(UnoEntityService[WorkflowAction]):
             return Failure(WorkflowServiceError(f"Error getting action: {str(e)}"))
 
 
-class WorkflowRecipientService(UnoEntityService[WorkflowRecipient]):
+class WorkflowRecipientService(WorkflowComponentService[WorkflowRecipient]):
     """Service for workflow recipient entities."""
     
+    component_name = "recipient"
+    
     def __init__(
         self, 
         repository: Optional[WorkflowRecipientRepository] = None,
@@ -645,6 +768,7 @@ class WorkflowRecipientService(UnoEntityService[WorkflowRecipient]):
                 action_id=action_id,
                 notification_config=notification_config
             )
+            await _publish_definition_change(result, workflow_id, "recipient_created")
             return result
         except Exception as e:
             self.logger.error(f"Error creating workflow recipient: {e}")
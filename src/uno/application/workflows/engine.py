@@ -6,14 +6,25 @@ import logging
 import json
 import inspect
 import asyncio
-from typing import Dict, Any, List, Optional, Callable, Set, Union, Type, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Any,
+    List,
+    Optional,
+    Callable,
+    Set,
+    Union,
+    Type,
+    Tuple,
+)
 from datetime import datetime
 
 from pydantic import BaseModel
 
 from uno.core.errors.result import Result, Success, Failure
 from uno.core.errors.base import UnoError
-from uno.domain.events import DomainEvent, EventHandler
+from uno.domain.events import DomainEvent, EventBus, EventHandler, get_event_bus
 from uno.workflows.errors import (
     WorkflowErrorCode,
     WorkflowNotFoundError,
@@ -46,6 +57,16 @@ from uno.workflows.entities import (
     WorkflowExecutionRecord,
     User,
 )
+from uno.workflows.trigger_index import (
+    WORKFLOW_DEFINITION_TABLES,
+    WorkflowDefinitionChangedEvent,
+    WorkflowTriggerIndex,
+    compile_field_conditions,
+    event_payload,
+)
+
+if TYPE_CHECKING:
+    from uno.workflows.conditions import ConditionPlan
 
 
 class WorkflowEngineError(UnoError):
@@ -93,9 +114,13 @@ class WorkflowEngine:
         self,
         db_manager: DBManager,
         logger: Optional[logging.Logger] = None,
+        trigger_index_ttl: Optional[float] = 300.0,
     ):
         self.db_manager = db_manager
         self.logger = logger or logging.getLogger(__name__)
+        self.trigger_index = WorkflowTriggerIndex(ttl=trigger_index_ttl)
+        self._trigger_index_lock = asyncio.Lock()
+        self._condition_plans: Dict[str, "ConditionPlan"] = {}
         self._condition_handlers: Dict[WorkflowConditionType, Callable] = {}
         self._action_handlers: Dict[WorkflowActionType, Callable] = {}
         self._recipient_resolvers: Dict[WorkflowRecipientType, Callable] = {}
@@ -174,6 +199,9 @@ class WorkflowEngine:
         """Process a database event and execute matching workflows."""
         self.logger.debug(f"Processing event: {event.table_name} {event.operation}")
 
+        if event.table_name in WORKFLOW_DEFINITION_TABLES:
+            self._invalidate_for_table_event(event)
+
         try:
             # Find matching workflows based on triggers
             matching_workflows = await self._find_matching_workflows(event)
@@ -222,105 +250,162 @@ class WorkflowEngine:
         self, event: WorkflowEventModel
     ) -> List[Tuple[WorkflowDef, WorkflowTrigger]]:
         """Find workflows with triggers matching the given event."""
+        await self._ensure_trigger_index()
+        return self.trigger_index.match(event.table_name, event.operation, event.payload)
+
+    def _check_field_conditions(
+        self, trigger: WorkflowTrigger, event: WorkflowEventModel
+    ) -> bool:
+        """Check if the event payload matches the trigger's field conditions."""
+        predicate = compile_field_conditions(trigger.field_conditions)
+        return predicate(event_payload(event.operation, event.payload))
+
+    async def _ensure_trigger_index(self) -> None:
+        """Build the trigger index, or reload invalidated workflows, if needed."""
+        index = self.trigger_index
+        if index.is_loaded and not index.pending_workflow_ids:
+            return
+
+        async with self._trigger_index_lock:
+            if not index.is_loaded:
+                await self.load_trigger_index()
+            elif index.pending_workflow_ids:
+                # Invalidations arriving during the load stay pending
+                generation = index.generation
+                workflow_ids = list(index.pending_workflow_ids)
+                async with self.db_manager.get_enhanced_session() as session:
+                    workflows = await self._load_active_workflows(session, workflow_ids)
+                for workflow in index.reload(workflows, workflow_ids, generation):
+                    self._condition_plan(workflow)
+
+    async def load_trigger_index(self) -> None:
+        """Load all active workflows into the trigger index."""
+        generation = self.trigger_index.generation
         async with self.db_manager.get_enhanced_session() as session:
-            # Query for active workflows with matching triggers
-            query = """
-            SELECT 
-                wd.id as workflow_id,
-                wt.id as trigger_id
-            FROM 
-                workflow_definition wd
-                JOIN workflow_trigger wt ON wd.id = wt.workflow_id
-            WHERE 
-                wd.status = 'active'
-                AND wt.is_active = TRUE
-                AND wt.entity_type = :entity_type
-                AND wt.operation = :operation
-            ORDER BY 
-                wt.priority ASC
-            """
+            workflows = await self._load_active_workflows(session)
 
-            params = {
-                "entity_type": event.table_name,
-                "operation": event.operation,
-            }
+        indexed = self.trigger_index.rebuild(workflows, generation)
 
-            result = await session.execute(query, params)
-            matches = result.fetchall()
+        # Compile conditions up front rather than on the first matching event
+        self._condition_plans.clear()
+        for workflow in indexed:
+            self._condition_plan(workflow)
 
-            if not matches:
-                return []
+        self.logger.info(
+            f"Loaded {len(workflows)} active workflows into the trigger index"
+        )
 
-            # Fetch complete workflow and trigger objects
-            workflows_with_triggers = []
+    async def _load_active_workflows(
+        self, session, workflow_ids: Optional[List[str]] = None
+    ) -> List[WorkflowDef]:
+        """Fetch active workflows with all their components in one query per table."""
+        where = "wd.status = 'active'"
+        params: Dict[str, Any] = {}
+        if workflow_ids is not None:
+            where += " AND wd.id = ANY(:workflow_ids)"
+            params["workflow_ids"] = workflow_ids
+
+        workflows_result = await session.execute(
+            f"SELECT wd.* FROM workflow_definition wd WHERE {where}", params
+        )
+        workflows: Dict[str, WorkflowDef] = {}
+        for workflow_data in workflows_result.fetchall():
+            workflow = WorkflowDef.from_record(workflow_data)
+            workflows[workflow.id] = workflow
+
+        if not workflows:
+            return []
+
+        def components_query(table: str, alias: str, order: str = "") -> str:
+            return f"""
+            SELECT {alias}.* FROM {table} {alias}
+            JOIN workflow_definition wd ON wd.id = {alias}.workflow_id
+            WHERE {where}
+            {order}
+            """
+
+        # Fetch triggers
+        triggers_result = await session.execute(
+            components_query("workflow_trigger", "wt"), params
+        )
+        for trigger_data in triggers_result.fetchall():
+            trigger = WorkflowTrigger.from_record(trigger_data)
+            workflows[trigger.workflow_id].triggers.append(trigger)
 
-            for match in matches:
-                workflow_id = match["workflow_id"]
-                trigger_id = match["trigger_id"]
+        # Fetch conditions
+        conditions_result = await session.execute(
+            components_query("workflow_condition", "wc", 'ORDER BY wc."order" ASC'),
+            params,
+        )
+        for condition_data in conditions_result.fetchall():
+            condition = WorkflowCondition.from_record(condition_data)
+            workflows[condition.workflow_id].conditions.append(condition)
 
-                # Fetch workflow with its components
-                workflow = await self._get_workflow_with_components(
-                    session, workflow_id
-                )
+        # Fetch actions
+        actions_result = await session.execute(
+            components_query("workflow_action", "wa", 'ORDER BY wa."order" ASC'),
+            params,
+        )
+        actions: Dict[str, WorkflowAction] = {}
+        for action_data in actions_result.fetchall():
+            action = WorkflowAction.from_record(action_data)
+            workflows[action.workflow_id].actions.append(action)
+            actions[action.id] = action
 
-                # Find the matching trigger
-                matching_trigger = next(
-                    (t for t in workflow.triggers if t.id == trigger_id), None
-                )
+        # Fetch recipients
+        recipients_result = await session.execute(
+            components_query("workflow_recipient", "wr"), params
+        )
+        for recipient_data in recipients_result.fetchall():
+            recipient = WorkflowRecipient.from_record(recipient_data)
+            workflows[recipient.workflow_id].recipients.append(recipient)
 
-                if matching_trigger and self._check_field_conditions(
-                    matching_trigger, event
-                ):
-                    workflows_with_triggers.append((workflow, matching_trigger))
+            # Associate recipients with specific actions if applicable
+            if recipient.action_id and recipient.action_id in actions:
+                actions[recipient.action_id].recipients.append(recipient)
 
-            return workflows_with_triggers
+        return list(workflows.values())
 
-    def _check_field_conditions(
-        self, trigger: WorkflowTrigger, event: WorkflowEventModel
-    ) -> bool:
-        """Check if the event payload matches the trigger's field conditions."""
-        if not trigger.field_conditions:
-            return True
+    def invalidate_workflow(self, workflow_id: Optional[str] = None) -> None:
+        """
+        Invalidate a workflow in the trigger index.
+
+        The workflow is reloaded on the next event; without a workflow ID
+        the whole index is rebuilt.
+        """
+        if workflow_id:
+            self.trigger_index.invalidate(workflow_id)
+            self._condition_plans.pop(workflow_id, None)
+        else:
+            self.trigger_index.invalidate_all()
+            self._condition_plans.clear()
 
-        payload = event.payload
-        if event.operation == WorkflowDBEvent.UPDATE:
-            # For updates, check against the new values
-            payload = payload.get("new", payload)
+    async def handle_definition_change(
+        self, event: WorkflowDefinitionChangedEvent
+    ) -> None:
+        """Invalidate the trigger index for a changed workflow definition."""
+        self.logger.debug(
+            f"Workflow definition {event.workflow_id} {event.change_type}, invalidating trigger index"
+        )
+        self.invalidate_workflow(event.workflow_id)
 
-        # Check each condition
-        for field, condition in trigger.field_conditions.items():
-            if field not in payload:
-                return False
-
-            field_value = payload[field]
-
-            if isinstance(condition, dict):
-                # Complex condition with operator
-                operator = condition.get("operator", "eq")
-                value = condition.get("value")
-
-                if operator == "eq" and field_value != value:
-                    return False
-                elif operator == "neq" and field_value == value:
-                    return False
-                elif operator == "gt" and not (field_value > value):
-                    return False
-                elif operator == "gte" and not (field_value >= value):
-                    return False
-                elif operator == "lt" and not (field_value < value):
-                    return False
-                elif operator == "lte" and not (field_value <= value):
-                    return False
-                elif operator == "in" and field_value not in value:
-                    return False
-                elif operator == "nin" and field_value in value:
-                    return False
-            else:
-                # Simple equality condition
-                if field_value != condition:
-                    return False
+    def subscribe_to_definition_changes(
+        self, event_bus: Optional[EventBus] = None
+    ) -> None:
+        """Keep the trigger index current by listening for definition change events."""
+        (event_bus or get_event_bus()).subscribe(
+            self.handle_definition_change,
+            event_type=WorkflowDefinitionChangedEvent,
+        )
+
+    def _invalidate_for_table_event(self, event: WorkflowEventModel) -> None:
+        """Invalidate the trigger index for a change to a workflow definition table."""
+        payload = event_payload(event.operation, event.payload)
+        if event.operation == WorkflowDBEvent.DELETE:
+            payload = payload.get("old", payload)
 
-        return True
+        key = "id" if event.table_name == "workflow_definition" else "workflow_id"
+        self.invalidate_workflow(payload.get(key))
 
     async def _get_workflow_with_components(
         self, session, workflow_id: str
@@ -565,45 +650,48 @@ class WorkflowEngine:
         if not workflow.conditions:
             return Success(True)  # No conditions means the workflow should execute
 
-        # Try to use the advanced condition evaluators first
-        from uno.workflows.conditions import get_evaluator
+        return await self._condition_plan(workflow).evaluate(event, context)
 
-        for condition in workflow.conditions:
-            # Try to get an advanced evaluator first
-            evaluator = get_evaluator(condition.condition_type)
-
-            if evaluator:
-                # Use the advanced evaluator
-                self.logger.debug(
-                    f"Using advanced evaluator for condition {condition.id} ({condition.name or condition.condition_type})"
-                )
-                result = await evaluator.evaluate(condition, event, context)
-            else:
-                # Fall back to legacy handler if no advanced evaluator is available
-                handler = self._condition_handlers.get(condition.condition_type)
-                if not handler:
-                    self.logger.warning(
-                        f"No handler or evaluator registered for condition type: {condition.condition_type}"
-                    )
-                    continue
+    async def evaluate_conditions_batch(
+        self,
+        workflow: WorkflowDef,
+        events: List[WorkflowEventModel],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> List[Result[bool]]:
+        """Evaluate a workflow's conditions against a batch of events."""
+        if not workflow.conditions:
+            return [Success(True) for _ in events]
 
-                # Check if the handler is async
-                if asyncio.iscoroutinefunction(handler):
-                    result = await handler(condition, event, context)
-                else:
-                    result = handler(condition, event, context)
+        return await self._condition_plan(workflow).evaluate_batch(events, context or {})
 
-            if result.is_failure:
-                return result
+    def _condition_plan(self, workflow: WorkflowDef) -> "ConditionPlan":
+        """Get the compiled conditions of a workflow, compiling them if needed."""
+        plan = self._condition_plans.get(workflow.id)
+        if plan is None or plan.conditions is not workflow.conditions:
+            # Import here to avoid circular imports
+            from uno.workflows.conditions import compile_conditions
 
-            if not result.value:
-                # If any condition fails, the workflow should not execute
-                self.logger.info(
-                    f"Condition {condition.id} ({condition.name or condition.condition_type}) not met"
-                )
-                return Success(False)
+            plan = compile_conditions(
+                workflow.conditions, self._evaluate_condition_with_handler, self.logger
+            )
+            self._condition_plans[workflow.id] = plan
+        return plan
+
+    async def _evaluate_condition_with_handler(
+        self, condition: WorkflowCondition, event: WorkflowEventModel, context: Dict[str, Any]
+    ) -> Optional[Result[bool]]:
+        """Evaluate a condition with a legacy handler, if one is registered."""
+        handler = self._condition_handlers.get(condition.condition_type)
+        if not handler:
+            self.logger.warning(
+                f"No handler or evaluator registered for condition type: {condition.condition_type}"
+            )
+            return None
 
-        return Success(True)
+        # Check if the handler is async
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(condition, event, context)
+        return handler(condition, event, context)
 
     async def _execute_actions(
         self, workflow: WorkflowDef, event: WorkflowEventModel, context: Dict[str, Any]
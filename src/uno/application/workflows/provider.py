@@ -46,6 +46,8 @@ from uno.workflows.engine import (
     PostgresWorkflowEventListener,
     WorkflowEventModel,
 )
+from uno.workflows.trigger_index import WorkflowDefinitionChangedEvent
+from uno.domain.events import get_event_bus
 
 
 class WorkflowRepository(UnoBaseRepository, UnoRepositoryProtocol):
@@ -372,6 +374,7 @@ class WorkflowService(UnoServiceProtocol):
         """Create a new workflow."""
         try:
             workflow_id = await self.repository.create_workflow(workflow)
+            await self._publish_definition_change(workflow_id, "created")
             return Success(workflow_id)
         except Exception as e:
             self.logger.exception(f"Error creating workflow: {e}")
@@ -390,6 +393,7 @@ class WorkflowService(UnoServiceProtocol):
             if not workflow_id:
                 return Failure(WorkflowNotFoundError(workflow.id))
 
+            await self._publish_definition_change(workflow_id, "updated")
             return Success(workflow_id)
         except Exception as e:
             self.logger.exception(f"Error updating workflow {workflow.id}: {e}")
@@ -408,6 +412,7 @@ class WorkflowService(UnoServiceProtocol):
             if not success:
                 return Failure(WorkflowNotFoundError(workflow_id))
 
+            await self._publish_definition_change(workflow_id, "deleted")
             return Success(True)
         except Exception as e:
             self.logger.exception(f"Error deleting workflow {workflow_id}: {e}")
@@ -419,6 +424,16 @@ class WorkflowService(UnoServiceProtocol):
                 )
             )
 
+    async def _publish_definition_change(self, workflow_id: str, change_type: str) -> None:
+        """Notify workflow engines that a workflow definition changed."""
+        await get_event_bus().publish(
+            WorkflowDefinitionChangedEvent(
+                aggregate_id=workflow_id,
+                workflow_id=workflow_id,
+                change_type=change_type,
+            )
+        )
+
     async def get_execution_logs(
         self,
         workflow_id: Optional[str] = None,
@@ -521,7 +536,9 @@ async def create_workflow_engine():
     """Create and configure a workflow engine instance."""
     db_manager = await get_scoped_service(DBManager)
     logger = get_service(logging.Logger)
-    return WorkflowEngine(db_manager, logger)
+    engine = WorkflowEngine(db_manager, logger)
+    engine.subscribe_to_definition_changes()
+    return engine
 
 
 async def create_workflow_repository():
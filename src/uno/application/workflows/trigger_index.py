@@ -0,0 +1,377 @@
+# SPDX-FileCopyrightText: 2024-present Richard Dahl <richard@dahl.us>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+In-process index of workflow triggers.
+
+The WorkflowEngine used to look up matching triggers with a SQL join for
+every incoming event, then load each matching workflow with its components.
+This module keeps the active workflow definitions in memory, indexed by
+(entity_type, operation), with each trigger's field conditions compiled into
+a single predicate. Dispatching an event is then a dictionary lookup followed
+by predicate calls, with no database round-trips.
+
+The index is invalidated per workflow when a WorkflowDefinitionChangedEvent
+is published, or when a change to one of the workflow definition tables is
+seen by the engine.
+"""
+
+import operator
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from uno.domain.events import DomainEvent
+from uno.workflows.entities import WorkflowDef, WorkflowTrigger
+from uno.workflows.models import WorkflowDBEvent
+
+
+# Tables holding workflow definitions; changes to them invalidate the index
+WORKFLOW_DEFINITION_TABLES = frozenset(
+    {
+        "workflow_definition",
+        "workflow_trigger",
+        "workflow_condition",
+        "workflow_action",
+        "workflow_recipient",
+    }
+)
+
+
+FieldPredicate = Callable[[Dict[str, Any]], bool]
+
+
+class WorkflowDefinitionChangedEvent(DomainEvent):
+    """Event published when a workflow definition or one of its components changes."""
+
+    event_type: str = "workflow_definition_changed"
+    aggregate_type: Optional[str] = "WorkflowDef"
+    workflow_id: Optional[str] = None
+    change_type: str = "updated"
+
+
+def _not_in(field_value: Any, value: Any) -> bool:
+    return field_value not in value
+
+
+def _in(field_value: Any, value: Any) -> bool:
+    return field_value in value
+
+
+# Comparisons for the operators supported in trigger field conditions; an
+# operator that is not listed never rejects an event
+_FIELD_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": _in,
+    "nin": _not_in,
+}
+
+
+def compile_field_conditions(field_conditions: Optional[Dict[str, Any]]) -> FieldPredicate:
+    """
+    Compile a trigger's field conditions into a payload predicate.
+
+    Args:
+        field_conditions: Mapping of field name to either a value (equality)
+            or a dict with ``operator`` and ``value`` keys
+
+    Returns:
+        Function returning True if a payload satisfies every condition
+    """
+    if not field_conditions:
+        return lambda payload: True
+
+    checks: List[Tuple[str, Callable[[Any, Any], bool], Any]] = []
+    for field_name, condition in field_conditions.items():
+        if isinstance(condition, dict):
+            compare = _FIELD_OPERATORS.get(condition.get("operator", "eq"))
+            checks.append((field_name, compare, condition.get("value")))
+        else:
+            checks.append((field_name, operator.eq, condition))
+
+    def predicate(payload: Dict[str, Any]) -> bool:
+        for field_name, compare, value in checks:
+            if field_name not in payload:
+                return False
+            if compare is not None and not compare(payload[field_name], value):
+                return False
+        return True
+
+    return predicate
+
+
+def event_payload(operation: Any, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the payload that trigger field conditions are checked against.
+
+    Args:
+        operation: The database operation of the event
+        payload: The event payload
+
+    Returns:
+        The new values for updates, otherwise the payload itself
+    """
+    if operation == WorkflowDBEvent.UPDATE:
+        return payload.get("new", payload)
+    return payload
+
+
+@dataclass
+class IndexedTrigger:
+    """
+    A trigger held in the index with its workflow and compiled predicate.
+
+    Attributes:
+        workflow: The workflow definition, with all its components loaded
+        trigger: The trigger
+        matches: Compiled field condition predicate
+    """
+
+    workflow: WorkflowDef
+    trigger: WorkflowTrigger
+    matches: FieldPredicate
+
+
+class WorkflowTriggerIndex:
+    """
+    Index of active workflow triggers keyed by (entity_type, operation).
+
+    Workflows are added with ``add_workflow`` after being loaded with their
+    components. ``invalidate`` removes a workflow and records it as pending
+    reload; ``invalidate_all`` marks the whole index as needing a rebuild.
+
+    Every invalidation increments ``generation``. Loaders read it before
+    loading and pass it to ``rebuild`` or ``reload``, so that invalidations
+    arriving while the workflows are loaded stay pending.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Initialize the index.
+
+        Args:
+            ttl: Optional number of seconds after which the index is considered
+                stale and rebuilt, as a safety net for missed invalidations
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], List[IndexedTrigger]] = {}
+        self._workflow_keys: Dict[str, Set[Tuple[str, str]]] = {}
+        # Pending workflow IDs with the generation of their last invalidation
+        self._pending: Dict[str, int] = {}
+        self._generation = 0
+        self._invalidated_all_at = 0
+        self._loaded_at: Optional[float] = None
+
+        # Statistics
+        self._lookups = 0
+        self._invalidations = 0
+        self._rebuilds = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index is built and not past its TTL."""
+        if self._loaded_at is None:
+            return False
+        if self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl:
+            return False
+        return True
+
+    @property
+    def pending_workflow_ids(self) -> Set[str]:
+        """IDs of invalidated workflows waiting to be reloaded."""
+        return set(self._pending)
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far."""
+        return self._generation
+
+    def rebuild(
+        self, workflows: Iterable[WorkflowDef], generation: Optional[int] = None
+    ) -> List[WorkflowDef]:
+        """
+        Replace the contents of the index.
+
+        Args:
+            workflows: The active workflows, with their components loaded
+            generation: The generation read before loading the workflows,
+                defaults to the current one; workflows invalidated since
+                are left pending, and the index stays unloaded if it was
+                invalidated as a whole since
+
+        Returns:
+            The workflows added to the index
+        """
+        if generation is None:
+            generation = self._generation
+
+        self._entries.clear()
+        self._workflow_keys.clear()
+        self._pending = {
+            workflow_id: invalidated_at
+            for workflow_id, invalidated_at in self._pending.items()
+            if invalidated_at > generation
+        }
+        added = []
+        for workflow in workflows:
+            if workflow.id not in self._pending:
+                self.add_workflow(workflow)
+                added.append(workflow)
+
+        if self._invalidated_all_at <= generation:
+            self._loaded_at = time.monotonic()
+        self._rebuilds += 1
+        return added
+
+    def reload(
+        self,
+        workflows: Iterable[WorkflowDef],
+        workflow_ids: Iterable[str],
+        generation: int,
+    ) -> List[WorkflowDef]:
+        """
+        Replace pending workflows with their reloaded definitions.
+
+        Args:
+            workflows: The reloaded workflows that are still active
+            workflow_ids: The pending workflow IDs that were reloaded
+            generation: The generation read before loading the workflows;
+                workflows invalidated since are left pending
+
+        Returns:
+            The workflows added to the index
+        """
+        loaded = {workflow.id: workflow for workflow in workflows}
+        added = []
+        for workflow_id in workflow_ids:
+            if self._pending.get(workflow_id, 0) > generation:
+                continue
+            self._pending.pop(workflow_id, None)
+            # Workflows that were not reloaded are no longer active
+            workflow = loaded.get(workflow_id)
+            if workflow is not None:
+                self.add_workflow(workflow)
+                added.append(workflow)
+        return added
+
+    def add_workflow(self, workflow: WorkflowDef) -> None:
+        """
+        Add or replace a workflow's active triggers.
+
+        Args:
+            workflow: The workflow, with its components loaded
+        """
+        self.remove_workflow(workflow.id)
+        self._pending.pop(workflow.id, None)
+
+        keys: Set[Tuple[str, str]] = set()
+        for trigger in workflow.triggers:
+            if not trigger.is_active:
+                continue
+            key = (trigger.entity_type, str(trigger.operation))
+            entries = self._entries.setdefault(key, [])
+            entries.append(
+                IndexedTrigger(
+                    workflow=workflow,
+                    trigger=trigger,
+                    matches=compile_field_conditions(trigger.field_conditions),
+                )
+            )
+            entries.sort(key=lambda entry: entry.trigger.priority)
+            keys.add(key)
+
+        if keys:
+            self._workflow_keys[workflow.id] = keys
+
+    def remove_workflow(self, workflow_id: str) -> bool:
+        """
+        Remove a workflow's triggers.
+
+        Args:
+            workflow_id: The workflow ID
+
+        Returns:
+            True if the workflow was indexed, False otherwise
+        """
+        keys = self._workflow_keys.pop(workflow_id, None)
+        if not keys:
+            return False
+
+        for key in keys:
+            remaining = [
+                entry
+                for entry in self._entries.get(key, [])
+                if entry.workflow.id != workflow_id
+            ]
+            if remaining:
+                self._entries[key] = remaining
+            else:
+                self._entries.pop(key, None)
+        return True
+
+    def invalidate(self, workflow_id: str) -> None:
+        """
+        Drop a workflow from the index and mark it for reloading.
+
+        Args:
+            workflow_id: The workflow ID
+        """
+        self.remove_workflow(workflow_id)
+        self._generation += 1
+        self._pending[workflow_id] = self._generation
+        self._invalidations += 1
+
+    def invalidate_all(self) -> None:
+        """Mark the whole index for rebuilding."""
+        self._generation += 1
+        self._invalidated_all_at = self._generation
+        self._loaded_at = None
+        self._invalidations += 1
+
+    def match(
+        self, entity_type: str, operation: Any, payload: Dict[str, Any]
+    ) -> List[Tuple[WorkflowDef, WorkflowTrigger]]:
+        """
+        Find the triggers matching an event, in priority order.
+
+        Args:
+            entity_type: The table name of the event
+            operation: The database operation of the event
+            payload: The event payload
+
+        Returns:
+            List of (workflow, trigger) tuples
+        """
+        self._lookups += 1
+        entries = self._entries.get((entity_type, str(operation)))
+        if not entries:
+            return []
+
+        values = event_payload(operation, payload)
+        return [
+            (entry.workflow, entry.trigger) for entry in entries if entry.matches(values)
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary of index statistics
+        """
+        return {
+            "loaded": self.is_loaded,
+            "workflows": len(self._workflow_keys),
+            "keys": len(self._entries),
+            "triggers": sum(len(entries) for entries in self._entries.values()),
+            "pending": len(self._pending),
+            "lookups": self._lookups,
+            "invalidations": self._invalidations,
+            "rebuilds": self._rebuilds,
+        }
@@ -5,7 +5,7 @@ This module provides utilities for caching query results, computed values,
 and other expensive operations to improve performance.
 """
 
-from typing import TypeVar, Generic, Dict, Any, Optional, List, Set, Callable, Awaitable, Union, cast, Tuple
+from typing import TypeVar, Generic, Dict, Any, Iterable, Optional, List, Set, Callable, Awaitable, Union, cast, Tuple
 import asyncio
 import logging
 import time
@@ -33,6 +33,7 @@ from uno.core.resources import (
     ResourceRegistry,
     get_resource_registry,
 )
+from uno.core.singleflight import SingleFlight, xfetch_due
 
 
 T = TypeVar('T')
@@ -69,6 +70,9 @@ class CacheEntry(Generic[T]):
         access_count: Number of times the entry has been accessed
         size: Size of the entry in bytes (estimated)
         metadata: Additional metadata about the entry
+        stale_until: Timestamp until which the expired entry may be served
+            while it is refreshed
+        compute_time: Time taken to compute the value in seconds
     """
     
     value: T
@@ -78,6 +82,8 @@ class CacheEntry(Generic[T]):
     access_count: int = 0
     size: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    stale_until: Optional[float] = None
+    compute_time: float = 0.0
     
     def is_expired(self, now: Optional[float] = None) -> bool:
         """
@@ -95,6 +101,22 @@ class CacheEntry(Generic[T]):
         now = now or time.time()
         return now > self.expires_at
     
+    def is_dead(self, now: Optional[float] = None) -> bool:
+        """
+        Check if the entry is expired and can no longer be served stale.
+        
+        Args:
+            now: Current timestamp, defaults to time.time()
+            
+        Returns:
+            True if the entry should be removed, False otherwise
+        """
+        now = now or time.time()
+        if not self.is_expired(now):
+            return False
+        
+        return self.stale_until is None or now > self.stale_until
+    
     def access(self) -> None:
         """
         Mark the entry as accessed.
@@ -115,6 +137,8 @@ class Cache(Generic[K, V]):
     - Time-based expiration
     - Thread-safe operations
     - Statistics and monitoring
+    - Coalesced loading in get_or_set, with early refresh and
+      stale-while-revalidate serving
     """
     
     def __init__(
@@ -125,6 +149,8 @@ class Cache(Generic[K, V]):
         max_bytes: Optional[int] = None,
         ttl: Optional[float] = 300.0,
         logger: Optional[logging.Logger] = None,
+        stale_ttl: Optional[float] = None,
+        xfetch_beta: float = 1.0,
     ):
         """
         Initialize the cache.
@@ -136,23 +162,34 @@ class Cache(Generic[K, V]):
             max_bytes: Maximum size of the cache in bytes
             ttl: Time-to-live for cache entries in seconds
             logger: Optional logger instance
+            stale_ttl: How long get_or_set serves an expired entry while
+                refreshing it, in seconds; None disables stale serving
+            xfetch_beta: Eagerness of get_or_set refreshing entries before
+                they expire; 0 disables early refresh
         """
         self.name = name
         self.strategy = strategy
         self.max_size = max_size
         self.max_bytes = max_bytes
         self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.xfetch_beta = xfetch_beta
         self.logger = logger or logging.getLogger(__name__)
         
         # Cache storage
         self._cache: Dict[K, CacheEntry[V]] = {}
         self._lock = AsyncLock()
         
+        # Concurrent loads of the same key in get_or_set
+        self._single_flight: SingleFlight[K, V] = SingleFlight(self.logger)
+        
         # Cache statistics
         self._hits = 0
         self._misses = 0
         self._evictions = 0
         self._expirations = 0
+        self._stale_hits = 0
+        self._early_refreshes = 0
         self._total_bytes = 0
         self._start_time = time.time()
     
@@ -180,9 +217,10 @@ class Cache(Generic[K, V]):
                 return default
             
             if entry.is_expired():
-                # Entry expired
-                self._remove_entry(key)
-                self._expirations += 1
+                # Entry expired; it is kept while get_or_set may serve it stale
+                if entry.is_dead():
+                    self._remove_entry(key)
+                    self._expirations += 1
                 return default
             
             # Cache hit
@@ -196,32 +234,66 @@ class Cache(Generic[K, V]):
         getter: Callable[[], Awaitable[V]],
         ttl: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        stale_ttl: Optional[float] = None,
     ) -> V:
         """
         Get a value from the cache or set it if not found.
         
+        Concurrent misses for the same key call the getter once and share its
+        result. A fresh entry may be refreshed in the background shortly
+        before it expires (XFetch), and an expired entry still within its
+        stale window is returned while it is refreshed in the background.
+        
         Args:
             key: The cache key
             getter: Function to get the value if not in cache
             ttl: Time-to-live for this entry, overrides default
             metadata: Additional metadata for this entry
+            stale_ttl: Stale window for this entry, overrides default
             
         Returns:
             The cached or retrieved value
         """
-        # Try to get from cache first
-        value = await self.get(key)
+        now = time.time()
+        
+        async with self._lock:
+            entry = self._cache.get(key)
+            
+            if entry is not None and entry.is_dead(now):
+                self._remove_entry(key)
+                self._expirations += 1
+                entry = None
+            
+            if entry is None:
+                self._misses += 1
+            else:
+                entry.access()
+                self._hits += 1
         
-        if value is not None:
+        async def load() -> V:
+            start = time.monotonic()
+            value = await getter()
+            await self.set(
+                key,
+                value,
+                ttl,
+                metadata,
+                stale_ttl=stale_ttl,
+                compute_time=time.monotonic() - start,
+            )
             return value
         
-        # Not in cache, get the value
-        value = await getter()
+        if entry is None:
+            return await self._single_flight.do(key, load)
         
-        # Set in cache
-        await self.set(key, value, ttl, metadata)
+        if entry.is_expired(now):
+            self._stale_hits += 1
+            self._single_flight.refresh(key, load)
+        elif xfetch_due(entry.expires_at, entry.compute_time, self.xfetch_beta, now):
+            if self._single_flight.refresh(key, load):
+                self._early_refreshes += 1
         
-        return value
+        return entry.value
     
     async def set(
         self,
@@ -229,6 +301,8 @@ class Cache(Generic[K, V]):
         value: V,
         ttl: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        stale_ttl: Optional[float] = None,
+        compute_time: float = 0.0,
     ) -> None:
         """
         Set a value in the cache.
@@ -238,47 +312,141 @@ class Cache(Generic[K, V]):
             value: The value to cache
             ttl: Time-to-live for this entry, overrides default
             metadata: Additional metadata for this entry
+            stale_ttl: Stale window for this entry, overrides default
+            compute_time: Time taken to compute the value in seconds
+        """
+        entry = self._create_entry(value, time.time(), ttl, metadata, stale_ttl, compute_time)
+        
+        async with self._lock:
+            await self._store_entry(key, entry)
+    
+    async def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """
+        Get several values from the cache under a single lock acquisition.
+        
+        Args:
+            keys: The cache keys
+            
+        Returns:
+            Dictionary of the keys found, with their values
+        """
+        found: Dict[K, V] = {}
+        async with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                
+                if entry is None:
+                    self._misses += 1
+                    continue
+                
+                if entry.is_expired():
+                    if entry.is_dead():
+                        self._remove_entry(key)
+                        self._expirations += 1
+                    continue
+                
+                entry.access()
+                self._hits += 1
+                found[key] = entry.value
+        
+        return found
+    
+    async def set_many(
+        self,
+        items: Dict[K, V],
+        ttl: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Set several values in the cache under a single lock acquisition.
+        
+        Args:
+            items: The values to cache, by key
+            ttl: Time-to-live for these entries, overrides default
+            metadata: Additional metadata for these entries
+            stale_ttl: Stale window for these entries, overrides default
         """
         now = time.time()
+        entries = [
+            (key, self._create_entry(value, now, ttl, metadata, stale_ttl))
+            for key, value in items.items()
+        ]
+        
+        async with self._lock:
+            for key, entry in entries:
+                await self._store_entry(key, entry)
+    
+    def _create_entry(
+        self,
+        value: V,
+        now: float,
+        ttl: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        stale_ttl: Optional[float] = None,
+        compute_time: float = 0.0,
+    ) -> CacheEntry[V]:
+        """
+        Create a cache entry, applying the default TTL and stale window.
+        
+        Args:
+            value: The value to cache
+            now: The current time
+            ttl: Time-to-live for this entry, overrides default
+            metadata: Additional metadata for this entry
+            stale_ttl: Stale window for this entry, overrides default
+            compute_time: Time taken to compute the value in seconds
+            
+        Returns:
+            The cache entry
+        """
         ttl_value = ttl if ttl is not None else self.ttl
         expires_at = now + ttl_value if ttl_value is not None else None
+        stale_value = stale_ttl if stale_ttl is not None else self.stale_ttl
+        stale_until = expires_at + stale_value if expires_at is not None and stale_value else None
         
-        # Estimate size
-        size = self._estimate_size(value)
-        
-        # Create entry
-        entry = CacheEntry(
+        return CacheEntry(
             value=value,
             created_at=now,
             expires_at=expires_at,
             last_accessed=now,
             access_count=0,
-            size=size,
+            size=self._estimate_size(value),
             metadata=metadata or {},
+            stale_until=stale_until,
+            compute_time=compute_time,
         )
+    
+    async def _store_entry(self, key: K, entry: CacheEntry[V]) -> None:
+        """
+        Store an entry, evicting others if needed. Must be called with the
+        lock held.
         
-        async with self._lock:
-            # Check if we need to evict entries
-            if self.max_size is not None and len(self._cache) >= self.max_size:
-                await self._evict_entries()
-            
-            # Check if we need to evict based on size
-            if self.max_bytes is not None:
-                existing_size = self._total_bytes
-                if key in self._cache:
-                    existing_size -= self._cache[key].size
-                
-                if existing_size + size > self.max_bytes:
-                    await self._evict_entries(needed_bytes=size)
-            
-            # Update total size
+        Args:
+            key: The cache key
+            entry: The entry to store
+        """
+        # Check if we need to evict entries
+        if self.max_size is not None and len(self._cache) >= self.max_size:
+            await self._evict_entries()
+        
+        # Check if we need to evict based on size
+        if self.max_bytes is not None:
+            existing_size = self._total_bytes
             if key in self._cache:
-                self._total_bytes -= self._cache[key].size
-            
-            self._total_bytes += size
+                existing_size -= self._cache[key].size
             
-            # Store in cache
-            self._cache[key] = entry
+            if existing_size + entry.size > self.max_bytes:
+                await self._evict_entries(needed_bytes=entry.size)
+        
+        # Update total size
+        if key in self._cache:
+            self._total_bytes -= self._cache[key].size
+        
+        self._total_bytes += entry.size
+        
+        # Store in cache
+        self._cache[key] = entry
     
     async def delete(self, key: K) -> bool:
         """
@@ -333,7 +501,7 @@ class Cache(Generic[K, V]):
         now = time.time()
         expired_keys = [
             k for k, v in self._cache.items()
-            if v.is_expired(now)
+            if v.is_dead(now)
         ]
         
         for key in expired_keys:
@@ -418,7 +586,7 @@ class Cache(Generic[K, V]):
             now = time.time()
             expired_keys = [
                 k for k, v in self._cache.items()
-                if v.is_expired(now)
+                if v.is_dead(now)
             ]
             
             for key in expired_keys:
@@ -484,6 +652,9 @@ class Cache(Generic[K, V]):
                 "hit_rate": hit_rate,
                 "evictions": self._evictions,
                 "expirations": self._expirations,
+                "stale_hits": self._stale_hits,
+                "early_refreshes": self._early_refreshes,
+                "single_flight": self._single_flight.get_stats(),
                 "uptime": time.time() - self._start_time,
             }
 
@@ -497,6 +668,7 @@ class QueryCache(Generic[K, V]):
     - Tag-based invalidation
     - Background refresh
     - Stale-while-revalidate behavior
+    - Coalesced loading and early refresh (XFetch) in get_or_set
     """
     
     def __init__(
@@ -508,6 +680,7 @@ class QueryCache(Generic[K, V]):
         ttl: Optional[float] = 60.0,
         stale_ttl: Optional[float] = 300.0,
         logger: Optional[logging.Logger] = None,
+        xfetch_beta: float = 1.0,
     ):
         """
         Initialize the query cache.
@@ -520,10 +693,13 @@ class QueryCache(Generic[K, V]):
             ttl: Time-to-live for cache entries in seconds
             stale_ttl: Time-to-live for stale cache entries in seconds
             logger: Optional logger instance
+            xfetch_beta: Eagerness of refreshing entries with a refresh
+                function before they expire; 0 disables early refresh
         """
         self.name = name
         self.ttl = ttl
         self.stale_ttl = stale_ttl or (ttl * 5 if ttl else 300.0)
+        self.xfetch_beta = xfetch_beta
         self.logger = logger or logging.getLogger(__name__)
         
         # Create the underlying cache
@@ -544,6 +720,10 @@ class QueryCache(Generic[K, V]):
         # Background refresh
         self._refresh_tasks: Dict[K, asyncio.Task] = {}
         self._refresh_lock = AsyncLock()
+        self._early_refreshes = 0
+        
+        # Concurrent loads of the same key in get_or_set
+        self._single_flight: SingleFlight[K, V] = SingleFlight(self.logger)
     
     async def get(
         self,
@@ -566,22 +746,100 @@ class QueryCache(Generic[K, V]):
         if entry is None:
             return default
         
+        return await self._entry_result(key, entry)
+    
+    async def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """
+        Get several query results from the cache with one cache lookup.
+        
+        Args:
+            keys: The query keys
+            
+        Returns:
+            Dictionary of the keys found, with their results
+        """
+        entries = await self.cache.get_many(keys)
+        return {key: await self._entry_result(key, entry) for key, entry in entries.items()}
+    
+    async def _entry_result(self, key: K, entry: Dict[str, Any]) -> V:
+        """
+        Get the result of a cache entry, refreshing the entry if it is stale
+        or about to expire.
+        
+        Args:
+            key: The query key
+            entry: The cache entry
+            
+        Returns:
+            The cached query result
+        """
         # Check if entry needs refresh
         now = time.time()
         metadata = entry.get("metadata", {})
         expires_at = metadata.get("expires_at")
         
+        refresh_func = metadata.get("refresh_func")
+        
         if expires_at is not None and now > expires_at:
             # Entry is stale but still usable
-            refresh_func = metadata.get("refresh_func")
-            
             if refresh_func is not None:
                 # Start background refresh
                 await self._start_refresh(key, refresh_func)
         
+        elif refresh_func is not None and xfetch_due(
+            expires_at, metadata.get("compute_time", 0.0), self.xfetch_beta, now
+        ):
+            # Refresh shortly before expiry so readers never see it stale
+            if await self._start_refresh(key, refresh_func):
+                self._early_refreshes += 1
+        
         # Return the result
         return entry.get("result")
     
+    async def get_or_set(
+        self,
+        key: K,
+        getter: Callable[[], Awaitable[V]],
+        tags: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+        refresh_func: Optional[Callable[[], Awaitable[V]]] = None,
+    ) -> V:
+        """
+        Get a query result from the cache or compute and cache it.
+        
+        Concurrent misses for the same key run the getter once and share its
+        result.
+        
+        Args:
+            key: The query key
+            getter: Function computing the result if not in cache
+            tags: List of tags for invalidation
+            ttl: Time-to-live for this entry, overrides default
+            refresh_func: Function to refresh the entry when stale
+            
+        Returns:
+            The cached or computed query result
+        """
+        result = await self.get(key)
+        
+        if result is not None:
+            return result
+        
+        async def load() -> V:
+            start = time.monotonic()
+            result = await getter()
+            await self.set(
+                key=key,
+                result=result,
+                tags=tags,
+                ttl=ttl,
+                refresh_func=refresh_func,
+                compute_time=time.monotonic() - start,
+            )
+            return result
+        
+        return await self._single_flight.do(key, load)
+    
     async def set(
         self,
         key: K,
@@ -589,6 +847,7 @@ class QueryCache(Generic[K, V]):
         tags: Optional[List[str]] = None,
         ttl: Optional[float] = None,
         refresh_func: Optional[Callable[[], Awaitable[V]]] = None,
+        compute_time: float = 0.0,
     ) -> None:
         """
         Set a query result in the cache.
@@ -599,34 +858,90 @@ class QueryCache(Generic[K, V]):
             tags: List of tags for invalidation
             ttl: Time-to-live for this entry, overrides default
             refresh_func: Function to refresh the entry when stale
+            compute_time: Time taken to compute the result in seconds
         """
-        ttl_value = ttl if ttl is not None else self.ttl
+        entry = self._create_entry(result, time.time(), tags, ttl, refresh_func, compute_time)
+        
+        # Store in cache
+        await self.cache.set(key, entry)
+        
+        # Update tag mappings
+        if tags:
+            await self._update_tags(key, tags)
+    
+    async def set_many(
+        self,
+        results: Dict[K, V],
+        tags: Optional[Dict[K, List[str]]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Set several query results in the cache with one cache write.
+        
+        Args:
+            results: The query results, by key
+            tags: Lists of tags for invalidation, by key
+            ttl: Time-to-live for these entries, overrides default
+        """
+        tags = tags or {}
         now = time.time()
         
+        # Store in cache
+        await self.cache.set_many(
+            {
+                key: self._create_entry(result, now, tags.get(key), ttl)
+                for key, result in results.items()
+            }
+        )
+        
+        # Update tag mappings
+        async with self._tag_lock:
+            for key in results:
+                if tags.get(key):
+                    self._replace_tags(key, tags[key])
+    
+    def _create_entry(
+        self,
+        result: V,
+        now: float,
+        tags: Optional[List[str]] = None,
+        ttl: Optional[float] = None,
+        refresh_func: Optional[Callable[[], Awaitable[V]]] = None,
+        compute_time: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Create a cache entry for a query result.
+        
+        Args:
+            result: The query result
+            now: The current time
+            tags: List of tags for invalidation
+            ttl: Time-to-live for this entry, overrides default
+            refresh_func: Function to refresh the entry when stale
+            compute_time: Time taken to compute the result in seconds
+            
+        Returns:
+            The cache entry, holding the result and its metadata
+        """
+        ttl_value = ttl if ttl is not None else self.ttl
+        
         # Create metadata
         metadata = {
             "created_at": now,
             "expires_at": now + ttl_value if ttl_value is not None else None,
             "stale_at": now + self.stale_ttl if self.stale_ttl is not None else None,
             "tags": tags or [],
+            "compute_time": compute_time,
         }
         
         # Store refresh function if provided
         if refresh_func is not None:
             metadata["refresh_func"] = refresh_func
         
-        # Create cache entry
-        entry = {
+        return {
             "result": result,
             "metadata": metadata,
         }
-        
-        # Store in cache
-        await self.cache.set(key, entry)
-        
-        # Update tag mappings
-        if tags:
-            await self._update_tags(key, tags)
     
     async def invalidate(
         self,
@@ -692,6 +1007,19 @@ class QueryCache(Generic[K, V]):
             
             return count
     
+    async def get_keys_for_tag(self, tag: str) -> Set[K]:
+        """
+        Get the keys of the entries associated with a tag.
+        
+        Args:
+            tag: The tag
+            
+        Returns:
+            Set of keys with the tag
+        """
+        async with self._tag_lock:
+            return set(self._tag_to_keys.get(tag, set()))
+    
     async def _update_tags(self, key: K, tags: List[str]) -> None:
         """
         Update tag mappings for a key.
@@ -701,46 +1029,61 @@ class QueryCache(Generic[K, V]):
             tags: List of tags
         """
         async with self._tag_lock:
-            # Remove old tags
-            old_tags = self._key_to_tags.pop(key, set())
-            
-            for tag in old_tags:
-                keys = self._tag_to_keys.get(tag, set())
-                keys.discard(key)
-                
-                if not keys:
-                    self._tag_to_keys.pop(tag, None)
+            self._replace_tags(key, tags)
+    
+    def _replace_tags(self, key: K, tags: List[str]) -> None:
+        """
+        Replace the tag mappings of a key. Must be called with the tag lock
+        held.
+        
+        Args:
+            key: The query key
+            tags: List of tags
+        """
+        # Remove old tags
+        old_tags = self._key_to_tags.pop(key, set())
+        
+        for tag in old_tags:
+            keys = self._tag_to_keys.get(tag, set())
+            keys.discard(key)
             
-            # Add new tags
-            self._key_to_tags[key] = set(tags)
+            if not keys:
+                self._tag_to_keys.pop(tag, None)
+        
+        # Add new tags
+        self._key_to_tags[key] = set(tags)
+        
+        for tag in tags:
+            if tag not in self._tag_to_keys:
+                self._tag_to_keys[tag] = set()
             
-            for tag in tags:
-                if tag not in self._tag_to_keys:
-                    self._tag_to_keys[tag] = set()
-                
-                self._tag_to_keys[tag].add(key)
+            self._tag_to_keys[tag].add(key)
     
     async def _start_refresh(
         self,
         key: K,
         refresh_func: Any,
-    ) -> None:
+    ) -> bool:
         """
         Start background refresh for a cache entry.
         
         Args:
             key: The query key
             refresh_func: Function to refresh the entry
+            
+        Returns:
+            True if a refresh was started, False if one is already running
         """
         async with self._refresh_lock:
             # Check if already refreshing
             if key in self._refresh_tasks and not self._refresh_tasks[key].done():
-                return
+                return False
             
             # Create and start refresh task
             self._refresh_tasks[key] = asyncio.create_task(
                 self._refresh_entry(key, refresh_func)
             )
+            return True
     
     async def _refresh_entry(
         self,
@@ -756,7 +1099,9 @@ class QueryCache(Generic[K, V]):
         """
         try:
             # Call the refresh function
+            start = time.monotonic()
             result = await refresh_func()
+            compute_time = time.monotonic() - start
             
             # Get existing entry
             entry = await self.cache.get(key)
@@ -774,6 +1119,7 @@ class QueryCache(Generic[K, V]):
                 result=result,
                 tags=tags,
                 refresh_func=refresh_func,
+                compute_time=compute_time,
             )
             
             self.logger.debug(f"Refreshed cache entry: {key}")
@@ -802,6 +1148,8 @@ class QueryCache(Generic[K, V]):
                 "tags": len(self._tag_to_keys),
                 "tagged_keys": sum(len(keys) for keys in self._tag_to_keys.values()),
                 "active_refreshes": sum(1 for task in self._refresh_tasks.values() if not task.done()),
+                "early_refreshes": self._early_refreshes,
+                "single_flight": self._single_flight.get_stats(),
             })
         
         return stats
@@ -1314,19 +1662,8 @@ def cached(
                 # Fall back to simple key if args are not hashable
                 key = f"{key_prefix}:{id(args)}:{id(kwargs)}"
             
-            # Try to get from cache
-            result = await cache.get(key)
-            
-            if result is not None:
-                return result
-            
-            # Not in cache, call the function
-            result = await func(*args, **kwargs)
-            
-            # Store in cache
-            await cache.set(key, result)
-            
-            return result
+            # Get from cache, calling the function once for concurrent misses
+            return await cache.get_or_set(key, lambda: func(*args, **kwargs))
         
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -14,6 +14,7 @@ from uno.core.monitoring.metrics import (
     Counter,
     Gauge,
     Histogram,
+    HistogramSnapshot,
     Timer,
     MetricsExporter,
     PrometheusExporter,
@@ -85,6 +86,7 @@ __all__ = [
     "Counter",
     "Gauge",
     "Histogram",
+    "HistogramSnapshot",
     "Timer",
     "MetricsExporter",
     "PrometheusExporter",
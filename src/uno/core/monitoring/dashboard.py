@@ -27,7 +27,7 @@ from uno.core.monitoring.health import (
     HealthRegistry, HealthStatus, get_health_registry
 )
 from uno.core.monitoring.metrics import (
-    MetricsRegistry, get_metrics_registry, MetricValue, MetricType
+    MetricsRegistry, get_metrics_registry, MetricValue, MetricType, HistogramSnapshot
 )
 from uno.core.monitoring.events import (
     EventLogger, get_event_logger, EventLevel
@@ -317,8 +317,8 @@ class MonitoringDashboard:
                 
                 # Add value with tags
                 simplified[name]["values"].append({
-                    "value": metric.value if not isinstance(metric.value, list) else None,
-                    "histogram": metric.value if isinstance(metric.value, list) else None,
+                    "value": metric.value if not isinstance(metric.value, HistogramSnapshot) else None,
+                    "histogram": metric.value.to_dict() if isinstance(metric.value, HistogramSnapshot) else None,
                     "tags": metric.tags,
                     "timestamp": metric.timestamp
                 })
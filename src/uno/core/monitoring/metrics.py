@@ -9,13 +9,13 @@ This module provides utilities for collecting and exporting application metrics,
 including counters, gauges, histograms, and timers.
 """
 
-from typing import Dict, List, Any, Optional, Callable, TypeVar, Generic, Union, Set, Awaitable
+from typing import Dict, List, Any, Optional, Callable, TypeVar, Generic, Union, Set, Awaitable, Sequence, Tuple, Iterator
 import asyncio
 import time
 import logging
 import functools
 import json
-import statistics
+import math
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from enum import Enum
@@ -50,11 +50,48 @@ class MetricUnit(Enum):
     PERCENT = "percent"
 
 
+# Default upper bounds of the cumulative buckets exported for histograms
+DEFAULT_HISTOGRAM_BUCKETS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Point-in-time summary of a histogram."""
+    count: int = 0
+    sum: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+    quantiles: Dict[str, float] = field(default_factory=dict)
+    buckets: List[Tuple[float, int]] = field(default_factory=list)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values."""
+        return self.sum / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the snapshot to a JSON-serializable dictionary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            **self.quantiles,
+            "buckets": [
+                ["+Inf" if math.isinf(bound) else bound, count]
+                for bound, count in self.buckets
+            ],
+        }
+
+
 @dataclass
 class MetricValue:
     """Value of a metric with metadata."""
     name: str
-    value: Union[int, float, List[float]]
+    value: Union[int, float, List[float], HistogramSnapshot]
     type: MetricType
     unit: MetricUnit = MetricUnit.NONE
     tags: Dict[str, str] = field(default_factory=dict)
@@ -133,12 +170,14 @@ class Counter(Metric[int]):
         super().__init__(name, description, unit, tags)
         self._type = MetricType.COUNTER
         self._value = 0
-        self._lock = asyncio.Lock()
     
-    async def increment(self, value: int = 1) -> None:
+    def inc(self, value: int = 1) -> None:
         """
         Increment the counter.
         
+        The update is a single in-place addition, so no lock is needed for
+        callers on the event loop.
+        
         Args:
             value: Amount to increment by (default 1)
         
@@ -148,8 +187,21 @@ class Counter(Metric[int]):
         if value < 0:
             raise ValueError("Cannot decrement a counter")
         
-        async with self._lock:
-            self._value += value
+        self._value += value
+    
+    async def increment(self, value: int = 1) -> None:
+        """
+        Increment the counter.
+        
+        Awaitable form of ``inc``.
+        
+        Args:
+            value: Amount to increment by (default 1)
+        
+        Raises:
+            ValueError: If value is negative
+        """
+        self.inc(value)
     
     def get_value(self) -> MetricValue:
         """Get the current value of the counter."""
@@ -270,12 +322,17 @@ class GaugeTracker:
         await self.gauge.decrement()
 
 
-class Histogram(Metric[List[float]]):
+class Histogram(Metric[HistogramSnapshot]):
     """
     Histogram metric for tracking distributions.
     
     Histograms are useful for tracking things like request duration,
     response size, or other values that you want to analyze statistically.
+    
+    Values are counted in logarithmically sized buckets (as in DDSketch),
+    so any quantile is reported within ``relative_accuracy`` of the true
+    value while memory stays bounded by ``max_size`` buckets regardless of
+    how many values are recorded. Count, sum, min and max are exact.
     """
     
     def __init__(
@@ -285,6 +342,8 @@ class Histogram(Metric[List[float]]):
         unit: MetricUnit = MetricUnit.NONE,
         tags: Optional[Dict[str, str]] = None,
         max_size: int = 1000,
+        relative_accuracy: float = 0.01,
+        buckets: Optional[Sequence[float]] = None,
     ):
         """
         Initialize a histogram.
@@ -294,32 +353,191 @@ class Histogram(Metric[List[float]]):
             description: Description of the histogram
             unit: Unit of measurement
             tags: Tags to attach to the histogram
-            max_size: Maximum number of values to track
+            max_size: Maximum number of buckets to keep; beyond this the
+                buckets of the smallest values are merged
+            relative_accuracy: Relative error of reported quantiles
+            buckets: Upper bounds of the cumulative buckets used for export
         """
         super().__init__(name, description, unit, tags)
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        
         self._type = MetricType.HISTOGRAM
-        self._values: List[float] = []
-        self._lock = asyncio.Lock()
         self._max_size = max_size
+        self._relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self._export_buckets = tuple(sorted(buckets or DEFAULT_HISTOGRAM_BUCKETS))
+        self.reset()
+    
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._positive_floor: Optional[int] = None
+        self._negative_floor: Optional[int] = None
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+    
+    def add(self, value: float) -> None:
+        """
+        Record a value in the histogram.
+        
+        Recording is a constant-time bucket increment and takes no lock.
+        
+        Args:
+            value: Value to record
+        """
+        self._count += 1
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        
+        if value > _MIN_INDEXABLE:
+            self._positive_floor = self._increment(
+                self._positive, self._key(value), self._positive_floor
+            )
+        elif value < -_MIN_INDEXABLE:
+            self._negative_floor = self._increment(
+                self._negative, self._key(-value), self._negative_floor
+            )
+        else:
+            self._zero_count += 1
     
     async def observe(self, value: float) -> None:
         """
         Record a value in the histogram.
         
+        Awaitable form of ``add``.
+        
         Args:
             value: Value to record
         """
-        async with self._lock:
-            self._values.append(value)
-            # Trim if necessary
-            if len(self._values) > self._max_size:
-                self._values = self._values[-self._max_size:]
+        self.add(value)
+    
+    def _key(self, magnitude: float) -> int:
+        """Get the bucket key of a positive magnitude."""
+        return math.ceil(math.log(magnitude) * self._multiplier)
+    
+    def _increment(self, store: Dict[int, int], key: int, floor: Optional[int]) -> Optional[int]:
+        """
+        Count a value in a bucket store, collapsing the lowest buckets.
+        
+        Args:
+            store: The bucket counts
+            key: The bucket key of the value
+            floor: Keys below the floor are counted in the floor bucket
+            
+        Returns:
+            The new floor
+        """
+        if floor is not None and key < floor:
+            key = floor
+        
+        if key in store:
+            store[key] += 1
+            return floor
+        
+        store[key] = 1
+        if len(store) > self._max_size:
+            # Merge the two lowest buckets; values below the new lowest key
+            # are counted in it from now on
+            lowest = min(store)
+            count = store.pop(lowest)
+            floor = min(store)
+            store[floor] += count
+        return floor
+    
+    def _bucket_value(self, key: int) -> float:
+        """Get the value representing a bucket."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+    
+    def _ordered_buckets(self) -> Iterator[Tuple[float, int]]:
+        """Iterate over (representative value, count) in ascending order."""
+        for key in sorted(self._negative, reverse=True):
+            yield -self._bucket_value(key), self._negative[key]
+        if self._zero_count:
+            yield 0.0, self._zero_count
+        for key in sorted(self._positive):
+            yield self._bucket_value(key), self._positive[key]
+    
+    def quantile(self, q: float) -> float:
+        """
+        Get the value at a quantile.
+        
+        Args:
+            q: Quantile between 0 and 1
+            
+        Returns:
+            The estimated value, or 0.0 if no values were recorded
+        """
+        if not self._count:
+            return 0.0
+        
+        rank = q * (self._count - 1)
+        seen = 0
+        value = self._max
+        for value, count in self._ordered_buckets():
+            seen += count
+            if seen > rank:
+                break
+        return min(max(value, self._min), self._max)
+    
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        Get a summary of the recorded values.
+        
+        Returns:
+            Snapshot with count, sum, extremes, quantiles and cumulative buckets
+        """
+        if not self._count:
+            return HistogramSnapshot(
+                quantiles={name: 0.0 for name in _SNAPSHOT_QUANTILES},
+                buckets=[(bound, 0) for bound in self._export_buckets] + [(math.inf, 0)],
+            )
+        
+        # Walk the buckets once, filling quantiles and export buckets together
+        targets = sorted(
+            (q * (self._count - 1), name) for name, q in _SNAPSHOT_QUANTILES.items()
+        )
+        quantiles: Dict[str, float] = {}
+        cumulative: List[Tuple[float, int]] = []
+        bounds = iter(self._export_buckets)
+        bound = next(bounds, None)
+        seen = 0
+        for value, count in self._ordered_buckets():
+            while bound is not None and value > bound:
+                cumulative.append((bound, seen))
+                bound = next(bounds, None)
+            seen += count
+            while targets and seen > targets[0][0]:
+                quantiles[targets.pop(0)[1]] = min(max(value, self._min), self._max)
+        while bound is not None:
+            cumulative.append((bound, seen))
+            bound = next(bounds, None)
+        cumulative.append((math.inf, self._count))
+        for _, name in targets:
+            quantiles[name] = self._max
+        
+        return HistogramSnapshot(
+            count=self._count,
+            sum=self._sum,
+            min=self._min,
+            max=self._max,
+            quantiles={name: quantiles[name] for name in _SNAPSHOT_QUANTILES},
+            buckets=cumulative,
+        )
     
     def get_value(self) -> MetricValue:
-        """Get the current values in the histogram."""
+        """Get a snapshot of the histogram."""
         return MetricValue(
             name=self.name,
-            value=self._values.copy(),
+            value=self.snapshot(),
             type=self._type,
             unit=self.unit,
             tags=self.tags,
@@ -333,30 +551,29 @@ class Histogram(Metric[List[float]]):
         Returns:
             Dictionary of statistical measures
         """
-        async with self._lock:
-            if not self._values:
-                return {
-                    "count": 0,
-                    "min": 0.0,
-                    "max": 0.0,
-                    "mean": 0.0,
-                    "median": 0.0,
-                    "p95": 0.0,
-                    "p99": 0.0,
-                }
-            
-            values = sorted(self._values)
-            count = len(values)
-            
-            return {
-                "count": count,
-                "min": min(values),
-                "max": max(values),
-                "mean": statistics.mean(values),
-                "median": statistics.median(values),
-                "p95": values[int(count * 0.95) - 1] if count >= 20 else values[-1],
-                "p99": values[int(count * 0.99) - 1] if count >= 100 else values[-1],
-            }
+        snapshot = self.snapshot()
+        return {
+            "count": snapshot.count,
+            "min": snapshot.min,
+            "max": snapshot.max,
+            "mean": snapshot.mean,
+            "median": snapshot.quantiles["p50"],
+            "p95": snapshot.quantiles["p95"],
+            "p99": snapshot.quantiles["p99"],
+            "p999": snapshot.quantiles["p999"],
+        }
+
+
+# Magnitudes at or below this are counted as zero by histograms
+_MIN_INDEXABLE = 1e-9
+
+# Quantiles reported in histogram snapshots
+_SNAPSHOT_QUANTILES: Dict[str, float] = {
+    "p50": 0.5,
+    "p95": 0.95,
+    "p99": 0.99,
+    "p999": 0.999,
+}
 
 
 class Timer(Metric[float]):
@@ -405,31 +622,34 @@ class Timer(Metric[float]):
             yield
         finally:
             duration = (time.time() - start_time) * 1000  # Convert to ms
-            asyncio.create_task(self._histogram.observe(duration))
+            self._histogram.add(duration)
+    
+    def add(self, duration: float) -> None:
+        """
+        Record a duration directly.
+        
+        Args:
+            duration: Duration in milliseconds
+        """
+        self._histogram.add(duration)
     
     async def record(self, duration: float) -> None:
         """
         Record a duration directly.
         
+        Awaitable form of ``add``.
+        
         Args:
             duration: Duration in milliseconds
         """
-        await self._histogram.observe(duration)
+        self._histogram.add(duration)
     
     def get_value(self) -> MetricValue:
         """Get the current value of the timer."""
         # For timers, the value is the mean of recorded durations
-        histogram_value = self._histogram.get_value()
-        values = histogram_value.value
-        
-        if not values:
-            mean = 0.0
-        else:
-            mean = statistics.mean(values)
-        
         return MetricValue(
             name=self.name,
-            value=mean,
+            value=self._histogram.snapshot().mean,
             type=self._type,
             unit=self.unit,
             tags=self.tags,
@@ -633,24 +853,14 @@ class PrometheusExporter(MetricsExporter):
                         
                         # Format value based on type
                         if metric.type == MetricType.HISTOGRAM:
-                            # For histograms, we export count, sum, and buckets
-                            values = metric.value
-                            if values:
-                                # Count
-                                output.append(f"{prometheus_name}_count{tag_str} {len(values)}")
-                                # Sum
-                                output.append(f"{prometheus_name}_sum{tag_str} {sum(values)}")
-                                # Buckets (simplified)
-                                if len(values) >= 100:
-                                    sorted_values = sorted(values)
-                                    p50 = sorted_values[len(sorted_values) // 2]
-                                    p95 = sorted_values[int(len(sorted_values) * 0.95)]
-                                    p99 = sorted_values[int(len(sorted_values) * 0.99)]
-                                    
-                                    output.append(f"{prometheus_name}_bucket{{le=\"50\"{tag_str[1:-1]}}} {len([v for v in values if v <= p50])}")
-                                    output.append(f"{prometheus_name}_bucket{{le=\"95\"{tag_str[1:-1]}}} {len([v for v in values if v <= p95])}")
-                                    output.append(f"{prometheus_name}_bucket{{le=\"99\"{tag_str[1:-1]}}} {len([v for v in values if v <= p99])}")
-                                    output.append(f"{prometheus_name}_bucket{{le=\"+Inf\"{tag_str[1:-1]}}} {len(values)}")
+                            # For histograms, we export cumulative buckets, sum and count
+                            snapshot = metric.value
+                            tag_suffix = "," + tag_str[1:-1] if tag_str else ""
+                            for bound, count in snapshot.buckets:
+                                le = "+Inf" if math.isinf(bound) else f"{bound:g}"
+                                output.append(f"{prometheus_name}_bucket{{le=\"{le}\"{tag_suffix}}} {count}")
+                            output.append(f"{prometheus_name}_sum{tag_str} {snapshot.sum}")
+                            output.append(f"{prometheus_name}_count{tag_str} {snapshot.count}")
                         else:
                             # Simple value
                             output.append(f"{prometheus_name}{tag_str} {metric.value}")
@@ -696,7 +906,7 @@ class LoggingExporter(MetricsExporter):
             
             # Add value with tags
             grouped[name]["values"].append({
-                "value": metric.value if not isinstance(metric.value, list) else f"[{len(metric.value)} values]",
+                "value": metric.value.to_dict() if isinstance(metric.value, HistogramSnapshot) else metric.value,
                 "tags": metric.tags
             })
         
@@ -1225,7 +1435,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         }
         
         # Track request count and in-progress
-        await self.request_counter.increment()
+        self.request_counter.inc()
         await self.request_in_progress.increment()
         
         # Track request duration
@@ -1246,7 +1456,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             # Track response metrics
             response_size = int(response.headers.get("content-length", 0))
             if response_size > 0:
-                await self.response_size.observe(response_size)
+                self.response_size.add(response_size)
             
             return response
         
@@ -1255,7 +1465,7 @@ class MetricsMiddleware(BaseHTTPMiddleware):
             duration = (time.time() - start_time) * 1000  # Convert to ms
             
             # Record request duration
-            await self.request_duration.observe(duration)
+            self.request_duration.add(duration)
             
             # Decrement in-progress counter
             await self.request_in_progress.decrement()
\ No newline at end of file
@@ -206,7 +206,7 @@ class TransactionMetricsTracker:
             self._current_transactions[transaction_id] = metrics
         
         # Record isolation level
-        await self.isolation_level_counter.increment()
+        self.isolation_level_counter.inc()
         
         return metrics
     
@@ -235,25 +235,25 @@ class TransactionMetricsTracker:
                 metrics.complete(success, error)
                 
                 # Record metrics
-                await self.transaction_counter.increment()
-                await self.transaction_timer.record(metrics.duration_ms)
-                await self.query_counter.increment(metrics.query_count)
+                self.transaction_counter.inc()
+                self.transaction_timer.add(metrics.duration_ms)
+                self.query_counter.inc(metrics.query_count)
                 
                 if metrics.row_count > 0:
-                    await self.row_histogram.observe(metrics.row_count)
+                    self.row_histogram.add(metrics.row_count)
                 
                 if metrics.savepoints > 0:
-                    await self.savepoint_counter.increment(metrics.savepoints)
+                    self.savepoint_counter.inc(metrics.savepoints)
                 
                 if metrics.rollbacks_to_savepoint > 0:
-                    await self.rollback_to_savepoint_counter.increment(
+                    self.rollback_to_savepoint_counter.inc(
                         metrics.rollbacks_to_savepoint
                     )
                 
                 if success:
-                    await self.transaction_success_counter.increment()
+                    self.transaction_success_counter.inc()
                 else:
-                    await self.transaction_failure_counter.increment()
+                    self.transaction_failure_counter.inc()
                 
                 # Store in history and remove from current
                 self._transaction_history.append(metrics)
@@ -29,6 +29,9 @@ from uno.core.multitenancy.domain_services import (
     TenantService, UserTenantService, TenantInvitationService
 )
 
+# Domain events
+from uno.core.multitenancy.events import TenantStatusChanged, TenantUpdated
+
 # Domain provider
 from uno.core.multitenancy.domain_provider import (
     MultitenancyProvider, TestingMultitenancyProvider
@@ -49,6 +52,9 @@ from uno.core.multitenancy.middleware import (
     TenantHostMiddleware, TenantPathMiddleware
 )
 
+# Caching
+from uno.core.multitenancy.cache import TenantCache, TenantInfo
+
 # Legacy components (deprecated)
 from uno.core.multitenancy.isolation import (
     RLSIsolationStrategy, SuperuserBypassMixin, AdminTenantMixin
@@ -84,6 +90,9 @@ __all__ = [
     "TenantServiceProtocol", "UserTenantServiceProtocol", "TenantInvitationServiceProtocol",
     "TenantService", "UserTenantService", "TenantInvitationService",
     
+    # Domain Events
+    "TenantStatusChanged", "TenantUpdated",
+    
     # Domain Provider
     "MultitenancyProvider", "TestingMultitenancyProvider",
     
@@ -98,6 +107,9 @@ __all__ = [
     "TenantIdentificationMiddleware", "TenantHeaderMiddleware",
     "TenantHostMiddleware", "TenantPathMiddleware",
     
+    # Caching
+    "TenantCache", "TenantInfo",
+    
     # Legacy components (deprecated)
     "TenantAwareRepository", "TenantRepository", "UserTenantAssociationRepository",
     "TenantService", "TenantAdminService", "TenantConfig", "TenantConfigService",
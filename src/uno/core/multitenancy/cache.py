@@ -0,0 +1,271 @@
+"""
+Tenant metadata and configuration caching.
+
+Resolving the tenant of a request costs a database round-trip. This module
+caches tenant metadata and merged tenant configurations in process, bounded
+by size and TTL, caches lookups of unknown tenants for a shorter TTL, and
+invalidates entries when tenant events are published.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import logging
+import time
+
+from uno.core.protocols import EventBus
+from uno.core.singleflight import SingleFlight
+from uno.core.multitenancy.events import TenantStatusChanged, TenantUpdated
+
+
+def _plain(value: Any) -> Any:
+    """Unwrap value objects and enums to their plain value."""
+    return getattr(value, "value", value)
+
+
+@dataclass(frozen=True)
+class TenantInfo:
+    """
+    Snapshot of the tenant metadata needed to resolve requests.
+    
+    Attributes:
+        id: The tenant ID
+        status: The tenant status
+        slug: The tenant slug
+        domain: The tenant's custom domain
+        tier: The tenant tier
+    """
+    
+    id: str
+    status: str
+    slug: Optional[str] = None
+    domain: Optional[str] = None
+    tier: Optional[str] = None
+    
+    @property
+    def is_active(self) -> bool:
+        """Whether the tenant is active."""
+        return self.status == "active"
+    
+    @classmethod
+    def from_tenant(cls, tenant: Any) -> "TenantInfo":
+        """
+        Create a snapshot of a tenant model or entity.
+        
+        Args:
+            tenant: The tenant
+            
+        Returns:
+            The tenant metadata
+        """
+        return cls(
+            id=str(_plain(tenant.id)),
+            status=str(_plain(tenant.status)),
+            slug=_plain(getattr(tenant, "slug", None)),
+            domain=getattr(tenant, "domain", None),
+            tier=getattr(tenant, "tier", None),
+        )
+
+
+class TenantCache:
+    """
+    TTL and LRU bounded cache of tenant metadata and configurations.
+    
+    Loads of the same entry are coalesced. A load that returns None is
+    cached for ``negative_ttl`` seconds, so requests for unknown tenants do
+    not reach the database either. Subscribed to an event bus, the cache
+    drops a tenant's entries when the tenant's status, properties or
+    settings change.
+    
+    The cache is meant to be used from a single event loop.
+    """
+    
+    TENANT = "tenant"
+    CONFIG = "config"
+    
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 30.0,
+        negative_ttl: float = 5.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries
+            ttl: Time-to-live for entries in seconds
+            negative_ttl: Time-to-live for unknown tenants in seconds
+            logger: Optional logger instance
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._single_flight: SingleFlight[Tuple[str, str], Any] = SingleFlight(self.logger)
+        # Bumped on invalidation so that loads started before it are not cached
+        self._generation = 0
+        
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._invalidations = 0
+    
+    async def get_tenant(
+        self,
+        tenant_id: str,
+        loader: Callable[[], Awaitable[Optional[TenantInfo]]],
+    ) -> Optional[TenantInfo]:
+        """
+        Get a tenant's metadata.
+        
+        Args:
+            tenant_id: The tenant ID
+            loader: Function loading the metadata, returning None for unknown tenants
+            
+        Returns:
+            The tenant metadata, or None if the tenant does not exist
+        """
+        return await self._get((self.TENANT, tenant_id), loader)
+    
+    async def get_config(
+        self,
+        tenant_id: str,
+        loader: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Get a tenant's merged configuration.
+        
+        Args:
+            tenant_id: The tenant ID
+            loader: Function loading the configuration
+            
+        Returns:
+            The cached configuration; callers must not modify it
+        """
+        return await self._get((self.CONFIG, tenant_id), loader)
+    
+    async def _get(self, key: Tuple[str, str], loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get an entry, loading it on a miss.
+        
+        Args:
+            key: The entry key
+            loader: Function loading the entry
+            
+        Returns:
+            The entry value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                if value is None:
+                    self._negative_hits += 1
+                else:
+                    self._hits += 1
+                return value
+            del self._entries[key]
+        
+        self._misses += 1
+        return await self._single_flight.do(key, lambda: self._load(key, loader))
+    
+    async def _load(self, key: Tuple[str, str], loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Load an entry and cache it unless it was invalidated meanwhile.
+        
+        Args:
+            key: The entry key
+            loader: Function loading the entry
+            
+        Returns:
+            The entry value
+        """
+        generation = self._generation
+        value = await loader()
+        
+        if generation == self._generation and self.max_size > 0:
+            ttl = self.ttl if value is not None else self.negative_ttl
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        
+        return value
+    
+    def invalidate(self, tenant_id: str) -> None:
+        """
+        Drop the cached metadata and configuration of a tenant.
+        
+        Args:
+            tenant_id: The tenant ID
+        """
+        self._generation += 1
+        self._invalidations += 1
+        self._entries.pop((self.TENANT, tenant_id), None)
+        self._entries.pop((self.CONFIG, tenant_id), None)
+    
+    def invalidate_config(self, tenant_id: str) -> None:
+        """
+        Drop the cached configuration of a tenant.
+        
+        Args:
+            tenant_id: The tenant ID
+        """
+        self._generation += 1
+        self._invalidations += 1
+        self._entries.pop((self.CONFIG, tenant_id), None)
+    
+    def clear(self, kind: Optional[str] = None) -> None:
+        """
+        Drop all entries.
+        
+        Args:
+            kind: Optional entry kind to drop, TENANT or CONFIG (defaults to both)
+        """
+        self._generation += 1
+        if kind is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[0] == kind]:
+                del self._entries[key]
+    
+    def subscribe(self, event_bus: EventBus) -> None:
+        """
+        Invalidate tenants when their events are published on an event bus.
+        
+        Args:
+            event_bus: The event bus the tenant service publishes to
+        """
+        event_bus.subscribe(TenantStatusChanged, self._on_tenant_changed)
+        event_bus.subscribe(TenantUpdated, self._on_tenant_changed)
+    
+    async def _on_tenant_changed(self, event: Any) -> None:
+        """
+        Invalidate the tenant of an event.
+        
+        Args:
+            event: A tenant event
+        """
+        self.invalidate(event.tenant_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary of cache statistics
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "single_flight": self._single_flight.get_stats(),
+        }
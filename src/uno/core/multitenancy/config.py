@@ -12,6 +12,7 @@ import logging
 from uno.core.multitenancy.models import Tenant, TenantSettings
 from uno.core.multitenancy.repository import TenantAwareRepository
 from uno.core.multitenancy.context import get_current_tenant_context
+from uno.core.multitenancy.cache import TenantCache
 
 
 class TenantConfigError(Exception):
@@ -24,14 +25,16 @@ class TenantConfig:
     Tenant-specific configuration manager.
     
     This class provides methods for managing tenant-specific configuration settings,
-    with support for defaults, inheritance, and validation.
+    with support for defaults, inheritance, and validation. Merged configurations
+    are kept in a TenantCache, bounded by size and TTL.
     """
     
     def __init__(
         self,
         default_config: Dict[str, Any],
         settings_repo: Optional[TenantAwareRepository] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        cache: Optional[TenantCache] = None
     ):
         """
         Initialize the tenant configuration manager.
@@ -40,11 +43,12 @@ class TenantConfig:
             default_config: Default configuration values
             settings_repo: Repository for tenant settings
             logger: Optional logger instance
+            cache: Cache for merged tenant configurations
         """
         self.default_config = default_config
         self.settings_repo = settings_repo
-        self._tenant_configs: Dict[str, Dict[str, Any]] = {}
         self.logger = logger or logging.getLogger(__name__)
+        self.cache = cache or TenantCache(logger=self.logger)
     
     async def get_tenant_config(
         self, tenant_id: Optional[str] = None
@@ -67,11 +71,22 @@ class TenantConfig:
             if not tenant_id:
                 return copy.deepcopy(self.default_config)
         
-        # Use cached config if available
-        if tenant_id in self._tenant_configs:
-            return copy.deepcopy(self._tenant_configs[tenant_id])
+        # The cached config is shared, so callers get a copy
+        tenant_config = await self.cache.get_config(
+            tenant_id, lambda: self._load_tenant_config(tenant_id)
+        )
+        return copy.deepcopy(tenant_config)
+    
+    async def _load_tenant_config(self, tenant_id: str) -> Dict[str, Any]:
+        """
+        Merge the default configuration with the settings of a tenant.
         
-        # Get tenant settings from repository
+        Args:
+            tenant_id: The tenant ID
+            
+        Returns:
+            The merged configuration dictionary
+        """
         tenant_config = copy.deepcopy(self.default_config)
         
         if self.settings_repo:
@@ -84,10 +99,7 @@ class TenantConfig:
                     tenant_config, setting.key.split('.'), setting.value
                 )
         
-        # Cache the result
-        self._tenant_configs[tenant_id] = tenant_config
-        
-        return copy.deepcopy(tenant_config)
+        return tenant_config
     
     async def set_tenant_config(
         self, key: str, value: Any, tenant_id: Optional[str] = None,
@@ -128,11 +140,8 @@ class TenantConfig:
                 setting.id, {"value": value, "description": description}
             )
             
-            # Update cache if it exists
-            if tenant_id in self._tenant_configs:
-                self._set_nested_value(
-                    self._tenant_configs[tenant_id], key.split('.'), value
-                )
+            # Reload the config on next access
+            self.cache.invalidate_config(tenant_id)
             
             return updated
         else:
@@ -145,11 +154,8 @@ class TenantConfig:
             )
             created = await self.settings_repo.create(new_setting.model_dump())
             
-            # Update cache if it exists
-            if tenant_id in self._tenant_configs:
-                self._set_nested_value(
-                    self._tenant_configs[tenant_id], key.split('.'), value
-                )
+            # Reload the config on next access
+            self.cache.invalidate_config(tenant_id)
             
             return created
     
@@ -189,9 +195,9 @@ class TenantConfig:
         setting = settings[0]
         success = await self.settings_repo.delete(setting.id)
         
-        # Update cache if it exists
-        if success and tenant_id in self._tenant_configs:
-            self._delete_nested_value(self._tenant_configs[tenant_id], key.split('.'))
+        # Reload the config on next access
+        if success:
+            self.cache.invalidate_config(tenant_id)
         
         return success
     
@@ -228,8 +234,7 @@ class TenantConfig:
                 count += 1
         
         # Clear the cache for this tenant
-        if tenant_id in self._tenant_configs:
-            del self._tenant_configs[tenant_id]
+        self.cache.invalidate_config(tenant_id)
         
         return count
     
@@ -273,10 +278,9 @@ class TenantConfig:
             tenant_id: Optional tenant ID (defaults to all tenants)
         """
         if tenant_id:
-            if tenant_id in self._tenant_configs:
-                del self._tenant_configs[tenant_id]
+            self.cache.invalidate_config(tenant_id)
         else:
-            self._tenant_configs.clear()
+            self.cache.clear(TenantCache.CONFIG)
     
     def _get_nested_value(self, config: Dict[str, Any], keys: List[str]) -> Any:
         """
@@ -147,7 +147,7 @@ def handle_result_error(result: Result) -> Any:
     Raises:
         HTTPException: If the result is a failure
     """
-    if result.is_failure():
+    if result.is_failure:
         error = result.error
         status_code = status.HTTP_400_BAD_REQUEST
         
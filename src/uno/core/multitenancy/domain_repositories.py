@@ -597,7 +597,7 @@ class TenantSQLAlchemyRepository(TenantRepositoryProtocol):
         try:
             # Check if slug is already taken
             slug_exists_result = await self.exists_by_slug(entity.slug.value)
-            if slug_exists_result.is_failure():
+            if slug_exists_result.is_failure:
                 return slug_exists_result
                 
             if slug_exists_result.value:
@@ -610,7 +610,7 @@ class TenantSQLAlchemyRepository(TenantRepositoryProtocol):
             # Check if domain is already taken (if provided)
             if entity.domain:
                 domain_exists_result = await self.exists_by_domain(entity.domain)
-                if domain_exists_result.is_failure():
+                if domain_exists_result.is_failure:
                     return domain_exists_result
                     
                 if domain_exists_result.value:
@@ -667,7 +667,7 @@ class TenantSQLAlchemyRepository(TenantRepositoryProtocol):
         try:
             # Check if the tenant exists
             exists_result = await self.get_by_id(entity.id)
-            if exists_result.is_failure():
+            if exists_result.is_failure:
                 return exists_result
                 
             if not exists_result.value:
@@ -679,7 +679,7 @@ class TenantSQLAlchemyRepository(TenantRepositoryProtocol):
             
             # Check if slug is already taken by a different tenant
             slug_result = await self.get_by_slug(entity.slug.value)
-            if slug_result.is_failure():
+            if slug_result.is_failure:
                 return slug_result
                 
             if slug_result.value and slug_result.value.id.value != entity.id.value:
@@ -692,7 +692,7 @@ class TenantSQLAlchemyRepository(TenantRepositoryProtocol):
             # Check if domain is already taken by a different tenant (if provided)
             if entity.domain:
                 domain_result = await self.get_by_domain(entity.domain)
-                if domain_result.is_failure():
+                if domain_result.is_failure:
                     return domain_result
                     
                 if domain_result.value and domain_result.value.id.value != entity.id.value:
@@ -761,7 +761,7 @@ class TenantSQLAlchemyRepository(TenantRepositoryProtocol):
         try:
             # Check if the tenant exists
             exists_result = await self.get_by_id(tenant_id)
-            if exists_result.is_failure():
+            if exists_result.is_failure:
                 return exists_result
                 
             if not exists_result.value:
@@ -1123,7 +1123,7 @@ class UserTenantAssociationSQLAlchemyRepository(UserTenantAssociationRepositoryP
         try:
             # Check if association exists
             association_result = await self.get_user_tenant(user_id, tenant_id)
-            if association_result.is_failure():
+            if association_result.is_failure:
                 return association_result
                 
             if not association_result.value:
@@ -1282,7 +1282,7 @@ class UserTenantAssociationSQLAlchemyRepository(UserTenantAssociationRepositoryP
         try:
             # Check if association already exists
             existing_result = await self.get_user_tenant(entity.user_id.value, entity.tenant_id.value)
-            if existing_result.is_failure():
+            if existing_result.is_failure:
                 return existing_result
                 
             if existing_result.value:
@@ -1347,7 +1347,7 @@ class UserTenantAssociationSQLAlchemyRepository(UserTenantAssociationRepositoryP
         try:
             # Check if the association exists
             exists_result = await self.get_by_id(entity.id)
-            if exists_result.is_failure():
+            if exists_result.is_failure:
                 return exists_result
                 
             if not exists_result.value:
@@ -1420,7 +1420,7 @@ class UserTenantAssociationSQLAlchemyRepository(UserTenantAssociationRepositoryP
         try:
             # Check if the association exists
             exists_result = await self.get_by_id(association_id)
-            if exists_result.is_failure():
+            if exists_result.is_failure:
                 return exists_result
                 
             if not exists_result.value:
@@ -1562,7 +1562,7 @@ class TenantAwareSQLAlchemyRepository(TenantAwareRepositoryProtocol, Generic[Ent
         """
         # Get the current tenant ID
         tenant_id_result = await self.get_tenant_id()
-        if tenant_id_result.is_failure():
+        if tenant_id_result.is_failure:
             return tenant_id_result
         
         tenant_id = tenant_id_result.value
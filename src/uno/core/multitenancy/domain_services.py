@@ -15,6 +15,7 @@ from uno.domain.service import Service
 from uno.core.errors.result import Result, Success, Failure
 from uno.core.errors.catalog import ErrorCodes, UnoError
 from uno.domain.repositories import Repository
+from uno.core.protocols import EventBus
 
 from .entities import (
     Tenant, TenantId, TenantSlug, UserTenantAssociation, UserTenantAssociationId, 
@@ -22,6 +23,7 @@ from .entities import (
     UserId, TenantCreateRequest, TenantUpdateRequest, UserTenantAssociationCreateRequest,
     TenantInvitationCreateRequest, TenantStatus, UserTenantStatus
 )
+from .events import TenantStatusChanged, TenantUpdated
 from .domain_repositories import (
     TenantRepositoryProtocol, UserTenantAssociationRepositoryProtocol,
     TenantInvitationRepositoryProtocol, TenantSettingRepositoryProtocol
@@ -441,17 +443,68 @@ class TenantService(TenantServiceProtocol):
     Implementation of the tenant management service.
     
     This service manages tenants, including creating, retrieving, updating,
-    and deleting tenants.
+    and deleting tenants. When an event bus is given, changes to tenants are
+    published as TenantStatusChanged and TenantUpdated events.
     """
     
     tenant_repository: TenantRepositoryProtocol
     logger: Optional[logging.Logger] = None
+    event_bus: Optional[EventBus] = None
     
     def __post_init__(self):
         """Initialize the service."""
         if self.logger is None:
             self.logger = logging.getLogger(__name__)
     
+    async def _publish(self, event: Any) -> None:
+        """
+        Publish a tenant event, if an event bus is configured.
+        
+        Failures are logged rather than raised, since the change is already saved.
+        
+        Args:
+            event: The event to publish
+        """
+        if self.event_bus is None:
+            return
+        
+        try:
+            await self.event_bus.publish(event)
+        except Exception as e:
+            self.logger.error(f"Error publishing {event.__class__.__name__}: {e}")
+    
+    async def _change_status(self, tenant_id: str, change: str) -> Result[Tenant]:
+        """
+        Change the status of a tenant and publish the change.
+        
+        Args:
+            tenant_id: The tenant ID
+            change: The name of the Tenant method changing the status
+            
+        Returns:
+            A Result containing the updated tenant if successful
+        """
+        # Get the tenant
+        get_result = await self.get_tenant(tenant_id)
+        if get_result.is_failure:
+            return get_result
+        
+        tenant = get_result.value
+        previous_status = tenant.status
+        
+        # Update the tenant status
+        getattr(tenant, change)()
+        
+        # Save the tenant
+        result = await self.tenant_repository.update(tenant)
+        if result.is_success:
+            await self._publish(TenantStatusChanged(
+                tenant_id=tenant_id,
+                status=tenant.status.value,
+                previous_status=previous_status.value,
+            ))
+        return result
+    
     async def create_tenant(self, request: TenantCreateRequest) -> Result[Tenant]:
         """
         Create a new tenant.
@@ -464,7 +517,7 @@ class TenantService(TenantServiceProtocol):
         """
         # Check if tenant with the same slug already exists
         slug_exists = await self.tenant_repository.exists_by_slug(request.slug)
-        if slug_exists.is_failure():
+        if slug_exists.is_failure:
             return slug_exists
         
         if slug_exists.value:
@@ -477,7 +530,7 @@ class TenantService(TenantServiceProtocol):
         # Check if tenant with the same domain already exists (if provided)
         if request.domain:
             domain_exists = await self.tenant_repository.exists_by_domain(request.domain)
-            if domain_exists.is_failure():
+            if domain_exists.is_failure:
                 return domain_exists
             
             if domain_exists.value:
@@ -517,7 +570,7 @@ class TenantService(TenantServiceProtocol):
             A Result containing the tenant if found
         """
         result = await self.tenant_repository.get_by_id(tenant_id)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -540,7 +593,7 @@ class TenantService(TenantServiceProtocol):
             A Result containing the tenant if found
         """
         result = await self.tenant_repository.get_by_slug(slug)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -563,7 +616,7 @@ class TenantService(TenantServiceProtocol):
             A Result containing the tenant if found
         """
         result = await self.tenant_repository.get_by_domain(domain)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -588,7 +641,7 @@ class TenantService(TenantServiceProtocol):
         """
         # Get the tenant
         get_result = await self.get_tenant(tenant_id)
-        if get_result.is_failure():
+        if get_result.is_failure:
             return get_result
         
         tenant = get_result.value
@@ -601,7 +654,7 @@ class TenantService(TenantServiceProtocol):
         if request.domain is not None and request.domain != tenant.domain:
             if request.domain != "":  # Allow clearing the domain
                 domain_exists = await self.tenant_repository.exists_by_domain(request.domain)
-                if domain_exists.is_failure():
+                if domain_exists.is_failure:
                     return domain_exists
                 
                 if domain_exists.value:
@@ -626,8 +679,10 @@ class TenantService(TenantServiceProtocol):
             tenant.update_metadata(request.metadata)
         
         # Update the tenant
-        tenant.updated_at = datetime.now(timezone.UTC)
+        tenant.updated_at = datetime.now(timezone.utc)
         result = await self.tenant_repository.update(tenant)
+        if result.is_success:
+            await self._publish(TenantUpdated(tenant_id=tenant_id))
         return result
     
     async def delete_tenant(self, tenant_id: str) -> Result[bool]:
@@ -642,14 +697,22 @@ class TenantService(TenantServiceProtocol):
         """
         # Check if the tenant exists
         get_result = await self.get_tenant(tenant_id)
-        if get_result.is_failure():
+        if get_result.is_failure:
             if get_result.error.code == ErrorCodes.RESOURCE_NOT_FOUND:
                 # If tenant doesn't exist, consider the deletion successful
                 return Success(False)
             return get_result
         
+        previous_status = get_result.value.status
+        
         # Delete the tenant
         result = await self.tenant_repository.delete(tenant_id)
+        if result.is_success:
+            await self._publish(TenantStatusChanged(
+                tenant_id=tenant_id,
+                status=TenantStatus.DELETED.value,
+                previous_status=previous_status.value,
+            ))
         return result
     
     async def list_tenants(
@@ -715,19 +778,7 @@ class TenantService(TenantServiceProtocol):
         Returns:
             A Result containing the updated tenant if successful
         """
-        # Get the tenant
-        get_result = await self.get_tenant(tenant_id)
-        if get_result.is_failure():
-            return get_result
-        
-        tenant = get_result.value
-        
-        # Update the tenant status
-        tenant.suspend()
-        
-        # Save the tenant
-        result = await self.tenant_repository.update(tenant)
-        return result
+        return await self._change_status(tenant_id, "suspend")
     
     async def activate_tenant(self, tenant_id: str) -> Result[Tenant]:
         """
@@ -739,19 +790,7 @@ class TenantService(TenantServiceProtocol):
         Returns:
             A Result containing the updated tenant if successful
         """
-        # Get the tenant
-        get_result = await self.get_tenant(tenant_id)
-        if get_result.is_failure():
-            return get_result
-        
-        tenant = get_result.value
-        
-        # Update the tenant status
-        tenant.activate()
-        
-        # Save the tenant
-        result = await self.tenant_repository.update(tenant)
-        return result
+        return await self._change_status(tenant_id, "activate")
     
     async def update_tenant_settings(self, tenant_id: str, settings: Dict[str, Any]) -> Result[Tenant]:
         """
@@ -766,7 +805,7 @@ class TenantService(TenantServiceProtocol):
         """
         # Get the tenant
         get_result = await self.get_tenant(tenant_id)
-        if get_result.is_failure():
+        if get_result.is_failure:
             return get_result
         
         tenant = get_result.value
@@ -776,6 +815,8 @@ class TenantService(TenantServiceProtocol):
         
         # Save the tenant
         result = await self.tenant_repository.update(tenant)
+        if result.is_success:
+            await self._publish(TenantUpdated(tenant_id=tenant_id))
         return result
 
 
@@ -809,7 +850,7 @@ class UserTenantService(UserTenantServiceProtocol):
         """
         # Check if the tenant exists
         tenant_result = await self.tenant_repository.get_by_id(request.tenant_id)
-        if tenant_result.is_failure():
+        if tenant_result.is_failure:
             return tenant_result
         
         if tenant_result.value is None:
@@ -821,7 +862,7 @@ class UserTenantService(UserTenantServiceProtocol):
         
         # Check if the association already exists
         existing_result = await self.association_repository.get_user_tenant(request.user_id, request.tenant_id)
-        if existing_result.is_failure():
+        if existing_result.is_failure:
             return existing_result
         
         if existing_result.value is not None:
@@ -861,7 +902,7 @@ class UserTenantService(UserTenantServiceProtocol):
             A Result containing the association if found
         """
         result = await self.association_repository.get_by_id(association_id)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -885,7 +926,7 @@ class UserTenantService(UserTenantServiceProtocol):
             A Result containing the association if found
         """
         result = await self.association_repository.get_user_tenant(user_id, tenant_id)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -910,14 +951,14 @@ class UserTenantService(UserTenantServiceProtocol):
         """
         # Get the association
         get_result = await self.get_association(association_id)
-        if get_result.is_failure():
+        if get_result.is_failure:
             return get_result
         
         association = get_result.value
         
         # Update the roles
         association.roles = roles
-        association.updated_at = datetime.now(timezone.UTC)
+        association.updated_at = datetime.now(timezone.utc)
         
         # Save the association
         result = await self.association_repository.update(association)
@@ -936,14 +977,14 @@ class UserTenantService(UserTenantServiceProtocol):
         """
         # Get the association
         get_result = await self.get_association(association_id)
-        if get_result.is_failure():
+        if get_result.is_failure:
             return get_result
         
         association = get_result.value
         
         # Update the status
         association.status = status
-        association.updated_at = datetime.now(timezone.UTC)
+        association.updated_at = datetime.now(timezone.utc)
         
         # Save the association
         result = await self.association_repository.update(association)
@@ -1004,7 +1045,7 @@ class UserTenantService(UserTenantServiceProtocol):
         """
         # Check if the user has an association with the tenant
         association_result = await self.association_repository.get_user_tenant(user_id, tenant_id)
-        if association_result.is_failure():
+        if association_result.is_failure:
             return association_result
         
         if association_result.value is None:
@@ -1080,7 +1121,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
         """
         # Check if the tenant exists
         tenant_result = await self.tenant_repository.get_by_id(request.tenant_id)
-        if tenant_result.is_failure():
+        if tenant_result.is_failure:
             return tenant_result
         
         if tenant_result.value is None:
@@ -1092,7 +1133,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
         
         # Calculate expiration date
         expiration_days = request.expiration_days or 7
-        expires_at = datetime.now(timezone.UTC) + timedelta(days=expiration_days)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=expiration_days)
         
         # Create the invitation
         invitation = TenantInvitation.create(
@@ -1122,7 +1163,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
             A Result containing the invitation if found
         """
         result = await self.invitation_repository.get_by_id(invitation_id)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -1145,7 +1186,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
             A Result containing the invitation if found
         """
         result = await self.invitation_repository.get_by_token(token)
-        if result.is_failure():
+        if result.is_failure:
             return result
         
         if result.value is None:
@@ -1170,7 +1211,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
         """
         # Get the invitation
         invitation_result = await self.get_invitation_by_token(token)
-        if invitation_result.is_failure():
+        if invitation_result.is_failure:
             return invitation_result
         
         invitation = invitation_result.value
@@ -1200,7 +1241,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
         )
         
         association_result = await self.user_tenant_service.create_association(association_request)
-        if association_result.is_failure():
+        if association_result.is_failure:
             return association_result
         
         # Mark the invitation as accepted
@@ -1221,7 +1262,7 @@ class TenantInvitationService(TenantInvitationServiceProtocol):
         """
         # Get the invitation
         invitation_result = await self.get_invitation_by_token(token)
-        if invitation_result.is_failure():
+        if invitation_result.is_failure:
             return invitation_result
         
         invitation = invitation_result.value
@@ -112,8 +112,8 @@ class Tenant(AggregateRoot[TenantId]):
     domain: Optional[str] = None
     settings: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
     @classmethod
     def create(cls, name: str, slug: str, tier: str = "standard", domain: Optional[str] = None) -> "Tenant":
@@ -135,8 +135,8 @@ class Tenant(AggregateRoot[TenantId]):
             slug=TenantSlug(slug),
             tier=tier,
             domain=domain,
-            created_at=datetime.now(timezone.UTC),
-            updated_at=datetime.now(timezone.UTC)
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
         )
     
     def suspend(self) -> None:
@@ -145,7 +145,7 @@ class Tenant(AggregateRoot[TenantId]):
             return  # Already suspended
             
         self.status = TenantStatus.SUSPENDED
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def activate(self) -> None:
         """Activate this tenant."""
@@ -153,12 +153,12 @@ class Tenant(AggregateRoot[TenantId]):
             return  # Already active
             
         self.status = TenantStatus.ACTIVE
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def delete(self) -> None:
         """Mark this tenant as deleted."""
         self.status = TenantStatus.DELETED
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def update_settings(self, settings: Dict[str, Any]) -> None:
         """
@@ -168,7 +168,7 @@ class Tenant(AggregateRoot[TenantId]):
             settings: The new settings to apply
         """
         self.settings.update(settings)
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def update_metadata(self, metadata: Dict[str, Any]) -> None:
         """
@@ -178,7 +178,7 @@ class Tenant(AggregateRoot[TenantId]):
             metadata: The new metadata to apply
         """
         self.metadata.update(metadata)
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
         
     def update(self, 
                name: Optional[str] = None, 
@@ -201,7 +201,7 @@ class Tenant(AggregateRoot[TenantId]):
         if tier is not None:
             self.tier = tier
             
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
         
 
 @dataclass
@@ -219,8 +219,8 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
     status: UserTenantStatus = UserTenantStatus.ACTIVE
     settings: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
     @classmethod
     def create(cls, user_id: str, tenant_id: str, roles: List[str] = None, is_primary: bool = False) -> "UserTenantAssociation":
@@ -242,8 +242,8 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             tenant_id=TenantId(tenant_id),
             roles=roles or [],
             is_primary=is_primary,
-            created_at=datetime.now(timezone.UTC),
-            updated_at=datetime.now(timezone.UTC)
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
         )
     
     def suspend(self) -> None:
@@ -252,7 +252,7 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             return  # Already suspended
             
         self.status = UserTenantStatus.SUSPENDED
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def activate(self) -> None:
         """Activate this user-tenant association."""
@@ -260,7 +260,7 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             return  # Already active
             
         self.status = UserTenantStatus.ACTIVE
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def set_primary(self, is_primary: bool) -> None:
         """
@@ -273,7 +273,7 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             return  # No change
             
         self.is_primary = is_primary
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def add_role(self, role: str) -> None:
         """
@@ -286,7 +286,7 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             return  # Already has this role
             
         self.roles.append(role)
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def remove_role(self, role: str) -> None:
         """
@@ -299,7 +299,7 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             return  # Doesn't have this role
             
         self.roles.remove(role)
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def update_settings(self, settings: Dict[str, Any]) -> None:
         """
@@ -309,7 +309,7 @@ class UserTenantAssociation(Entity[UserTenantAssociationId]):
             settings: The new settings to apply
         """
         self.settings.update(settings)
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
 
 
 @dataclass(frozen=True)
@@ -338,8 +338,8 @@ class TenantSetting(Entity[TenantSettingId]):
     key: str
     value: Any
     description: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
     @classmethod
     def create(cls, tenant_id: str, key: str, value: Any, description: Optional[str] = None) -> "TenantSetting":
@@ -361,8 +361,8 @@ class TenantSetting(Entity[TenantSettingId]):
             key=key,
             value=value,
             description=description,
-            created_at=datetime.now(timezone.UTC),
-            updated_at=datetime.now(timezone.UTC)
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
         )
     
     def update_value(self, value: Any) -> None:
@@ -373,7 +373,7 @@ class TenantSetting(Entity[TenantSettingId]):
             value: The new value for the setting
         """
         self.value = value
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def update_description(self, description: Optional[str]) -> None:
         """
@@ -383,7 +383,7 @@ class TenantSetting(Entity[TenantSettingId]):
             description: The new description for the setting
         """
         self.description = description
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
 
 
 @dataclass
@@ -402,8 +402,8 @@ class TenantInvitation(Entity[TenantInvitationId]):
     expires_at: datetime
     status: str = "pending"
     metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.UTC))
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
     @classmethod
     def create(cls, tenant_id: str, email: str, invited_by: str, 
@@ -423,7 +423,7 @@ class TenantInvitation(Entity[TenantInvitationId]):
         """
         if expires_at is None:
             # Default to 7 days from now
-            expires_at = datetime.now(timezone.UTC) + datetime.timedelta(days=7)
+            expires_at = datetime.now(timezone.utc) + datetime.timedelta(days=7)
             
         return cls(
             id=TenantInvitationId(f"inv_{uuid.uuid4().hex}"),
@@ -433,8 +433,8 @@ class TenantInvitation(Entity[TenantInvitationId]):
             invited_by=UserId(invited_by),
             token=uuid.uuid4().hex,
             expires_at=expires_at,
-            created_at=datetime.now(timezone.UTC),
-            updated_at=datetime.now(timezone.UTC)
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
         )
     
     def accept(self) -> None:
@@ -446,7 +446,7 @@ class TenantInvitation(Entity[TenantInvitationId]):
             raise ValueError("Cannot accept expired invitation")
             
         self.status = "accepted"
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def decline(self) -> None:
         """Mark the invitation as declined."""
@@ -454,7 +454,7 @@ class TenantInvitation(Entity[TenantInvitationId]):
             raise ValueError(f"Cannot decline invitation with status '{self.status}'")
             
         self.status = "declined"
-        self.updated_at = datetime.now(timezone.UTC)
+        self.updated_at = datetime.now(timezone.utc)
     
     def is_expired(self) -> bool:
         """
@@ -463,7 +463,7 @@ class TenantInvitation(Entity[TenantInvitationId]):
         Returns:
             True if the invitation has expired, False otherwise
         """
-        return self.expires_at < datetime.now(timezone.UTC)
+        return self.expires_at < datetime.now(timezone.utc)
     
     def is_valid(self) -> bool:
         """
@@ -0,0 +1,50 @@
+"""
+Domain events for multi-tenancy.
+
+These events are published by the tenant service when a tenant changes, so
+that components caching tenant data can invalidate it.
+"""
+
+from typing import Any, Optional
+
+from uno.core.events import Event
+
+
+class TenantStatusChanged(Event):
+    """Event published when a tenant is activated, suspended or deleted."""
+    
+    def __init__(
+        self,
+        tenant_id: str,
+        status: str,
+        previous_status: Optional[str] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize the event.
+        
+        Args:
+            tenant_id: The tenant ID
+            status: The new status of the tenant
+            previous_status: The status of the tenant before the change
+            **kwargs: Base event fields
+        """
+        super().__init__(**kwargs)
+        self.tenant_id = tenant_id
+        self.status = status
+        self.previous_status = previous_status
+
+
+class TenantUpdated(Event):
+    """Event published when a tenant's properties or settings are updated."""
+    
+    def __init__(self, tenant_id: str, **kwargs: Any):
+        """
+        Initialize the event.
+        
+        Args:
+            tenant_id: The tenant ID
+            **kwargs: Base event fields
+        """
+        super().__init__(**kwargs)
+        self.tenant_id = tenant_id
@@ -15,6 +15,8 @@ from starlette.responses import Response
 
 from uno.core.multitenancy.context import TenantContext, get_current_tenant_context
 from uno.core.multitenancy.service import TenantService
+from uno.core.multitenancy.cache import TenantCache, TenantInfo
+from uno.core.errors.base import ErrorCode
 
 
 class TenantIdentificationMiddleware(BaseHTTPMiddleware):
@@ -33,7 +35,8 @@ class TenantIdentificationMiddleware(BaseHTTPMiddleware):
         path_prefix: bool = False,
         jwt_claim: Optional[str] = None,
         default_tenant: Optional[str] = None,
-        exclude_paths: List[str] = None
+        exclude_paths: List[str] = None,
+        tenant_cache: Optional[TenantCache] = None
     ):
         """
         Initialize the middleware.
@@ -47,6 +50,8 @@ class TenantIdentificationMiddleware(BaseHTTPMiddleware):
             jwt_claim: JWT claim containing the tenant ID
             default_tenant: Default tenant ID to use if no tenant is identified
             exclude_paths: List of paths to exclude from tenant identification
+            tenant_cache: Cache of tenant metadata; subscribe it to the event bus
+                the tenant service publishes to so status changes apply at once
         """
         super().__init__(app)
         self.tenant_service = tenant_service
@@ -56,6 +61,7 @@ class TenantIdentificationMiddleware(BaseHTTPMiddleware):
         self.jwt_claim = jwt_claim
         self.default_tenant = default_tenant
         self.exclude_paths = exclude_paths or []
+        self.tenant_cache = tenant_cache or TenantCache()
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -226,14 +232,46 @@ class TenantIdentificationMiddleware(BaseHTTPMiddleware):
             The validated tenant ID, or None if the tenant is not valid
         """
         try:
-            tenant = await self.tenant_service.get_tenant(tenant_id)
-            if tenant and tenant.status == "active":
+            tenant = await self.tenant_cache.get_tenant(
+                tenant_id, lambda: self._load_tenant(tenant_id)
+            )
+            if tenant and tenant.is_active:
                 return tenant_id
         except:
             pass
         
         return None
     
+    async def _load_tenant(self, tenant_id: str) -> Optional[TenantInfo]:
+        """
+        Load the metadata of a tenant from the tenant service.
+        
+        Args:
+            tenant_id: The tenant ID
+            
+        Returns:
+            The tenant metadata, or None if the tenant does not exist
+            
+        Raises:
+            Exception: If the lookup fails for another reason, so that the
+                failure is not cached as an unknown tenant
+        """
+        tenant = await self.tenant_service.get_tenant(tenant_id)
+        
+        # Domain services return a Result rather than an optional tenant
+        if hasattr(tenant, "is_failure"):
+            if tenant.is_failure:
+                error = tenant.error
+                code = getattr(error, "error_code", None) or getattr(error, "code", None)
+                if code == ErrorCode.RESOURCE_NOT_FOUND:
+                    return None
+                if isinstance(error, Exception):
+                    raise error
+                raise RuntimeError(f"Failed to load tenant {tenant_id}: {error}")
+            tenant = tenant.value
+        
+        return TenantInfo.from_tenant(tenant) if tenant else None
+    
     def _should_exclude(self, path: str) -> bool:
         """
         Check if the path should be excluded from tenant identification.
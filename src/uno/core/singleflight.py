@@ -0,0 +1,185 @@
+"""
+Request coalescing for cache loads.
+
+When a popular cache entry expires, every concurrent request misses and
+recomputes the same value. A SingleFlight runs one computation per key at a
+time and hands its result to every caller waiting on that key.
+
+This module also provides the XFetch early-expiration test, which lets a
+cache refresh an entry shortly before it expires, with a probability that
+grows as expiry approaches and with the time the value takes to compute.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Set, TypeVar
+import asyncio
+import logging
+import math
+import random
+import time
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+def xfetch_due(
+    expires_at: Optional[float],
+    compute_time: float,
+    beta: float = 1.0,
+    now: Optional[float] = None,
+) -> bool:
+    """
+    Decide whether to refresh an entry before it expires (XFetch).
+    
+    An entry is refreshed early when ``now - compute_time * beta * ln(rand)``
+    reaches its expiry. Entries that are slow to compute are refreshed
+    earlier, and across many readers roughly one refresh happens before the
+    entry expires.
+    
+    Args:
+        expires_at: Timestamp when the entry expires, None if it never does
+        compute_time: Time taken to compute the entry's value, in seconds
+        beta: Eagerness of early refreshes; 0 disables them
+        now: Current timestamp, defaults to time.time()
+    
+    Returns:
+        True if the entry should be refreshed now
+    """
+    if expires_at is None or beta <= 0 or compute_time <= 0:
+        return False
+    
+    now = now if now is not None else time.time()
+    # 1 - random() is in (0, 1], so the logarithm is defined
+    return now - compute_time * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent computations of the same key.
+    
+    The first caller for a key starts the computation as a task; callers
+    arriving while it runs await the same task instead of starting their own.
+    A cancelled caller does not cancel the computation other callers are
+    waiting for.
+    """
+    
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the single-flight group.
+        
+        Args:
+            logger: Optional logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._in_flight: Dict[K, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        
+        # Statistics
+        self._calls = 0
+        self._executions = 0
+        self._coalesced = 0
+        self._refreshes = 0
+        self._errors = 0
+    
+    def in_flight(self, key: K) -> bool:
+        """
+        Check whether a computation for a key is running.
+        
+        Args:
+            key: The key
+        
+        Returns:
+            True if the key is being computed
+        """
+        return key in self._in_flight
+    
+    async def do(self, key: K, func: Callable[[], Awaitable[V]]) -> V:
+        """
+        Compute a key's value, sharing the computation with concurrent callers.
+        
+        Args:
+            key: The key
+            func: Function computing the value, called only if no computation
+                for the key is running
+        
+        Returns:
+            The computed value
+        
+        Raises:
+            Exception: Whatever the computation raised, for every waiting caller
+        """
+        self._calls += 1
+        task = self._in_flight.get(key)
+        
+        if task is None:
+            self._executions += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self._coalesced += 1
+        
+        return await asyncio.shield(task)
+    
+    def refresh(self, key: K, func: Callable[[], Awaitable[V]]) -> bool:
+        """
+        Recompute a key's value in the background.
+        
+        Args:
+            key: The key
+            func: Function computing the value
+        
+        Returns:
+            True if a refresh was started, False if the key is already being computed
+        """
+        if key in self._in_flight:
+            return False
+        
+        self._refreshes += 1
+        task = asyncio.ensure_future(self.do(key, func))
+        # Keep a reference so the task is not garbage collected while running
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+        return True
+    
+    def _finish(self, key: K, task: asyncio.Task) -> None:
+        """
+        Forget a finished computation.
+        
+        Args:
+            key: The key
+            task: The finished computation
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        
+        if not task.cancelled() and task.exception() is not None:
+            self._errors += 1
+    
+    def _background_done(self, task: asyncio.Task) -> None:
+        """
+        Log the failure of a background refresh.
+        
+        Args:
+            task: The finished refresh
+        """
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(f"Error refreshing cache entry: {task.exception()}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get single-flight statistics.
+        
+        Returns:
+            Dictionary of statistics; ``coalesced`` counts the calls served by
+            a computation started by another caller
+        """
+        return {
+            "calls": self._calls,
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "background_refreshes": self._refreshes,
+            "errors": self._errors,
+            "in_flight": len(self._in_flight),
+        }
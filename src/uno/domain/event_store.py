@@ -5,9 +5,25 @@ This module provides the event store implementation for persisting and retrievin
 domain events, supporting event-driven architectures and event sourcing.
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional, Type, Generic, TypeVar, cast, Union
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from datetime import datetime
 from uuid import UUID
 
@@ -20,15 +36,32 @@ from sqlalchemy import (
     MetaData,
     insert,
     select,
+    cast,
+    func,
+    text,
+    literal_column,
+    tuple_,
+    BigInteger,
     Integer,
+    UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
 
+from uno.core.errors.base import ConcurrencyError
 from uno.database.session import async_session
 from uno.domain.events import DomainEvent, EventStore
 from uno.domain.models import Entity, AggregateRoot
 
+# Decode event data with msgspec when available
+try:
+    import msgspec
+
+    _decode_json = msgspec.json.decode
+except ImportError:
+    _decode_json = json.loads
+
 
 E = TypeVar("E", bound=DomainEvent)
 
@@ -50,8 +83,35 @@ class EventStore(Generic[E]):
         """
         raise NotImplementedError
 
+    async def append_events(
+        self,
+        aggregate_id: str,
+        events: List[E],
+        expected_version: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Append events to the stream of an aggregate.
+
+        The default implementation saves the events one by one; stores that
+        can write a stream atomically override it.
+
+        Args:
+            aggregate_id: The ID of the aggregate the events belong to
+            events: The events to append, in order
+            expected_version: The version the stream must be at, if checked
+
+        Returns:
+            The version of the stream after the append, if the store tracks it
+        """
+        for event in events:
+            await self.save_event(event)
+        return None
+
     async def get_events_by_aggregate_id(
-        self, aggregate_id: str, event_types: Optional[List[str]] = None
+        self,
+        aggregate_id: str,
+        event_types: Optional[List[str]] = None,
+        after_version: Optional[int] = None,
     ) -> List[E]:
         """
         Get all events for a specific aggregate ID.
@@ -59,6 +119,7 @@ class EventStore(Generic[E]):
         Args:
             aggregate_id: The ID of the aggregate to get events for
             event_types: Optional list of event types to filter by
+            after_version: Optional stream version to get the events after
 
         Returns:
             List of events for the aggregate
@@ -80,15 +141,60 @@ class EventStore(Generic[E]):
         """
         raise NotImplementedError
 
+    async def stream_events_by_aggregate_id(
+        self, aggregate_id: str, after_version: Optional[int] = None
+    ) -> AsyncIterator[E]:
+        """
+        Iterate over the events of an aggregate.
+
+        The default implementation loads the events with
+        get_events_by_aggregate_id; stores that can read in pages override it.
+
+        Args:
+            aggregate_id: The ID of the aggregate to get events for
+            after_version: Optional stream version to get the events after
+
+        Yields:
+            The events of the aggregate, in stream order
+        """
+        if after_version is None:
+            events = await self.get_events_by_aggregate_id(aggregate_id)
+        else:
+            events = await self.get_events_by_aggregate_id(
+                aggregate_id, after_version=after_version
+            )
+        for event in events:
+            yield event
+
+
+@dataclass
+class _PendingAppend:
+    """An append waiting for the next group commit."""
+
+    aggregate_id: str
+    events: List[DomainEvent]
+    expected_version: Optional[int]
+    metadata: Optional[Dict[str, Any]]
+    future: asyncio.Future
+
 
 class PostgresEventStore(EventStore[E]):
     """
     PostgreSQL implementation of the event store.
 
     This implementation uses a PostgreSQL table to store domain events.
+    Events appended to an aggregate's stream are numbered with a per-aggregate
+    version, written in one transaction, and checked against the version the
+    caller expects the stream to be at.
+
+    With group commit enabled, appends arriving within a short window are
+    written in a single transaction, each in its own savepoint so that a
+    conflicting append fails alone.
     """
 
     EVENT_TABLE_NAME = "domain_events"
+    # Channel the notify_domain_event trigger publishes inserted events on
+    NOTIFY_CHANNEL = "domain_events"
     # Use the schema from settings rather than hardcoding 'public'
     try:
         from uno.settings import uno_settings
@@ -104,6 +210,11 @@ class PostgresEventStore(EventStore[E]):
         table_name: str = EVENT_TABLE_NAME,
         schema: str = EVENT_TABLE_SCHEMA,
         logger: Optional[logging.Logger] = None,
+        copy_threshold: int = 1000,
+        group_commit: bool = False,
+        group_commit_window: float = 0.005,
+        group_commit_max_batch: int = 500,
+        page_size: int = 1000,
     ):
         """
         Initialize the PostgreSQL event store.
@@ -113,11 +224,29 @@ class PostgresEventStore(EventStore[E]):
             table_name: The name of the table to store events in
             schema: The database schema to use
             logger: Optional logger for diagnostic information
+            copy_threshold: Number of events from which an append uses COPY
+                instead of INSERT
+            group_commit: Whether to coalesce concurrent appends into one transaction
+            group_commit_window: Time in seconds to collect appends for a group commit
+            group_commit_max_batch: Maximum number of appends in a group commit
+            page_size: Number of rows fetched at a time when reading events
         """
         self.event_type = event_type
         self.table_name = table_name
         self.schema = schema
         self.logger = logger or logging.getLogger(__name__)
+        self.copy_threshold = copy_threshold
+        self.group_commit = group_commit
+        self.group_commit_window = group_commit_window
+        self.group_commit_max_batch = group_commit_max_batch
+        self.page_size = page_size
+
+        # Event classes and cached decoders by stored event type
+        self._event_classes: Dict[str, Type[E]] = {}
+        self._decoders: Dict[str, Callable[[Dict[str, Any]], E]] = {}
+
+        self._pending: List[_PendingAppend] = []
+        self._committer: Optional[asyncio.Task] = None
 
         # Define table structure
         metadata = MetaData()
@@ -129,6 +258,16 @@ class PostgresEventStore(EventStore[E]):
             Column("aggregate_id", String(36), nullable=True, index=True),
             Column("aggregate_type", String(100), nullable=True),
             Column("timestamp", TIMESTAMP, nullable=False, index=True),
+            Column("version", Integer, nullable=True),
+            # Assigned from a sequence by the assign_event_position trigger
+            Column("position", BigInteger, nullable=True, unique=True),
+            # ID of the inserting transaction, which orders the global feed
+            Column(
+                "transaction_id",
+                BigInteger,
+                nullable=True,
+                server_default=text("pg_current_xact_id()::text::bigint"),
+            ),
             Column("data", JSONB, nullable=False),
             Column("metadata", JSONB, nullable=True),
             Column(
@@ -137,6 +276,7 @@ class PostgresEventStore(EventStore[E]):
                 nullable=False,
                 server_default="CURRENT_TIMESTAMP",
             ),
+            UniqueConstraint("aggregate_id", "version"),
             schema=self.schema,
         )
 
@@ -163,38 +303,23 @@ class PostgresEventStore(EventStore[E]):
         """
         Save a domain event to the PostgreSQL store.
 
+        An event of an aggregate is appended to the aggregate's stream, so
+        that it is numbered with the stream's next version.
+
         Args:
             event: The domain event to save
             aggregate_id: Optional ID of the aggregate that generated this event
             metadata: Optional metadata to store with the event
         """
-        try:
-            # Prepare event data
-            event_data = event.model_dump()
-
-            # Extract standard fields
-            event_id = event_data.pop("event_id", None) or str(event.event_id)
-            event_type = event_data.pop("event_type", None) or event.event_type
-            timestamp = event_data.pop("timestamp", None) or event.timestamp
-
-            # Determine aggregate details
-            aggregate_type = None
-            if "aggregate_type" in event_data:
-                aggregate_type = event_data.pop("aggregate_type")
-
-            # Use provided aggregate ID or extract from event if available
-            if aggregate_id is None and "aggregate_id" in event_data:
-                aggregate_id = event_data.pop("aggregate_id")
+        aggregate_id = aggregate_id or event.aggregate_id
+        if aggregate_id:
+            await self.append_events(aggregate_id, [event], metadata=metadata)
+            return
 
+        try:
             # Insert event into database
             insert_stmt = insert(self.events_table).values(
-                event_id=event_id,
-                event_type=event_type,
-                aggregate_id=aggregate_id,
-                aggregate_type=aggregate_type,
-                timestamp=timestamp,
-                data=json.dumps(event_data),
-                metadata=json.dumps(metadata) if metadata else None,
+                **self._event_row(event, aggregate_id, metadata)
             )
 
             async with async_session() as session:
@@ -205,75 +330,285 @@ class PostgresEventStore(EventStore[E]):
             self.logger.error(f"Error saving event: {e}")
             raise
 
-    async def get_events_by_aggregate_id(
-        self, aggregate_id: str, event_types: Optional[List[str]] = None
-    ) -> List[E]:
+    async def append_events(
+        self,
+        aggregate_id: str,
+        events: List[E],
+        expected_version: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
         """
-        Get all events for a specific aggregate ID.
+        Append events to the stream of an aggregate in one transaction.
+
+        The events are numbered from the current version of the stream and
+        written with a single multi-row INSERT, or with COPY when there are at
+        least ``copy_threshold`` of them.
 
         Args:
-            aggregate_id: The ID of the aggregate to get events for
-            event_types: Optional list of event types to filter by
+            aggregate_id: The ID of the aggregate the events belong to
+            events: The events to append, in order
+            expected_version: The version the stream must be at (0 for a new
+                stream), or None to append without checking
+            metadata: Optional metadata to store with each event
 
         Returns:
-            List of events for the aggregate
+            The version of the stream after the append
+
+        Raises:
+            ConcurrencyError: If the stream is not at the expected version
         """
-        try:
-            # Build query
-            query = (
-                select(self.events_table)
-                .where(self.events_table.c.aggregate_id == aggregate_id)
-                .order_by(self.events_table.c.timestamp)
+        if self.group_commit:
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append(
+                _PendingAppend(aggregate_id, list(events), expected_version, metadata, future)
             )
+            if self._committer is None or self._committer.done():
+                self._committer = asyncio.ensure_future(self._run_group_commits())
+            return await future
+
+        try:
+            async with async_session() as session:
+                version = await self._append(
+                    session, aggregate_id, events, expected_version, metadata
+                )
+                await session.commit()
+            return version
 
-            # Add event type filter if provided
-            if event_types:
-                query = query.where(self.events_table.c.event_type.in_(event_types))
+        except ConcurrencyError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error appending events: {e}")
+            raise
 
-            # Execute query
+    async def _run_group_commits(self) -> None:
+        """Commit pending appends in groups until none are left."""
+        while self._pending:
+            # Let concurrent appends join the group
+            await asyncio.sleep(self.group_commit_window)
+
+            batch = self._pending[: self.group_commit_max_batch]
+            del self._pending[: self.group_commit_max_batch]
+            await self._commit_group(batch)
+
+    async def _commit_group(self, batch: List[_PendingAppend]) -> None:
+        """
+        Write a group of appends in one transaction.
+
+        Appends are written in aggregate order, so that concurrent group
+        commits lock aggregates in the same order, and each in a savepoint. The appends' callers are
+        answered once the transaction is committed.
+
+        Args:
+            batch: The appends to write
+        """
+        outcomes: List[Any] = []
+        try:
             async with async_session() as session:
-                result = await session.execute(query)
-                try:
-                    rows = (
-                        await result.fetchall()
-                        if hasattr(result.fetchall, "__await__")
-                        else result.fetchall()
-                    )
-                except Exception as e:
-                    self.logger.error(f"Error fetching result rows: {e}")
-                    rows = []
+                for pending in sorted(batch, key=lambda pending: pending.aggregate_id or ""):
+                    try:
+                        async with session.begin_nested():
+                            outcome = await self._append(
+                                session,
+                                pending.aggregate_id,
+                                pending.events,
+                                pending.expected_version,
+                                pending.metadata,
+                            )
+                    except Exception as e:
+                        outcome = e
+                    outcomes.append((pending, outcome))
+                await session.commit()
 
-            # Convert rows to domain events
-            events = []
-            for row in rows:
-                try:
-                    # Handle different row data formats
-                    if hasattr(row, "data"):
-                        # For database rows with column objects
-                        data = row.data
-                        event_data = json.loads(data) if isinstance(data, str) else data
-                        event_data.update(
-                            {
-                                "event_id": row.event_id,
-                                "event_type": row.event_type,
-                                "timestamp": row.timestamp,
-                                "aggregate_id": getattr(row, "aggregate_id", None),
-                            }
-                        )
-                        events.append(self.event_type.model_validate(event_data))
-                    elif isinstance(row, dict):
-                        # For dictionary rows
-                        events.append(self.event_type.model_validate(row))
-                    else:
-                        # As a fallback, convert the whole row to a dict
-                        row_dict = dict(row) if hasattr(row, "__iter__") else vars(row)
-                        events.append(self.event_type.model_validate(row_dict))
+        except Exception as e:
+            self.logger.error(f"Error committing {len(batch)} grouped appends: {e}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        for pending, outcome in outcomes:
+            if pending.future.done():
+                continue
+            if isinstance(outcome, Exception):
+                pending.future.set_exception(outcome)
+            else:
+                pending.future.set_result(outcome)
+
+    async def _append(
+        self,
+        session: AsyncSession,
+        aggregate_id: str,
+        events: List[E],
+        expected_version: Optional[int],
+        metadata: Optional[Dict[str, Any]],
+    ) -> int:
+        """
+        Write events to an aggregate's stream within the session's transaction.
 
-                except Exception as e:
-                    self.logger.error(f"Error processing row {row}: {e}")
-                    continue
+        Args:
+            session: The session to write with
+            aggregate_id: The ID of the aggregate the events belong to
+            events: The events to append, in order
+            expected_version: The version the stream must be at, or None
+            metadata: Optional metadata to store with each event
 
-            return events
+        Returns:
+            The version of the stream after the append
+
+        Raises:
+            ConcurrencyError: If the stream is not at the expected version
+        """
+        # Serialize appends to the aggregate until the transaction ends
+        await session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"{self.schema}.{self.table_name}:{aggregate_id}"},
+        )
+        result = await session.execute(
+            select(func.coalesce(func.max(self.events_table.c.version), 0)).where(
+                self.events_table.c.aggregate_id == aggregate_id
+            )
+        )
+        current_version = result.scalar_one()
+
+        if expected_version is not None and current_version != expected_version:
+            aggregate_type = events[0].aggregate_type if events else None
+            raise ConcurrencyError(
+                aggregate_type or "aggregate",
+                aggregate_id,
+                expected_version=expected_version,
+                actual_version=current_version,
+            )
+
+        if not events:
+            return current_version
+
+        rows = [
+            self._event_row(event, aggregate_id, metadata, current_version + index)
+            for index, event in enumerate(events, start=1)
+        ]
+        if len(rows) >= self.copy_threshold and await self._copy_rows(session, rows):
+            return current_version + len(rows)
+
+        # Stay well below the bind parameter limit of a statement
+        chunk_size = self.copy_threshold or len(rows)
+        for start in range(0, len(rows), chunk_size):
+            await session.execute(
+                insert(self.events_table).values(rows[start : start + chunk_size])
+            )
+
+        return current_version + len(rows)
+
+    async def _copy_rows(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Write rows with COPY, if the database driver supports it.
+
+        Args:
+            session: The session to write with
+            rows: The rows to write
+
+        Returns:
+            True if the rows were written, False if COPY is not available
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = getattr(raw_connection, "driver_connection", None)
+        if not hasattr(driver_connection, "copy_records_to_table"):
+            return False
+
+        columns = list(rows[0])
+        records = [
+            tuple(
+                json.dumps(row[column])
+                if column in ("data", "metadata") and row[column] is not None
+                else row[column]
+                for column in columns
+            )
+            for row in rows
+        ]
+        await driver_connection.copy_records_to_table(
+            self.table_name, records=records, columns=columns, schema_name=self.schema
+        )
+        return True
+
+    def _event_row(
+        self,
+        event: E,
+        aggregate_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        version: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the table row of an event.
+
+        Args:
+            event: The domain event
+            aggregate_id: Optional ID of the aggregate that generated this event
+            metadata: Optional metadata to store with the event
+            version: The event's version in the aggregate's stream, or None
+                for an event outside any stream
+
+        Returns:
+            The column values of the row
+        """
+        # Prepare event data
+        event_data = event.model_dump(mode="json")
+
+        # Extract standard fields
+        event_id = event_data.pop("event_id", None) or str(event.event_id)
+        event_type = event_data.pop("event_type", None) or event.event_type
+        event_data.pop("timestamp", None)
+
+        # Determine aggregate details
+        aggregate_type = event_data.pop("aggregate_type", None)
+
+        # Use provided aggregate ID or extract from event if available
+        event_aggregate_id = event_data.pop("aggregate_id", None)
+        if aggregate_id is None:
+            aggregate_id = event_aggregate_id
+
+        # The stored version is the one assigned by the stream
+        if version is not None:
+            event_data["version"] = version
+
+        return {
+            "event_id": event_id,
+            "event_type": event_type,
+            "aggregate_id": aggregate_id,
+            "aggregate_type": aggregate_type,
+            "timestamp": event.timestamp,
+            # Only stream rows are versioned; (aggregate_id, version) is unique
+            "version": version,
+            "data": event_data,
+            "metadata": metadata,
+        }
+
+    async def get_events_by_aggregate_id(
+        self,
+        aggregate_id: str,
+        event_types: Optional[List[str]] = None,
+        after_version: Optional[int] = None,
+    ) -> List[E]:
+        """
+        Get all events for a specific aggregate ID.
+
+        Args:
+            aggregate_id: The ID of the aggregate to get events for
+            event_types: Optional list of event types to filter by
+            after_version: Optional stream version to get the events after,
+                e.g. the version of a snapshot
+
+        Returns:
+            List of events for the aggregate, in stream order
+        """
+        try:
+            return [
+                event
+                async for event in self.stream_events(
+                    aggregate_id=aggregate_id,
+                    event_types=event_types,
+                    after_version=after_version,
+                )
+            ]
 
         except Exception as e:
             self.logger.error(f"Error fetching events by aggregate ID: {e}")
@@ -293,66 +628,409 @@ class PostgresEventStore(EventStore[E]):
             List of events matching the criteria
         """
         try:
-            # Build query
-            query = select(self.events_table).where(
-                self.events_table.c.event_type == event_type
+            return [
+                event
+                async for event in self.stream_events(event_types=[event_type], since=since)
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Error fetching events by type: {e}")
+            return []
+
+    async def stream_events_by_aggregate_id(
+        self, aggregate_id: str, after_version: Optional[int] = None
+    ) -> AsyncIterator[E]:
+        """
+        Iterate over the events of an aggregate without loading them all.
+
+        Args:
+            aggregate_id: The ID of the aggregate to get events for
+            after_version: Optional stream version to get the events after
+
+        Yields:
+            The events of the aggregate, in stream order
+        """
+        async for event in self.stream_events(
+            aggregate_id=aggregate_id, after_version=after_version
+        ):
+            yield event
+
+    async def stream_events(
+        self,
+        aggregate_id: Optional[str] = None,
+        event_types: Optional[List[str]] = None,
+        after_version: Optional[int] = None,
+        since: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[E]:
+        """
+        Iterate over stored events, fetching them in pages.
+
+        Rows are read through a server-side cursor, ``page_size`` at a time,
+        so replaying a long history runs in constant memory. Rows that cannot
+        be decoded are logged and skipped.
+
+        Args:
+            aggregate_id: Optional ID of the aggregate to get events for
+            event_types: Optional list of event types to filter by
+            after_version: Optional stream version to get the events after;
+                only meaningful with an aggregate ID
+            since: Optional timestamp to get the events since
+            page_size: Number of rows fetched at a time, defaults to the
+                store's page size
+
+        Yields:
+            The events, in stream order for an aggregate and in timestamp
+            order otherwise
+        """
+        table = self.events_table
+        query = select(
+            table.c.event_id,
+            table.c.event_type,
+            table.c.aggregate_id,
+            table.c.timestamp,
+            # Decoded by _decode_row rather than by the JSONB result processor
+            cast(table.c.data, TEXT).label("data"),
+        )
+
+        if aggregate_id is not None:
+            query = query.where(table.c.aggregate_id == aggregate_id).order_by(
+                table.c.version, table.c.timestamp
             )
+        else:
+            query = query.order_by(table.c.timestamp, table.c.event_id)
+
+        if event_types:
+            query = query.where(table.c.event_type.in_(event_types))
+        if after_version is not None:
+            query = query.where(table.c.version > after_version)
+        if since is not None:
+            query = query.where(table.c.timestamp >= since)
+
+        page_size = page_size or self.page_size
+        async with async_session() as session:
+            result = await session.stream(query.execution_options(yield_per=page_size))
+            async for page in result.partitions():
+                for row in page:
+                    try:
+                        event = self._decode_row(row)
+                    except Exception as e:
+                        self.logger.error(f"Error decoding event {row.event_id}: {e}")
+                        continue
+                    yield event
+
+    async def read_feed(
+        self, after_position: int = 0, limit: Optional[int] = None
+    ) -> List[Tuple[int, Optional[E]]]:
+        """
+        Read the global event feed, in commit order.
 
-            # Add timestamp filter if provided
-            if since:
-                query = query.where(self.events_table.c.timestamp >= since)
+        Appends take no global lock, so positions are not handed out in
+        commit order. The feed is ordered by inserting transaction instead,
+        and only holds events of transactions older than every transaction
+        still in progress. Such a transaction can no longer commit events,
+        so reading from the position of the last processed event never
+        skips an event committed later.
 
-            # Order by timestamp
-            query = query.order_by(self.events_table.c.timestamp)
+        Args:
+            after_position: The position to read after, 0 for the beginning
+            limit: Maximum number of events to read, defaults to the page size
 
-            # Execute query
-            async with async_session() as session:
-                result = await session.execute(query)
+        Returns:
+            List of (position, event) pairs, in feed order; the event is
+            None if it cannot be decoded, so that readers still advance past it
+        """
+        table = self.events_table
+        feed_order = tuple_(table.c.transaction_id, table.c.position)
+        checkpoint = table.alias("checkpoint")
+        after_transaction_id = (
+            select(checkpoint.c.transaction_id)
+            .where(checkpoint.c.position == after_position)
+            .scalar_subquery()
+        )
+        visibility_horizon = literal_column(
+            "pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+        )
+        query = (
+            select(
+                table.c.position,
+                table.c.event_id,
+                table.c.event_type,
+                table.c.aggregate_id,
+                table.c.timestamp,
+                cast(table.c.data, TEXT).label("data"),
+            )
+            .where(
+                feed_order > tuple_(func.coalesce(after_transaction_id, -1), after_position),
+                table.c.transaction_id < visibility_horizon,
+            )
+            .order_by(table.c.transaction_id, table.c.position)
+            .limit(limit or self.page_size)
+        )
+
+        async with async_session() as session:
+            result = await session.execute(query)
+            rows = result.all()
+
+        feed = []
+        for row in rows:
+            try:
+                event = self._decode_row(row)
+            except Exception as e:
+                self.logger.error(f"Error decoding event {row.event_id}: {e}")
+                event = None
+            feed.append((row.position, event))
+        return feed
+
+    @asynccontextmanager
+    async def listen(self, callback: Callable[[str], None]) -> AsyncIterator[bool]:
+        """
+        Listen for notifications of inserted events.
+
+        A connection is held for as long as the context is open. The callback
+        receives the notification payload, and is called on the event loop.
+
+        Args:
+            callback: Function called for each notification
+
+        Yields:
+            True if listening, False if the database driver does not support it
+        """
+        async with async_session() as session:
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = getattr(raw_connection, "driver_connection", None)
+            if not hasattr(driver_connection, "add_listener"):
+                yield False
+                return
+
+            def listener(connection: Any, pid: int, channel: str, payload: str) -> None:
+                callback(payload)
+
+            await driver_connection.add_listener(self.NOTIFY_CHANNEL, listener)
+            try:
+                yield True
+            finally:
                 try:
-                    rows = (
-                        await result.fetchall()
-                        if hasattr(result.fetchall, "__await__")
-                        else result.fetchall()
-                    )
+                    await driver_connection.remove_listener(self.NOTIFY_CHANNEL, listener)
                 except Exception as e:
-                    self.logger.error(f"Error fetching result rows: {e}")
-                    rows = []
+                    self.logger.warning(f"Error removing event listener: {e}")
 
-            # Convert rows to domain events
-            events = []
-            for row in rows:
-                try:
-                    # Handle different row data formats
-                    if hasattr(row, "data"):
-                        # For database rows with column objects
-                        data = row.data
-                        event_data = json.loads(data) if isinstance(data, str) else data
-                        event_data.update(
-                            {
-                                "event_id": row.event_id,
-                                "event_type": row.event_type,
-                                "timestamp": row.timestamp,
-                                "aggregate_id": getattr(row, "aggregate_id", None),
-                            }
-                        )
-                        events.append(self.event_type.model_validate(event_data))
-                    elif isinstance(row, dict):
-                        # For dictionary rows
-                        events.append(self.event_type.model_validate(row))
-                    else:
-                        # As a fallback, convert the whole row to a dict
-                        row_dict = dict(row) if hasattr(row, "__iter__") else vars(row)
-                        events.append(self.event_type.model_validate(row_dict))
+    def register_event_type(
+        self, event_class: Type[E], event_type: Optional[str] = None
+    ) -> None:
+        """
+        Decode events of a type into a specific event class.
 
-                except Exception as e:
-                    self.logger.error(f"Error processing row {row}: {e}")
-                    continue
+        Events of unregistered types are decoded into the store's event type.
+
+        Args:
+            event_class: The event class
+            event_type: The stored event type, defaults to the class's
+                default ``event_type``
+        """
+        if event_type is None:
+            event_type = event_class.model_fields["event_type"].default
+        self._event_classes[event_type] = event_class
+        self._decoders.pop(event_type, None)
+
+    def _decoder(self, event_type: str) -> Callable[[Dict[str, Any]], E]:
+        """
+        Get the decoder of an event type, building it on first use.
+
+        Args:
+            event_type: The stored event type
+
+        Returns:
+            Function validating event data into an event
+        """
+        decoder = self._decoders.get(event_type)
+        if decoder is None:
+            event_class = self._event_classes.get(event_type, self.event_type)
+            decoder = TypeAdapter(event_class).validate_python
+            self._decoders[event_type] = decoder
+        return decoder
+
+    def _decode_row(self, row: Any) -> E:
+        """
+        Decode a row into an event.
+
+        Args:
+            row: A row with the event columns and the data as JSON text
+
+        Returns:
+            The event
+        """
+        event_data = _decode_json(row.data)
+        if isinstance(event_data, str):
+            # Rows written before events were stored as JSON objects
+            event_data = _decode_json(event_data)
+
+        event_data["event_id"] = row.event_id
+        event_data["event_type"] = row.event_type
+        event_data["timestamp"] = row.timestamp
+        event_data["aggregate_id"] = row.aggregate_id
+        return self._decoder(row.event_type)(event_data)
+
+
+@dataclass
+class AggregateSnapshot:
+    """
+    The state of an aggregate at a version of its event stream.
+
+    Attributes:
+        aggregate_id: The ID of the aggregate
+        aggregate_type: The type name of the aggregate
+        version: The stream version the state reflects
+        state: The serialized state of the aggregate
+    """
+
+    aggregate_id: str
+    aggregate_type: str
+    version: int
+    state: Dict[str, Any]
+
+
+class SnapshotStore:
+    """
+    Abstract base class for aggregate snapshot stores.
+
+    A snapshot store keeps the latest snapshot of each aggregate, so that
+    loading an aggregate only replays the events recorded after it.
+    """
+
+    async def get_snapshot(
+        self, aggregate_id: str, aggregate_type: str
+    ) -> Optional[AggregateSnapshot]:
+        """
+        Get the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            aggregate_type: The type name of the aggregate
+
+        Returns:
+            The snapshot, or None if the aggregate has none
+        """
+        raise NotImplementedError
+
+    async def save_snapshot(self, snapshot: AggregateSnapshot) -> None:
+        """
+        Save a snapshot, replacing older snapshots of the aggregate.
+
+        Args:
+            snapshot: The snapshot to save
+        """
+        raise NotImplementedError
+
+
+class PostgresSnapshotStore(SnapshotStore):
+    """
+    PostgreSQL implementation of the snapshot store.
+
+    Snapshots are kept in the aggregate_snapshots table created by the
+    CreateEventSnapshotsTable SQL emitter, one row per aggregate.
+    """
+
+    SNAPSHOT_TABLE_NAME = "aggregate_snapshots"
+
+    def __init__(
+        self,
+        table_name: str = SNAPSHOT_TABLE_NAME,
+        schema: str = PostgresEventStore.EVENT_TABLE_SCHEMA,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the PostgreSQL snapshot store.
+
+        Args:
+            table_name: The name of the table to store snapshots in
+            schema: The database schema to use
+            logger: Optional logger for diagnostic information
+        """
+        self.table_name = table_name
+        self.schema = schema
+        self.logger = logger or logging.getLogger(__name__)
+
+        # Define table structure
+        metadata = MetaData()
+        self.snapshots_table = Table(
+            self.table_name,
+            metadata,
+            Column("aggregate_id", String(36), primary_key=True),
+            Column("aggregate_type", String(100), primary_key=True),
+            Column("version", Integer, nullable=False),
+            Column("timestamp", TIMESTAMP, nullable=False),
+            Column("state", JSONB, nullable=False),
+            schema=self.schema,
+        )
+
+    async def get_snapshot(
+        self, aggregate_id: str, aggregate_type: str
+    ) -> Optional[AggregateSnapshot]:
+        """
+        Get the latest snapshot of an aggregate.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            aggregate_type: The type name of the aggregate
+
+        Returns:
+            The snapshot, or None if the aggregate has none or it cannot be read
+        """
+        try:
+            query = select(
+                self.snapshots_table.c.version, self.snapshots_table.c.state
+            ).where(
+                self.snapshots_table.c.aggregate_id == aggregate_id,
+                self.snapshots_table.c.aggregate_type == aggregate_type,
+            )
+
+            async with async_session() as session:
+                result = await session.execute(query)
+                row = result.first()
+
+            if row is None:
+                return None
 
-            return events
+            state = json.loads(row.state) if isinstance(row.state, str) else row.state
+            return AggregateSnapshot(aggregate_id, aggregate_type, row.version, state)
 
         except Exception as e:
-            self.logger.error(f"Error fetching events by type: {e}")
-            return []
+            # Without a snapshot the aggregate is rebuilt from its full history
+            self.logger.error(f"Error fetching snapshot of {aggregate_id}: {e}")
+            return None
+
+    async def save_snapshot(self, snapshot: AggregateSnapshot) -> None:
+        """
+        Save a snapshot, unless a snapshot of a later version is stored.
+
+        Args:
+            snapshot: The snapshot to save
+        """
+        statement = pg_insert(self.snapshots_table).values(
+            aggregate_id=snapshot.aggregate_id,
+            aggregate_type=snapshot.aggregate_type,
+            version=snapshot.version,
+            timestamp=func.now(),
+            state=snapshot.state,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                self.snapshots_table.c.aggregate_id,
+                self.snapshots_table.c.aggregate_type,
+            ],
+            set_={
+                "version": statement.excluded.version,
+                "timestamp": statement.excluded.timestamp,
+                "state": statement.excluded.state,
+            },
+            where=self.snapshots_table.c.version < statement.excluded.version,
+        )
+
+        async with async_session() as session:
+            await session.execute(statement)
+            await session.commit()
 
 
 class EventSourcedRepository(Generic[E]):
@@ -361,13 +1039,24 @@ class EventSourcedRepository(Generic[E]):
 
     This implementation rebuilds aggregates from their event history,
     enabling full auditability and temporal queries.
+
+    With a snapshot store, a snapshot is saved whenever an aggregate's stream
+    crosses a multiple of ``snapshot_interval`` events, and loading replays
+    only the events after the latest snapshot. Loaded aggregates are kept in
+    an in-process LRU cache of ``cache_size`` entries.
     """
 
+    # Event type appended by remove(); an aggregate with one is not loaded
+    DELETED_EVENT_TYPE = "aggregate_deleted"
+
     def __init__(
         self,
         aggregate_type: Type[AggregateRoot],
         event_store: EventStore,
         logger: Optional[logging.Logger] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
+        snapshot_interval: int = 100,
+        cache_size: int = 1000,
     ):
         """
         Initialize the event-sourced repository.
@@ -376,11 +1065,19 @@ class EventSourcedRepository(Generic[E]):
             aggregate_type: The type of aggregate this repository manages
             event_store: The event store to use for event persistence and retrieval
             logger: Optional logger for diagnostic information
+            snapshot_store: Optional store for aggregate snapshots
+            snapshot_interval: Number of events between snapshots
+            cache_size: Maximum number of aggregates kept in memory
         """
         self.aggregate_type = aggregate_type
         self.event_store = event_store
         self.logger = logger or logging.getLogger(__name__)
-        self._snapshots: Dict[str, AggregateRoot] = {}  # In-memory cache for snapshots
+        self.snapshot_store = snapshot_store
+        self.snapshot_interval = snapshot_interval
+        self.cache_size = cache_size
+
+        # In-memory LRU cache of aggregates and their stream versions
+        self._snapshots: "OrderedDict[str, Tuple[AggregateRoot, Optional[int]]]" = OrderedDict()
 
     async def save(self, aggregate: AggregateRoot) -> AggregateRoot:
         """
@@ -398,19 +1095,43 @@ class EventSourcedRepository(Generic[E]):
         # Collect all domain events from the aggregate
         events = aggregate.clear_events()
 
-        # Save each event to the event store
-        for event in events:
-            # Set the aggregate information on the event if not already set
-            if not event.aggregate_id:
-                event = event.with_metadata(
-                    aggregate_id=str(aggregate.id),
-                    aggregate_type=self.aggregate_type.__name__,
+        # Set the aggregate information on the events if not already set
+        events = [
+            event
+            if event.aggregate_id
+            else event.model_copy(
+                update={
+                    "aggregate_id": str(aggregate.id),
+                    "aggregate_type": self.aggregate_type.__name__,
+                }
+            )
+            for event in events
+        ]
+
+        # Append the events to the aggregate's stream in one write, checked
+        # against the version the aggregate was loaded at
+        if events:
+            try:
+                version = await self.event_store.append_events(
+                    str(aggregate.id),
+                    events,
+                    expected_version=self._loaded_version(aggregate),
                 )
+            except ConcurrencyError:
+                # The cached aggregate is stale, reload it on next access
+                self._snapshots.pop(str(aggregate.id), None)
+                raise
+        else:
+            version = self._cached_version(str(aggregate.id))
 
-            await self.event_store.save_event(event)
+        # Snapshot when the stream crosses a multiple of the interval
+        if version is not None and events:
+            previous_version = version - len(events)
+            if version // self.snapshot_interval > previous_version // self.snapshot_interval:
+                await self._save_snapshot(aggregate, version)
 
-        # Update the snapshot cache
-        self._snapshots[str(aggregate.id)] = aggregate
+        # Update the aggregate cache
+        self._cache(str(aggregate.id), aggregate, version)
 
         return aggregate
 
@@ -424,9 +1145,10 @@ class EventSourcedRepository(Generic[E]):
         Returns:
             The aggregate if found, None otherwise
         """
-        # Check if we have a snapshot in the cache
+        # Check if we have the aggregate in the cache
         if id in self._snapshots:
-            return self._snapshots[id]
+            self._snapshots.move_to_end(id)
+            return self._snapshots[id][0]
 
         # Otherwise, rebuild the aggregate from events
         return await self.get_by_id(id)
@@ -435,27 +1157,63 @@ class EventSourcedRepository(Generic[E]):
         """
         Get an aggregate by rebuilding it from its event history.
 
+        The aggregate is restored from its latest snapshot, if any, and the
+        events recorded after the snapshot are replayed on top of it.
+
         Args:
             id: The ID of the aggregate to retrieve
 
         Returns:
-            The reconstructed aggregate if found, None otherwise
+            The reconstructed aggregate if found and not removed, None otherwise
         """
-        # Get all events for this aggregate
-        events = await self.event_store.get_events_by_aggregate_id(id)
+        snapshot = None
+        if self.snapshot_store is not None:
+            snapshot = await self.snapshot_store.get_snapshot(
+                id, self.aggregate_type.__name__
+            )
 
-        if not events:
-            return None
+        if snapshot is not None:
+            try:
+                aggregate = self._restore_snapshot(snapshot)
+            except Exception as e:
+                # E.g. the aggregate's fields changed since the snapshot was taken
+                self.logger.warning(f"Ignoring snapshot of aggregate {id}: {e}")
+                snapshot = None
+
+        if snapshot is not None:
+            # Replay the events recorded since the snapshot
+            version = snapshot.version
+            after_version = snapshot.version
+        else:
+            # Replay the whole history on a new instance of the aggregate
+            aggregate = None
+            version = 0
+            after_version = None
+
+        # Apply each event to rebuild the aggregate's state, streaming them
+        # so that long histories are not loaded at once
+        replayed = 0
+        async for event in self.event_store.stream_events_by_aggregate_id(
+            id, after_version=after_version
+        ):
+            if event.event_type == self.DELETED_EVENT_TYPE:
+                # The aggregate was removed
+                return None
+            if aggregate is None:
+                aggregate = self.aggregate_type(id=id)
+            self._apply_event(aggregate, event)
+            replayed += 1
 
-        # Create a new instance of the aggregate
-        aggregate = self.aggregate_type(id=id)
+        if aggregate is None:
+            return None
+        version += replayed
 
-        # Apply each event to rebuild the aggregate's state
-        for event in events:
-            self._apply_event(aggregate, event)
+        # Snapshot long replays so the next load is short
+        if self.snapshot_store is not None and replayed >= self.snapshot_interval:
+            await self._save_snapshot(aggregate, version)
 
         # Cache the reconstructed aggregate
-        self._snapshots[id] = aggregate
+        self._cache(id, aggregate, version)
 
         return aggregate
 
@@ -548,17 +1306,112 @@ class EventSourcedRepository(Generic[E]):
         from uno.domain.events import DomainEvent
 
         event = DomainEvent(
-            event_type="aggregate_deleted",
+            event_type=self.DELETED_EVENT_TYPE,
             aggregate_id=str(aggregate.id),
             aggregate_type=self.aggregate_type.__name__,
         )
 
-        # Add the event to the store
-        await self.event_store.save_event(event)
+        # Append the event to the aggregate's stream, so that it is numbered
+        # after the events it deletes and replayed after any snapshot
+        await self.event_store.append_events(
+            str(aggregate.id), [event], expected_version=self._loaded_version(aggregate)
+        )
+
+        # Remove from the aggregate cache
+        self._snapshots.pop(str(aggregate.id), None)
+
+    def _cache(self, id: str, aggregate: AggregateRoot, version: Optional[int]) -> None:
+        """
+        Cache an aggregate, evicting the least recently used ones.
+
+        Args:
+            id: The aggregate ID
+            aggregate: The aggregate
+            version: The stream version of the aggregate, if known
+        """
+        self._snapshots[id] = (aggregate, version)
+        self._snapshots.move_to_end(id)
+        while len(self._snapshots) > self.cache_size:
+            self._snapshots.popitem(last=False)
+
+    def _cached_version(self, id: str) -> Optional[int]:
+        """
+        Get the stream version of a cached aggregate.
+
+        Args:
+            id: The aggregate ID
+
+        Returns:
+            The stream version, or None if unknown
+        """
+        entry = self._snapshots.get(id)
+        return entry[1] if entry is not None else None
+
+    def _loaded_version(self, aggregate: AggregateRoot) -> Optional[int]:
+        """
+        Get the stream version an aggregate was loaded or last saved at.
+
+        Args:
+            aggregate: The aggregate
+
+        Returns:
+            The stream version, or None if the aggregate was not loaded through
+            this repository or has been evicted from its cache
+        """
+        entry = self._snapshots.get(str(aggregate.id))
+        if entry is None or entry[0] is not aggregate:
+            return None
+        return entry[1]
+
+    async def _save_snapshot(self, aggregate: AggregateRoot, version: int) -> None:
+        """
+        Save a snapshot of an aggregate, logging rather than raising failures.
+
+        Args:
+            aggregate: The aggregate
+            version: The stream version the aggregate's state reflects
+        """
+        if self.snapshot_store is None:
+            return
 
-        # Remove from snapshot cache
-        if str(aggregate.id) in self._snapshots:
-            del self._snapshots[str(aggregate.id)]
+        try:
+            await self.snapshot_store.save_snapshot(
+                AggregateSnapshot(
+                    aggregate_id=str(aggregate.id),
+                    aggregate_type=self.aggregate_type.__name__,
+                    version=version,
+                    state=self._snapshot_state(aggregate),
+                )
+            )
+        except Exception as e:
+            self.logger.warning(f"Error saving snapshot of aggregate {aggregate.id}: {e}")
+
+    def _snapshot_state(self, aggregate: AggregateRoot) -> Dict[str, Any]:
+        """
+        Serialize the state of an aggregate for a snapshot.
+
+        Override this and _restore_snapshot for aggregates whose state is not
+        fully captured by their model fields.
+
+        Args:
+            aggregate: The aggregate
+
+        Returns:
+            The serialized state
+        """
+        return aggregate.model_dump(mode="json", exclude={"events", "child_entities"})
+
+    def _restore_snapshot(self, snapshot: AggregateSnapshot) -> AggregateRoot:
+        """
+        Restore an aggregate from a snapshot.
+
+        Args:
+            snapshot: The snapshot
+
+        Returns:
+            The restored aggregate
+        """
+        return self.aggregate_type.model_validate(snapshot.state)
 
     def _apply_event(self, aggregate: AggregateRoot, event: DomainEvent) -> None:
         """
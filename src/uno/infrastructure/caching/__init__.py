@@ -21,6 +21,14 @@ from uno.caching.decorators import (
     cache_aside
 )
 from uno.caching.key import get_cache_key
+from uno.caching.serialization import (
+    Codec,
+    Compressor,
+    Serializer,
+    SerializationError,
+    register_codec,
+    register_compressor
+)
 from uno.caching.invalidation import (
     InvalidationStrategy,
     TimeBasedInvalidation,
@@ -105,6 +113,12 @@ __all__ = [
     "invalidate_cache",
     "cache_aside",
     "get_cache_key",
+    "Codec",
+    "Compressor",
+    "Serializer",
+    "SerializationError",
+    "register_codec",
+    "register_compressor",
     "InvalidationStrategy",
     "TimeBasedInvalidation",
     "EventBasedInvalidation",
@@ -14,10 +14,13 @@ class LocalCacheConfig:
     type: Literal["memory", "file"] = "memory"
     max_size: int = 1000  # Max number of items for memory cache or MB for file cache
     ttl: int = 300  # Default TTL in seconds
-    serializer: str = "pickle"  # Default serializer
+    serializer: str = "pickle"  # Codec for file cache entries: pickle, json, msgpack or orjson
+    compression: Optional[str] = None  # Compression for large file cache entries: zstd or lz4
+    compression_threshold: int = 1024  # Minimum encoded size in bytes to compress
     
     # Memory cache specific options
     lru_policy: bool = True  # Use LRU eviction policy
+    memory_shards: int = 1  # Lock-striped shards for memory cache, each with its own LRU order
     
     # File cache specific options
     directory: Optional[str] = None  # Cache directory for file cache
@@ -50,7 +53,9 @@ class DistributedCacheConfig:
     connect_timeout: float = 1.0
     
     # General settings
-    serializer: str = "pickle"
+    serializer: str = "pickle"  # Codec for cached values: pickle, json, msgpack or orjson
+    compression: Optional[str] = None  # Compression for large values: zstd or lz4
+    compression_threshold: int = 1024  # Minimum encoded size in bytes to compress
     prefix: str = "uno:"
     ttl: int = 300  # Default TTL in seconds
 
@@ -75,6 +80,17 @@ class InvalidationConfig:
     patterns: Dict[str, List[str]] = field(default_factory=dict)  # Entity to patterns mapping
 
 
+@dataclass
+class SingleFlightConfig:
+    """Configuration for coalesced loading in get_or_set."""
+    
+    distributed_lock: bool = False  # Coordinate loads across processes with a Redis lock
+    lock_ttl: float = 30.0  # Seconds before the lock of a crashed loader expires
+    lock_wait: float = 5.0  # Seconds to wait for another process's load before loading
+    stale_ttl: int = 0  # Seconds an expired value is served while it is refreshed
+    xfetch_beta: float = 1.0  # Eagerness of refreshing values before they expire, 0 disables
+
+
 @dataclass
 class MonitoringConfig:
     """Configuration for cache monitoring."""
@@ -108,6 +124,7 @@ class CacheConfig:
     distributed: DistributedCacheConfig = field(default_factory=DistributedCacheConfig)
     invalidation: InvalidationConfig = field(default_factory=InvalidationConfig)
     monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    single_flight: SingleFlightConfig = field(default_factory=SingleFlightConfig)
     
     # Key generation
     key_prefix: str = "uno:"
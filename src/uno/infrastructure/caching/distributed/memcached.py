@@ -3,16 +3,16 @@
 This module provides a Memcached-based distributed cache implementation.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Set, Union
-import json
-import pickle
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Set, Union
 import time
 import asyncio
 import logging
 import random
+import uuid
 from concurrent.futures import ThreadPoolExecutor
 
 from uno.caching.distributed.base import DistributedCache
+from uno.caching.serialization import MAGIC, Serializer
 
 # Import Memcached client conditionally to avoid hard dependency
 try:
@@ -24,16 +24,27 @@ except ImportError:
 
 logger = logging.getLogger("uno.caching.memcached")
 
+# Marks a value stored with the tokens of its tags
+_TAGGED = "__uno_tags__"
+
 
 class MemcachedCache(DistributedCache):
     """Memcached-based distributed cache implementation.
     
     This implementation uses Memcached as a distributed cache. It supports both
     synchronous and asynchronous operations.
+    
+    Memcached cannot list the keys written with a tag, so each tag has a
+    token stored under its own key instead. A value set with tags is stored
+    with the current tokens of its tags, and invalidating a tag replaces its
+    token, so that the values stored with the old token are treated as
+    missing when read.
     """
     
     def __init__(self, hosts: Optional[List[str]] = None, max_pool_size: int = 10,
-                 connect_timeout: float = 1.0, ttl: int = 300, prefix: str = "uno:"):
+                 connect_timeout: float = 1.0, ttl: int = 300, prefix: str = "uno:",
+                 serializer: str = "pickle", compression: Optional[str] = None,
+                 compression_threshold: int = 1024):
         """Initialize the Memcached cache.
         
         Args:
@@ -42,12 +53,16 @@ class MemcachedCache(DistributedCache):
             connect_timeout: Connection timeout in seconds.
             ttl: Default time-to-live in seconds.
             prefix: Key prefix for cache entries.
+            serializer: The codec used to encode values, e.g. "pickle", "msgpack" or "orjson".
+            compression: Optional compression for large values, e.g. "zstd" or "lz4".
+            compression_threshold: The minimum encoded size in bytes to compress.
         """
         if not MEMCACHED_AVAILABLE:
             raise ImportError("Memcached client is not available. Please install it with `pip install pymemcache aiomcache`.")
         
         self.default_ttl = ttl
         self.prefix = prefix
+        self._serializer = Serializer(serializer, compression, compression_threshold)
         self._executor = ThreadPoolExecutor(max_workers=4)
         
         # Parse host information
@@ -109,6 +124,8 @@ class MemcachedCache(DistributedCache):
         try:
             full_key = self._get_full_key(key)
             value = self._client.get(full_key)
+            if value is not None:
+                value = self._untag(value, self._client.get_multi)
             
             if value is None:
                 self._stats["misses"] += 1
@@ -132,24 +149,31 @@ class MemcachedCache(DistributedCache):
         try:
             full_key = self._get_full_key(key)
             value = await self._async_client.get(full_key.encode())
+            if value is not None:
+                value = self._deserialize(value)
+                if self._is_tagged(value):
+                    tokens = await self._get_tokens_async(list(value[_TAGGED]))
+                    value = self._untag(value, lambda tag_keys: tokens)
             
             if value is None:
                 self._stats["misses"] += 1
                 return None
             
             self._stats["hits"] += 1
-            return self._deserialize(value)
+            return value
         except Exception as e:
             logger.warning(f"Error getting value from Memcached: {e}")
             return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -160,6 +184,15 @@ class MemcachedCache(DistributedCache):
             if ttl is None:
                 ttl = self.default_ttl
             
+            if tags:
+                tag_keys = self._get_tag_keys(tags)
+                tokens = self._client.get_multi(tag_keys)
+                missing = {tag_key: uuid.uuid4().hex for tag_key in tag_keys if tag_key not in tokens}
+                if missing:
+                    self._client.set_multi(missing, expire=0)
+                    tokens.update(missing)
+                value = {_TAGGED: {tag_key: tokens[tag_key] for tag_key in tag_keys}, "value": value}
+            
             result = self._client.set(full_key, value, expire=ttl)
             
             if result:
@@ -170,19 +203,33 @@ class MemcachedCache(DistributedCache):
             logger.warning(f"Error setting value in Memcached: {e}")
             return False
     
-    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None,
+                        tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache asynchronously.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by.
             
         Returns:
             True if the value was successfully cached, False otherwise.
         """
         try:
             full_key = self._get_full_key(key)
+            
+            if tags:
+                tag_keys = self._get_tag_keys(tags)
+                tokens = await self._get_tokens_async(tag_keys)
+                missing = {tag_key: uuid.uuid4().hex for tag_key in tag_keys if tag_key not in tokens}
+                await asyncio.gather(*(
+                    self._async_client.set(tag_key.encode(), self._serialize(token), exptime=0)
+                    for tag_key, token in missing.items()
+                ))
+                tokens.update(missing)
+                value = {_TAGGED: {tag_key: tokens[tag_key] for tag_key in tag_keys}, "value": value}
+            
             serialized_value = self._serialize(value)
             
             if ttl is None:
@@ -272,6 +319,60 @@ class MemcachedCache(DistributedCache):
         logger.warning("Pattern-based invalidation is not supported by Memcached")
         return 0
     
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all values set with any of the given tags.
+        
+        The tags get new tokens; the values stored with the old tokens are
+        evicted by Memcached in due course.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of tags invalidated, as Memcached cannot count the keys.
+        """
+        tag_keys = self._get_tag_keys(tags)
+        if not tag_keys:
+            return 0
+        
+        try:
+            failed = self._client.set_multi(
+                {tag_key: uuid.uuid4().hex for tag_key in tag_keys}, expire=0
+            )
+            count = len(tag_keys) - len(failed or [])
+            self._stats["deletions"] += count
+            
+            return count
+        except Exception as e:
+            logger.warning(f"Error invalidating tags in Memcached: {e}")
+            return 0
+    
+    async def invalidate_tags_async(self, tags: Iterable[str]) -> int:
+        """Invalidate all values set with any of the given tags asynchronously.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of tags invalidated, as Memcached cannot count the keys.
+        """
+        tag_keys = self._get_tag_keys(tags)
+        if not tag_keys:
+            return 0
+        
+        try:
+            results = await asyncio.gather(*(
+                self._async_client.set(tag_key.encode(), self._serialize(uuid.uuid4().hex), exptime=0)
+                for tag_key in tag_keys
+            ))
+            count = sum(1 for result in results if result)
+            self._stats["deletions"] += count
+            
+            return count
+        except Exception as e:
+            logger.warning(f"Error invalidating tags in Memcached: {e}")
+            return 0
+    
     def clear(self) -> bool:
         """Clear all cached values.
         
@@ -416,8 +517,11 @@ class MemcachedCache(DistributedCache):
             result = {}
             for i, key in enumerate(keys):
                 full_key = full_keys[i]
-                if full_key in values:
-                    result[key] = values[full_key]
+                value = values.get(full_key)
+                if value is not None:
+                    value = self._untag(value, self._client.get_multi)
+                if value is not None:
+                    result[key] = value
                     self._stats["hits"] += 1
                 else:
                     self._stats["misses"] += 1
@@ -699,6 +803,63 @@ class MemcachedCache(DistributedCache):
         """
         return f"{self.prefix}{key}"
     
+    def _get_tag_keys(self, tags: Iterable[str]) -> List[str]:
+        """Get the keys holding the tokens of tags.
+        
+        Args:
+            tags: The tags.
+            
+        Returns:
+            The token keys, without duplicates.
+        """
+        return sorted({f"{self.prefix}__tag__:{tag}" for tag in tags})
+    
+    def _is_tagged(self, value: Any) -> bool:
+        """Check whether a stored value was set with tags.
+        
+        Args:
+            value: The stored value.
+            
+        Returns:
+            True if the value holds the tokens of its tags.
+        """
+        return isinstance(value, dict) and _TAGGED in value
+    
+    def _untag(self, value: Any, get_tokens: Any) -> Any:
+        """Unwrap a stored value, unless one of its tags was invalidated.
+        
+        Args:
+            value: The stored value.
+            get_tokens: Function returning the current tokens of token keys.
+            
+        Returns:
+            The cached value, or None if one of its tags was invalidated.
+        """
+        if not self._is_tagged(value):
+            return value
+        
+        tokens = get_tokens(list(value[_TAGGED]))
+        for tag_key, token in value[_TAGGED].items():
+            if tokens.get(tag_key) != token:
+                return None
+        return value["value"]
+    
+    async def _get_tokens_async(self, tag_keys: List[str]) -> Dict[str, Any]:
+        """Get the current tokens of tags asynchronously.
+        
+        Args:
+            tag_keys: The token keys.
+            
+        Returns:
+            A dictionary mapping token keys to tokens; missing tokens are omitted.
+        """
+        values = await self._async_client.multi_get(*(tag_key.encode() for tag_key in tag_keys))
+        return {
+            tag_key: self._deserialize(value)
+            for tag_key, value in zip(tag_keys, values)
+            if value is not None
+        }
+    
     def _serialize(self, value: Any) -> bytes:
         """Serialize a value for storage in Memcached.
         
@@ -708,8 +869,7 @@ class MemcachedCache(DistributedCache):
         Returns:
             The serialized value as bytes.
         """
-        # Use pickle for serialization
-        return pickle.dumps(value)
+        return self._serializer.dumps(value)
     
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize a value from Memcached.
@@ -720,10 +880,9 @@ class MemcachedCache(DistributedCache):
         Returns:
             The deserialized value.
         """
-        # Use pickle for deserialization
-        return pickle.loads(data)
+        return self._serializer.loads(data)
     
-    def _serialize_for_memcached(self, key: str, value: Any) -> Tuple[bytes, int, int]:
+    def _serialize_for_memcached(self, key: str, value: Any) -> Tuple[bytes, int]:
         """Serialize a value for the pymemcache client.
         
         Args:
@@ -731,10 +890,9 @@ class MemcachedCache(DistributedCache):
             value: The value to serialize.
             
         Returns:
-            A tuple of (serialized_value, flags, length).
+            A tuple of (serialized_value, flags).
         """
-        serialized_value = pickle.dumps(value)
-        return serialized_value, 1, len(serialized_value)
+        return self._serialize(value), 1
     
     def _deserialize_from_memcached(self, key: str, value: bytes, flags: int) -> Any:
         """Deserialize a value for the pymemcache client.
@@ -747,8 +905,9 @@ class MemcachedCache(DistributedCache):
         Returns:
             The deserialized value.
         """
-        if flags == 1:
-            return pickle.loads(value)
+        # Values written by the async client are stored without flags
+        if flags == 1 or value[:1] == bytes([MAGIC]):
+            return self._deserialize(value)
         return value
     
     def _parse_host(self, host_str: str) -> Tuple[str, int]:
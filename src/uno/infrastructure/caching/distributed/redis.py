@@ -3,16 +3,16 @@
 This module provides a Redis-based distributed cache implementation.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Set, Union
-import json
-import pickle
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Set, Union
 import time
+import uuid
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 from uno.caching.distributed.base import DistributedCache
+from uno.caching.serialization import Serializer
 
 # Import Redis client conditionally to avoid hard dependency
 try:
@@ -24,19 +24,81 @@ except ImportError:
 
 logger = logging.getLogger("uno.caching.redis")
 
+# Prefix of the tag set keys, e.g. "uno:tag:catalog"
+TAG_KEY_PREFIX = "tag:"
+
+# Prefix of the lock keys, e.g. "uno:lock:<key>"
+LOCK_KEY_PREFIX = "lock:"
+
+# Stores a value and adds its key to the sets of its tags. A tag set expires
+# with its longest-lived member, so setting a short-lived key never shortens
+# the TTL of the set.
+#
+# KEYS: the cache key followed by its tag set keys
+# ARGV: the serialized value and the TTL in seconds
+_TAGGED_SET_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ttl)
+for i = 2, #KEYS do
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if redis.call('TTL', KEYS[i]) < ttl then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+return 1
+"""
+
+# Atomically deletes the members of the given tag sets and the sets
+# themselves, returning the number of cache keys deleted. Members that have
+# already expired or been deleted are not counted.
+#
+# KEYS: the tag set keys
+_INVALIDATE_TAGS_SCRIPT = """
+local count = 0
+for _, tag_key in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag_key)
+    -- Unpack in batches to stay below the Lua stack limit
+    for i = 1, #members, 1000 do
+        count = count + redis.call('UNLINK', unpack(members, i, math.min(i + 999, #members)))
+    end
+    redis.call('UNLINK', tag_key)
+end
+return count
+"""
+
+# Deletes a lock only if it is still held with the given token, so a holder
+# whose lock expired cannot release a lock taken over by someone else.
+#
+# KEYS: the lock key
+# ARGV: the lock token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCache(DistributedCache):
     """Redis-based distributed cache implementation.
     
     This implementation uses Redis as a distributed cache. It supports both
     synchronous and asynchronous operations.
+    
+    Values can be set with tags. Each tag is a Redis set of the keys written
+    with it, maintained on write, so ``invalidate_tags`` deletes exactly those
+    keys with one script call instead of scanning the keyspace. A key keeps
+    its membership in the sets of tags it was previously written with, so
+    invalidating one of those tags also deletes the key.
     """
     
     def __init__(self, connection_string: Optional[str] = None, hosts: Optional[List[str]] = None,
                  username: Optional[str] = None, password: Optional[str] = None, database: int = 0,
                  use_connection_pool: bool = True, max_connections: int = 10,
                  socket_timeout: float = 2.0, socket_connect_timeout: float = 1.0,
-                 retry_on_timeout: bool = True, ttl: int = 300, prefix: str = "uno:"):
+                 retry_on_timeout: bool = True, ttl: int = 300, prefix: str = "uno:",
+                 serializer: str = "pickle", compression: Optional[str] = None,
+                 compression_threshold: int = 1024):
         """Initialize the Redis cache.
         
         Args:
@@ -52,12 +114,16 @@ class RedisCache(DistributedCache):
             retry_on_timeout: Whether to retry on timeout.
             ttl: Default time-to-live in seconds.
             prefix: Key prefix for cache entries.
+            serializer: The codec used to encode values, e.g. "pickle", "msgpack" or "orjson".
+            compression: Optional compression for large values, e.g. "zstd" or "lz4".
+            compression_threshold: The minimum encoded size in bytes to compress.
         """
         if not REDIS_AVAILABLE:
             raise ImportError("Redis client is not available. Please install it with `pip install redis`.")
         
         self.default_ttl = ttl
         self.prefix = prefix
+        self._serializer = Serializer(serializer, compression, compression_threshold)
         self._executor = ThreadPoolExecutor(max_workers=4)
         
         # Parse connection information
@@ -131,6 +197,15 @@ class RedisCache(DistributedCache):
                 retry_on_timeout=retry_on_timeout
             )
         
+        # Tag scripts; the client is passed on every call so that they can
+        # also run in pipelines
+        self._tagged_set_script = self._client.register_script(_TAGGED_SET_SCRIPT)
+        self._invalidate_tags_script = self._client.register_script(_INVALIDATE_TAGS_SCRIPT)
+        self._async_tagged_set_script = self._async_client.register_script(_TAGGED_SET_SCRIPT)
+        self._async_invalidate_tags_script = self._async_client.register_script(_INVALIDATE_TAGS_SCRIPT)
+        self._release_lock_script = self._client.register_script(_RELEASE_LOCK_SCRIPT)
+        self._async_release_lock_script = self._async_client.register_script(_RELEASE_LOCK_SCRIPT)
+        
         # Statistics
         self._stats = {
             "hits": 0,
@@ -186,13 +261,15 @@ class RedisCache(DistributedCache):
             logger.warning(f"Error getting value from Redis: {e}")
             return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -204,7 +281,14 @@ class RedisCache(DistributedCache):
             if ttl is None:
                 ttl = self.default_ttl
             
-            result = self._client.set(full_key, serialized_value, ex=ttl)
+            if tags:
+                result = self._tagged_set_script(
+                    keys=[full_key, *self._get_tag_keys(tags)],
+                    args=[serialized_value, ttl],
+                    client=self._client
+                )
+            else:
+                result = self._client.set(full_key, serialized_value, ex=ttl)
             
             if result:
                 self._stats["insertions"] += 1
@@ -214,13 +298,15 @@ class RedisCache(DistributedCache):
             logger.warning(f"Error setting value in Redis: {e}")
             return False
     
-    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None,
+                        tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache asynchronously.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -232,7 +318,14 @@ class RedisCache(DistributedCache):
             if ttl is None:
                 ttl = self.default_ttl
             
-            result = await self._async_client.set(full_key, serialized_value, ex=ttl)
+            if tags:
+                result = await self._async_tagged_set_script(
+                    keys=[full_key, *self._get_tag_keys(tags)],
+                    args=[serialized_value, ttl],
+                    client=self._async_client
+                )
+            else:
+                result = await self._async_client.set(full_key, serialized_value, ex=ttl)
             
             if result:
                 self._stats["insertions"] += 1
@@ -319,14 +412,7 @@ class RedisCache(DistributedCache):
         """
         try:
             full_pattern = self._get_full_key(pattern)
-            
-            # Scan for matching keys
-            keys = []
-            cursor = b"0"
-            
-            while cursor != b"0":
-                cursor, partial_keys = await self._async_client.scan(cursor=cursor, match=full_pattern)
-                keys.extend(partial_keys)
+            keys = [key async for key in self._async_client.scan_iter(match=full_pattern)]
             
             if not keys:
                 return 0
@@ -339,6 +425,50 @@ class RedisCache(DistributedCache):
             logger.warning(f"Error invalidating pattern in Redis: {e}")
             return 0
     
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all keys set with any of the given tags.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of keys invalidated.
+        """
+        tag_keys = self._get_tag_keys(tags)
+        if not tag_keys:
+            return 0
+        
+        try:
+            count = self._invalidate_tags_script(keys=tag_keys, client=self._client)
+            self._stats["deletions"] += count
+            
+            return count
+        except redis.RedisError as e:
+            logger.warning(f"Error invalidating tags in Redis: {e}")
+            return 0
+    
+    async def invalidate_tags_async(self, tags: Iterable[str]) -> int:
+        """Invalidate all keys set with any of the given tags asynchronously.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of keys invalidated.
+        """
+        tag_keys = self._get_tag_keys(tags)
+        if not tag_keys:
+            return 0
+        
+        try:
+            count = await self._async_invalidate_tags_script(keys=tag_keys, client=self._async_client)
+            self._stats["deletions"] += count
+            
+            return count
+        except redis.RedisError as e:
+            logger.warning(f"Error invalidating tags in Redis: {e}")
+            return 0
+    
     def clear(self) -> bool:
         """Clear all cached values with this prefix.
         
@@ -368,14 +498,7 @@ class RedisCache(DistributedCache):
         try:
             # Delete all keys with the specified prefix
             pattern = self._get_full_key("*")
-            
-            # Scan for matching keys
-            keys = []
-            cursor = b"0"
-            
-            while cursor != b"0":
-                cursor, partial_keys = await self._async_client.scan(cursor=cursor, match=pattern)
-                keys.extend(partial_keys)
+            keys = [key async for key in self._async_client.scan_iter(match=pattern)]
             
             if not keys:
                 return True
@@ -474,11 +597,8 @@ class RedisCache(DistributedCache):
             # Count keys with the specified prefix
             pattern = self._get_full_key("*")
             key_count = 0
-            cursor = b"0"
-            
-            while cursor != b"0":
-                cursor, partial_keys = await self._async_client.scan(cursor=cursor, match=pattern)
-                key_count += len(partial_keys)
+            async for _ in self._async_client.scan_iter(match=pattern):
+                key_count += 1
             
             stats["key_count"] = key_count
             
@@ -572,12 +692,14 @@ class RedisCache(DistributedCache):
             logger.warning(f"Error getting multiple values from Redis: {e}")
             return {}
     
-    def multi_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    def multi_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None,
+                  tags: Optional[Iterable[str]] = None) -> bool:
         """Set multiple values in the cache.
         
         Args:
             mapping: A dictionary mapping keys to values.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the values by.
             
         Returns:
             True if all values were successfully cached, False otherwise.
@@ -588,15 +710,23 @@ class RedisCache(DistributedCache):
         try:
             # Get full keys and serialize values
             pipeline = self._client.pipeline()
+            tag_keys = self._get_tag_keys(tags) if tags else []
+            
+            if ttl is None:
+                ttl = self.default_ttl
             
             for key, value in mapping.items():
                 full_key = self._get_full_key(key)
                 serialized_value = self._serialize(value)
                 
-                if ttl is None:
-                    ttl = self.default_ttl
-                
-                pipeline.set(full_key, serialized_value, ex=ttl)
+                if tag_keys:
+                    self._tagged_set_script(
+                        keys=[full_key, *tag_keys],
+                        args=[serialized_value, ttl],
+                        client=pipeline
+                    )
+                else:
+                    pipeline.set(full_key, serialized_value, ex=ttl)
             
             # Execute the pipeline
             results = pipeline.execute()
@@ -610,12 +740,14 @@ class RedisCache(DistributedCache):
             logger.warning(f"Error setting multiple values in Redis: {e}")
             return False
     
-    async def multi_set_async(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    async def multi_set_async(self, mapping: Dict[str, Any], ttl: Optional[int] = None,
+                              tags: Optional[Iterable[str]] = None) -> bool:
         """Set multiple values in the cache asynchronously.
         
         Args:
             mapping: A dictionary mapping keys to values.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the values by.
             
         Returns:
             True if all values were successfully cached, False otherwise.
@@ -626,15 +758,23 @@ class RedisCache(DistributedCache):
         try:
             # Get full keys and serialize values
             pipeline = self._async_client.pipeline()
+            tag_keys = self._get_tag_keys(tags) if tags else []
+            
+            if ttl is None:
+                ttl = self.default_ttl
             
             for key, value in mapping.items():
                 full_key = self._get_full_key(key)
                 serialized_value = self._serialize(value)
                 
-                if ttl is None:
-                    ttl = self.default_ttl
-                
-                pipeline.set(full_key, serialized_value, ex=ttl)
+                if tag_keys:
+                    await self._async_tagged_set_script(
+                        keys=[full_key, *tag_keys],
+                        args=[serialized_value, ttl],
+                        client=pipeline
+                    )
+                else:
+                    pipeline.set(full_key, serialized_value, ex=ttl)
             
             # Execute the pipeline
             results = await pipeline.execute()
@@ -849,6 +989,102 @@ class RedisCache(DistributedCache):
         """
         return f"{self.prefix}{key}"
     
+    def acquire_lock(self, name: str, ttl: float) -> Optional[str]:
+        """Try to acquire a lock with SET NX.
+        
+        Args:
+            name: The lock name.
+            ttl: Seconds after which the lock expires if it is not released.
+            
+        Returns:
+            The token to release the lock with, or None if the lock is held.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = self._client.set(self._get_lock_key(name), token, nx=True, px=int(ttl * 1000))
+            return token if acquired else None
+        except redis.RedisError as e:
+            logger.warning(f"Error acquiring lock in Redis: {e}")
+            return None
+    
+    async def acquire_lock_async(self, name: str, ttl: float) -> Optional[str]:
+        """Try to acquire a lock with SET NX asynchronously.
+        
+        Args:
+            name: The lock name.
+            ttl: Seconds after which the lock expires if it is not released.
+            
+        Returns:
+            The token to release the lock with, or None if the lock is held.
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._async_client.set(
+                self._get_lock_key(name), token, nx=True, px=int(ttl * 1000)
+            )
+            return token if acquired else None
+        except redis.RedisError as e:
+            logger.warning(f"Error acquiring lock in Redis: {e}")
+            return None
+    
+    def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock acquired with acquire_lock.
+        
+        Args:
+            name: The lock name.
+            token: The token returned when the lock was acquired.
+            
+        Returns:
+            True if the lock was released, False if it expired or is held by someone else.
+        """
+        try:
+            return bool(self._release_lock_script(
+                keys=[self._get_lock_key(name)], args=[token], client=self._client
+            ))
+        except redis.RedisError as e:
+            logger.warning(f"Error releasing lock in Redis: {e}")
+            return False
+    
+    async def release_lock_async(self, name: str, token: str) -> bool:
+        """Release a lock acquired with acquire_lock_async.
+        
+        Args:
+            name: The lock name.
+            token: The token returned when the lock was acquired.
+            
+        Returns:
+            True if the lock was released, False if it expired or is held by someone else.
+        """
+        try:
+            return bool(await self._async_release_lock_script(
+                keys=[self._get_lock_key(name)], args=[token], client=self._async_client
+            ))
+        except redis.RedisError as e:
+            logger.warning(f"Error releasing lock in Redis: {e}")
+            return False
+    
+    def _get_lock_key(self, name: str) -> str:
+        """Get the key of a lock.
+        
+        Args:
+            name: The lock name.
+            
+        Returns:
+            The lock key.
+        """
+        return f"{self.prefix}{LOCK_KEY_PREFIX}{name}"
+    
+    def _get_tag_keys(self, tags: Iterable[str]) -> List[str]:
+        """Get the keys of the sets tracking the keys of tags.
+        
+        Args:
+            tags: The tags.
+            
+        Returns:
+            The tag set keys, without duplicates.
+        """
+        return [f"{self.prefix}{TAG_KEY_PREFIX}{tag}" for tag in dict.fromkeys(tags)]
+    
     def _serialize(self, value: Any) -> bytes:
         """Serialize a value for storage in Redis.
         
@@ -858,8 +1094,7 @@ class RedisCache(DistributedCache):
         Returns:
             The serialized value as bytes.
         """
-        # Use pickle for serialization
-        return pickle.dumps(value)
+        return self._serializer.dumps(value)
     
     def _deserialize(self, data: bytes) -> Any:
         """Deserialize a value from Redis.
@@ -870,5 +1105,4 @@ class RedisCache(DistributedCache):
         Returns:
             The deserialized value.
         """
-        # Use pickle for deserialization
-        return pickle.loads(data)
+        return self._serializer.loads(data)
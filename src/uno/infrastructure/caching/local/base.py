@@ -4,7 +4,7 @@ This module provides the base class for local cache implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 import time
 
 
@@ -24,13 +24,15 @@ class LocalCache(ABC):
         pass
     
     @abstractmethod
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds.
+            tags: Optional tags to invalidate the value by.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -61,6 +63,18 @@ class LocalCache(ABC):
         """
         pass
     
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all values set with any of the given tags.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of keys invalidated.
+        """
+        pass
+    
     @abstractmethod
     def clear(self) -> bool:
         """Clear all cached values.
@@ -3,10 +3,8 @@
 This module provides a file-based cache implementation.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Set, Union
 import os
-import json
-import pickle
 import threading
 import time
 import hashlib
@@ -15,6 +13,7 @@ import shutil
 from pathlib import Path
 
 from uno.caching.local.base import LocalCache
+from uno.caching.serialization import SerializationError, Serializer
 
 
 class FileCache(LocalCache):
@@ -26,7 +25,8 @@ class FileCache(LocalCache):
     """
     
     def __init__(self, directory: Optional[str] = None, max_size: int = 1000,
-                 ttl: int = 300, shards: int = 8, serializer: str = "pickle"):
+                 ttl: int = 300, shards: int = 8, serializer: str = "pickle",
+                 compression: Optional[str] = None, compression_threshold: int = 1024):
         """Initialize the file cache.
         
         Args:
@@ -35,12 +35,16 @@ class FileCache(LocalCache):
             max_size: The maximum size of the cache in MB.
             ttl: The default time-to-live in seconds.
             shards: The number of shards to use.
-            serializer: The serialization format to use. Either "pickle" or "json".
+            serializer: The codec used to encode entries, e.g. "pickle", "json",
+                        "msgpack" or "orjson".
+            compression: Optional compression for large entries, e.g. "zstd" or "lz4".
+            compression_threshold: The minimum encoded size in bytes to compress.
         """
         self.max_size = max_size * 1024 * 1024  # Convert MB to bytes
         self.default_ttl = ttl
         self.shards = shards
         self.serializer = serializer
+        self._serializer = Serializer(serializer, compression, compression_threshold)
         
         # Set up the cache directory
         if directory is None:
@@ -116,19 +120,21 @@ class FileCache(LocalCache):
                 os.utime(file_path, None)
                 
                 return entry["value"]
-            except (IOError, pickle.PickleError, json.JSONDecodeError) as e:
+            except (IOError, SerializationError) as e:
                 # Handle read errors
                 with self._index_lock:
                     self._stats["misses"] += 1
                 return None
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -143,13 +149,14 @@ class FileCache(LocalCache):
         entry = {
             "key": key,
             "value": value,
-            "expiry": time.time() + ttl
+            "expiry": time.time() + ttl,
+            "tags": list(tags) if tags else [],
         }
         
         # Serialize the entry
         try:
             data = self._serialize(entry)
-        except (pickle.PickleError, TypeError) as e:
+        except SerializationError as e:
             # Handle serialization errors
             return False
         
@@ -273,6 +280,57 @@ class FileCache(LocalCache):
         
         return count
     
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all keys set with any of the given tags.
+        
+        Entries do not have a tag index on disk, so every entry is read.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of keys invalidated.
+        """
+        tags = set(tags)
+        if not tags:
+            return 0
+        
+        count = 0
+        for shard in range(self.shards):
+            shard_dir = os.path.join(self.directory, str(shard))
+            
+            # Use the appropriate shard lock
+            with self._shard_locks[shard]:
+                try:
+                    files = os.listdir(shard_dir)
+                except IOError:
+                    # Ignore errors for listing directories
+                    continue
+                
+                for filename in files:
+                    file_path = os.path.join(shard_dir, filename)
+                    try:
+                        with open(file_path, "rb") as f:
+                            entry = self._deserialize(f.read())
+                        if tags.isdisjoint(entry.get("tags", ())):
+                            continue
+                        
+                        file_size = os.path.getsize(file_path)
+                        os.unlink(file_path)
+                        
+                        # Update size tracker
+                        with self._index_lock:
+                            self._current_size -= file_size
+                            self._stats["size"] = self._current_size
+                            self._stats["deletions"] += 1
+                        
+                        count += 1
+                    except (IOError, SerializationError):
+                        # Ignore errors for individual files
+                        pass
+        
+        return count
+    
     def clear(self) -> bool:
         """Clear all cached values.
         
@@ -434,12 +492,7 @@ class FileCache(LocalCache):
         Returns:
             The serialized entry as bytes.
         """
-        if self.serializer == "pickle":
-            return pickle.dumps(entry)
-        elif self.serializer == "json":
-            return json.dumps(entry).encode()
-        else:
-            raise ValueError(f"Unsupported serializer: {self.serializer}")
+        return self._serializer.dumps(entry)
     
     def _deserialize(self, data: bytes) -> Dict[str, Any]:
         """Deserialize a cache entry.
@@ -450,12 +503,7 @@ class FileCache(LocalCache):
         Returns:
             The deserialized entry.
         """
-        if self.serializer == "pickle":
-            return pickle.loads(data)
-        elif self.serializer == "json":
-            return json.loads(data.decode())
-        else:
-            raise ValueError(f"Unsupported serializer: {self.serializer}")
+        return self._serializer.loads(data)
     
     def _calculate_size(self) -> int:
         """Calculate the current size of the cache in bytes.
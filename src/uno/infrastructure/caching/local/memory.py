@@ -3,8 +3,7 @@
 This module provides an in-memory cache implementation.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Set, Union
-import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Set, Union
 import threading
 import time
 import fnmatch
@@ -13,152 +12,355 @@ from collections import OrderedDict
 from uno.caching.local.base import LocalCache
 
 
+# Separator between the segments of a cache key, e.g. "user:123:profile"
+KEY_SEPARATOR = ":"
+
+# Characters that start a wildcard in invalidation patterns
+_WILDCARDS = "*?["
+
+
+class _PrefixNode:
+    """Node of a prefix trie over cache key segments.
+    
+    A key is stored in the node reached by all of its segments but the last,
+    so the keys sharing a prefix of whole segments form a subtree.
+    """
+    
+    __slots__ = ("children", "keys")
+    
+    def __init__(self):
+        self.children: Dict[str, "_PrefixNode"] = {}
+        self.keys: Set[str] = set()
+    
+    def add(self, key: str) -> None:
+        """Add a key to the trie."""
+        node = self
+        for segment in key.split(KEY_SEPARATOR)[:-1]:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _PrefixNode()
+            node = child
+        node.keys.add(key)
+    
+    def remove(self, key: str) -> None:
+        """Remove a key from the trie, pruning empty nodes."""
+        path: List[Tuple["_PrefixNode", str]] = []
+        node = self
+        for segment in key.split(KEY_SEPARATOR)[:-1]:
+            child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+        node.keys.discard(key)
+        
+        for parent, segment in reversed(path):
+            child = parent.children[segment]
+            if child.keys or child.children:
+                break
+            del parent.children[segment]
+    
+    def collect(self, prefix: str) -> List[str]:
+        """Get all keys starting with a prefix.
+        
+        Only the subtrees that can contain the prefix are visited.
+        
+        Args:
+            prefix: The key prefix.
+        
+        Returns:
+            The keys starting with the prefix.
+        """
+        *segments, partial = prefix.split(KEY_SEPARATOR)
+        node = self
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return []
+        
+        # Keys stored here end in a segment that must start with the partial
+        # segment; whole subtrees match if their segment does
+        keys = [key for key in node.keys if key.startswith(prefix)] if partial else list(node.keys)
+        for segment, child in node.children.items():
+            if segment.startswith(partial):
+                child._collect_all(keys)
+        return keys
+    
+    def _collect_all(self, keys: List[str]) -> None:
+        """Append every key in this subtree."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            keys.extend(node.keys)
+            stack.extend(node.children.values())
+
+
+class _CacheShard:
+    """One lock-protected partition of a memory cache.
+    
+    Each shard keeps its own LRU order, prefix trie, tag index and
+    statistics, so operations on keys in different shards never contend.
+    """
+    
+    def __init__(self, max_size: int, lru_policy: bool):
+        self.max_size = max_size
+        self.lru_policy = lru_policy
+        self.entries: Dict[str, Tuple[Any, float]] = OrderedDict() if lru_policy else {}
+        self.prefixes = _PrefixNode()
+        self.tags: Dict[str, Set[str]] = {}
+        self.key_tags: Dict[str, Tuple[str, ...]] = {}
+        self.lock = threading.RLock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "insertions": 0,
+            "deletions": 0,
+        }
+    
+    def get(self, key: str, now: float) -> Tuple[bool, Any]:
+        """Get a live value. Must be called with the lock held."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return False, None
+        
+        value, expiry = entry
+        if expiry < now:
+            self.remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return False, None
+        
+        if self.lru_policy:
+            self.entries.move_to_end(key)
+        
+        self.stats["hits"] += 1
+        return True, value
+    
+    def put(self, key: str, value: Any, expiry: float, tags: Optional[Tuple[str, ...]]) -> None:
+        """Store a value. Must be called with the lock held."""
+        if key in self.entries:
+            self._untag(key)
+            self.entries[key] = (value, expiry)
+            if self.lru_policy:
+                self.entries.move_to_end(key)
+        else:
+            if len(self.entries) >= self.max_size:
+                self.evict()
+            self.entries[key] = (value, expiry)
+            self.prefixes.add(key)
+            self.stats["insertions"] += 1
+        
+        if tags:
+            self.key_tags[key] = tags
+            for tag in tags:
+                self.tags.setdefault(tag, set()).add(key)
+    
+    def remove(self, key: str) -> bool:
+        """Remove a key and its index entries. Must be called with the lock held."""
+        if self.entries.pop(key, None) is None:
+            return False
+        self.prefixes.remove(key)
+        self._untag(key)
+        return True
+    
+    def evict(self) -> None:
+        """Evict an entry based on the eviction policy. Must be called with the lock held."""
+        if not self.entries:
+            return
+        
+        # With LRU policy the first entry is the least recently used one;
+        # without it, an arbitrary entry is evicted
+        key = next(iter(self.entries))
+        self.remove(key)
+        self.stats["evictions"] += 1
+    
+    def clear(self) -> int:
+        """Remove all entries. Must be called with the lock held."""
+        size = len(self.entries)
+        self.entries.clear()
+        self.prefixes = _PrefixNode()
+        self.tags.clear()
+        self.key_tags.clear()
+        return size
+    
+    def _untag(self, key: str) -> None:
+        """Remove a key from the tag index."""
+        for tag in self.key_tags.pop(key, ()):
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+
 class MemoryCache(LocalCache):
     """In-memory cache implementation.
     
     This implementation uses a dictionary to store values in memory. It supports
     LRU eviction policy to keep memory usage under control.
+    
+    With ``shards`` above one, keys are spread over lock-striped shards, each
+    holding an equal share of ``max_size`` and evicting its own least
+    recently used entries, so eviction is only approximately LRU; a single
+    shard keeps exact LRU order and suits most cache sizes. Every shard
+    indexes its keys in a prefix trie over ``:``-separated segments and
+    by tag, so ``invalidate_pattern("user:123:*")`` and ``invalidate_tags``
+    only visit the matching keys instead of the whole cache.
     """
     
-    def __init__(self, max_size: int = 1000, ttl: int = 300, lru_policy: bool = True):
+    def __init__(self, max_size: int = 1000, ttl: int = 300, lru_policy: bool = True,
+                 shards: int = 1):
         """Initialize the memory cache.
         
         Args:
             max_size: The maximum number of items to store in the cache.
             ttl: The default time-to-live in seconds.
             lru_policy: Whether to use the LRU eviction policy.
+            shards: The number of lock-striped shards; use more than one only
+                for large caches under heavy concurrent access.
         """
         self.max_size = max_size
         self.default_ttl = ttl
         self.lru_policy = lru_policy
+        self.shards = max(1, min(shards, max_size))
         
-        # Use OrderedDict if LRU policy is enabled
-        if lru_policy:
-            self._cache: Dict[str, Tuple[Any, float]] = OrderedDict()
-        else:
-            self._cache: Dict[str, Tuple[Any, float]] = {}
-            
-        self._lock = threading.RLock()
+        shard_size = -(-max_size // self.shards)
+        self._shards = [_CacheShard(shard_size, lru_policy) for _ in range(self.shards)]
+        self._created_at = time.time()
+    
+    def _get_shard(self, key: str) -> _CacheShard:
+        """Get the shard holding a key.
         
-        # Statistics
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "evictions": 0,
-            "expirations": 0,
-            "size": 0,
-            "max_size": max_size,
-            "insertions": 0,
-            "deletions": 0,
-            "created_at": time.time(),
-        }
+        Args:
+            key: The cache key.
+        
+        Returns:
+            The shard.
+        """
+        return self._shards[hash(key) % self.shards]
+    
+    def _group_by_shard(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        """Group keys by the index of their shard.
+        
+        Args:
+            keys: The cache keys.
+        
+        Returns:
+            A dictionary mapping shard indexes to keys.
+        """
+        groups: Dict[int, List[str]] = {}
+        for key in keys:
+            groups.setdefault(hash(key) % self.shards, []).append(key)
+        return groups
     
     def get(self, key: str) -> Any:
         """Get a value from the cache.
         
         Args:
             key: The cache key.
-            
+        
         Returns:
             The cached value or None if not found or expired.
         """
-        with self._lock:
-            if key not in self._cache:
-                self._stats["misses"] += 1
-                return None
-            
-            value, expiry = self._cache[key]
-            
-            # Check if the value has expired
-            if expiry < time.time():
-                # Remove expired value
-                del self._cache[key]
-                self._stats["size"] -= 1
-                self._stats["expirations"] += 1
-                self._stats["misses"] += 1
-                return None
-            
-            # Update access order if using LRU policy
-            if self.lru_policy:
-                self._cache.move_to_end(key)
-            
-            self._stats["hits"] += 1
-            return value
+        shard = self._get_shard(key)
+        with shard.lock:
+            return shard.get(key, time.time())[1]
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache.
         
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
-            
+            tags: Optional tags to invalidate the value by.
+        
         Returns:
             True if the value was successfully cached, False otherwise.
         """
-        with self._lock:
-            # Check if we need to evict an item due to size limit
-            if key not in self._cache and len(self._cache) >= self.max_size:
-                self._evict()
-            
-            # Calculate expiry time
-            if ttl is None:
-                ttl = self.default_ttl
-            expiry = time.time() + ttl
-            
-            # Update stats for new insertion
-            if key not in self._cache:
-                self._stats["size"] += 1
-                self._stats["insertions"] += 1
-            
-            # Store the value with its expiry time
-            self._cache[key] = (value, expiry)
-            
-            # Update access order if using LRU policy
-            if self.lru_policy:
-                self._cache.move_to_end(key)
-            
-            return True
+        if ttl is None:
+            ttl = self.default_ttl
+        expiry = time.time() + ttl
+        tag_tuple = tuple(tags) if tags else None
+        
+        shard = self._get_shard(key)
+        with shard.lock:
+            shard.put(key, value, expiry, tag_tuple)
+        return True
     
     def delete(self, key: str) -> bool:
         """Delete a value from the cache.
         
         Args:
             key: The cache key.
-            
+        
         Returns:
             True if the value was successfully deleted, False otherwise.
         """
-        with self._lock:
-            if key not in self._cache:
+        shard = self._get_shard(key)
+        with shard.lock:
+            if not shard.remove(key):
                 return False
-            
-            del self._cache[key]
-            self._stats["size"] -= 1
-            self._stats["deletions"] += 1
+            shard.stats["deletions"] += 1
             return True
     
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching a pattern.
         
         This method uses Unix shell-style wildcards (e.g., * matches any characters).
+        Only keys sharing the literal prefix of the pattern are examined.
         
         Args:
             pattern: The pattern to match against cache keys.
-            
+        
         Returns:
             The number of keys invalidated.
         """
-        with self._lock:
-            # Convert wildcard pattern to regex
-            keys_to_delete = [k for k in self._cache.keys() if fnmatch.fnmatch(k, pattern)]
-            
-            for key in keys_to_delete:
-                del self._cache[key]
-                self._stats["size"] -= 1
-                self._stats["deletions"] += 1
-            
-            return len(keys_to_delete)
+        wildcard = min((i for i in map(pattern.find, _WILDCARDS) if i >= 0), default=-1)
+        if wildcard < 0:
+            return int(self.delete(pattern))
+        
+        prefix = pattern[:wildcard]
+        # "prefix*" matches every key with the prefix
+        prefix_only = wildcard == len(pattern) - 1 and pattern[-1] == "*"
+        
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys = shard.prefixes.collect(prefix)
+                if not prefix_only:
+                    keys = [key for key in keys if fnmatch.fnmatch(key, pattern)]
+                for key in keys:
+                    shard.remove(key)
+                shard.stats["deletions"] += len(keys)
+                count += len(keys)
+        return count
+    
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all keys set with any of the given tags.
+        
+        Args:
+            tags: The tags to invalidate.
+        
+        Returns:
+            The number of keys invalidated.
+        """
+        tags = list(tags)
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys: Set[str] = set()
+                for tag in tags:
+                    keys.update(shard.tags.get(tag, ()))
+                for key in keys:
+                    shard.remove(key)
+                shard.stats["deletions"] += len(keys)
+                count += len(keys)
+        return count
     
     def clear(self) -> bool:
         """Clear all cached values.
@@ -166,15 +368,10 @@ class MemoryCache(LocalCache):
         Returns:
             True if the cache was successfully cleared, False otherwise.
         """
-        with self._lock:
-            size = len(self._cache)
-            self._cache.clear()
-            
-            # Update stats
-            self._stats["deletions"] += size
-            self._stats["size"] = 0
-            
-            return True
+        for shard in self._shards:
+            with shard.lock:
+                shard.stats["deletions"] += shard.clear()
+        return True
     
     def check_health(self) -> bool:
         """Check the health of the cache.
@@ -193,117 +390,109 @@ class MemoryCache(LocalCache):
         Returns:
             A dictionary with cache statistics.
         """
-        with self._lock:
-            # Copy stats and add current size
-            stats = self._stats.copy()
-            stats["size"] = len(self._cache)
-            
-            # Calculate hit rate
-            total_requests = stats["hits"] + stats["misses"]
-            stats["hit_rate"] = stats["hits"] / total_requests if total_requests > 0 else 0
-            
-            # Add uptime
-            stats["uptime"] = time.time() - stats["created_at"]
-            
-            return stats
+        stats: Dict[str, Any] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "size": 0,
+            "max_size": self.max_size,
+            "insertions": 0,
+            "deletions": 0,
+            "created_at": self._created_at,
+            "shards": self.shards,
+            "tags": 0,
+        }
+        
+        for shard in self._shards:
+            with shard.lock:
+                for name, value in shard.stats.items():
+                    stats[name] += value
+                stats["size"] += len(shard.entries)
+                stats["tags"] += len(shard.tags)
+        
+        # Calculate hit rate
+        total_requests = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / total_requests if total_requests > 0 else 0
+        
+        # Add uptime
+        stats["uptime"] = time.time() - stats["created_at"]
+        
+        return stats
     
     def close(self) -> None:
         """Close the cache and release resources.
         
         For memory cache, this simply clears the cache.
         """
-        with self._lock:
-            self._cache.clear()
-            self._stats["size"] = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
     
     def multi_get(self, keys: List[str]) -> Dict[str, Any]:
         """Get multiple values from the cache.
         
         Args:
             keys: The cache keys.
-            
+        
         Returns:
             A dictionary mapping keys to values. Keys not found in the cache are omitted.
         """
-        with self._lock:
-            result = {}
-            now = time.time()
-            
-            for key in keys:
-                if key in self._cache:
-                    value, expiry = self._cache[key]
-                    
-                    # Check if the value has expired
-                    if expiry >= now:
+        result = {}
+        now = time.time()
+        
+        for index, shard_keys in self._group_by_shard(keys).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    found, value = shard.get(key, now)
+                    if found:
                         result[key] = value
-                        self._stats["hits"] += 1
-                        
-                        # Update access order if using LRU policy
-                        if self.lru_policy:
-                            self._cache.move_to_end(key)
-                    else:
-                        # Remove expired value
-                        del self._cache[key]
-                        self._stats["size"] -= 1
-                        self._stats["expirations"] += 1
-                        self._stats["misses"] += 1
-                else:
-                    self._stats["misses"] += 1
-            
-            return result
+        
+        return result
     
-    def multi_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+    def multi_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None,
+                  tags: Optional[Iterable[str]] = None) -> bool:
         """Set multiple values in the cache.
         
         Args:
             mapping: A dictionary mapping keys to values.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
-            
+            tags: Optional tags to invalidate the values by.
+        
         Returns:
             True if all values were successfully cached, False otherwise.
         """
-        with self._lock:
-            if ttl is None:
-                ttl = self.default_ttl
-            
-            expiry = time.time() + ttl
-            
-            for key, value in mapping.items():
-                # Check if we need to evict an item due to size limit
-                if key not in self._cache and len(self._cache) >= self.max_size:
-                    self._evict()
-                
-                # Update stats for new insertion
-                if key not in self._cache:
-                    self._stats["size"] += 1
-                    self._stats["insertions"] += 1
-                
-                # Store the value with its expiry time
-                self._cache[key] = (value, expiry)
-                
-                # Update access order if using LRU policy
-                if self.lru_policy:
-                    self._cache.move_to_end(key)
-            
-            return True
+        if ttl is None:
+            ttl = self.default_ttl
+        expiry = time.time() + ttl
+        tag_tuple = tuple(tags) if tags else None
+        
+        for index, shard_keys in self._group_by_shard(mapping).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    shard.put(key, mapping[key], expiry, tag_tuple)
+        
+        return True
     
     def multi_delete(self, keys: List[str]) -> bool:
         """Delete multiple values from the cache.
         
         Args:
             keys: The cache keys.
-            
+        
         Returns:
             True if all values were successfully deleted, False otherwise.
         """
-        with self._lock:
-            for key in keys:
-                if key in self._cache:
-                    del self._cache[key]
-                    self._stats["size"] -= 1
-                    self._stats["deletions"] += 1
-            
-            return True
+        for index, shard_keys in self._group_by_shard(keys).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    if shard.remove(key):
+                        shard.stats["deletions"] += 1
+        
+        return True
     
     def touch(self, key: str, ttl: int) -> bool:
         """Update the TTL of a cached value.
@@ -311,36 +500,20 @@ class MemoryCache(LocalCache):
         Args:
             key: The cache key.
             ttl: The new TTL in seconds.
-            
+        
         Returns:
             True if the TTL was successfully updated, False otherwise.
         """
-        with self._lock:
-            if key not in self._cache:
+        shard = self._get_shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
                 return False
             
-            value, _ = self._cache[key]
-            expiry = time.time() + ttl
-            self._cache[key] = (value, expiry)
+            shard.entries[key] = (entry[0], time.time() + ttl)
             
             # Update access order if using LRU policy
             if self.lru_policy:
-                self._cache.move_to_end(key)
+                shard.entries.move_to_end(key)
             
             return True
-    
-    def _evict(self) -> None:
-        """Evict an item from the cache based on the eviction policy."""
-        if not self._cache:
-            return
-        
-        if self.lru_policy:
-            # With LRU policy, evict the least recently used item
-            key, _ = self._cache.popitem(last=False)
-        else:
-            # Without LRU policy, evict a random item
-            key = next(iter(self._cache.keys()))
-            del self._cache[key]
-        
-        self._stats["size"] -= 1
-        self._stats["evictions"] += 1
@@ -3,10 +3,11 @@
 This module provides the main entry point for the Uno caching framework.
 """
 
-from typing import Any, Dict, List, Optional, Type, Union, TypeVar, cast
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Type, Union, TypeVar, cast
 import asyncio
 import logging
 import threading
+import time
 from contextlib import contextmanager, asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 
@@ -23,6 +24,7 @@ from uno.caching.invalidation.time_based import TimeBasedInvalidation
 from uno.caching.invalidation.event_based import EventBasedInvalidation
 from uno.caching.invalidation.pattern_based import PatternBasedInvalidation
 from uno.caching.monitoring.monitor import CacheMonitor
+from uno.core.singleflight import SingleFlight, xfetch_due
 
 T = TypeVar('T')
 
@@ -52,6 +54,15 @@ def get_cache_manager(config: Optional[CacheConfig] = None) -> "CacheManager":
     return _cache_manager_instance
 
 
+# Key of the refresh metadata in values cached by get_or_set_async
+REFRESH_FIELD = "__uno_refresh__"
+
+
+def _is_refresh_entry(value: Any) -> bool:
+    """Check whether a cached value was stored by get_or_set_async."""
+    return isinstance(value, dict) and REFRESH_FIELD in value
+
+
 class CacheManager:
     """Main entry point for the Uno caching framework.
     
@@ -72,6 +83,12 @@ class CacheManager:
         self.monitor: Optional[CacheMonitor] = None
         self.initialized = False
         self._executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Concurrent loads of the same key in get_or_set_async
+        self._single_flight: SingleFlight[str, Any] = SingleFlight(logger)
+        self._stale_hits = 0
+        self._early_refreshes = 0
+        self._lock_waits = 0
     
     def initialize(self) -> None:
         """Initialize the caching system.
@@ -92,14 +109,18 @@ class CacheManager:
             self.local_cache = MemoryCache(
                 max_size=local_config.max_size,
                 ttl=local_config.ttl,
-                lru_policy=local_config.lru_policy
+                lru_policy=local_config.lru_policy,
+                shards=local_config.memory_shards
             )
         elif local_config.type == "file":
             self.local_cache = FileCache(
                 directory=local_config.directory,
                 max_size=local_config.max_size,
                 ttl=local_config.ttl,
-                shards=local_config.shards
+                shards=local_config.shards,
+                serializer=local_config.serializer,
+                compression=local_config.compression,
+                compression_threshold=local_config.compression_threshold
             )
         
         # Initialize distributed cache if enabled
@@ -115,7 +136,10 @@ class CacheManager:
                     use_connection_pool=dist_config.use_connection_pool,
                     max_connections=dist_config.max_connections,
                     ttl=dist_config.ttl,
-                    prefix=dist_config.prefix
+                    prefix=dist_config.prefix,
+                    serializer=dist_config.serializer,
+                    compression=dist_config.compression,
+                    compression_threshold=dist_config.compression_threshold
                 )
             elif dist_config.type == "memcached":
                 self.distributed_cache = MemcachedCache(
@@ -123,7 +147,10 @@ class CacheManager:
                     max_pool_size=dist_config.max_pool_size,
                     connect_timeout=dist_config.connect_timeout,
                     ttl=dist_config.ttl,
-                    prefix=dist_config.prefix
+                    prefix=dist_config.prefix,
+                    serializer=dist_config.serializer,
+                    compression=dist_config.compression,
+                    compression_threshold=dist_config.compression_threshold
                 )
         
         # Initialize invalidation strategy
@@ -306,7 +333,8 @@ class CacheManager:
         
         return default
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache.
         
         This method sets the value in the local cache and, if multi-level caching
@@ -316,6 +344,7 @@ class CacheManager:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by with invalidate_tags.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -340,7 +369,7 @@ class CacheManager:
         if self.local_cache:
             try:
                 local_ttl = min(ttl, self.config.local.ttl) if ttl > 0 else self.config.local.ttl
-                self.local_cache.set(full_key, value, local_ttl)
+                self.local_cache.set(full_key, value, local_ttl, tags=tags)
             except Exception as e:
                 logger.warning(f"Error setting value in local cache: {e}")
                 if self.monitor:
@@ -351,7 +380,7 @@ class CacheManager:
         if self.distributed_cache and self.config.use_multi_level:
             try:
                 dist_ttl = min(ttl, self.config.distributed.ttl) if ttl > 0 else self.config.distributed.ttl
-                self.distributed_cache.set(full_key, value, dist_ttl)
+                self.distributed_cache.set(full_key, value, dist_ttl, tags=tags)
             except Exception as e:
                 logger.warning(f"Error setting value in distributed cache: {e}")
                 if self.monitor:
@@ -360,7 +389,8 @@ class CacheManager:
         
         return success
     
-    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def set_async(self, key: str, value: Any, ttl: Optional[int] = None,
+                        tags: Optional[Iterable[str]] = None) -> bool:
         """Set a value in the cache asynchronously.
         
         This is the async version of the set method.
@@ -369,6 +399,7 @@ class CacheManager:
             key: The cache key.
             value: The value to cache.
             ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            tags: Optional tags to invalidate the value by with invalidate_tags_async.
             
         Returns:
             True if the value was successfully cached, False otherwise.
@@ -393,7 +424,7 @@ class CacheManager:
         if self.local_cache:
             try:
                 local_ttl = min(ttl, self.config.local.ttl) if ttl > 0 else self.config.local.ttl
-                self.local_cache.set(full_key, value, local_ttl)
+                self.local_cache.set(full_key, value, local_ttl, tags=tags)
             except Exception as e:
                 logger.warning(f"Error setting value in local cache: {e}")
                 if self.monitor:
@@ -405,7 +436,7 @@ class CacheManager:
             try:
                 dist_ttl = min(ttl, self.config.distributed.ttl) if ttl > 0 else self.config.distributed.ttl
                 # Use the async interface for the distributed cache
-                await self.distributed_cache.set_async(full_key, value, dist_ttl)
+                await self.distributed_cache.set_async(full_key, value, dist_ttl, tags=tags)
             except Exception as e:
                 logger.warning(f"Error setting value in distributed cache: {e}")
                 if self.monitor:
@@ -414,6 +445,133 @@ class CacheManager:
         
         return success
     
+    async def get_or_set_async(self, key: str, getter: Callable[[], Awaitable[Any]],
+                               ttl: Optional[int] = None, stale_ttl: Optional[int] = None) -> Any:
+        """Get a value from the cache or load and cache it.
+        
+        Concurrent misses for the same key in this process call the getter
+        once and share its result. With ``single_flight.distributed_lock``
+        enabled and a Redis distributed cache, processes also coordinate
+        through a Redis lock so that only one of them calls the getter.
+        
+        A value may be refreshed in the background shortly before it expires
+        (XFetch), and an expired value is returned for up to ``stale_ttl``
+        seconds while it is refreshed in the background.
+        
+        Args:
+            key: The cache key.
+            getter: Coroutine function loading the value.
+            ttl: Optional time-to-live in seconds. If not provided, the default TTL is used.
+            stale_ttl: Optional number of seconds an expired value is served while it is
+                refreshed. If not provided, ``single_flight.stale_ttl`` is used.
+            
+        Returns:
+            The cached or loaded value.
+        """
+        if not self.initialized or not self.config.enabled:
+            return await getter()
+        
+        if ttl is None:
+            ttl = self.config.invalidation.default_ttl
+        if stale_ttl is None:
+            stale_ttl = self.config.single_flight.stale_ttl
+        
+        def load() -> Awaitable[Any]:
+            return self._load_async(key, getter, ttl, stale_ttl)
+        
+        entry = await self.get_async(key)
+        if not _is_refresh_entry(entry):
+            return await self._single_flight.do(key, load)
+        
+        fresh_until, compute_time = entry[REFRESH_FIELD]
+        now = time.time()
+        if fresh_until is not None and now >= fresh_until:
+            self._stale_hits += 1
+            self._single_flight.refresh(key, load)
+        elif xfetch_due(fresh_until, compute_time, self.config.single_flight.xfetch_beta, now):
+            if self._single_flight.refresh(key, load):
+                self._early_refreshes += 1
+        
+        return entry["value"]
+    
+    async def _load_async(self, key: str, getter: Callable[[], Awaitable[Any]],
+                          ttl: int, stale_ttl: int) -> Any:
+        """Load a value with the getter and cache it for get_or_set_async.
+        
+        The value is stored together with the time it stops being fresh and
+        the time the getter took, and is kept for ``stale_ttl`` seconds
+        after it stops being fresh.
+        
+        Args:
+            key: The cache key.
+            getter: Coroutine function loading the value.
+            ttl: The time-to-live in seconds.
+            stale_ttl: The number of seconds an expired value is served.
+            
+        Returns:
+            The loaded value.
+        """
+        lock_cache = self._get_lock_cache()
+        lock_name = get_cache_key(key, self.config.key_prefix, self.config.use_hash_keys,
+                                  self.config.hash_algorithm)
+        token = None
+        if lock_cache:
+            token = await lock_cache.acquire_lock_async(lock_name, self.config.single_flight.lock_ttl)
+            if token is None:
+                # Another process is loading the value; use its result once it is cached
+                entry = await self._wait_for_load_async(key)
+                if entry is not None:
+                    return entry["value"]
+        
+        try:
+            start = time.monotonic()
+            value = await getter()
+            compute_time = time.monotonic() - start
+            
+            fresh_until = time.time() + ttl if ttl > 0 else None
+            entry = {REFRESH_FIELD: [fresh_until, compute_time], "value": value}
+            await self.set_async(key, entry, ttl + stale_ttl if ttl > 0 else ttl)
+            return value
+        finally:
+            if token is not None:
+                await lock_cache.release_lock_async(lock_name, token)
+    
+    async def _wait_for_load_async(self, key: str) -> Optional[Dict[str, Any]]:
+        """Wait for another process to cache a fresh value for get_or_set_async.
+        
+        Args:
+            key: The cache key.
+            
+        Returns:
+            The cached entry, or None if none was cached within ``single_flight.lock_wait``.
+        """
+        self._lock_waits += 1
+        deadline = time.monotonic() + self.config.single_flight.lock_wait
+        delay = 0.01
+        
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            
+            entry = await self.get_async(key)
+            if _is_refresh_entry(entry):
+                fresh_until = entry[REFRESH_FIELD][0]
+                if fresh_until is None or time.time() < fresh_until:
+                    return entry
+        
+        return None
+    
+    def _get_lock_cache(self) -> Optional[RedisCache]:
+        """Get the cache holding the locks of get_or_set_async.
+        
+        Returns:
+            The Redis distributed cache if distributed locking is enabled, None otherwise.
+        """
+        if (self.config.single_flight.distributed_lock and self.config.use_multi_level
+                and isinstance(self.distributed_cache, RedisCache)):
+            return self.distributed_cache
+        return None
+    
     def delete(self, key: str) -> bool:
         """Delete a value from the cache.
         
@@ -573,6 +731,81 @@ class CacheManager:
         
         return count
     
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Invalidate all values set with any of the given tags.
+        
+        This method deletes the tagged values from both local and distributed caches.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of keys invalidated.
+        """
+        if not self.initialized or not self.config.enabled:
+            return 0
+        
+        tags = list(tags)
+        count = 0
+        
+        # Invalidate in local cache
+        if self.local_cache:
+            try:
+                count += self.local_cache.invalidate_tags(tags)
+            except Exception as e:
+                logger.warning(f"Error invalidating tags in local cache: {e}")
+                if self.monitor:
+                    self.monitor.record_error("local", "invalidate_tags", str(e))
+        
+        # Invalidate in distributed cache
+        if self.distributed_cache:
+            try:
+                count += self.distributed_cache.invalidate_tags(tags)
+            except Exception as e:
+                logger.warning(f"Error invalidating tags in distributed cache: {e}")
+                if self.monitor:
+                    self.monitor.record_error("distributed", "invalidate_tags", str(e))
+        
+        return count
+    
+    async def invalidate_tags_async(self, tags: Iterable[str]) -> int:
+        """Invalidate all values set with any of the given tags asynchronously.
+        
+        This is the async version of the invalidate_tags method.
+        
+        Args:
+            tags: The tags to invalidate.
+            
+        Returns:
+            The number of keys invalidated.
+        """
+        if not self.initialized or not self.config.enabled:
+            return 0
+        
+        tags = list(tags)
+        count = 0
+        
+        # Invalidate in local cache (we can do this synchronously as it's in-memory)
+        if self.local_cache:
+            try:
+                count += self.local_cache.invalidate_tags(tags)
+            except Exception as e:
+                logger.warning(f"Error invalidating tags in local cache: {e}")
+                if self.monitor:
+                    await asyncio.to_thread(self.monitor.record_error, "local", "invalidate_tags", str(e))
+        
+        # Invalidate in distributed cache
+        if self.distributed_cache:
+            try:
+                # Use the async interface for the distributed cache
+                count += await self.distributed_cache.invalidate_tags_async(tags)
+            except Exception as e:
+                logger.warning(f"Error invalidating tags in distributed cache: {e}")
+                if self.monitor:
+                    await asyncio.to_thread(self.monitor.record_error, "distributed", "invalidate_tags", str(e))
+        
+        return count
+    
     def clear(self) -> bool:
         """Clear all cached values.
         
@@ -650,10 +883,17 @@ class CacheManager:
         Returns:
             A dictionary with cache statistics.
         """
-        if not self.initialized or not self.config.enabled or not self.monitor:
+        if not self.initialized or not self.config.enabled:
             return {}
         
-        return self.monitor.get_stats()
+        stats = dict(self.monitor.get_stats()) if self.monitor else {}
+        stats["single_flight"] = {
+            **self._single_flight.get_stats(),
+            "stale_hits": self._stale_hits,
+            "early_refreshes": self._early_refreshes,
+            "lock_waits": self._lock_waits,
+        }
+        return stats
     
     def check_health(self) -> Dict[str, bool]:
         """Check the health of the caching system.
@@ -0,0 +1,447 @@
+"""Cache serialization module.
+
+This module provides the codecs and compressors used to store cached values.
+Every encoded entry starts with a small header recording the codec and the
+compression used to write it, so entries stay readable when a cache is
+reconfigured to use a different codec.
+
+Codecs and compressors that depend on optional packages are only registered
+when the package is installed.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+import json
+import pickle
+import struct
+
+# Import optional codec and compression libraries conditionally
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+
+# First byte of an encoded entry. Entries written before codecs were recorded
+# are raw pickle (starting with 0x80) or JSON data, so they never start with it.
+MAGIC = 0xC5
+
+# Entry header: magic byte, codec id, compression id
+_HEADER = struct.Struct("BBB")
+
+# Compression id of uncompressed entries
+NO_COMPRESSION = 0
+
+
+class SerializationError(ValueError):
+    """Raised when a value cannot be encoded or decoded."""
+
+
+class Codec(ABC):
+    """Base class for cache value codecs.
+    
+    Attributes:
+        name: The name the codec is registered under.
+        codec_id: The id recorded in the header of entries using the codec.
+    """
+    
+    name: str
+    codec_id: int
+    
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode a value.
+        
+        Args:
+            value: The value to encode.
+        
+        Returns:
+            The encoded value.
+        """
+        pass
+    
+    @abstractmethod
+    def decode(self, data: memoryview) -> Any:
+        """Decode a value.
+        
+        Args:
+            data: The encoded value.
+        
+        Returns:
+            The decoded value.
+        """
+        pass
+
+
+class PickleCodec(Codec):
+    """Pickle codec using protocol 5 with out-of-band buffers.
+    
+    Large binary buffers (bytearrays, NumPy arrays and other objects
+    supporting out-of-band pickling) are appended after the pickle stream
+    instead of being copied into it, and are decoded as views of the entry.
+    Values without such buffers are stored as a plain pickle stream.
+    """
+    
+    name = "pickle"
+    codec_id = 1
+    
+    # First byte of values framed with out-of-band buffers; pickle streams
+    # start with the PROTO opcode (0x80)
+    _FRAMED = 0x00
+    
+    def encode(self, value: Any) -> bytes:
+        """Encode a value.
+        
+        Args:
+            value: The value to encode.
+        
+        Returns:
+            The pickle stream, or a frame holding the buffer count and sizes,
+            the pickle stream and the buffers.
+        """
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        if not buffers:
+            return data
+        
+        raw = [buffer.raw() for buffer in buffers]
+        sizes = struct.pack(
+            f"<BI{len(raw) + 1}Q", self._FRAMED, len(raw), len(data), *(len(view) for view in raw)
+        )
+        return b"".join([sizes, data, *raw])
+    
+    def decode(self, data: memoryview) -> Any:
+        """Decode a value.
+        
+        Args:
+            data: The encoded value.
+        
+        Returns:
+            The decoded value.
+        """
+        if data[0] != self._FRAMED:
+            return pickle.loads(data)
+        
+        count, = struct.unpack_from("<I", data, 1)
+        sizes = struct.unpack_from(f"<{count + 1}Q", data, 5)
+        offset = 5 + 8 * len(sizes)
+        views = []
+        for size in sizes:
+            views.append(data[offset:offset + size])
+            offset += size
+        return pickle.loads(views[0], buffers=views[1:])
+
+
+class JsonCodec(Codec):
+    """JSON codec using the standard library."""
+    
+    name = "json"
+    codec_id = 2
+    
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+    
+    def decode(self, data: memoryview) -> Any:
+        return json.loads(bytes(data))
+
+
+class MsgpackCodec(Codec):
+    """MessagePack codec using msgspec.
+    
+    Datetimes round-trip as MessagePack timestamps; tuples and sets are
+    decoded as lists.
+    """
+    
+    name = "msgpack"
+    codec_id = 3
+    
+    def encode(self, value: Any) -> bytes:
+        return msgspec.msgpack.encode(value)
+    
+    def decode(self, data: memoryview) -> Any:
+        return msgspec.msgpack.decode(data)
+
+
+class OrjsonCodec(Codec):
+    """JSON codec using orjson.
+    
+    Datetimes, dataclasses and UUIDs are encoded natively but decoded as
+    strings and dictionaries.
+    """
+    
+    name = "orjson"
+    codec_id = 4
+    
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    
+    def decode(self, data: memoryview) -> Any:
+        return orjson.loads(data)
+
+
+class Compressor(ABC):
+    """Base class for cache entry compressors.
+    
+    Attributes:
+        name: The name the compressor is registered under.
+        compression_id: The id recorded in the header of entries using the compressor.
+    """
+    
+    name: str
+    compression_id: int
+    
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress encoded data.
+        
+        Args:
+            data: The data to compress.
+        
+        Returns:
+            The compressed data.
+        """
+        pass
+    
+    @abstractmethod
+    def decompress(self, data: memoryview) -> bytes:
+        """Decompress encoded data.
+        
+        Args:
+            data: The compressed data.
+        
+        Returns:
+            The decompressed data.
+        """
+        pass
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard compressor."""
+    
+    name = "zstd"
+    compression_id = 1
+    
+    def __init__(self, level: int = 3):
+        """Initialize the compressor.
+        
+        Args:
+            level: The compression level.
+        """
+        self.level = level
+    
+    def compress(self, data: bytes) -> bytes:
+        # Compressor objects are not thread-safe, so one is created per call
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+    
+    def decompress(self, data: memoryview) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+class Lz4Compressor(Compressor):
+    """LZ4 frame compressor."""
+    
+    name = "lz4"
+    compression_id = 2
+    
+    def compress(self, data: bytes) -> bytes:
+        return lz4.frame.compress(data)
+    
+    def decompress(self, data: memoryview) -> bytes:
+        return lz4.frame.decompress(data)
+
+
+_codecs: Dict[str, Codec] = {}
+_codecs_by_id: Dict[int, Codec] = {}
+_compressors: Dict[str, Compressor] = {}
+_compressors_by_id: Dict[int, Compressor] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """Register a codec.
+    
+    Args:
+        codec: The codec. Replaces any codec with the same name or id.
+    """
+    _codecs[codec.name] = codec
+    _codecs_by_id[codec.codec_id] = codec
+
+
+def register_compressor(compressor: Compressor) -> None:
+    """Register a compressor.
+    
+    Args:
+        compressor: The compressor. Replaces any compressor with the same name or id.
+    """
+    if compressor.compression_id == NO_COMPRESSION:
+        raise ValueError(f"Compression id {NO_COMPRESSION} is reserved for uncompressed entries")
+    _compressors[compressor.name] = compressor
+    _compressors_by_id[compressor.compression_id] = compressor
+
+
+def get_codec(name: str) -> Codec:
+    """Get a registered codec.
+    
+    Args:
+        name: The codec name.
+    
+    Returns:
+        The codec.
+    
+    Raises:
+        ValueError: If no codec is registered under the name.
+    """
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported serializer: {name}. Available serializers: {', '.join(_codecs)}"
+        ) from None
+
+
+def get_compressor(name: str) -> Compressor:
+    """Get a registered compressor.
+    
+    Args:
+        name: The compressor name.
+    
+    Returns:
+        The compressor.
+    
+    Raises:
+        ValueError: If no compressor is registered under the name.
+    """
+    try:
+        return _compressors[name]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported compression: {name}. Available compression: {', '.join(_compressors) or 'none'}"
+        ) from None
+
+
+def available_codecs() -> List[str]:
+    """Get the names of the registered codecs."""
+    return list(_codecs)
+
+
+def available_compressors() -> List[str]:
+    """Get the names of the registered compressors."""
+    return list(_compressors)
+
+
+register_codec(PickleCodec())
+register_codec(JsonCodec())
+if MSGSPEC_AVAILABLE:
+    register_codec(MsgpackCodec())
+if ORJSON_AVAILABLE:
+    register_codec(OrjsonCodec())
+if ZSTD_AVAILABLE:
+    register_compressor(ZstdCompressor())
+if LZ4_AVAILABLE:
+    register_compressor(Lz4Compressor())
+
+
+class Serializer:
+    """Encodes cache values with a codec and optional compression.
+    
+    Entries are written with the configured codec and, when they reach the
+    compression threshold, compressed with the configured compressor. Reading
+    uses the codec and compressor recorded in the entry header, so a cache can
+    switch codecs without invalidating existing entries. Data without a header
+    is decoded with the configured codec.
+    """
+    
+    def __init__(self, codec: str = "pickle", compression: Optional[str] = None,
+                 compression_threshold: int = 1024):
+        """Initialize the serializer.
+        
+        Args:
+            codec: The name of the codec used to write entries.
+            compression: Optional name of the compressor for large entries.
+            compression_threshold: The minimum encoded size in bytes to compress.
+        """
+        self.codec = get_codec(codec)
+        self.compressor = get_compressor(compression) if compression else None
+        self.compression_threshold = compression_threshold
+    
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value into an entry.
+        
+        Args:
+            value: The value to encode.
+        
+        Returns:
+            The entry.
+        
+        Raises:
+            SerializationError: If the value cannot be encoded.
+        """
+        try:
+            data = self.codec.encode(value)
+        except Exception as e:
+            raise SerializationError(f"Cannot encode value with {self.codec.name}: {e}") from e
+        
+        compression_id = NO_COMPRESSION
+        if self.compressor and len(data) >= self.compression_threshold:
+            compressed = self.compressor.compress(data)
+            # Keep the data uncompressed when compression does not pay off
+            if len(compressed) < len(data):
+                data = compressed
+                compression_id = self.compressor.compression_id
+        
+        return _HEADER.pack(MAGIC, self.codec.codec_id, compression_id) + data
+    
+    def loads(self, data: bytes) -> Any:
+        """Decode an entry.
+        
+        Args:
+            data: The entry.
+        
+        Returns:
+            The decoded value.
+        
+        Raises:
+            SerializationError: If the entry cannot be decoded.
+        """
+        view = memoryview(data)
+        if len(view) < _HEADER.size or view[0] != MAGIC:
+            codec = self.codec
+        else:
+            _, codec_id, compression_id = _HEADER.unpack_from(view)
+            view = view[_HEADER.size:]
+            
+            codec = _codecs_by_id.get(codec_id)
+            if codec is None:
+                raise SerializationError(f"Entry uses unknown codec id {codec_id}")
+            
+            if compression_id != NO_COMPRESSION:
+                compressor = _compressors_by_id.get(compression_id)
+                if compressor is None:
+                    raise SerializationError(f"Entry uses unknown compression id {compression_id}")
+                try:
+                    view = memoryview(compressor.decompress(view))
+                except Exception as e:
+                    raise SerializationError(f"Cannot decompress entry with {compressor.name}: {e}") from e
+        
+        try:
+            return codec.decode(view)
+        except Exception as e:
+            raise SerializationError(f"Cannot decode value with {codec.name}: {e}") from e
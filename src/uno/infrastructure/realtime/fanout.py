@@ -0,0 +1,254 @@
+"""Broadcast fan-out support shared by the WebSocket and SSE managers.
+
+Broadcasting used to serialize the message once per connection and await
+every socket write together, so a single slow client held up the whole
+broadcast. Managers now encode a message once into a frame and put that
+frame on a bounded send queue per connection; each connection writes its
+queue from its own task. When a client falls behind, its queue applies an
+overflow policy instead of growing without bound, and frames published with
+a coalesce key replace a pending frame with the same key so the client only
+receives the latest state.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum, auto
+from typing import Any, Deque, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+
+# Type of the pre-encoded frames held by a send queue
+FrameType = TypeVar("FrameType")
+
+
+class OverflowPolicy(Enum):
+    """What a full send queue does with a new frame."""
+
+    DROP_OLDEST = auto()   # Drop the oldest pending frame to make room
+    DROP_NEWEST = auto()   # Reject the new frame
+    DISCONNECT = auto()    # Reject the new frame and disconnect the client
+
+
+class EnqueueResult(Enum):
+    """Outcome of offering a frame to a send queue."""
+
+    QUEUED = auto()      # The frame was queued
+    COALESCED = auto()   # The frame replaced a pending frame with the same key
+    EVICTED = auto()     # The frame was queued after dropping the oldest frame
+    DROPPED = auto()     # The frame was rejected because the queue is full
+    CLOSED = auto()      # The connection is not accepting frames
+
+    @property
+    def accepted(self) -> bool:
+        """Whether the frame will be sent to the client."""
+        return self in (EnqueueResult.QUEUED, EnqueueResult.COALESCED, EnqueueResult.EVICTED)
+
+
+class _PendingFrame:
+    """A queued frame with its coalesce key and enqueue time."""
+
+    __slots__ = ("frame", "key", "queued_at")
+
+    def __init__(self, frame: Any, key: Optional[Hashable], queued_at: float):
+        self.frame = frame
+        self.key = key
+        self.queued_at = queued_at
+
+
+class SendQueue(Generic[FrameType]):
+    """Bounded queue of pre-encoded frames for one connection.
+
+    Offering a frame never blocks; a full queue applies its overflow policy.
+    Frames offered with a coalesce key replace the pending frame with the
+    same key, keeping its place in the queue.
+    """
+
+    def __init__(self,
+                maxsize: int = 256,
+                policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
+        """Initialize the send queue.
+
+        Args:
+            maxsize: Maximum number of pending frames.
+            policy: What to do when a frame is offered to a full queue.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._pending: Deque[_PendingFrame] = deque()
+        self._keyed: Dict[Hashable, _PendingFrame] = {}
+        self._ready = asyncio.Event()
+
+        # Stats
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def offer(self, frame: FrameType, key: Optional[Hashable] = None) -> EnqueueResult:
+        """Offer a frame to the queue without waiting.
+
+        Args:
+            frame: The encoded frame.
+            key: Optional coalesce key; a pending frame with the same key is
+                replaced by this one.
+
+        Returns:
+            The outcome of the offer.
+        """
+        now = time.monotonic()
+
+        if key is not None:
+            pending = self._keyed.get(key)
+            if pending is not None:
+                pending.frame = frame
+                self.coalesced += 1
+                return EnqueueResult.COALESCED
+
+        result = EnqueueResult.QUEUED
+        if len(self._pending) >= self.maxsize:
+            self.dropped += 1
+            if self.policy != OverflowPolicy.DROP_OLDEST:
+                return EnqueueResult.DROPPED
+            self._forget(self._pending.popleft())
+            result = EnqueueResult.EVICTED
+
+        pending = _PendingFrame(frame, key, now)
+        self._pending.append(pending)
+        if key is not None:
+            self._keyed[key] = pending
+        self._ready.set()
+        return result
+
+    async def get(self) -> Tuple[FrameType, float]:
+        """Wait for the next frame.
+
+        Returns:
+            The frame and the monotonic time at which it was queued.
+        """
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+
+        pending = self._pending.popleft()
+        self._forget(pending)
+        return pending.frame, pending.queued_at
+
+    def clear(self) -> None:
+        """Discard all pending frames."""
+        self._pending.clear()
+        self._keyed.clear()
+
+    def _forget(self, pending: _PendingFrame) -> None:
+        """Drop the coalesce key of a frame leaving the queue."""
+        if pending.key is not None and self._keyed.get(pending.key) is pending:
+            del self._keyed[pending.key]
+
+
+class _LatencyWindow:
+    """Summary of the most recent latency samples."""
+
+    __slots__ = ("_samples", "count", "total", "max")
+
+    def __init__(self, size: int):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def summary(self) -> Dict[str, float]:
+        samples: List[float] = sorted(self._samples)
+
+        def percentile(fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": percentile(0.5),
+            "p99": percentile(0.99),
+            "max": self.max,
+        }
+
+
+class FanoutMetrics:
+    """Fan-out and delivery metrics for a connection manager.
+
+    Fan-out latency is the time taken to encode a broadcast and queue it for
+    every recipient. Delivery latency is the time a frame waited in a
+    connection's send queue before it was written to the client.
+    """
+
+    def __init__(self, window: int = 1024):
+        """Initialize the metrics.
+
+        Args:
+            window: Number of recent samples kept for latency percentiles.
+        """
+        self.broadcasts = 0
+        self.recipients = 0
+        self.queued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.closed = 0
+        self._fanout = _LatencyWindow(window)
+        self._delivery = _LatencyWindow(window)
+
+    def record_broadcast(self, results: List[EnqueueResult], seconds: float) -> None:
+        """Record the outcome of a broadcast.
+
+        Args:
+            results: The enqueue result for each recipient.
+            seconds: Time taken to encode and queue the broadcast.
+        """
+        self.broadcasts += 1
+        self.recipients += len(results)
+        for result in results:
+            if result is EnqueueResult.QUEUED:
+                self.queued += 1
+            elif result is EnqueueResult.COALESCED:
+                self.coalesced += 1
+            elif result is EnqueueResult.EVICTED:
+                self.queued += 1
+                self.dropped += 1
+            elif result is EnqueueResult.DROPPED:
+                self.dropped += 1
+            else:
+                self.closed += 1
+        self._fanout.add(seconds)
+
+    def record_delivery(self, seconds: float) -> None:
+        """Record how long a frame waited before being written.
+
+        Args:
+            seconds: Time between queuing and writing the frame.
+        """
+        self._delivery.add(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the fan-out statistics.
+
+        Returns:
+            Dictionary of fan-out statistics.
+        """
+        return {
+            "broadcasts": self.broadcasts,
+            "recipients": self.recipients,
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "closed": self.closed,
+            "fanout_seconds": self._fanout.summary(),
+            "delivery_seconds": self._delivery.summary(),
+        }
@@ -5,6 +5,7 @@ updates to clients. SSE is a server push technology that allows a client to
 receive automatic updates from a server via an HTTP connection.
 """
 
+from uno.realtime.fanout import OverflowPolicy
 from uno.realtime.sse.connection import SSEConnection
 from uno.realtime.sse.manager import SSEManager
 from uno.realtime.sse.event import Event, EventPriority
@@ -13,6 +14,7 @@ from uno.realtime.sse.errors import SSEError, SSEErrorCode
 __all__ = [
     'SSEConnection',
     'SSEManager',
+    'OverflowPolicy',
     'Event',
     'EventPriority',
     'SSEError',
@@ -5,11 +5,13 @@ This module provides the SSEConnection class for managing individual SSE connect
 
 import asyncio
 import logging
+import time
 from typing import (
     Optional, Dict, Any, List, Set, Callable, Awaitable, AsyncIterator, 
-    Protocol, Union, TypeVar, Generic
+    Protocol, Union, TypeVar, Generic, Hashable
 )
 
+from uno.realtime.fanout import EnqueueResult, FanoutMetrics, OverflowPolicy, SendQueue
 from uno.realtime.sse.event import Event, EventPriority, create_keep_alive_event
 from uno.realtime.sse.errors import SSEError, SSEErrorCode, ConnectionError, StreamError
 
@@ -53,7 +55,10 @@ class SSEConnection(Generic[ResponseSender]):
                 response: ResponseSender,
                 writer: AsyncResponseWriter,
                 client_id: Optional[str] = None,
-                client_info: Optional[Dict[str, Any]] = None):
+                client_info: Optional[Dict[str, Any]] = None,
+                send_queue_size: int = 256,
+                overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                metrics: Optional[FanoutMetrics] = None):
         """Initialize a new SSE connection.
         
         Args:
@@ -61,6 +66,9 @@ class SSEConnection(Generic[ResponseSender]):
             writer: The async writer for sending SSE data.
             client_id: Optional client identifier, generated if not provided.
             client_info: Optional dictionary with additional client information.
+            send_queue_size: Maximum number of queued events.
+            overflow_policy: What to do when the send queue is full.
+            metrics: Optional fan-out metrics to record delivery latency in.
         """
         from uuid import uuid4
         
@@ -72,7 +80,8 @@ class SSEConnection(Generic[ResponseSender]):
         self._response = response
         self._writer = writer
         self._is_connected = False
-        self._event_queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._send_queue: SendQueue[str] = SendQueue(send_queue_size, overflow_policy)
+        self._metrics = metrics
         self._closing = asyncio.Event()
         self._send_task: Optional[asyncio.Task] = None
         self._keep_alive_task: Optional[asyncio.Task] = None
@@ -171,11 +180,27 @@ class SSEConnection(Generic[ResponseSender]):
         Returns:
             True if the event was queued, False if the connection is closed.
         """
+        return self.enqueue_frame(event.to_sse_format()).accepted
+    
+    def enqueue_frame(self, frame: str, coalesce_key: Optional[Hashable] = None) -> EnqueueResult:
+        """Queue an event already in SSE format without waiting.
+        
+        Args:
+            frame: The event in SSE format.
+            coalesce_key: Optional key; a queued frame with the same key is
+                replaced by this one.
+            
+        Returns:
+            The outcome of queuing the frame.
+        """
         if not self._is_connected:
-            return False
+            return EnqueueResult.CLOSED
         
-        await self._event_queue.put(event)
-        return True
+        result = self._send_queue.offer(frame, coalesce_key)
+        if result is EnqueueResult.DROPPED and self._send_queue.policy == OverflowPolicy.DISCONNECT:
+            self._logger.warning(f"SSE connection {self.client_id} is too slow, closing")
+            self.close()
+        return result
     
     async def send_data(self, 
                        resource: str, 
@@ -250,8 +275,8 @@ class SSEConnection(Generic[ResponseSender]):
             while self._is_connected and not self._closing.is_set():
                 # Get the next event with a timeout
                 try:
-                    event = await asyncio.wait_for(
-                        self._event_queue.get(), 
+                    event_text, queued_at = await asyncio.wait_for(
+                        self._send_queue.get(), 
                         timeout=1.0
                     )
                 except asyncio.TimeoutError:
@@ -260,10 +285,10 @@ class SSEConnection(Generic[ResponseSender]):
                 
                 # Send the event
                 try:
-                    event_text = event.to_sse_format()
                     await self._writer.write(event_text)
                     await self._writer.flush()
-                    self._event_queue.task_done()
+                    if self._metrics is not None:
+                        self._metrics.record_delivery(time.monotonic() - queued_at)
                 except Exception as e:
                     self._logger.error(f"Error sending SSE event: {e}")
                     # If we can't send, mark the connection as closed
@@ -282,7 +307,9 @@ class SSEConnection(Generic[ResponseSender]):
         try:
             while self._is_connected and not self._closing.is_set():
                 await asyncio.sleep(self._keep_alive_interval)
-                if self._is_connected and not self._closing.is_set():
+                # Pending events keep the connection alive; a keep-alive on
+                # a full queue would only evict one of them
+                if self._is_connected and not self._closing.is_set() and not len(self._send_queue):
                     # Send a keep-alive comment
                     event = create_keep_alive_event()
                     await self.send_event(event)
@@ -5,12 +5,14 @@ This module provides the SSEManager class for managing multiple SSE connections.
 
 import asyncio
 import logging
+import time
 from typing import (
     Dict, Set, List, Any, Optional, Union, TypeVar, Generic, 
-    Callable, Coroutine, Awaitable, Type
+    Callable, Coroutine, Awaitable, Type, Hashable
 )
 import weakref
 
+from uno.realtime.fanout import FanoutMetrics, OverflowPolicy
 from uno.realtime.sse.connection import SSEConnection, AsyncResponseWriter
 from uno.realtime.sse.event import Event, EventPriority, create_data_event, create_notification_event
 
@@ -40,7 +42,9 @@ class SSEManager(Generic[ResponseType]):
                 require_authentication: bool = False,
                 auth_handler: Optional[AuthHandler] = None,
                 keep_alive: bool = True,
-                keep_alive_interval: float = 30.0):
+                keep_alive_interval: float = 30.0,
+                send_queue_size: int = 256,
+                overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
         """Initialize a new SSE manager.
         
         Args:
@@ -48,6 +52,8 @@ class SSEManager(Generic[ResponseType]):
             auth_handler: Optional function to handle authentication.
             keep_alive: Whether to send keep-alive comments.
             keep_alive_interval: Interval in seconds for keep-alive comments.
+            send_queue_size: Maximum number of queued events per connection.
+            overflow_policy: What to do when a connection's send queue is full.
         """
         # Connections (we use WeakValueDictionary to avoid memory leaks)
         self._connections: weakref.WeakValueDictionary[str, SSEConnection] = weakref.WeakValueDictionary()
@@ -61,6 +67,9 @@ class SSEManager(Generic[ResponseType]):
         self.auth_handler = auth_handler
         self.keep_alive = keep_alive
         self.keep_alive_interval = keep_alive_interval
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = overflow_policy
+        self.fanout_metrics = FanoutMetrics()
         
         self._logger = logging.getLogger(__name__)
     
@@ -136,7 +145,15 @@ class SSEManager(Generic[ResponseType]):
             AuthenticationError: If authentication is required but fails.
         """
         # Create the connection
-        connection = SSEConnection(response, writer, client_id, client_info)
+        connection = SSEConnection(
+            response,
+            writer,
+            client_id,
+            client_info,
+            send_queue_size=self.send_queue_size,
+            overflow_policy=self.overflow_policy,
+            metrics=self.fanout_metrics
+        )
         
         # Store the connection (do this before authentication to ensure cleanup on error)
         self._connections[connection.client_id] = connection
@@ -266,18 +283,25 @@ class SSEManager(Generic[ResponseType]):
     
     async def broadcast_event(self, 
                            event: Event, 
-                           filter_func: Optional[Callable[[SSEConnection], bool]] = None) -> int:
+                           filter_func: Optional[Callable[[SSEConnection], bool]] = None,
+                           coalesce_key: Optional[Hashable] = None) -> int:
         """Broadcast an event to all connections.
         
+        The event is encoded once and queued for each connection without
+        waiting on any client; a connection whose send queue is full applies
+        its overflow policy.
+        
         Args:
             event: The event to broadcast.
             filter_func: Optional function to filter connections.
+            coalesce_key: Optional key; an event with the same key still queued
+                for a connection is replaced by this one.
             
         Returns:
             The number of connections that received the event.
         """
-        sent_count = 0
-        tasks = []
+        start = time.perf_counter()
+        frame = event.to_sse_format()
         
         # Get all active connections
         connections = list(self._connections.values())
@@ -286,17 +310,23 @@ class SSEManager(Generic[ResponseType]):
         if filter_func:
             connections = [conn for conn in connections if filter_func(conn)]
         
-        # Send the event to all connections
-        for connection in connections:
-            if connection.is_connected:
-                tasks.append(connection.send_event(event))
+        # Queue the encoded event for all connections
+        results = [
+            connection.enqueue_frame(frame, coalesce_key)
+            for connection in connections
+            if connection.is_connected
+        ]
         
-        # Wait for all send operations to complete
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            sent_count = sum(1 for r in results if r is True)
+        self.fanout_metrics.record_broadcast(results, time.perf_counter() - start)
+        return sum(1 for result in results if result.accepted)
+    
+    def get_fanout_stats(self) -> Dict[str, Any]:
+        """Get broadcast fan-out and delivery statistics.
         
-        return sent_count
+        Returns:
+            Dictionary of fan-out statistics.
+        """
+        return self.fanout_metrics.get_stats()
     
     async def broadcast_to_users(self, 
                                event: Event, 
@@ -18,6 +18,7 @@ from uno.realtime.subscriptions.store import (
     SubscriptionStore,
     InMemorySubscriptionStore
 )
+from uno.realtime.subscriptions.index import QuerySubscriptionIndex
 from uno.realtime.subscriptions.errors import (
     SubscriptionError,
     SubscriptionErrorCode
@@ -31,6 +32,7 @@ __all__ = [
     'SubscriptionFilter',
     'SubscriptionStore',
     'InMemorySubscriptionStore',
+    'QuerySubscriptionIndex',
     'SubscriptionError',
     'SubscriptionErrorCode',
 ]
\ No newline at end of file
@@ -0,0 +1,308 @@
+"""Inverted index over query subscription parameters.
+
+Matching an event against QUERY subscriptions used to mean calling
+``matches_event`` on every query subscription in the store. This module
+indexes each query subscription under one of its parameters (its anchor)
+so that an event only has to be checked against the subscriptions whose
+anchor it satisfies:
+
+- equality and ``in`` parameters are kept in field -> value postings,
+- numeric range parameters are kept in per-field lists of bounds sorted so
+  that the subscriptions whose range can contain a value are found by
+  bisection,
+- subscriptions with no indexable parameter are always candidates.
+
+The index only narrows the candidates; the store still confirms every
+candidate with ``Subscription.matches_event``.
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from numbers import Real
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from uno.realtime.subscriptions.subscription import (
+    Subscription,
+    SubscriptionType,
+    query_condition,
+)
+
+
+# Anchor kinds, in order of preference when several parameters are indexable
+_VALUES = "values"
+_LOWER = "lower"
+_UPPER = "upper"
+
+# (kind, field, values or bound)
+Anchor = Tuple[str, str, Any]
+
+
+def _is_bound(value: Any) -> bool:
+    """Check whether a value can be stored in a sorted bound list."""
+    return isinstance(value, Real) and not (isinstance(value, float) and math.isnan(value))
+
+
+def _hashable_values(values: Any) -> Optional[Tuple[Hashable, ...]]:
+    """Get the values of an ``in`` operand if they can all be posted."""
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        return None
+    try:
+        for value in values:
+            hash(value)
+    except TypeError:
+        return None
+    return tuple(values)
+
+
+class _BoundList:
+    """Subscription IDs sorted by a numeric bound."""
+
+    __slots__ = ("_bounds", "_ids")
+
+    def __init__(self):
+        self._bounds: List[Any] = []
+        self._ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, bound: Any, subscription_id: str) -> None:
+        position = bisect_right(self._bounds, bound)
+        self._bounds.insert(position, bound)
+        self._ids.insert(position, subscription_id)
+
+    def remove(self, bound: Any, subscription_id: str) -> None:
+        position = bisect_left(self._bounds, bound)
+        end = bisect_right(self._bounds, bound)
+        for index in range(position, end):
+            if self._ids[index] == subscription_id:
+                del self._bounds[index]
+                del self._ids[index]
+                return
+
+    def at_most(self, value: Any) -> List[str]:
+        """IDs whose bound is less than or equal to the value."""
+        return self._ids[: bisect_right(self._bounds, value)]
+
+    def at_least(self, value: Any) -> List[str]:
+        """IDs whose bound is greater than or equal to the value."""
+        return self._ids[bisect_left(self._bounds, value):]
+
+
+class QuerySubscriptionIndex:
+    """Index of QUERY subscriptions for candidate lookup by event data.
+
+    Each subscription is indexed under a single anchor parameter. Equality
+    parameters are preferred, choosing the one with the fewest subscriptions
+    already posted under its value; numeric range parameters are used
+    otherwise. Candidates are returned in the order the subscriptions were
+    first indexed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[Hashable, Set[str]]] = {}
+        self._lower_bounds: Dict[str, _BoundList] = {}
+        self._upper_bounds: Dict[str, _BoundList] = {}
+        self._unindexed: Set[str] = set()
+        self._anchors: Dict[str, Optional[Anchor]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+        # Statistics
+        self._lookups = 0
+        self._candidates = 0
+
+    def __len__(self) -> int:
+        return len(self._anchors)
+
+    def __contains__(self, subscription_id: object) -> bool:
+        return subscription_id in self._anchors
+
+    def add(self, subscription: Subscription) -> None:
+        """Add or re-index a query subscription.
+
+        Subscriptions that are not QUERY subscriptions are removed from the
+        index instead.
+
+        Args:
+            subscription: The subscription to index.
+        """
+        subscription_id = subscription.id
+        self._unlink(subscription_id)
+
+        if subscription.type != SubscriptionType.QUERY or not subscription.query:
+            self._order.pop(subscription_id, None)
+            return
+
+        if subscription_id not in self._order:
+            self._order[subscription_id] = self._next_order
+            self._next_order += 1
+
+        anchor = self._choose_anchor(subscription.query)
+        self._anchors[subscription_id] = anchor
+        if anchor is None:
+            self._unindexed.add(subscription_id)
+            return
+
+        kind, field_name, operand = anchor
+        if kind == _VALUES:
+            postings = self._postings.setdefault(field_name, {})
+            for value in operand:
+                postings.setdefault(value, set()).add(subscription_id)
+        elif kind == _LOWER:
+            self._lower_bounds.setdefault(field_name, _BoundList()).add(operand, subscription_id)
+        else:
+            self._upper_bounds.setdefault(field_name, _BoundList()).add(operand, subscription_id)
+
+    def remove(self, subscription_id: str) -> bool:
+        """Remove a subscription from the index.
+
+        Args:
+            subscription_id: The ID of the subscription.
+
+        Returns:
+            True if the subscription was indexed, False otherwise.
+        """
+        self._order.pop(subscription_id, None)
+        return self._unlink(subscription_id)
+
+    def _unlink(self, subscription_id: str) -> bool:
+        """Remove a subscription's postings, keeping its position."""
+        if subscription_id not in self._anchors:
+            return False
+
+        anchor = self._anchors.pop(subscription_id)
+        if anchor is None:
+            self._unindexed.discard(subscription_id)
+            return True
+
+        kind, field_name, operand = anchor
+        if kind == _VALUES:
+            postings = self._postings[field_name]
+            for value in operand:
+                ids = postings.get(value)
+                if ids is not None:
+                    ids.discard(subscription_id)
+                    if not ids:
+                        del postings[value]
+            if not postings:
+                del self._postings[field_name]
+        else:
+            bounds = self._lower_bounds if kind == _LOWER else self._upper_bounds
+            bounds[field_name].remove(operand, subscription_id)
+            if not bounds[field_name]:
+                del bounds[field_name]
+        return True
+
+    def _choose_anchor(self, query: Dict[str, Any]) -> Optional[Anchor]:
+        """Choose the parameter a subscription is indexed under."""
+        best: Optional[Anchor] = None
+        best_size = 0
+        range_anchor: Optional[Anchor] = None
+
+        for field_name, value in query.items():
+            condition = query_condition(value)
+            if condition is None:
+                operator, operand = "eq", value
+            else:
+                operator, operand = condition
+
+            if operator == "eq":
+                try:
+                    hash(operand)
+                except TypeError:
+                    continue
+                values: Optional[Tuple[Hashable, ...]] = (operand,)
+            elif operator == "in":
+                values = _hashable_values(operand)
+                if values is None:
+                    continue
+            else:
+                if range_anchor is None:
+                    range_anchor = self._range_anchor(field_name, operator, operand)
+                continue
+
+            postings = self._postings.get(field_name, {})
+            size = sum(len(postings.get(item, ())) for item in values) + len(values)
+            if best is None or size < best_size:
+                best, best_size = (_VALUES, field_name, values), size
+
+        return best if best is not None else range_anchor
+
+    @staticmethod
+    def _range_anchor(field_name: str, operator: str, operand: Any) -> Optional[Anchor]:
+        """Get the bound anchor for a range parameter, if it has a numeric bound."""
+        if operator in ("gt", "gte") and _is_bound(operand):
+            return (_LOWER, field_name, operand)
+        if operator in ("lt", "lte") and _is_bound(operand):
+            return (_UPPER, field_name, operand)
+        if operator == "between" and isinstance(operand, (list, tuple)) and len(operand) == 2:
+            low, high = operand
+            if _is_bound(low) and _is_bound(high):
+                return (_LOWER, field_name, low)
+        return None
+
+    def candidates(self, event_data: Dict[str, Any]) -> List[str]:
+        """Get the IDs of the subscriptions that may match an event.
+
+        Args:
+            event_data: The event data.
+
+        Returns:
+            List of subscription IDs, without duplicates, in index order.
+        """
+        candidate_ids: Set[str] = set(self._unindexed)
+
+        for field_name, value in event_data.items():
+            postings = self._postings.get(field_name)
+            if postings:
+                try:
+                    ids = postings.get(value)
+                except TypeError:
+                    ids = None
+                if ids:
+                    candidate_ids.update(ids)
+
+            if _is_bound(value):
+                lower = self._lower_bounds.get(field_name)
+                if lower:
+                    candidate_ids.update(lower.at_most(value))
+                upper = self._upper_bounds.get(field_name)
+                if upper:
+                    candidate_ids.update(upper.at_least(value))
+
+        self._lookups += 1
+        self._candidates += len(candidate_ids)
+        return sorted(candidate_ids, key=self._order.__getitem__)
+
+    def rebuild(self, subscriptions: Iterable[Subscription]) -> None:
+        """Replace the contents of the index.
+
+        Args:
+            subscriptions: The subscriptions to index.
+        """
+        self._postings.clear()
+        self._lower_bounds.clear()
+        self._upper_bounds.clear()
+        self._unindexed.clear()
+        self._anchors.clear()
+        self._order.clear()
+        for subscription in subscriptions:
+            self.add(subscription)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics.
+
+        Returns:
+            Dictionary of index statistics.
+        """
+        return {
+            "subscriptions": len(self._anchors),
+            "posted_fields": len(self._postings),
+            "posted_values": sum(len(postings) for postings in self._postings.values()),
+            "range_fields": len(set(self._lower_bounds) | set(self._upper_bounds)),
+            "unindexed": len(self._unindexed),
+            "lookups": self._lookups,
+            "candidates": self._candidates,
+        }
@@ -6,7 +6,7 @@ This module provides storage for subscriptions with query and retrieval capabili
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Set, Tuple, AsyncIterator
+from typing import List, Dict, Any, Optional, Set, Tuple, AsyncIterator, Iterable
 from datetime import datetime, timedelta
 
 from uno.realtime.subscriptions.subscription import (
@@ -18,6 +18,7 @@ from uno.realtime.subscriptions.errors import (
     StoreError, 
     SubscriptionErrorCode
 )
+from uno.realtime.subscriptions.index import QuerySubscriptionIndex
 
 
 class SubscriptionStore(ABC):
@@ -192,6 +193,7 @@ class InMemorySubscriptionStore(SubscriptionStore):
         self._resource_subscriptions: Dict[str, Set[str]] = {}
         self._resource_type_subscriptions: Dict[str, Set[str]] = {}
         self._topic_subscriptions: Dict[str, Set[str]] = {}
+        self._query_index = QuerySubscriptionIndex()
         self._logger = logging.getLogger(__name__)
     
     async def save(self, subscription: Subscription) -> str:
@@ -227,6 +229,9 @@ class InMemorySubscriptionStore(SubscriptionStore):
                 self._topic_subscriptions[subscription.topic] = set()
             self._topic_subscriptions[subscription.topic].add(subscription.id)
         
+        # Index query parameters for event matching
+        self._query_index.add(subscription)
+        
         return subscription.id
     
     async def get(self, subscription_id: str) -> Optional[Subscription]:
@@ -277,6 +282,9 @@ class InMemorySubscriptionStore(SubscriptionStore):
         # Update the subscription
         self._subscriptions[subscription.id] = subscription
         
+        # Re-index query parameters, which may have been changed in place
+        self._query_index.add(subscription)
+        
         # Update user mapping if needed
         if old_subscription.user_id != subscription.user_id:
             # Remove from old user
@@ -350,6 +358,7 @@ class InMemorySubscriptionStore(SubscriptionStore):
         
         # Remove from type-specific mappings
         self._remove_from_type_mapping(subscription)
+        self._query_index.remove(subscription_id)
         
         # Remove the subscription
         del self._subscriptions[subscription_id]
@@ -513,79 +522,45 @@ class InMemorySubscriptionStore(SubscriptionStore):
             List of subscriptions that match the event.
         """
         matching_subscriptions = []
+        seen: Set[str] = set()
+        
+        def collect(subscription_ids: Iterable[str]) -> None:
+            for subscription_id in subscription_ids:
+                # Skip if already added
+                if subscription_id in seen:
+                    continue
+                
+                subscription = self._subscriptions.get(subscription_id)
+                if subscription is None:
+                    continue
+                
+                # Filter by active status if requested
+                if active_only and not subscription.is_active():
+                    continue
+                
+                # Check if the subscription matches the event
+                if subscription.matches_event(event_data):
+                    seen.add(subscription_id)
+                    matching_subscriptions.append(subscription)
         
         # Check resource-specific subscriptions
         resource_id = event_data.get("resource_id")
         if resource_id and resource_id in self._resource_subscriptions:
-            for subscription_id in self._resource_subscriptions[resource_id]:
-                if subscription_id in self._subscriptions:
-                    subscription = self._subscriptions[subscription_id]
-                    
-                    # Filter by active status if requested
-                    if active_only and not subscription.is_active():
-                        continue
-                    
-                    # Check if the subscription matches the event
-                    if subscription.matches_event(event_data):
-                        matching_subscriptions.append(subscription)
+            collect(self._resource_subscriptions[resource_id])
         
         # Check resource type subscriptions
         resource_type = event_data.get("resource_type")
         if resource_type and resource_type in self._resource_type_subscriptions:
-            for subscription_id in self._resource_type_subscriptions[resource_type]:
-                if subscription_id in self._subscriptions:
-                    subscription = self._subscriptions[subscription_id]
-                    
-                    # Skip if already added
-                    if subscription in matching_subscriptions:
-                        continue
-                    
-                    # Filter by active status if requested
-                    if active_only and not subscription.is_active():
-                        continue
-                    
-                    # Check if the subscription matches the event
-                    if subscription.matches_event(event_data):
-                        matching_subscriptions.append(subscription)
+            collect(self._resource_type_subscriptions[resource_type])
         
         # Check topic subscriptions
         topic = event_data.get("topic")
         if topic and topic in self._topic_subscriptions:
-            for subscription_id in self._topic_subscriptions[topic]:
-                if subscription_id in self._subscriptions:
-                    subscription = self._subscriptions[subscription_id]
-                    
-                    # Skip if already added
-                    if subscription in matching_subscriptions:
-                        continue
-                    
-                    # Filter by active status if requested
-                    if active_only and not subscription.is_active():
-                        continue
-                    
-                    # Check if the subscription matches the event
-                    if subscription.matches_event(event_data):
-                        matching_subscriptions.append(subscription)
-        
-        # Check query subscriptions
-        # For query subscriptions, we need to check all of them
-        # This is potentially expensive, but in-memory store is meant for small datasets
-        for subscription in self._subscriptions.values():
-            # Skip if already added
-            if subscription in matching_subscriptions:
-                continue
-            
-            # Only check query subscriptions
-            if subscription.type != SubscriptionType.QUERY:
-                continue
-            
-            # Filter by active status if requested
-            if active_only and not subscription.is_active():
-                continue
-            
-            # Check if the subscription matches the event
-            if subscription.matches_event(event_data):
-                matching_subscriptions.append(subscription)
+            collect(self._topic_subscriptions[topic])
+        
+        # Check query subscriptions, narrowed to the candidates whose
+        # indexed parameter the event satisfies
+        collect(self._query_index.candidates(event_data))
         
         return matching_subscriptions
     
@@ -7,7 +7,7 @@ import uuid
 import json
 from enum import Enum, auto
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any, List, Set, ClassVar
+from typing import Optional, Dict, Any, List, Set, ClassVar, Tuple
 from datetime import datetime
 
 
@@ -34,6 +34,68 @@ class SubscriptionStatus(Enum):
     INACTIVE = auto()    # Manually deactivated
 
 
+# Operators usable in QUERY subscription parameters, written as
+# {"operator": "gte", "value": 10}; any other value is matched by equality
+QUERY_OPERATORS = frozenset({"eq", "neq", "gt", "gte", "lt", "lte", "between", "in"})
+
+
+def query_condition(value: Any) -> Optional[Tuple[str, Any]]:
+    """Get the operator and operand of a query parameter.
+    
+    Args:
+        value: The query parameter value.
+        
+    Returns:
+        The (operator, operand) tuple if the value is an operator condition,
+        None if the value is matched by equality.
+    """
+    if (
+        isinstance(value, dict)
+        and set(value) == {"operator", "value"}
+        and value["operator"] in QUERY_OPERATORS
+    ):
+        return value["operator"], value["value"]
+    return None
+
+
+def match_query_value(event_value: Any, value: Any) -> bool:
+    """Check whether an event field value satisfies a query parameter.
+    
+    Args:
+        event_value: The value of the field in the event.
+        value: The query parameter value.
+        
+    Returns:
+        True if the event value satisfies the parameter, False otherwise.
+    """
+    condition = query_condition(value)
+    if condition is None:
+        return event_value == value
+    
+    operator, operand = condition
+    try:
+        if operator == "eq":
+            return event_value == operand
+        if operator == "neq":
+            return event_value != operand
+        if operator == "in":
+            return event_value in operand
+        if event_value is None:
+            return False
+        if operator == "gt":
+            return event_value > operand
+        if operator == "gte":
+            return event_value >= operand
+        if operator == "lt":
+            return event_value < operand
+        if operator == "lte":
+            return event_value <= operand
+        low, high = operand
+        return low <= event_value <= high
+    except (TypeError, ValueError):
+        return False
+
+
 @dataclass
 class Subscription:
     """Represents a subscription to real-time updates.
@@ -297,10 +359,9 @@ class Subscription:
             if not self.query:
                 return False
                 
-            # Simple implementation: check that all query parameters match
-            # In a real system, this would use a more sophisticated query matching
+            # Every query parameter must match the corresponding event field
             for key, value in self.query.items():
-                if key not in event_data or event_data[key] != value:
+                if key not in event_data or not match_query_value(event_data[key], value):
                     return False
             return True
         
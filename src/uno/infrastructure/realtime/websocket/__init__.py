@@ -4,6 +4,7 @@ This module provides a WebSocket server implementation that integrates with the
 framework, allowing for real-time bidirectional communication between server and clients.
 """
 
+from uno.realtime.fanout import OverflowPolicy
 from uno.realtime.websocket.manager import WebSocketManager
 from uno.realtime.websocket.connection import WebSocketConnection, ConnectionState
 from uno.realtime.websocket.message import Message, MessageType
@@ -12,6 +13,7 @@ from uno.realtime.websocket.errors import WebSocketError
 
 __all__ = [
     'WebSocketManager',
+    'OverflowPolicy',
     'WebSocketConnection',
     'ConnectionState',
     'Message',
@@ -8,8 +8,14 @@ import asyncio
 import logging
 import time
 from enum import Enum, auto
-from typing import Dict, Any, Optional, Set, List, Callable, Awaitable, Union, Protocol, cast
+from typing import Dict, Any, Optional, Set, List, Callable, Awaitable, Union, Protocol, Hashable, cast
 
+from uno.realtime.fanout import (
+    EnqueueResult,
+    FanoutMetrics,
+    OverflowPolicy,
+    SendQueue,
+)
 from uno.realtime.websocket.message import Message, MessageType
 from uno.realtime.websocket.errors import (
     WebSocketError,
@@ -84,7 +90,10 @@ class WebSocketConnection:
                 ping_interval: float = 30.0,
                 ping_timeout: float = 10.0,
                 max_message_size: int = 1024 * 1024,  # 1 MB
-                close_timeout: float = 5.0):
+                close_timeout: float = 5.0,
+                send_queue_size: int = 256,
+                overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                metrics: Optional[FanoutMetrics] = None):
         """Initialize a WebSocket connection.
         
         Args:
@@ -96,6 +105,9 @@ class WebSocketConnection:
             ping_timeout: Timeout for ping responses in seconds.
             max_message_size: Maximum message size in bytes.
             close_timeout: Timeout for graceful connection close in seconds.
+            send_queue_size: Maximum number of queued broadcast frames.
+            overflow_policy: What to do when the send queue is full.
+            metrics: Optional fan-out metrics to record delivery latency in.
         """
         self.socket = socket
         self.client_id = client_id or str(uuid.uuid4())
@@ -129,9 +141,15 @@ class WebSocketConnection:
         self.on_disconnect_handlers: List[DisconnectionHandler] = []
         self.on_error_handlers: List[ErrorHandler] = []
         
+        # Queue of pre-encoded broadcast frames, written by the send task
+        self.send_queue: SendQueue[str] = SendQueue(send_queue_size, overflow_policy)
+        self.metrics = metrics
+        
         # Tasks
         self.ping_task: Optional[asyncio.Task] = None
         self.main_task: Optional[asyncio.Task] = None
+        self.send_task: Optional[asyncio.Task] = None
+        self.close_task: Optional[asyncio.Task] = None
     
     def __str__(self) -> str:
         """Return a string representation of the connection."""
@@ -224,6 +242,10 @@ class WebSocketConnection:
         if self.main_task:
             self.main_task.cancel()
         
+        if self.send_task:
+            self.send_task.cancel()
+        self.send_queue.clear()
+        
         # Notify disconnection handlers
         await self._notify_disconnect_handlers(code, reason)
     
@@ -242,6 +264,9 @@ class WebSocketConnection:
     async def send_message(self, message: Message) -> None:
         """Send a message to the client.
         
+        The message is queued behind any pending frames and written by the
+        send task, so it never interleaves with a queued frame on the socket.
+        
         Args:
             message: The message to send.
         """
@@ -254,15 +279,47 @@ class WebSocketConnection:
         try:
             # Convert the message to JSON
             json_data = message.to_json()
-            
-            # Send the message
-            await self.socket.send_text(json_data)
-            
         except Exception as e:
             raise ConnectionError(
                 WebSocketErrorCode.CONNECTION_CLOSED_UNEXPECTEDLY,
                 f"Failed to send message: {e}"
             )
+        
+        result = self.enqueue_frame(json_data)
+        if not result.accepted:
+            raise ConnectionError(
+                WebSocketErrorCode.CONNECTION_CLOSED_UNEXPECTEDLY,
+                f"Failed to send message: {result.name.lower()}"
+            )
+    
+    def enqueue_frame(self, frame: str, coalesce_key: Optional[Hashable] = None) -> EnqueueResult:
+        """Queue a pre-encoded message for sending without waiting.
+        
+        Frames are written in order by the connection's send task, so a slow
+        client never blocks the caller. When the send queue is full the
+        connection's overflow policy decides which frame is dropped.
+        
+        Args:
+            frame: The JSON-encoded message.
+            coalesce_key: Optional key; a queued frame with the same key is
+                replaced by this one.
+            
+        Returns:
+            The outcome of queuing the frame.
+        """
+        if self.state not in (ConnectionState.CONNECTED, ConnectionState.AUTHENTICATED):
+            return EnqueueResult.CLOSED
+        
+        result = self.send_queue.offer(frame, coalesce_key)
+        
+        if result is EnqueueResult.DROPPED and self.send_queue.policy == OverflowPolicy.DISCONNECT:
+            if self.close_task is None:
+                logger.warning(f"Connection {self.client_id} is too slow, disconnecting")
+                self.close_task = asyncio.create_task(self.close(1013, "Client too slow"))
+        elif self.send_task is None or self.send_task.done():
+            self.send_task = asyncio.create_task(self._send_loop())
+        
+        return result
     
     async def close(self, code: int = 1000, reason: str = "") -> None:
         """Close the connection.
@@ -449,6 +506,26 @@ class WebSocketConnection:
             # Sleep until next ping
             await asyncio.sleep(self.ping_interval)
     
+    async def _send_loop(self) -> None:
+        """Background task for writing queued frames to the client."""
+        try:
+            while self.state in (ConnectionState.CONNECTED, ConnectionState.AUTHENTICATED):
+                frame, queued_at = await self.send_queue.get()
+                try:
+                    await self.socket.send_text(frame)
+                except Exception as e:
+                    logger.error(f"Error sending queued message to {self.client_id}: {e}")
+                    await self.handle_error(ConnectionError(
+                        WebSocketErrorCode.CONNECTION_CLOSED_UNEXPECTEDLY,
+                        f"Failed to send message: {e}"
+                    ))
+                    return
+                
+                if self.metrics is not None:
+                    self.metrics.record_delivery(time.monotonic() - queued_at)
+        except asyncio.CancelledError:
+            pass
+    
     def _on_ping_task_done(self, task: asyncio.Task) -> None:
         """Callback for when the ping task is done."""
         try:
@@ -6,9 +6,11 @@ various web frameworks.
 
 import logging
 import asyncio
+import time
 import uuid
-from typing import Dict, Set, Any, Optional, List, Callable, Awaitable, Union, Protocol, Type, TypeVar
+from typing import Dict, Set, Any, Optional, List, Callable, Awaitable, Union, Protocol, Type, TypeVar, Iterable, Hashable
 
+from uno.realtime.fanout import FanoutMetrics, OverflowPolicy
 from uno.realtime.websocket.connection import WebSocketConnection, WebSocketSender, ConnectionState
 from uno.realtime.websocket.message import Message, MessageType
 from uno.realtime.websocket.protocol import WebSocketProtocol, DefaultProtocol
@@ -36,7 +38,9 @@ class WebSocketManager:
                 ping_interval: float = 30.0,
                 ping_timeout: float = 10.0,
                 max_message_size: int = 1024 * 1024,  # 1 MB
-                close_timeout: float = 5.0):
+                close_timeout: float = 5.0,
+                send_queue_size: int = 256,
+                overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
         """Initialize the WebSocket manager.
         
         Args:
@@ -48,6 +52,8 @@ class WebSocketManager:
             ping_timeout: Timeout for ping responses in seconds.
             max_message_size: Maximum message size in bytes.
             close_timeout: Timeout for graceful connection close in seconds.
+            send_queue_size: Maximum number of queued broadcast frames per connection.
+            overflow_policy: What to do when a connection's send queue is full.
         """
         self.protocol = protocol or DefaultProtocol(require_authentication, auth_handler)
         self.require_authentication = require_authentication
@@ -57,6 +63,9 @@ class WebSocketManager:
         self.ping_timeout = ping_timeout
         self.max_message_size = max_message_size
         self.close_timeout = close_timeout
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = overflow_policy
+        self.fanout_metrics = FanoutMetrics()
         
         # Connection storage
         self.connections: Dict[str, WebSocketConnection] = {}
@@ -103,7 +112,10 @@ class WebSocketManager:
             ping_interval=self.ping_interval,
             ping_timeout=self.ping_timeout,
             max_message_size=self.max_message_size,
-            close_timeout=self.close_timeout
+            close_timeout=self.close_timeout,
+            send_queue_size=self.send_queue_size,
+            overflow_policy=self.overflow_policy,
+            metrics=self.fanout_metrics
         )
         
         # Register connection
@@ -190,58 +202,99 @@ class WebSocketManager:
     
     async def broadcast(self, 
                        message: Message,
-                       filter_func: Optional[Callable[[WebSocketConnection], bool]] = None) -> None:
+                       filter_func: Optional[Callable[[WebSocketConnection], bool]] = None,
+                       coalesce_key: Optional[Hashable] = None) -> int:
         """Broadcast a message to all connections.
         
         Args:
             message: The message to broadcast.
             filter_func: Optional function to filter connections.
-        """
-        tasks = []
-        for connection in self.connections.values():
-            if filter_func and not filter_func(connection):
-                continue
+            coalesce_key: Optional key; a frame with the same key still queued
+                for a connection is replaced by this message.
             
-            if connection.state in (ConnectionState.CONNECTED, ConnectionState.AUTHENTICATED):
-                tasks.append(connection.send_message(message))
+        Returns:
+            The number of connections the message was queued for.
+        """
+        connections = self.connections.values()
+        if filter_func:
+            connections = [connection for connection in connections if filter_func(connection)]
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        return self._fan_out(message, connections, coalesce_key)
     
     async def broadcast_to_users(self, 
                                message: Message,
-                               user_ids: List[str]) -> None:
+                               user_ids: List[str],
+                               coalesce_key: Optional[Hashable] = None) -> int:
         """Broadcast a message to specific users.
         
         Args:
             message: The message to broadcast.
             user_ids: The user IDs to send to.
+            coalesce_key: Optional key for replacing queued frames.
+            
+        Returns:
+            The number of connections the message was queued for.
         """
-        tasks = []
-        for user_id in user_ids:
-            for connection in self.connections_by_user.get(user_id, set()):
-                if connection.state in (ConnectionState.CONNECTED, ConnectionState.AUTHENTICATED):
-                    tasks.append(connection.send_message(message))
+        connections = [
+            connection
+            for user_id in user_ids
+            for connection in self.connections_by_user.get(user_id, set())
+        ]
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        return self._fan_out(message, connections, coalesce_key)
     
     async def broadcast_to_subscription(self, 
                                       message: Message,
-                                      subscription: str) -> None:
+                                      subscription: str,
+                                      coalesce_key: Optional[Hashable] = None) -> int:
         """Broadcast a message to connections with a subscription.
         
         Args:
             message: The message to broadcast.
             subscription: The subscription key.
+            coalesce_key: Optional key for replacing queued frames.
+            
+        Returns:
+            The number of connections the message was queued for.
         """
-        tasks = []
-        for connection in self.subscriptions.get(subscription, set()):
-            if connection.state in (ConnectionState.CONNECTED, ConnectionState.AUTHENTICATED):
-                tasks.append(connection.send_message(message))
+        return self._fan_out(message, self.subscriptions.get(subscription, set()), coalesce_key)
+    
+    def get_fanout_stats(self) -> Dict[str, Any]:
+        """Get broadcast fan-out and delivery statistics.
         
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        Returns:
+            Dictionary of fan-out statistics.
+        """
+        return self.fanout_metrics.get_stats()
+    
+    def _fan_out(self, 
+                message: Message,
+                connections: Iterable[WebSocketConnection],
+                coalesce_key: Optional[Hashable] = None) -> int:
+        """Encode a message once and queue it for each connection.
+        
+        Queuing never waits on a client, so slow connections cannot hold up
+        the broadcast; their send queues apply the overflow policy instead.
+        
+        Args:
+            message: The message to send.
+            connections: The connections to send it to.
+            coalesce_key: Optional key for replacing queued frames.
+            
+        Returns:
+            The number of connections the message was queued for.
+        """
+        start = time.perf_counter()
+        frame = message.to_json()
+        
+        results = [
+            connection.enqueue_frame(frame, coalesce_key)
+            for connection in connections
+            if connection.state in (ConnectionState.CONNECTED, ConnectionState.AUTHENTICATED)
+        ]
+        
+        self.fanout_metrics.record_broadcast(results, time.perf_counter() - start)
+        return sum(1 for result in results if result.accepted)
     
     async def send_to_client(self, 
                            client_id: str,
@@ -5,19 +5,73 @@
 """
 Security audit logger for Uno applications.
 
-This module provides a logger for security events.
+This module provides a logger for security events, with file and
+PostgreSQL storage and an optional buffer that writes events in batches
+from a background thread.
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Protocol
+from typing import Deque, Dict, List, Optional, Any, Protocol
+
+import psycopg
+from psycopg import sql
 
 from uno.security.audit.event import SecurityEvent
-from uno.security.config import AuditingConfig, AuditLogLevel, AuditLogStorage
+from uno.security.config import (
+    AuditingConfig,
+    AuditLogLevel,
+    AuditOverflowPolicy,
+    AuditLogStorage as AuditLogStorageType,
+)
+
+
+# Maximum number of buffers passed to a single writev call (IOV_MAX on Linux)
+_IOV_MAX = 1024
+
+# Columns of the audit log table, in table order
+_EVENT_COLUMNS = (
+    "event_id",
+    "event_type",
+    "user_id",
+    "timestamp",
+    "ip_address",
+    "user_agent",
+    "success",
+    "message",
+    "details",
+    "context",
+    "severity",
+)
+
+
+def _write_lines(fd: int, lines: List[bytes]) -> None:
+    """
+    Write lines to a file descriptor, gathering them into as few system calls as possible.
+    
+    Args:
+        fd: File descriptor opened for appending
+        lines: Encoded lines to write
+    """
+    for start in range(0, len(lines), _IOV_MAX):
+        chunk = lines[start:start + _IOV_MAX]
+        if hasattr(os, "writev"):
+            written = os.writev(fd, chunk)
+            remainder = b"".join(chunk)[written:] if written < sum(map(len, chunk)) else b""
+        else:
+            remainder = b"".join(chunk)
+        
+        # Finish partial writes
+        while remainder:
+            written = os.write(fd, remainder)
+            remainder = remainder[written:]
 
 
 class AuditLogStorage(Protocol):
@@ -27,6 +81,10 @@ class AuditLogStorage(Protocol):
         """Log a security event."""
         ...
     
+    def log_events(self, events: List[SecurityEvent]) -> None:
+        """Log a batch of security events."""
+        ...
+    
     def get_events(
         self,
         start_time: Optional[float] = None,
@@ -58,18 +116,21 @@ class FileLogStorage:
     File-based audit log storage.
     
     This class stores audit logs in a file, with one JSON object per line.
+    A batch of events is appended with a single gathered write.
     """
     
-    def __init__(self, log_file: str, max_file_size: int = 10_000_000):
+    def __init__(self, log_file: str, max_file_size: int = 10_000_000, fsync: bool = False):
         """
         Initialize file-based log storage.
         
         Args:
             log_file: Path to the log file
             max_file_size: Maximum file size in bytes (default: 10 MB)
+            fsync: Whether to fsync the file after every write
         """
         self.log_file = log_file
         self.max_file_size = max_file_size
+        self.fsync = fsync
         
         # Create the log directory if it doesn't exist
         log_dir = os.path.dirname(log_file)
@@ -86,12 +147,30 @@ class FileLogStorage:
         Args:
             event: Security event to log
         """
+        self.log_events([event])
+    
+    def log_events(self, events: List[SecurityEvent]) -> None:
+        """
+        Log a batch of security events.
+        
+        Args:
+            events: Security events to log
+        """
+        if not events:
+            return
+        
         # Rotate the log file if it's too large
         self._rotate_log_file_if_needed()
         
-        # Write the event to the log file
-        with open(self.log_file, "a") as f:
-            f.write(event.to_json() + "\n")
+        # Write the events to the log file
+        lines = [(event.to_json() + "\n").encode() for event in events]
+        fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            _write_lines(fd, lines)
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
     
     def get_events(
         self,
@@ -167,10 +246,12 @@ class FileLogStorage:
     
     def _rotate_log_file_if_needed(self) -> None:
         """Rotate the log file if it's too large."""
-        if not os.path.exists(self.log_file):
+        try:
+            size = os.path.getsize(self.log_file)
+        except OSError:
             return
         
-        if os.path.getsize(self.log_file) >= self.max_file_size:
+        if size >= self.max_file_size:
             # Rotate the log file
             timestamp = int(time.time())
             rotated_file = f"{self.log_file}.{timestamp}"
@@ -208,18 +289,54 @@ class DatabaseLogStorage:
     """
     Database-based audit log storage.
     
-    This class is a placeholder for a database-based audit log storage implementation.
-    In a real implementation, this would store audit logs in a database table.
+    This class stores audit logs in a PostgreSQL table, which is created on
+    first use. A batch of events is written with a single COPY.
     """
     
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, table_name: str = "security_audit_log"):
         """
         Initialize database-based log storage.
         
         Args:
             connection_string: Database connection string
+            table_name: Name of the audit log table
         """
         self.connection_string = connection_string
+        self.table_name = table_name
+        self._connection: Optional[psycopg.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _get_connection(self) -> psycopg.Connection:
+        """
+        Get the database connection, creating it and the table if needed.
+        
+        Returns:
+            The database connection
+        """
+        if self._connection is None or self._connection.closed:
+            connection = psycopg.connect(self.connection_string, autocommit=True)
+            connection.execute(
+                sql.SQL(
+                    """
+                    CREATE TABLE IF NOT EXISTS {} (
+                        event_id TEXT PRIMARY KEY,
+                        event_type TEXT NOT NULL,
+                        user_id TEXT,
+                        timestamp DOUBLE PRECISION NOT NULL,
+                        ip_address TEXT,
+                        user_agent TEXT,
+                        success BOOLEAN NOT NULL,
+                        message TEXT,
+                        details TEXT,
+                        context JSONB NOT NULL,
+                        severity TEXT NOT NULL
+                    )
+                    """
+                ).format(sql.Identifier(self.table_name))
+            )
+            self._connection = connection
+        
+        return self._connection
     
     def log_event(self, event: SecurityEvent) -> None:
         """
@@ -228,8 +345,36 @@ class DatabaseLogStorage:
         Args:
             event: Security event to log
         """
-        # Placeholder implementation
-        pass
+        self.log_events([event])
+    
+    def log_events(self, events: List[SecurityEvent]) -> None:
+        """
+        Log a batch of security events.
+        
+        Args:
+            events: Security events to log
+        """
+        if not events:
+            return
+        
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(self.table_name),
+            sql.SQL(", ").join(map(sql.Identifier, _EVENT_COLUMNS)),
+        )
+        
+        with self._lock:
+            connection = self._get_connection()
+            try:
+                with connection.transaction(), connection.cursor() as cursor:
+                    with cursor.copy(copy_sql) as copy:
+                        for event in events:
+                            row = event.to_dict()
+                            row["context"] = json.dumps(row["context"])
+                            copy.write_row([row[column] for column in _EVENT_COLUMNS])
+            except psycopg.OperationalError:
+                # Reconnect on the next write
+                connection.close()
+                raise
     
     def get_events(
         self,
@@ -241,7 +386,7 @@ class DatabaseLogStorage:
         offset: Optional[int] = None,
     ) -> List[SecurityEvent]:
         """
-        Get security events.
+        Get security events, newest first.
         
         Args:
             start_time: Optional start time (Unix timestamp)
@@ -254,8 +399,347 @@ class DatabaseLogStorage:
         Returns:
             List of security events
         """
-        # Placeholder implementation
-        return []
+        conditions = []
+        params: List[Any] = []
+        
+        if start_time is not None:
+            conditions.append(sql.SQL("timestamp >= %s"))
+            params.append(start_time)
+        if end_time is not None:
+            conditions.append(sql.SQL("timestamp <= %s"))
+            params.append(end_time)
+        if event_types is not None:
+            conditions.append(sql.SQL("event_type = ANY(%s)"))
+            params.append(list(event_types))
+        if user_id is not None:
+            conditions.append(sql.SQL("user_id = %s"))
+            params.append(user_id)
+        
+        query = sql.SQL("SELECT {} FROM {}").format(
+            sql.SQL(", ").join(map(sql.Identifier, _EVENT_COLUMNS)),
+            sql.Identifier(self.table_name),
+        )
+        if conditions:
+            query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
+        query += sql.SQL(" ORDER BY timestamp DESC LIMIT %s OFFSET %s")
+        params.extend([limit, offset or 0])
+        
+        with self._lock:
+            rows = self._get_connection().execute(query, params).fetchall()
+        
+        return [SecurityEvent.from_dict(dict(zip(_EVENT_COLUMNS, row))) for row in rows]
+
+
+class BufferedLogStorage:
+    """
+    Buffered audit log storage.
+    
+    This class wraps another storage backend. Events are appended to a
+    bounded in-memory buffer and a background thread writes them to the
+    backend in batches, every ``flush_interval`` seconds or as soon as a
+    full batch is buffered. When the buffer is full, new events are dropped
+    and counted, or wait for space, depending on the overflow policy.
+    
+    A batch that cannot be written is retried up to ``max_retries`` times,
+    then split in halves until the events that cannot be written are
+    isolated; those are dropped and counted as rejected.
+    
+    Events still buffered are written when the storage is closed, which
+    also happens at interpreter exit; events buffered when the process is
+    killed are lost.
+    """
+    
+    def __init__(
+        self,
+        storage: Any,
+        capacity: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        overflow_policy: AuditOverflowPolicy = AuditOverflowPolicy.DROP_NEWEST,
+        block_timeout: float = 1.0,
+        max_retries: int = 3,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize buffered log storage.
+        
+        Args:
+            storage: Storage backend the events are written to
+            capacity: Maximum number of buffered events
+            batch_size: Maximum number of events written at once
+            flush_interval: Maximum seconds an event stays buffered
+            overflow_policy: What to do with new events when the buffer is full
+            block_timeout: Seconds to wait for space before dropping an event
+                with the block policy
+            max_retries: Times a failed batch is retried before it is split
+            logger: Logger
+        """
+        self.storage = storage
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = AuditOverflowPolicy(overflow_policy)
+        self.block_timeout = block_timeout
+        self.max_retries = max_retries
+        self.logger = logger or logging.getLogger("uno.security.audit")
+        
+        self._buffer: Deque[SecurityEvent] = deque()
+        self._condition = threading.Condition()
+        self._writing = 0
+        self._flush_waiters = 0
+        self._closed = False
+        
+        # Statistics
+        self._logged = 0
+        self._written = 0
+        self._dropped = 0
+        self._blocked = 0
+        self._flushes = 0
+        self._errors = 0
+        self._rejected = 0
+        
+        self._thread = threading.Thread(target=self._run, name="uno-audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def log_event(self, event: SecurityEvent) -> None:
+        """
+        Buffer a security event.
+        
+        Args:
+            event: Security event to log
+        """
+        with self._condition:
+            if not self._closed:
+                self._enqueue(event)
+                return
+        
+        # After closing, events are written directly
+        self._write([event])
+    
+    def _enqueue(self, event: SecurityEvent) -> None:
+        """
+        Append an event to the buffer, applying the overflow policy.
+        
+        Must be called with the condition held.
+        
+        Args:
+            event: Security event to buffer
+        """
+        if len(self._buffer) >= self.capacity:
+            if self.overflow_policy == AuditOverflowPolicy.DROP_NEWEST:
+                self._dropped += 1
+                return
+            
+            if self.overflow_policy == AuditOverflowPolicy.DROP_OLDEST:
+                self._buffer.popleft()
+                self._dropped += 1
+            else:
+                self._blocked += 1
+                self._condition.notify_all()
+                has_space = self._condition.wait_for(
+                    lambda: len(self._buffer) < self.capacity or self._closed,
+                    self.block_timeout,
+                )
+                if not has_space or self._closed:
+                    self._dropped += 1
+                    return
+        
+        self._buffer.append(event)
+        self._logged += 1
+        if len(self._buffer) >= self.batch_size:
+            self._condition.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the buffered events are written.
+        
+        Args:
+            timeout: Optional maximum seconds to wait
+            
+        Returns:
+            True if the buffer was drained, False on timeout
+        """
+        with self._condition:
+            self._flush_waiters += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(
+                    lambda: not self._buffer and not self._writing, timeout
+                )
+            finally:
+                self._flush_waiters -= 1
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread after writing the buffered events.
+        
+        Args:
+            timeout: Optional maximum seconds to wait for the writes
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+    
+    def _run(self) -> None:
+        """Write buffered events in batches until closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: (
+                        self._closed
+                        or len(self._buffer) >= self.batch_size
+                        or (self._flush_waiters > 0 and bool(self._buffer))
+                    ),
+                    self.flush_interval,
+                )
+                if self._closed and not self._buffer:
+                    return
+                
+                count = min(len(self._buffer), self.batch_size)
+                batch = [self._buffer.popleft() for _ in range(count)]
+                self._writing = count
+                # Wake producers waiting for space
+                self._condition.notify_all()
+            
+            if batch:
+                self._write_batch(batch)
+            
+            with self._condition:
+                self._writing = 0
+                self._condition.notify_all()
+    
+    def _write_batch(self, batch: List[SecurityEvent]) -> None:
+        """
+        Write a batch, retrying and then splitting it if the write fails.
+        
+        Args:
+            batch: Events to write
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._write(batch)
+            except Exception as e:
+                self.logger.error(f"Error writing {len(batch)} audit events: {e}")
+                with self._condition:
+                    self._errors += 1
+                    if self._closed or attempt == self.max_retries:
+                        break
+                    # Retry after the flush interval, or at once when closing
+                    self._condition.wait_for(lambda: self._closed, self.flush_interval)
+            else:
+                with self._condition:
+                    self._written += len(batch)
+                    self._flushes += 1
+                return
+        
+        # Isolate the events that cannot be written, e.g. invalid rows or
+        # duplicates of events already written by an ambiguous commit
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            self._write_split(half)
+    
+    def _write_split(self, batch: List[SecurityEvent]) -> None:
+        """
+        Write part of a failed batch, splitting it further if the write fails.
+        
+        An event that cannot be written on its own is dropped.
+        
+        Args:
+            batch: Events to write
+        """
+        if not batch:
+            return
+        
+        try:
+            self._write(batch)
+        except Exception as e:
+            with self._condition:
+                self._errors += 1
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                self._write_split(batch[:middle])
+                self._write_split(batch[middle:])
+                return
+            
+            self.logger.error(f"Dropping audit event {batch[0].event_id} that cannot be written: {e}")
+            with self._condition:
+                self._dropped += 1
+                self._rejected += 1
+            return
+        
+        with self._condition:
+            self._written += len(batch)
+            self._flushes += 1
+    
+    def _write(self, events: List[SecurityEvent]) -> None:
+        """
+        Write events to the wrapped storage.
+        
+        Args:
+            events: Events to write
+        """
+        log_events = getattr(self.storage, "log_events", None)
+        if log_events is not None:
+            log_events(events)
+        else:
+            for event in events:
+                self.storage.log_event(event)
+    
+    def get_events(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        event_types: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[SecurityEvent]:
+        """
+        Get security events, after writing the buffered ones.
+        
+        Args:
+            start_time: Optional start time (Unix timestamp)
+            end_time: Optional end time (Unix timestamp)
+            event_types: Optional list of event types to filter by
+            user_id: Optional user ID to filter by
+            limit: Optional limit on the number of events to return
+            offset: Optional offset for pagination
+            
+        Returns:
+            List of security events
+        """
+        self.flush(self.block_timeout + self.flush_interval)
+        return self.storage.get_events(
+            start_time, end_time, event_types, user_id, limit, offset
+        )
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get buffer statistics.
+        
+        Returns:
+            Dictionary with the number of buffered, logged, written, dropped,
+            blocked and rejected events, and the number of batches and failed
+            writes
+        """
+        with self._condition:
+            return {
+                "buffered": len(self._buffer) + self._writing,
+                "capacity": self.capacity,
+                "logged": self._logged,
+                "written": self._written,
+                "dropped": self._dropped,
+                "blocked": self._blocked,
+                "flushes": self._flushes,
+                "errors": self._errors,
+                "rejected": self._rejected,
+            }
 
 
 class AuditLogger:
@@ -263,7 +747,9 @@ class AuditLogger:
     Security audit logger.
     
     This class provides logging for security events, with configurable
-    log level, storage, and filtering.
+    log level, storage, and filtering. With ``config.buffered`` enabled,
+    events are buffered in memory and written in batches by a background
+    thread.
     """
     
     def __init__(
@@ -291,21 +777,37 @@ class AuditLogger:
         """
         storage_type = self.config.storage
         
-        if storage_type == AuditLogStorage.FILE:
+        if storage_type == AuditLogStorageType.FILE:
             storage_path = self.config.storage_path or "audit.log"
-            return FileLogStorage(storage_path)
-        elif storage_type == AuditLogStorage.DATABASE:
-            # Placeholder for database storage
-            return DatabaseLogStorage("placeholder")
-        elif storage_type == AuditLogStorage.REMOTE:
+            storage = FileLogStorage(storage_path, fsync=self.config.fsync)
+        elif storage_type == AuditLogStorageType.DATABASE:
+            if not self.config.database_url:
+                self.logger.warning("No database_url configured, audit events are not stored")
+                return None
+            storage = DatabaseLogStorage(self.config.database_url, self.config.database_table)
+        elif storage_type == AuditLogStorageType.REMOTE:
             # Placeholder for remote storage
             return None
-        elif storage_type == AuditLogStorage.SYSLOG:
+        elif storage_type == AuditLogStorageType.SYSLOG:
             # Placeholder for syslog storage
             return None
         else:
             # Default to file storage
-            return FileLogStorage("audit.log")
+            storage = FileLogStorage("audit.log", fsync=self.config.fsync)
+        
+        if self.config.buffered:
+            storage = BufferedLogStorage(
+                storage,
+                capacity=self.config.buffer_size,
+                batch_size=self.config.flush_batch_size,
+                flush_interval=self.config.flush_interval,
+                overflow_policy=self.config.overflow_policy,
+                block_timeout=self.config.block_timeout,
+                max_retries=self.config.flush_max_retries,
+                logger=self.logger,
+            )
+        
+        return storage
     
     def log_event(self, event: SecurityEvent) -> None:
         """
@@ -368,4 +870,34 @@ class AuditLogger:
         
         return self.storage.get_events(
             start_time, end_time, event_types, user_id, limit, offset
-        )
\ No newline at end of file
+        )
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until buffered events are written.
+        
+        Args:
+            timeout: Optional maximum seconds to wait
+            
+        Returns:
+            True if all events were written, False on timeout
+        """
+        if isinstance(self.storage, BufferedLogStorage):
+            return self.storage.flush(timeout)
+        return True
+    
+    def close(self) -> None:
+        """Write buffered events and stop the background writer."""
+        if isinstance(self.storage, BufferedLogStorage):
+            self.storage.close()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get buffer statistics.
+        
+        Returns:
+            Buffer statistics, or an empty dictionary if events are not buffered
+        """
+        if isinstance(self.storage, BufferedLogStorage):
+            return self.storage.get_stats()
+        return {}
@@ -9,10 +9,10 @@ import time
 import logging
 import hashlib
 import uuid
-from typing import Dict, List, Optional, Any, Union, Callable
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import jwt
 from pydantic import BaseModel
@@ -20,7 +20,12 @@ from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from uno.security.config import SecurityConfig, AuthenticationConfig
-from uno.security.auth.token_cache import TokenCache, TokenCacheConfig, create_token_cache
+from uno.security.auth.token_cache import (
+    TokenCache,
+    TokenCacheConfig,
+    VerifiedTokenCache,
+    create_token_cache,
+)
 
 
 @dataclass
@@ -47,6 +52,15 @@ class JWTConfig:
     
     token_type: str = "Bearer"
     """Type of token for the Authorization header."""
+    
+    public_key: Optional[str] = None
+    """Public key for verifying RS/ES/PS/EdDSA JWTs; derived from secret_key when not set."""
+    
+    verified_cache_size: int = 10000
+    """Maximum number of validated tokens kept in process; 0 disables the cache."""
+    
+    verified_cache_ttl: int = 300
+    """Maximum time in seconds a validated token is kept in process."""
 
 
 class TokenType(str, Enum):
@@ -125,7 +139,8 @@ class JWTAuth:
                 access_token_expire_minutes=auth_config.jwt_expiration_minutes,
                 refresh_token_expire_days=auth_config.refresh_token_expiration_days,
                 issuer=auth_config.jwt_issuer,
-                audience=auth_config.jwt_audience
+                audience=auth_config.jwt_audience,
+                public_key=auth_config.jwt_public_key
             )
         elif isinstance(config, AuthenticationConfig):
             self.config = JWTConfig(
@@ -134,7 +149,8 @@ class JWTAuth:
                 access_token_expire_minutes=config.jwt_expiration_minutes,
                 refresh_token_expire_days=config.refresh_token_expiration_days,
                 issuer=getattr(config, "jwt_issuer", None),
-                audience=getattr(config, "jwt_audience", None)
+                audience=getattr(config, "jwt_audience", None),
+                public_key=getattr(config, "jwt_public_key", None)
             )
         else:
             raise TypeError(f"Unsupported config type: {type(config)}")
@@ -143,8 +159,43 @@ class JWTAuth:
             self.logger.warning("No JWT secret key provided. Using an insecure default key.")
             self.config.secret_key = "INSECURE_DEFAULT_KEY_CHANGE_THIS_IN_PRODUCTION"
         
-        # Initialize token cache if provided or create a default one
-        self.token_cache = token_cache or create_token_cache(config, logger)
+        # Initialize token cache if provided or create a default one;
+        # JWTConfig has no token cache settings, so it gets the defaults
+        if token_cache is None:
+            cache_config = TokenCacheConfig() if isinstance(config, JWTConfig) else config
+            token_cache = create_token_cache(cache_config, logger)
+        self.token_cache = token_cache
+        
+        # Validated tokens, checked before the token cache and jwt.decode
+        self.verified_tokens = VerifiedTokenCache(
+            max_size=self.config.verified_cache_size,
+            ttl=self.config.verified_cache_ttl
+        )
+        
+        # Parse the keys once instead of on every encode and decode
+        self._signing_key, self._verification_key = self._prepare_keys()
+    
+    def _prepare_keys(self) -> Tuple[Any, Any]:
+        """
+        Parse the signing and verification keys for the configured algorithm.
+        
+        For asymmetric algorithms the verification key is the configured
+        public key, or the public half of the signing key.
+        
+        Returns:
+            Tuple of the signing key and the verification key
+        """
+        algorithm = jwt.get_algorithm_by_name(self.config.algorithm)
+        signing_key = algorithm.prepare_key(self.config.secret_key)
+        
+        if self.config.public_key:
+            verification_key = algorithm.prepare_key(self.config.public_key)
+        elif hasattr(signing_key, "public_key"):
+            verification_key = signing_key.public_key()
+        else:
+            verification_key = signing_key
+        
+        return signing_key, verification_key
     
     def create_access_token(
         self,
@@ -213,9 +264,7 @@ class JWTAuth:
         Returns:
             Encoded JWT token
         """
-        import uuid
-        
-        now = datetime.now(datetime.UTC)
+        now = datetime.now(timezone.utc)
         expires_at = now + expires_delta
         
         # Prepare claims
@@ -256,7 +305,7 @@ class JWTAuth:
         # Encode the token
         return jwt.encode(
             claims,
-            self.config.secret_key,
+            self._signing_key,
             algorithm=self.config.algorithm
         )
     
@@ -264,6 +313,9 @@ class JWTAuth:
         """
         Decode and validate a JWT token.
         
+        Tokens validated before are served from an in-process cache keyed by
+        the token digest; only the blacklist is checked for them.
+        
         Args:
             token: The JWT token to decode and validate
             
@@ -274,69 +326,75 @@ class JWTAuth:
             jwt.InvalidTokenError: If the token is invalid
         """
         try:
-            # Check token cache first
-            cached_payload = None
-            if self.token_cache:
-                cached_payload = self.token_cache.get(token)
-                
-                if cached_payload:
-                    self.logger.debug("Token found in cache")
-                    
-                    # Verify expiration
-                    exp = cached_payload["exp"]
-                    if exp < time.time():
-                        self.logger.debug("Cached token expired")
-                        self.token_cache.invalidate(token)
-                        raise jwt.ExpiredSignatureError("Token has expired")
-                    
-                    # Check for token JTI in blacklist
-                    if self.token_cache.is_blacklisted(cached_payload["jti"]):
-                        self.logger.warning(f"Token {cached_payload['jti']} is blacklisted")
-                        raise jwt.InvalidTokenError("Token has been revoked")
+            now = time.time()
+            token_data = self.verified_tokens.get(token, now)
             
-            # Not in cache or cache disabled, decode token
-            if not cached_payload:
-                payload = jwt.decode(
-                    token,
-                    self.config.secret_key,
-                    algorithms=[self.config.algorithm],
-                    options={"verify_signature": True, "verify_exp": True}
-                )
+            if token_data is None:
+                # Check token cache next
+                payload = None
+                if self.token_cache:
+                    payload = self.token_cache.get(token)
+                    
+                    if payload:
+                        self.logger.debug("Token found in cache")
+                        
+                        # Verify expiration
+                        if payload["exp"] < now:
+                            self.logger.debug("Cached token expired")
+                            self.token_cache.invalidate(token)
+                            raise jwt.ExpiredSignatureError("Token has expired")
                 
-                # Check for token JTI in blacklist
-                if self.token_cache and self.token_cache.is_blacklisted(payload["jti"]):
-                    self.logger.warning(f"Token {payload['jti']} is blacklisted")
-                    raise jwt.InvalidTokenError("Token has been revoked")
+                # Not in cache or cache disabled, decode token
+                if not payload:
+                    payload = jwt.decode(
+                        token,
+                        self._verification_key,
+                        algorithms=[self.config.algorithm],
+                        audience=self.config.audience,
+                        issuer=self.config.issuer,
+                        options={"verify_signature": True, "verify_exp": True}
+                    )
+                    
+                    # Cache the token for future use
+                    if self.token_cache:
+                        self.token_cache.set(token, payload)
+                        self.logger.debug("Token added to cache")
                 
-                # Cache the token for future use
-                if self.token_cache:
-                    self.token_cache.set(token, payload)
-                    self.logger.debug("Token added to cache")
-            else:
-                # Use cached payload
-                payload = cached_payload
+                token_data = self._create_token_data(payload)
+                self.verified_tokens.set(token, token_data, token_data.exp)
             
-            # Extract custom claims if present
-            custom_claims = payload.pop("custom_claims", {}) if "custom_claims" in payload else {}
-            
-            # Create TokenData object
-            token_data = TokenData(
-                sub=payload["sub"],
-                exp=payload["exp"],
-                iat=payload["iat"],
-                token_type=payload["token_type"],
-                jti=payload["jti"],
-                roles=payload.get("roles", []),
-                tenant_id=payload.get("tenant_id"),
-                email=payload.get("email"),
-                name=payload.get("name"),
-                custom_claims=custom_claims
-            )
+            # Check for token JTI in blacklist
+            if self.token_cache and self.token_cache.is_blacklisted(token_data.jti):
+                self.logger.warning(f"Token {token_data.jti} is blacklisted")
+                raise jwt.InvalidTokenError("Token has been revoked")
             
             return token_data
         except jwt.InvalidTokenError as e:
             self.logger.warning(f"Invalid token: {str(e)}")
             raise
+    
+    def _create_token_data(self, payload: Dict[str, Any]) -> TokenData:
+        """
+        Create token data from validated claims.
+        
+        Args:
+            payload: The token claims
+            
+        Returns:
+            The token data
+        """
+        return TokenData(
+            sub=payload["sub"],
+            exp=payload["exp"],
+            iat=payload["iat"],
+            token_type=payload["token_type"],
+            jti=payload["jti"],
+            roles=payload.get("roles", []),
+            tenant_id=payload.get("tenant_id"),
+            email=payload.get("email"),
+            name=payload.get("name"),
+            custom_claims=payload.get("custom_claims", {})
+        )
             
     def revoke_token(self, token: str) -> bool:
         """
@@ -356,8 +414,10 @@ class JWTAuth:
             # Decode the token
             payload = jwt.decode(
                 token,
-                self.config.secret_key,
+                self._verification_key,
                 algorithms=[self.config.algorithm],
+                audience=self.config.audience,
+                issuer=self.config.issuer,
                 options={"verify_signature": True, "verify_exp": False}  # Don't verify exp to allow revoking expired tokens
             )
             
@@ -372,8 +432,9 @@ class JWTAuth:
             # Blacklist the token
             self.token_cache.blacklist(jti, exp)
             
-            # Invalidate from token cache
+            # Invalidate from token caches
             self.token_cache.invalidate(token)
+            self.verified_tokens.invalidate(token)
             
             self.logger.info(f"Revoked token with JTI: {jti}")
             return True
@@ -5,8 +5,12 @@ This module provides caching mechanisms for JWT tokens to improve
 performance and reduce load on authentication services.
 """
 
+import hashlib
 import logging
+import math
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Any, Callable, Tuple, Union, List
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -40,6 +44,183 @@ class TokenCacheConfig:
     
     blacklist_ttl: int = 86400  # 24 hours
     """Time-to-live for blacklisted tokens in seconds."""
+    
+    blacklist_filter_error_rate: float = 0.001
+    """False positive rate of the in-memory blacklist filter at max_size revoked tokens."""
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Get the digest a token is cached under.
+    
+    Args:
+        token: The token string
+        
+    Returns:
+        A 32-byte digest of the token
+    """
+    return hashlib.blake2b(token.encode(), digest_size=32).digest()
+
+
+class BloomFilter:
+    """
+    Bloom filter over strings.
+    
+    A negative answer is exact, so a filter populated alongside a blacklist
+    answers most lookups for tokens that are not revoked without consulting
+    the blacklist. Items cannot be removed; the false positive rate rises
+    above the configured one once more than ``capacity`` items are added.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize the filter.
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: False positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+    
+    def _positions(self, item: str) -> List[int]:
+        """Get the bit positions of an item using double hashing."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+    
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+        
+        Args:
+            item: The item to add
+        """
+        with self._lock:
+            for position in self._positions(item):
+                self._bits[position >> 3] |= 1 << (position & 7)
+    
+    def might_contain(self, item: str) -> bool:
+        """
+        Check whether an item may have been added.
+        
+        Args:
+            item: The item to check
+            
+        Returns:
+            False if the item was never added, True if it may have been
+        """
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    def clear(self) -> None:
+        """Remove all items from the filter."""
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
+
+
+class VerifiedTokenCache:
+    """
+    In-process LRU cache of validated token data.
+    
+    Entries are keyed by the token digest and expire at the earlier of the
+    token's expiry and the cache TTL, so a cached token is never served past
+    its ``exp`` claim. Cached values are shared between callers.
+    """
+    
+    def __init__(self, max_size: int = 10000, ttl: int = 300):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of tokens to store
+            ttl: Maximum time-to-live for cached tokens in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, token: str, now: Optional[float] = None) -> Optional[Any]:
+        """
+        Get the validated data of a token.
+        
+        Args:
+            token: The token string
+            now: Current timestamp, defaults to time.time()
+            
+        Returns:
+            The token data if cached and not expired, None otherwise
+        """
+        key = token_digest(token)
+        now = now if now is not None else time.time()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            expires_at, token_data = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return token_data
+    
+    def set(self, token: str, token_data: Any, expires_at: float) -> None:
+        """
+        Cache the validated data of a token.
+        
+        Args:
+            token: The token string
+            token_data: The validated token data
+            expires_at: Token expiry timestamp
+        """
+        if self.max_size <= 0:
+            return
+        
+        key = token_digest(token)
+        expires_at = min(expires_at, time.time() + self.ttl)
+        
+        with self._lock:
+            self._entries[key] = (expires_at, token_data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, token: str) -> None:
+        """
+        Remove a token from the cache.
+        
+        Args:
+            token: The token string
+        """
+        with self._lock:
+            self._entries.pop(token_digest(token), None)
+    
+    def clear(self) -> None:
+        """Remove all tokens from the cache."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with the size, hits and misses of the cache
+        """
+        return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
 
 
 class TokenCache(ABC):
@@ -119,7 +300,9 @@ class MemoryTokenCache(TokenCache):
     """
     In-memory implementation of token cache.
     
-    This implementation stores tokens in memory using an LRU cache.
+    This implementation stores tokens in memory using an LRU cache. Blacklist
+    lookups are answered by a bloom filter populated alongside the blacklist,
+    which is only consulted when the filter reports a possible match.
     """
     
     def __init__(self, config: TokenCacheConfig, logger: Optional[logging.Logger] = None):
@@ -135,16 +318,15 @@ class MemoryTokenCache(TokenCache):
         
         # Initialize memory caches
         self.token_cache = MemoryCache(
-            name="token_cache",
             max_size=config.max_size,
             ttl=config.ttl
         )
         
-        self.blacklist = MemoryCache(
-            name="token_blacklist",
+        self.blacklist_cache = MemoryCache(
             max_size=config.max_size,
             ttl=config.blacklist_ttl
         )
+        self.blacklist_filter = BloomFilter(config.max_size, config.blacklist_filter_error_rate)
     
     def get(self, token: str) -> Optional[Dict[str, Any]]:
         """Get token claims from cache."""
@@ -177,7 +359,10 @@ class MemoryTokenCache(TokenCache):
         if not self.config.enabled or not self.config.blacklist_enabled:
             return False
         
-        return self.blacklist.exists(jti)
+        if not self.blacklist_filter.might_contain(jti):
+            return False
+        
+        return self.blacklist_cache.get(jti) is not None
     
     def blacklist(self, jti: str, expiry: int) -> None:
         """Blacklist a token ID."""
@@ -189,12 +374,15 @@ class MemoryTokenCache(TokenCache):
         ttl = max(expiry - now, 60)  # At least 60 seconds
         ttl = min(ttl, self.config.blacklist_ttl)  # At most blacklist_ttl
         
-        self.blacklist.set(jti, True, ttl)
+        # Add to the filter first so a concurrent lookup never misses the entry
+        self.blacklist_filter.add(jti)
+        self.blacklist_cache.set(jti, True, ttl)
     
     def clear(self) -> None:
         """Clear all cached tokens."""
         self.token_cache.clear()
-        self.blacklist.clear()
+        self.blacklist_cache.clear()
+        self.blacklist_filter.clear()
 
 
 class RedisTokenCache(TokenCache):
@@ -202,6 +390,8 @@ class RedisTokenCache(TokenCache):
     Redis implementation of token cache.
     
     This implementation stores tokens in Redis for distributed caching.
+    Blacklist lookups always go to Redis, since tokens may be revoked by
+    other processes.
     """
     
     def __init__(self, config: TokenCacheConfig, logger: Optional[logging.Logger] = None):
@@ -220,15 +410,13 @@ class RedisTokenCache(TokenCache):
         
         # Initialize Redis caches
         self.token_cache = RedisCache(
-            name="token_cache",
-            redis_url=config.redis_url,
+            connection_string=config.redis_url,
             ttl=config.ttl,
             prefix="token:"
         )
         
-        self.blacklist = RedisCache(
-            name="token_blacklist",
-            redis_url=config.redis_url,
+        self.blacklist_cache = RedisCache(
+            connection_string=config.redis_url,
             ttl=config.blacklist_ttl,
             prefix="blacklist:"
         )
@@ -264,7 +452,7 @@ class RedisTokenCache(TokenCache):
         if not self.config.enabled or not self.config.blacklist_enabled:
             return False
         
-        return self.blacklist.exists(jti)
+        return self.blacklist_cache.exists(jti)
     
     def blacklist(self, jti: str, expiry: int) -> None:
         """Blacklist a token ID."""
@@ -276,12 +464,12 @@ class RedisTokenCache(TokenCache):
         ttl = max(expiry - now, 60)  # At least 60 seconds
         ttl = min(ttl, self.config.blacklist_ttl)  # At most blacklist_ttl
         
-        self.blacklist.set(jti, True, ttl)
+        self.blacklist_cache.set(jti, True, ttl)
     
     def clear(self) -> None:
         """Clear all cached tokens."""
         self.token_cache.clear()
-        self.blacklist.clear()
+        self.blacklist_cache.clear()
 
 
 def create_token_cache(
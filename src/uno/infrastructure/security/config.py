@@ -90,6 +90,14 @@ class AuditLogStorage(str, Enum):
     SYSLOG = "syslog"
 
 
+class AuditOverflowPolicy(str, Enum):
+    """What buffered audit logging does when its buffer is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
 class ContentSecurityPolicyLevel(str, Enum):
     """Content Security Policy (CSP) levels."""
 
@@ -251,6 +259,9 @@ class AuthenticationConfig(BaseModel):
     jwt_algorithm: str = Field("HS256", description="Algorithm for signing JWTs")
     jwt_issuer: Optional[str] = Field(None, description="Issuer claim for the JWT")
     jwt_audience: Optional[str] = Field(None, description="Audience claim for the JWT")
+    jwt_public_key: Optional[str] = Field(
+        None, description="Public key for verifying asymmetrically signed JWTs"
+    )
     enable_jwt_middleware: bool = Field(
         True, description="Enable JWT middleware for FastAPI"
     )
@@ -280,6 +291,33 @@ class AuditingConfig(BaseModel):
     storage_path: Optional[str] = Field(
         None, description="Path for audit log storage (if file or remote)"
     )
+    database_url: Optional[str] = Field(
+        None, description="PostgreSQL connection string for database storage"
+    )
+    database_table: str = Field(
+        "security_audit_log", description="Table for database storage"
+    )
+    buffered: bool = Field(
+        False, description="Buffer events in memory and write them in batches"
+    )
+    buffer_size: int = Field(10_000, description="Maximum number of buffered events")
+    flush_interval: float = Field(
+        1.0, description="Maximum seconds an event stays buffered before it is written"
+    )
+    flush_batch_size: int = Field(500, description="Maximum number of events written at once")
+    overflow_policy: AuditOverflowPolicy = Field(
+        AuditOverflowPolicy.DROP_NEWEST,
+        description="What to do with new events when the buffer is full",
+    )
+    block_timeout: float = Field(
+        1.0, description="Seconds to wait for buffer space before dropping an event (block policy)"
+    )
+    flush_max_retries: int = Field(
+        3, description="Times a failed batch is retried before it is split to isolate bad events"
+    )
+    fsync: bool = Field(
+        False, description="fsync the audit log file after every write (file storage)"
+    )
     retention_days: int = Field(365, description="Audit log retention in days")
     include_events: List[str] = Field(
         default_factory=lambda: [
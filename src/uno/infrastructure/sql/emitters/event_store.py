@@ -39,7 +39,9 @@ class CreateDomainEventsTable(SQLEmitter):
             aggregate_id VARCHAR(36),
             aggregate_type VARCHAR(100),
             timestamp TIMESTAMP NOT NULL,
-            version INT DEFAULT 1,
+            version INT,
+            position BIGINT,
+            transaction_id BIGINT DEFAULT pg_current_xact_id()::text::bigint,
             data JSONB NOT NULL,
             metadata JSONB,
             created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
@@ -49,7 +51,33 @@ class CreateDomainEventsTable(SQLEmitter):
         CREATE INDEX IF NOT EXISTS idx_domain_events_event_type ON {schema}.domain_events(event_type);
         CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_id ON {schema}.domain_events(aggregate_id);
         CREATE INDEX IF NOT EXISTS idx_domain_events_timestamp ON {schema}.domain_events(timestamp);
-        CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_version ON {schema}.domain_events(aggregate_id, version);
+        
+        -- Each stream version is written once; events outside a stream have no version
+        ALTER TABLE {schema}.domain_events ALTER COLUMN version DROP DEFAULT;
+
+        -- Tables created while version defaulted to 1 can repeat a version
+        -- within a stream, so renumber those streams in event order first
+        UPDATE {schema}.domain_events AS e
+        SET version = renumbered.version
+        FROM (
+            SELECT
+                event_id,
+                ROW_NUMBER() OVER (
+                    PARTITION BY aggregate_id ORDER BY timestamp, event_id
+                )::INT AS version
+            FROM {schema}.domain_events
+            WHERE aggregate_id IN (
+                SELECT aggregate_id FROM {schema}.domain_events
+                WHERE aggregate_id IS NOT NULL AND version IS NOT NULL
+                GROUP BY aggregate_id
+                HAVING COUNT(*) <> COUNT(DISTINCT version)
+            )
+        ) AS renumbered
+        WHERE e.event_id = renumbered.event_id
+        AND e.version IS DISTINCT FROM renumbered.version;
+
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_domain_events_aggregate_version_unique ON {schema}.domain_events(aggregate_id, version);
+        DROP INDEX IF EXISTS {schema}.idx_domain_events_aggregate_version;
         
         COMMENT ON TABLE {schema}.domain_events IS 'Stores domain events for event sourcing and event-driven architecture';
         """
@@ -63,6 +91,80 @@ class CreateDomainEventsTable(SQLEmitter):
             )
         )
 
+        # Generate the global position SQL
+        position_sql = f"""
+        SET ROLE {admin_role};
+        
+        -- Number events in a global sequence, for tables created before it existed
+        CREATE SEQUENCE IF NOT EXISTS {schema}.domain_events_position_seq;
+        ALTER TABLE {schema}.domain_events ADD COLUMN IF NOT EXISTS position BIGINT;
+        
+        UPDATE {schema}.domain_events AS e
+        SET position = numbered.position
+        FROM (
+            SELECT event_id, nextval('{schema}.domain_events_position_seq') AS position
+            FROM (
+                SELECT event_id FROM {schema}.domain_events
+                WHERE position IS NULL
+                ORDER BY created_at, timestamp, event_id
+            ) AS unnumbered
+        ) AS numbered
+        WHERE e.event_id = numbered.event_id;
+        
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_domain_events_position ON {schema}.domain_events(position);
+        
+        -- Record the inserting transaction, which orders the global feed;
+        -- events written before it was recorded come first
+        ALTER TABLE {schema}.domain_events ADD COLUMN IF NOT EXISTS transaction_id BIGINT;
+        UPDATE {schema}.domain_events SET transaction_id = 0 WHERE transaction_id IS NULL;
+        ALTER TABLE {schema}.domain_events
+            ALTER COLUMN transaction_id SET DEFAULT pg_current_xact_id()::text::bigint;
+        CREATE INDEX IF NOT EXISTS idx_domain_events_feed
+            ON {schema}.domain_events(transaction_id, position);
+        """
+
+        # Add the position statement to the list
+        statements.append(
+            SQLStatement(
+                name="create_domain_events_position",
+                type=SQLStatementType.TABLE,
+                sql=position_sql,
+            )
+        )
+
+        # Generate the position assignment function SQL
+        position_function_sql = f"""
+        SET ROLE {admin_role};
+        
+        -- Assign global positions from the sequence. No lock is taken, so
+        -- concurrent appends do not wait for each other; readers order the
+        -- feed by transaction_id and only read the events of finished
+        -- transactions, so they never skip an event committed later.
+        CREATE OR REPLACE FUNCTION {schema}.assign_event_position()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.position := nextval('{schema}.domain_events_position_seq');
+            NEW.transaction_id := pg_current_xact_id()::text::bigint;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        
+        DROP TRIGGER IF EXISTS domain_event_position_trigger ON {schema}.domain_events;
+        CREATE TRIGGER domain_event_position_trigger
+        BEFORE INSERT ON {schema}.domain_events
+        FOR EACH ROW
+        EXECUTE FUNCTION {schema}.assign_event_position();
+        """
+
+        # Add the position function statement to the list
+        statements.append(
+            SQLStatement(
+                name="create_assign_event_position_trigger",
+                type=SQLStatementType.TRIGGER,
+                sql=position_function_sql,
+            )
+        )
+
         # Generate the notification function SQL
         notification_function_sql = f"""
         SET ROLE {admin_role};
@@ -80,7 +182,8 @@ class CreateDomainEventsTable(SQLEmitter):
                     'aggregate_id', NEW.aggregate_id,
                     'aggregate_type', NEW.aggregate_type,
                     'timestamp', NEW.timestamp,
-                    'version', NEW.version
+                    'version', NEW.version,
+                    'position', NEW.position
                 )::text
             );
             RETURN NEW;
@@ -125,6 +228,7 @@ class CreateDomainEventsTable(SQLEmitter):
         -- Grant permissions
         GRANT SELECT, INSERT ON {schema}.domain_events TO {writer_role};
         GRANT SELECT ON {schema}.domain_events TO {reader_role};
+        GRANT USAGE ON SEQUENCE {schema}.domain_events_position_seq TO {writer_role};
         """
 
         # Add the grant permissions statement to the list
@@ -14,13 +14,16 @@ from datetime import datetime, UTC, timedelta
 from enum import Enum, auto
 from typing import (
     Any, Callable, Dict, Generic, List, Optional, Set, Type, TypeVar, Union,
-    Protocol, cast, Awaitable, NamedTuple, Counter
+    Protocol, cast, Awaitable, NamedTuple, Counter, TYPE_CHECKING
 )
 
 from uno.core.result import Result, Success, Failure
 from uno.domain.events import DomainEvent, EventBus, EventStore, EventHandler
 from uno.read_model.read_model import ReadModel, ReadModelRepository
 
+if TYPE_CHECKING:
+    from uno.read_model.subscription import CatchUpSubscription
+
 # Type variables
 T = TypeVar('T', bound=ReadModel)
 EventT = TypeVar('EventT', bound=DomainEvent)
@@ -349,27 +352,92 @@ class Projector:
         
         self.logger.info("Rebuilding all read models...")
         
-        # Get all events from the event store
-        events = await self.event_store.get_events()
-        
-        # Process events in order
-        for event in events:
-            event_type = type(event)
-            
-            # Skip events that don't have projections
-            if event_type not in self._projections:
-                continue
-            
-            # Apply each projection for this event type
-            for projection in self._projections[event_type]:
-                try:
-                    read_model = await projection.apply(event)
-                    if read_model:
-                        await projection.repository.save(read_model)
-                except Exception as e:
-                    self.logger.error(f"Error rebuilding projection for event {event.event_type}: {str(e)}")
+        # Stream the events when the store supports it, so that rebuilding
+        # does not load the whole history into memory
+        if hasattr(self.event_store, "stream_events"):
+            async for event in self.event_store.stream_events():
+                await self._rebuild_from_event(event)
+        else:
+            events = await self.event_store.get_events()
+            for event in events:
+                await self._rebuild_from_event(event)
         
         self.logger.info("Rebuild complete")
+    
+    def subscribe_to_feed(
+        self,
+        subscription_id: str,
+        progress_repository: Optional[Any] = None,
+        batch_size: int = 1000,
+        poll_interval: float = 5.0
+    ) -> "CatchUpSubscription":
+        """
+        Create a subscription applying the event feed to the projections.
+        
+        Unlike rebuild_all, the subscription resumes from the checkpoint
+        saved in the progress repository, then keeps the read models up to
+        date as events are committed. The event store must provide a global
+        event feed, such as PostgresEventStore.read_feed.
+        
+        Args:
+            subscription_id: Unique identifier the checkpoint is saved under
+            progress_repository: Optional repository for persisting progress
+            batch_size: Maximum number of events read at once
+            poll_interval: Maximum time to wait for new events before polling, in seconds
+        
+        Returns:
+            The subscription, to be started with its start method
+        """
+        from uno.read_model.subscription import CatchUpSubscription
+        
+        if not hasattr(self.event_store, "read_feed"):
+            raise ValueError("Cannot subscribe to the event feed: the event store does not provide one")
+        
+        return CatchUpSubscription(
+            event_store=self.event_store,
+            handler=self._apply_feed_event,
+            progress_tracker=ProgressTracker(subscription_id, progress_repository),
+            batch_size=batch_size,
+            poll_interval=poll_interval,
+            logger=self.logger,
+        )
+    
+    async def _apply_feed_event(self, event: Any) -> None:
+        """
+        Apply an event from the event feed to the projections of its type.
+        
+        Errors are raised, so that the subscription stops before the event
+        instead of checkpointing past it.
+        
+        Args:
+            event: The event to apply
+        """
+        for projection in self._projections.get(type(event), []):
+            read_model = await projection.apply(event)
+            if read_model:
+                await projection.repository.save(read_model)
+    
+    async def _rebuild_from_event(self, event: Any) -> None:
+        """
+        Apply an event to the projections of its type during a rebuild.
+        
+        Args:
+            event: The event to apply
+        """
+        event_type = type(event)
+        
+        # Skip events that don't have projections
+        if event_type not in self._projections:
+            return
+        
+        # Apply each projection for this event type
+        for projection in self._projections[event_type]:
+            try:
+                read_model = await projection.apply(event)
+                if read_model:
+                    await projection.repository.save(read_model)
+            except Exception as e:
+                self.logger.error(f"Error rebuilding projection for event {event.event_type}: {str(e)}")
 
 
 @dataclass
@@ -8,6 +8,7 @@ for different storage backends, including PostgreSQL, Redis, and hybrid solution
 import logging
 import json
 import pickle
+import time
 from typing import Dict, List, Optional, Any, Type, TypeVar, Generic, cast, Tuple, Union
 from datetime import datetime, timedelta, UTC
 import uuid
@@ -41,12 +42,16 @@ class PostgresReadModelRepository(Generic[T], ReadModelRepositoryProtocol[T]):
     with a dedicated table per read model type.
     """
     
+    # Columns written by batch_save, in record order
+    BATCH_COLUMNS = ("id", "version", "created_at", "updated_at", "data", "metadata")
+    
     def __init__(
         self,
         model_type: Type[T],
         db_provider: DatabaseProvider,
         table_name: Optional[str] = None,
         schema_name: str = "read_models",
+        copy_threshold: int = 1000,
         logger: Optional[logging.Logger] = None
     ):
         """
@@ -57,14 +62,24 @@ class PostgresReadModelRepository(Generic[T], ReadModelRepositoryProtocol[T]):
             db_provider: The database provider
             table_name: Optional table name, defaults to model_type.__name__.lower()
             schema_name: PostgreSQL schema name for read model tables
+            copy_threshold: Minimum batch size saved with COPY instead of an
+                UNNEST upsert; also the maximum size of an UNNEST upsert
             logger: Optional logger instance
         """
         self.model_type = model_type
         self.db_provider = db_provider
         self.table_name = table_name or f"{model_type.__name__.lower()}"
         self.qualified_table_name = f"{schema_name}.{self.table_name}"
+        self.copy_threshold = copy_threshold
         self.logger = logger or logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
+        # Batch save statistics
+        self._batches = 0
+        self._batch_rows = 0
+        self._batch_seconds = 0.0
+        self._last_batch_rate = 0.0
+        self._last_batch_method: Optional[str] = None
+        
     async def create_table_if_not_exists(self) -> Result[bool]:
         """
         Create the read model table if it doesn't exist.
@@ -95,7 +110,7 @@ class PostgresReadModelRepository(Generic[T], ReadModelRepositoryProtocol[T]):
                     version INTEGER NOT NULL DEFAULT 1,
                     created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    data JSONB NOT NULL DEFAULT '{}',
+                    data JSONB NOT NULL DEFAULT '{{}}',
                     metadata JSONB NOT NULL DEFAULT '{{}}'
                 );
                 """
@@ -449,6 +464,12 @@ class PostgresReadModelRepository(Generic[T], ReadModelRepositoryProtocol[T]):
         """
         Save multiple read models in a batch.
         
+        The models are upserted in a single transaction. Batches of at least
+        ``copy_threshold`` models are copied into a temporary table with
+        binary COPY and merged with one INSERT ... SELECT; smaller batches
+        are upserted with one INSERT ... SELECT FROM UNNEST of column arrays.
+        If a batch contains several models with the same ID, the last one wins.
+        
         Args:
             models: The read models to save
             
@@ -459,41 +480,31 @@ class PostgresReadModelRepository(Generic[T], ReadModelRepositoryProtocol[T]):
             return Success([])
         
         try:
+            # Deduplicate by ID, as an upsert cannot affect the same row twice
+            records = {}
+            for model in models:
+                records[model.id.value] = (
+                    model.id.value,
+                    model.version,
+                    model.created_at,
+                    model.updated_at or datetime.now(UTC),
+                    json.dumps(model.data),
+                    json.dumps(model.metadata)
+                )
+            rows = list(records.values())
+            
+            start = time.perf_counter()
             async with self.db_provider.async_connection() as conn:
-                # Start a transaction
                 async with conn.transaction():
-                    for model in models:
-                        model_dict = {
-                            "id": model.id.value,
-                            "version": model.version,
-                            "created_at": model.created_at,
-                            "updated_at": model.updated_at or datetime.now(UTC),
-                            "data": json.dumps(model.data),
-                            "metadata": json.dumps(model.metadata)
-                        }
-                        
-                        # Upsert query (INSERT ... ON CONFLICT ... DO UPDATE)
-                        query = f"""
-                        INSERT INTO {self.qualified_table_name}
-                        (id, version, created_at, updated_at, data, metadata)
-                        VALUES ($1, $2, $3, $4, $5, $6)
-                        ON CONFLICT (id) DO UPDATE SET
-                            version = $2,
-                            updated_at = $4,
-                            data = $5,
-                            metadata = $6
-                        """
-                        
-                        await conn.execute(
-                            query,
-                            model.id.value,
-                            model.version,
-                            model.created_at,
-                            model.updated_at,
-                            model_dict["data"],
-                            model_dict["metadata"]
-                        )
+                    if len(rows) >= self.copy_threshold and hasattr(conn, "copy_records_to_table"):
+                        method = "copy"
+                        await self._copy_upsert(conn, rows)
+                    else:
+                        method = "unnest"
+                        for offset in range(0, len(rows), self.copy_threshold):
+                            await self._unnest_upsert(conn, rows[offset:offset + self.copy_threshold])
             
+            self._record_batch(len(rows), time.perf_counter() - start, method)
             return Success(models)
         except Exception as e:
             model_ids = [model.id.value for model in models]
@@ -506,6 +517,93 @@ class PostgresReadModelRepository(Generic[T], ReadModelRepositoryProtocol[T]):
                 )
             )
     
+    def _upsert_query(self, source: str) -> str:
+        """
+        Build the upsert of batch records selected from a source.
+        
+        Args:
+            source: The FROM clause providing the records
+            
+        Returns:
+            The upsert query
+        """
+        columns = ", ".join(self.BATCH_COLUMNS)
+        return f"""
+        INSERT INTO {self.qualified_table_name} ({columns})
+        SELECT {columns} FROM {source}
+        ON CONFLICT (id) DO UPDATE SET
+            version = EXCLUDED.version,
+            updated_at = EXCLUDED.updated_at,
+            data = EXCLUDED.data,
+            metadata = EXCLUDED.metadata
+        """
+    
+    async def _unnest_upsert(self, conn: Any, rows: List[Tuple]) -> None:
+        """
+        Upsert batch records with a single statement taking column arrays.
+        
+        Args:
+            conn: The connection, inside a transaction
+            rows: The records, in BATCH_COLUMNS order
+        """
+        source = (
+            "UNNEST($1::text[], $2::integer[], $3::timestamptz[], $4::timestamptz[], "
+            f"$5::jsonb[], $6::jsonb[]) AS batch({', '.join(self.BATCH_COLUMNS)})"
+        )
+        await conn.execute(self._upsert_query(source), *(list(column) for column in zip(*rows)))
+    
+    async def _copy_upsert(self, conn: Any, rows: List[Tuple]) -> None:
+        """
+        Upsert batch records by copying them into a temporary table.
+        
+        Args:
+            conn: The connection, inside a transaction
+            rows: The records, in BATCH_COLUMNS order
+        """
+        temp_table = f"{self.table_name}_batch"
+        await conn.execute(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {temp_table} "
+            f"(LIKE {self.qualified_table_name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+        await conn.copy_records_to_table(temp_table, records=rows, columns=list(self.BATCH_COLUMNS))
+        await conn.execute(self._upsert_query(temp_table))
+    
+    def _record_batch(self, rows: int, seconds: float, method: str) -> None:
+        """
+        Record the throughput of a batch save.
+        
+        Args:
+            rows: Number of rows saved
+            seconds: Time taken, in seconds
+            method: How the rows were written, "copy" or "unnest"
+        """
+        self._batches += 1
+        self._batch_rows += rows
+        self._batch_seconds += seconds
+        self._last_batch_rate = rows / seconds if seconds > 0 else 0.0
+        self._last_batch_method = method
+        self.logger.debug(
+            f"Batch saved {rows} rows to {self.qualified_table_name} with {method} "
+            f"in {seconds * 1000:.1f}ms ({self._last_batch_rate:,.0f} rows/s)"
+        )
+    
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """
+        Get batch save statistics, to size projector batches.
+        
+        Returns:
+            Dictionary of statistics; ``rows_per_second`` is the average
+            throughput across all batch saves
+        """
+        return {
+            "batches": self._batches,
+            "rows": self._batch_rows,
+            "seconds": self._batch_seconds,
+            "rows_per_second": self._batch_rows / self._batch_seconds if self._batch_seconds > 0 else 0.0,
+            "last_rows_per_second": self._last_batch_rate,
+            "last_method": self._last_batch_method,
+        }
+    
     def _record_to_model(self, record: Any) -> T:
         """
         Convert a database record to a read model.
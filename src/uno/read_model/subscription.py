@@ -0,0 +1,153 @@
+"""Catch-up subscriptions to the global event feed.
+
+A subscription resumes from its last checkpoint, reads the events committed
+since then in large batches, and then tails the feed, waking up when the
+event store notifies it of new events. Progress is checkpointed through a
+ProgressTracker, so a restarted projection only processes the events it has
+not seen yet instead of rebuilding from scratch.
+"""
+
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from uno.domain.events import DomainEvent
+from uno.read_model.projector import ProgressTracker
+
+
+class CatchUpSubscription:
+    """
+    Subscription that catches up on the event feed and then tails it.
+    
+    The event store must provide ``read_feed(after_position, limit)``, which
+    returns (position, event) pairs in commit order. If it also provides a
+    ``listen(callback)`` context manager, the subscription wakes up on its
+    notifications; otherwise, and whenever a notification is missed, it
+    polls the feed every ``poll_interval`` seconds.
+    """
+    
+    def __init__(
+        self,
+        event_store: Any,
+        handler: Callable[[DomainEvent], Awaitable[None]],
+        progress_tracker: ProgressTracker,
+        batch_size: int = 1000,
+        poll_interval: float = 5.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the subscription.
+        
+        Args:
+            event_store: The event store providing the feed
+            handler: Function called with each event, in feed order
+            progress_tracker: Tracker storing the subscription's checkpoint
+            batch_size: Maximum number of events read at once
+            poll_interval: Maximum time to wait for a notification before
+                reading the feed, in seconds
+            logger: Optional logger instance
+        """
+        self.event_store = event_store
+        self.handler = handler
+        self.progress_tracker = progress_tracker
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.position = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the subscription is running."""
+        return self._task is not None and not self._task.done()
+    
+    async def start(self) -> None:
+        """Start processing the feed in the background."""
+        if self.running:
+            return
+        
+        self._task = asyncio.create_task(self.run())
+        self.logger.info(f"Subscription {self.progress_tracker.projection_id} started")
+    
+    async def stop(self) -> None:
+        """Stop processing the feed and save the checkpoint."""
+        if self._task is None:
+            return
+        
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Subscription {self.progress_tracker.projection_id} failed: {e}")
+        
+        self._task = None
+        self.logger.info(f"Subscription {self.progress_tracker.projection_id} stopped")
+    
+    async def run(self) -> None:
+        """
+        Process the feed until cancelled.
+        
+        Listening starts before catching up, so events committed while
+        catching up are not missed. The checkpoint is saved when processing
+        stops, including when the handler raises.
+        """
+        await self.progress_tracker.load_checkpoint()
+        self.position = self.progress_tracker.last_processed_position or 0
+        
+        listen = getattr(self.event_store, "listen", None)
+        context = listen(self._notify) if listen else nullcontext(False)
+        
+        try:
+            async with context as listening:
+                if not listening:
+                    self.logger.debug("Event notifications unavailable, polling the event feed")
+                
+                while True:
+                    self._wakeup.clear()
+                    await self.catch_up()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            await self.progress_tracker.save_checkpoint()
+    
+    async def catch_up(self) -> int:
+        """
+        Process the events committed since the current position.
+        
+        Returns:
+            The number of events read
+        """
+        count = 0
+        while True:
+            batch: List[Tuple[int, Optional[DomainEvent]]] = await self.event_store.read_feed(
+                self.position, self.batch_size
+            )
+            for position, event in batch:
+                # Events that cannot be decoded are skipped, not retried forever
+                if event is not None:
+                    await self.handler(event)
+                self.position = position
+                await self.progress_tracker.record_progress(
+                    position, event.timestamp if event is not None else None
+                )
+            
+            count += len(batch)
+            if self.progress_tracker.events_since_checkpoint:
+                await self.progress_tracker.save_checkpoint()
+            if len(batch) < self.batch_size:
+                return count
+    
+    def _notify(self, payload: str) -> None:
+        """
+        Wake the subscription up when events are committed.
+        
+        Args:
+            payload: The notification payload
+        """
+        self._wakeup.set()
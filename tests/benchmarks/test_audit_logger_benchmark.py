@@ -0,0 +1,37 @@
+"""
+Benchmark of audit logging: direct fsynced file writes against buffered,
+batched writes.
+"""
+
+import time
+
+import pytest
+
+from uno.security.audit.event import SecurityEvent
+from uno.security.audit.logger import BufferedLogStorage, FileLogStorage
+
+
+def login_event(i: int) -> SecurityEvent:
+    return SecurityEvent(event_type="login", user_id=f"user-{i}", ip_address="10.0.0.1")
+
+
+@pytest.mark.benchmark
+def test_logging_throughput(tmp_path):
+    """Compare direct file logging with buffered logging, both fsynced."""
+    rounds = 500
+    direct = FileLogStorage(str(tmp_path / "direct.log"), fsync=True)
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        direct.log_event(login_event(i))
+    direct_rate = rounds / (time.perf_counter() - start)
+
+    buffered = BufferedLogStorage(FileLogStorage(str(tmp_path / "buffered.log"), fsync=True),
+                                  capacity=rounds, flush_interval=0.1)
+    start = time.perf_counter()
+    for i in range(rounds):
+        buffered.log_event(login_event(i))
+    buffered_rate = rounds / (time.perf_counter() - start)
+    buffered.close()
+
+    print(f"\ndirect: {direct_rate:,.0f} events/s, buffered: {buffered_rate:,.0f} events/s")
@@ -0,0 +1,70 @@
+"""
+Benchmark of serialize-once WebSocket broadcast fan-out to 10k connections
+with one slow client.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from uno.realtime.websocket.connection import ConnectionState, WebSocketConnection
+from uno.realtime.websocket.manager import WebSocketManager
+from uno.realtime.websocket.message import Message, MessageType
+
+
+class FakeSocket:
+    """WebSocket sender with an optional delay per frame."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+
+    async def send_text(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+def add_websocket(manager, client_id, delay=0.0):
+    connection = WebSocketConnection(
+        FakeSocket(delay),
+        client_id=client_id,
+        auto_ping=False,
+        send_queue_size=manager.send_queue_size,
+        overflow_policy=manager.overflow_policy,
+        metrics=manager.fanout_metrics,
+    )
+    connection.state = ConnectionState.CONNECTED
+    manager.connections[client_id] = connection
+    return connection
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_fan_out_to_ten_thousand_connections():
+    """Time a broadcast to 10k connections and report delivery latency."""
+    manager = WebSocketManager(auto_ping=False)
+    add_websocket(manager, "slow", delay=10)
+    for i in range(10_000):
+        add_websocket(manager, f"c{i}")
+
+    start = time.perf_counter()
+    queued = await manager.broadcast(Message(type=MessageType.EVENT, payload={"n": 1}))
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.1)
+
+    stats = manager.get_fanout_stats()
+    print(
+        f"\nwebsocket fan-out to {queued:,} connections: {elapsed * 1000:.1f} ms, "
+        f"delivery p99 {stats['delivery_seconds']['p99'] * 1000:.1f} ms"
+    )
+
+    for connection in manager.connections.values():
+        connection.send_task.cancel()
@@ -0,0 +1,26 @@
+"""
+Benchmark of MemoryCache pattern invalidation over 100k keys, which should
+cost in proportion to the matching keys rather than the cache size.
+"""
+
+import time
+
+import pytest
+
+from uno.caching.local.memory import MemoryCache
+
+
+@pytest.mark.benchmark
+def test_pattern_invalidation_over_large_cache():
+    """Time invalidating a small prefix in a cache of 100k keys."""
+    cache = MemoryCache(max_size=200_000, ttl=60)
+    for user in range(20_000):
+        for item in range(5):
+            cache.set(f"user:{user}:item:{item}", item)
+
+    start = time.perf_counter()
+    count = cache.invalidate_pattern("user:123:*")
+    elapsed = time.perf_counter() - start
+
+    assert count == 5
+    print(f"\ninvalidate_pattern over 100,000 keys: {elapsed * 1000:.3f} ms")
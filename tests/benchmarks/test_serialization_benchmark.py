@@ -0,0 +1,71 @@
+"""
+Benchmark of encode and decode throughput per cache serialization codec and
+compressor on a payload shaped like a cached query result.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from uno.caching.serialization import Serializer, available_codecs, available_compressors
+
+
+def query_result(rows: int = 500, seed: int = 1):
+    """Build a payload shaped like a cached query result."""
+    rng = random.Random(seed)
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statuses = ["pending", "paid", "shipped", "cancelled"]
+    return {
+        "total": rows,
+        "page": 1,
+        "items": [
+            {
+                "id": f"01HX{i:022d}",
+                "customer_id": rng.randrange(10_000),
+                "status": rng.choice(statuses),
+                "total": round(rng.uniform(5, 500), 2),
+                "currency": "USD",
+                "created_at": (created + timedelta(minutes=i)).isoformat(),
+                "shipping_address": {
+                    "street": f"{rng.randrange(1, 9999)} Main St",
+                    "city": "Springfield",
+                    "postal_code": f"{rng.randrange(10_000, 99_999)}",
+                },
+                "tags": rng.sample(["gift", "express", "bulk", "promo", "vip"], 2),
+                "notes": None,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+@pytest.mark.benchmark
+def test_codec_throughput():
+    """Compare encode and decode throughput per codec on a query result."""
+    payload = query_result(500)
+    configurations = [(codec, None) for codec in available_codecs()]
+    configurations += [("msgpack", compression) for compression in available_compressors()
+                       if "msgpack" in available_codecs()]
+
+    print()
+    for codec, compression in configurations:
+        serializer = Serializer(codec, compression)
+        data = serializer.dumps(payload)
+        assert serializer.loads(data) == payload
+        rounds = 20
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            serializer.dumps(payload)
+        encode = rounds / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            serializer.loads(data)
+        decode = rounds / (time.perf_counter() - start)
+
+        name = f"{codec}+{compression}" if compression else codec
+        print(f"{name:>14}: {len(data):>8,} bytes, "
+              f"encode {encode:>7,.0f}/s, decode {decode:>7,.0f}/s")
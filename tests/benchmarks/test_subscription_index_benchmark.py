@@ -0,0 +1,85 @@
+"""
+Benchmark for matching events against realtime query subscriptions.
+
+Compares checking every query subscription against an event, as the
+in-memory store used to, with looking up candidates in the store's
+inverted index, at 100k subscriptions.
+"""
+
+import time
+
+import pytest
+
+from uno.realtime.subscriptions.store import InMemorySubscriptionStore
+from uno.realtime.subscriptions.subscription import (
+    SubscriptionType,
+    create_query_subscription,
+)
+
+
+SUBSCRIPTION_COUNT = 100_000
+EVENT_COUNT = 50
+
+
+def make_query(i):
+    if i % 4 == 0:
+        return {"resource_id": f"order-{i % 20000}"}
+    if i % 4 == 1:
+        return {"customer_id": f"customer-{i % 5000}", "status": "paid"}
+    if i % 4 == 2:
+        return {
+            "customer_id": f"customer-{i % 5000}",
+            "total": {"operator": "gte", "value": 900 + i % 100},
+        }
+    return {"region": {"operator": "in", "value": [f"region-{i % 1000}", "region-x"]}}
+
+
+def make_event(i):
+    return {
+        "resource_id": f"order-{i * 7 % 20000}",
+        "customer_id": f"customer-{i * 13 % 5000}",
+        "status": "paid" if i % 2 else "new",
+        "total": i * 37 % 1000,
+        "region": f"region-{i % 1000}",
+    }
+
+
+def scan_matching(store, event):
+    """Match an event by checking every query subscription."""
+    return [
+        subscription
+        for subscription in store._subscriptions.values()
+        if subscription.type == SubscriptionType.QUERY
+        and subscription.is_active()
+        and subscription.matches_event(event)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_indexed_matching_throughput():
+    """Compare indexed matching with a full scan of query subscriptions."""
+    store = InMemorySubscriptionStore()
+    for i in range(SUBSCRIPTION_COUNT):
+        await store.save(create_query_subscription(f"user-{i}", make_query(i)))
+    events = [make_event(i) for i in range(EVENT_COUNT)]
+
+    start = time.perf_counter()
+    scanned = [scan_matching(store, event) for event in events]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [await store.get_matching_event(event) for event in events]
+    index_seconds = time.perf_counter() - start
+
+    assert [[s.id for s in matches] for matches in indexed] == [
+        [s.id for s in matches] for matches in scanned
+    ]
+    assert any(indexed)
+
+    scan_rate = EVENT_COUNT / scan_seconds
+    index_rate = EVENT_COUNT / index_seconds
+    print(
+        f"\nquery subscriptions ({SUBSCRIPTION_COUNT:,}): scan {scan_rate:,.0f} events/s, "
+        f"indexed {index_rate:,.0f} events/s ({index_rate / scan_rate:.1f}x)"
+    )
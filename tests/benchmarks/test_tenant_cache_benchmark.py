@@ -0,0 +1,43 @@
+"""
+Benchmark of tenant lookups through TenantCache against direct loads from a
+tenant store with a fixed latency.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from uno.core.multitenancy.cache import TenantCache, TenantInfo
+
+
+class FakeTenantStore:
+    """Tenant lookups with a fixed latency."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def load(self, tenant_id):
+        await asyncio.sleep(self.latency)
+        return TenantInfo(id=tenant_id, status="active")
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_cached_lookup_rate():
+    """Compare tenant lookups through the cache with direct loads."""
+    store = FakeTenantStore(latency=0.001)
+    cache = TenantCache()
+    lookups = 200
+
+    start = time.perf_counter()
+    for _ in range(lookups):
+        await store.load("acme")
+    direct = lookups / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(lookups):
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+    cached = lookups / (time.perf_counter() - start)
+
+    print(f"\ndirect: {direct:,.0f} lookups/s, cached: {cached:,.0f} lookups/s")
@@ -0,0 +1,145 @@
+"""
+Benchmark for compiled workflow condition evaluation.
+
+Compares evaluating a workflow's conditions event by event through the
+condition evaluators, which resolve the configuration on every call, with
+evaluating a compiled ConditionPlan over a batch of events.
+"""
+
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from uno.workflows.conditions import (
+    CompositeEvaluator,
+    FieldValueEvaluator,
+    TimeBasedEvaluator,
+    compile_conditions,
+    get_evaluator,
+    get_evaluator_registry,
+)
+from uno.workflows.engine import WorkflowEventModel
+from uno.workflows.models import WorkflowConditionType, WorkflowDBEvent
+
+
+EVENT_COUNT = 20000
+
+logger = logging.getLogger(__name__)
+
+
+def make_condition(condition_id, condition_type, config):
+    return SimpleNamespace(
+        id=condition_id,
+        workflow_id="wf",
+        condition_type=condition_type,
+        condition_config=config,
+        query_id=None,
+        name=condition_id,
+    )
+
+
+CONDITIONS = [
+    make_condition(
+        "total",
+        WorkflowConditionType.FIELD_VALUE,
+        {"field": "order.total", "operator": "gte", "value": 10},
+    ),
+    make_condition(
+        "window",
+        WorkflowConditionType.TIME_BASED,
+        {
+            "operator": "between",
+            "start_datetime": "2000-01-01T00:00:00Z",
+            "end_datetime": "2100-01-01T00:00:00Z",
+        },
+    ),
+    make_condition(
+        "composite",
+        "composite",
+        {
+            "operator": "or",
+            "conditions": [
+                {"config": {"field": "order.customer.tier", "value": "gold"}},
+                {"config": {"field": "order.region", "operator": "in", "value": ["eu", "us"]}},
+            ],
+        },
+    ),
+]
+
+
+@pytest.fixture
+def registered_evaluators():
+    registry = get_evaluator_registry()
+    saved = dict(registry.evaluators)
+    registry.evaluators.clear()
+    registry.register(WorkflowConditionType.FIELD_VALUE, FieldValueEvaluator(logger=logger))
+    registry.register(WorkflowConditionType.TIME_BASED, TimeBasedEvaluator(logger=logger))
+    registry.register("composite", CompositeEvaluator(registry.evaluators, logger=logger))
+    yield registry
+    registry.evaluators.clear()
+    registry.evaluators.update(saved)
+
+
+@pytest.fixture
+def events():
+    regions = ["eu", "us", "apac"]
+    tiers = ["gold", "silver"]
+    return [
+        WorkflowEventModel(
+            table_name="order",
+            schema_name="public",
+            operation=WorkflowDBEvent.INSERT,
+            timestamp=float(i),
+            payload={
+                "order": {
+                    "total": i % 50,
+                    "region": regions[i % 3],
+                    "customer": {"tier": tiers[i % 2]},
+                }
+            },
+        )
+        for i in range(EVENT_COUNT)
+    ]
+
+
+async def evaluate_interpreted(events):
+    """Evaluate conditions one event at a time through the evaluators."""
+    results = []
+    for event in events:
+        matched = True
+        for condition in CONDITIONS:
+            result = await get_evaluator(condition.condition_type).evaluate(
+                condition, event, {}
+            )
+            if result.is_failure or not result.value:
+                matched = False
+                break
+        results.append(matched)
+    return results
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_compiled_condition_throughput(registered_evaluators, events):
+    """Compare compiled batch evaluation with per-event interpretation."""
+    start = time.perf_counter()
+    interpreted = await evaluate_interpreted(events)
+    interpreted_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    plan = compile_conditions(CONDITIONS)
+    compiled = [result.value for result in await plan.evaluate_batch(events, {})]
+    compiled_seconds = time.perf_counter() - start
+
+    assert plan.is_compiled
+    assert compiled == interpreted
+
+    interpreted_rate = EVENT_COUNT / interpreted_seconds
+    compiled_rate = EVENT_COUNT / compiled_seconds
+    print(
+        f"\nworkflow conditions: interpreted {interpreted_rate:,.0f} events/s, "
+        f"compiled {compiled_rate:,.0f} events/s "
+        f"({compiled_rate / interpreted_rate:.1f}x)"
+    )
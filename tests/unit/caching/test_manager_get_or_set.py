@@ -0,0 +1,135 @@
+"""
+Tests for CacheManager.get_or_set_async: coalesced loading, stale serving
+and the Redis lock coordinating loads across processes.
+"""
+
+import asyncio
+
+import pytest
+
+from uno.caching.config import CacheConfig, MonitoringConfig, SingleFlightConfig
+from uno.caching.local.memory import MemoryCache
+from uno.caching.manager import CacheManager
+
+
+def make_manager(distributed_cache=None, **single_flight):
+    config = CacheConfig(
+        monitoring=MonitoringConfig(enabled=False),
+        single_flight=SingleFlightConfig(**single_flight),
+    )
+    manager = CacheManager(config)
+    manager.local_cache = MemoryCache(ttl=60)
+    manager.distributed_cache = distributed_cache
+    manager.initialized = True
+    return manager
+
+
+class TestGetOrSetAsync:
+    """Tests for in-process coalescing and stale serving."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        manager = make_manager()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"id": 7}
+
+        results = await asyncio.gather(*(manager.get_or_set_async("user:7", load) for _ in range(100)))
+
+        assert calls == 1
+        assert all(result == {"id": 7} for result in results)
+        assert await manager.get_or_set_async("user:7", load) == {"id": 7}
+        assert calls == 1
+
+        stats = manager.get_stats()["single_flight"]
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 99
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_value_while_refreshing(self):
+        manager = make_manager(stale_ttl=30, xfetch_beta=0)
+        version = 0
+
+        async def load():
+            nonlocal version
+            version += 1
+            return version
+
+        assert await manager.get_or_set_async("key", load, ttl=1) == 1
+
+        # Age the cached value past its freshness
+        entry = await manager.get_async("key")
+        entry["__uno_refresh__"][0] -= 2
+        await manager.set_async("key", entry, 30)
+
+        assert await manager.get_or_set_async("key", load, ttl=1) == 1
+        await asyncio.sleep(0.01)
+        assert await manager.get_or_set_async("key", load, ttl=1) == 2
+        assert manager.get_stats()["single_flight"]["stale_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_calls_getter(self):
+        manager = make_manager()
+        manager.config.enabled = False
+
+        async def load():
+            return "value"
+
+        assert await manager.get_or_set_async("key", load) == "value"
+
+
+class TestDistributedLock:
+    """Tests for coordinating loads across processes with a Redis lock."""
+
+    @pytest.fixture
+    def server(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeServer()
+
+    def redis_cache(self, server):
+        import fakeredis
+        from uno.caching.distributed.redis import RedisCache
+
+        cache = RedisCache(ttl=60, prefix="test:")
+        cache._client = fakeredis.FakeRedis(server=server)
+        cache._async_client = fakeredis.FakeAsyncRedis(server=server)
+        return cache
+
+    def test_lock_is_exclusive(self, server):
+        cache = self.redis_cache(server)
+
+        token = cache.acquire_lock("job", ttl=10)
+        assert token is not None
+        assert cache.acquire_lock("job", ttl=10) is None
+
+        # Only the holder's token releases the lock
+        assert not cache.release_lock("job", "other")
+        assert cache.release_lock("job", token)
+        assert cache.acquire_lock("job", ttl=10) is not None
+
+    @pytest.mark.asyncio
+    async def test_processes_load_once(self, server):
+        # Two managers sharing a Redis server stand in for two processes
+        managers = [
+            make_manager(self.redis_cache(server), distributed_lock=True, lock_wait=2)
+            for _ in range(2)
+        ]
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "report"
+
+        results = await asyncio.gather(
+            *(manager.get_or_set_async("report:1", load) for manager in managers for _ in range(10))
+        )
+
+        assert calls == 1
+        assert results == ["report"] * 20
+        assert sum(m.get_stats()["single_flight"]["lock_waits"] for m in managers) == 1
@@ -0,0 +1,80 @@
+"""
+Tests for tagging values through CacheManager and invalidating them by tag
+in both the local and the distributed cache.
+"""
+
+import pytest
+
+from uno.caching.config import CacheConfig, MonitoringConfig
+from uno.caching.local.memory import MemoryCache
+from uno.caching.manager import CacheManager
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_cache():
+    from uno.caching.distributed.redis import RedisCache
+
+    cache = RedisCache(ttl=60, prefix="test:")
+    server = fakeredis.FakeServer()
+    cache._client = fakeredis.FakeRedis(server=server)
+    cache._async_client = fakeredis.FakeAsyncRedis(server=server)
+    return cache
+
+
+@pytest.fixture
+def manager(redis_cache):
+    manager = CacheManager(CacheConfig(monitoring=MonitoringConfig(enabled=False)))
+    manager.local_cache = MemoryCache(ttl=60)
+    manager.distributed_cache = redis_cache
+    manager.initialized = True
+    return manager
+
+
+class TestCacheManagerTags:
+    """Tests for CacheManager.set with tags and invalidate_tags."""
+
+    def test_invalidate_tags_deletes_tagged_values(self, manager, redis_cache):
+        manager.set("user:1", {"id": 1}, tags=["users", "tenant:a"])
+        manager.set("user:2", {"id": 2}, tags=["users", "tenant:b"])
+        manager.set("settings", {"theme": "dark"})
+
+        # One key in each cache level
+        assert manager.invalidate_tags(["tenant:a"]) == 2
+
+        assert manager.get("user:1") is None
+        assert manager.get("user:2") == {"id": 2}
+        assert manager.get("settings") == {"theme": "dark"}
+
+        manager.invalidate_tags(["users"])
+
+        assert manager.get("user:2") is None
+        assert manager.local_cache.get_stats()["size"] == 1
+        assert manager.get("settings") == {"theme": "dark"}
+
+    def test_invalidated_values_are_not_refilled_from_the_distributed_cache(
+        self, manager
+    ):
+        manager.set("user:1", {"id": 1}, tags=["users"])
+
+        manager.invalidate_tags(["users"])
+        manager.local_cache.clear()
+
+        assert manager.get("user:1") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_async(self, manager):
+        await manager.set_async("user:1", {"id": 1}, tags=["users"])
+        await manager.set_async("order:1", {"id": 1}, tags=["orders"])
+
+        assert await manager.invalidate_tags_async(["users"]) == 2
+
+        assert await manager.get_async("user:1") is None
+        assert await manager.get_async("order:1") == {"id": 1}
+
+    def test_disabled_cache_invalidates_nothing(self, manager):
+        manager.set("user:1", {"id": 1}, tags=["users"])
+        manager.config.enabled = False
+
+        assert manager.invalidate_tags(["users"]) == 0
@@ -0,0 +1,136 @@
+"""
+Tests for the sharded MemoryCache and its pattern and tag invalidation.
+"""
+
+import pytest
+
+from uno.caching.local.memory import MemoryCache
+
+
+@pytest.fixture
+def cache():
+    return MemoryCache(max_size=1000, ttl=60, shards=4)
+
+
+class TestMemoryCache:
+    """Tests for basic MemoryCache operations."""
+
+    def test_get_set_delete(self, cache):
+        assert cache.set("user:1", {"name": "a"})
+        assert cache.get("user:1") == {"name": "a"}
+        assert cache.delete("user:1")
+        assert cache.get("user:1") is None
+        assert not cache.delete("user:1")
+
+    def test_expired_values_are_misses(self, cache):
+        cache.set("short", 1, ttl=-1)
+
+        assert cache.get("short") is None
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["size"] == 0
+
+    def test_multi_get_and_multi_set(self, cache):
+        cache.multi_set({f"k{i}": i for i in range(20)})
+
+        assert cache.multi_get(["k1", "k5", "missing"]) == {"k1": 1, "k5": 5}
+        cache.multi_delete(["k1", "k5"])
+        assert cache.multi_get(["k1", "k5", "k6"]) == {"k6": 6}
+
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_size=3, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")
+        cache.set("d", 4)
+
+        assert cache.get("b") is None
+        assert cache.multi_get(["a", "c", "d"]) == {"a": 1, "c": 3, "d": 4}
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_size_is_bounded_across_shards(self):
+        cache = MemoryCache(max_size=100, ttl=60, shards=4)
+        for i in range(1000):
+            cache.set(f"key:{i}", i)
+
+        assert cache.get_stats()["size"] <= 100
+
+    def test_touch(self, cache):
+        cache.set("k", 1, ttl=-1)
+        assert cache.touch("k", 60)
+        assert cache.get("k") == 1
+        assert not cache.touch("missing", 60)
+
+
+class TestPatternInvalidation:
+    """Tests for prefix-indexed pattern invalidation."""
+
+    def test_prefix_pattern(self, cache):
+        for i in range(10):
+            cache.set(f"user:123:item:{i}", i)
+            cache.set(f"user:124:item:{i}", i)
+        cache.set("user:123", "profile")
+
+        assert cache.invalidate_pattern("user:123:*") == 10
+        assert cache.get("user:123") == "profile"
+        assert cache.get("user:124:item:0") == 0
+        assert cache.get_stats()["size"] == 11
+
+    def test_partial_segment_prefix(self, cache):
+        cache.set("user:12", 1)
+        cache.set("user:123:a", 2)
+        cache.set("user:2:a", 3)
+
+        assert cache.invalidate_pattern("user:12*") == 2
+        assert cache.get("user:2:a") == 3
+
+    def test_wildcards_after_prefix(self, cache):
+        cache.set("order:1:status", 1)
+        cache.set("order:1:total", 2)
+        cache.set("order:2:status", 3)
+
+        assert cache.invalidate_pattern("order:*:status") == 2
+        assert cache.get("order:1:total") == 2
+
+    def test_leading_wildcard_scans_all_keys(self, cache):
+        cache.set("a:x", 1)
+        cache.set("b:x", 2)
+        cache.set("b:y", 3)
+
+        assert cache.invalidate_pattern("*:x") == 2
+        assert cache.get("b:y") == 3
+
+    def test_exact_key(self, cache):
+        cache.set("exact", 1)
+
+        assert cache.invalidate_pattern("exact") == 1
+        assert cache.invalidate_pattern("exact") == 0
+
+    def test_deleted_keys_leave_the_index(self, cache):
+        cache.set("user:1:a", 1)
+        cache.delete("user:1:a")
+        cache.set("user:1:b", 2)
+
+        assert cache.invalidate_pattern("user:1:*") == 1
+
+
+class TestTagInvalidation:
+    """Tests for tag-indexed invalidation."""
+
+    def test_invalidate_tags(self, cache):
+        cache.set("product:1", 1, tags=["catalog", "product:1"])
+        cache.set("product:2", 2, tags=["catalog"])
+        cache.multi_set({"cart:1": 1, "cart:2": 2}, tags=["carts"])
+
+        assert cache.invalidate_tags(["product:1"]) == 1
+        assert cache.invalidate_tags(["catalog", "carts"]) == 3
+        assert cache.get_stats()["size"] == 0
+        assert cache.get_stats()["tags"] == 0
+
+    def test_overwrite_replaces_tags(self, cache):
+        cache.set("k", 1, tags=["old"])
+        cache.set("k", 2, tags=["new"])
+
+        assert cache.invalidate_tags(["old"]) == 0
+        assert cache.invalidate_tags(["new"]) == 1
@@ -0,0 +1,81 @@
+"""
+Tests for RedisCache tag invalidation and pattern invalidation, run against
+an in-process fake Redis server.
+"""
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from uno.caching.distributed.redis import RedisCache
+
+
+@pytest.fixture
+def cache():
+    cache = RedisCache(ttl=60, prefix="test:")
+    server = fakeredis.FakeServer()
+    cache._client = fakeredis.FakeRedis(server=server)
+    cache._async_client = fakeredis.FakeAsyncRedis(server=server)
+    return cache
+
+
+class TestTagInvalidation:
+    """Tests for tag-set based invalidation."""
+
+    def test_invalidate_tags(self, cache):
+        cache.set("product:1", 1, tags=["catalog", "product:1"])
+        cache.set("product:2", 2, tags=["catalog"])
+        cache.set("untagged", 3)
+        cache.multi_set({"cart:1": 1, "cart:2": 2}, tags=["carts"])
+
+        assert cache.invalidate_tags(["product:1"]) == 1
+        assert cache.invalidate_tags(["catalog", "carts"]) == 3
+        assert cache.multi_get(["product:1", "product:2", "cart:1", "untagged"]) == {"untagged": 3}
+
+        # Tag sets are deleted with their members
+        assert cache._client.keys("test:tag:*") == []
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_async(self, cache):
+        await cache.set_async("order:1", "a", tags=["orders"])
+        await cache.multi_set_async({"order:2": "b", "order:3": "c"}, tags=["orders"])
+
+        assert await cache.invalidate_tags_async(["orders", "missing"]) == 3
+        assert await cache.get_async("order:2") is None
+
+    def test_expired_members_are_not_counted(self, cache):
+        cache.set("a", 1, tags=["t"])
+        cache.set("b", 2, tags=["t"])
+        cache._client.delete("test:a")
+
+        assert cache.invalidate_tags(["t"]) == 1
+
+    def test_tag_set_ttl_covers_longest_member(self, cache):
+        cache.set("long", 1, ttl=600, tags=["t"])
+        cache.set("short", 2, ttl=10, tags=["t"])
+
+        assert cache._client.ttl("test:tag:t") == 600
+
+
+class TestPatternInvalidation:
+    """Tests for SCAN based pattern invalidation."""
+
+    def test_invalidate_pattern(self, cache):
+        cache.multi_set({"user:1:a": 1, "user:1:b": 2, "user:2:a": 3})
+
+        assert cache.invalidate_pattern("user:1:*") == 2
+        assert cache.get("user:2:a") == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_async(self, cache):
+        await cache.multi_set_async({"user:1:a": 1, "user:1:b": 2, "user:2:a": 3})
+
+        assert await cache.invalidate_pattern_async("user:1:*") == 2
+        assert await cache.get_async("user:2:a") == 3
+
+    @pytest.mark.asyncio
+    async def test_clear_async(self, cache):
+        await cache.multi_set_async({"a": 1, "b": 2})
+
+        assert await cache.clear_async()
+        assert await cache.multi_get_async(["a", "b"]) == {}
@@ -0,0 +1,128 @@
+"""
+Tests for the cache serialization codecs, per-entry codec metadata and
+compression.
+"""
+
+import pickle
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from uno.caching.local.file import FileCache
+from uno.caching.serialization import (
+    MAGIC,
+    SerializationError,
+    Serializer,
+    available_codecs,
+    available_compressors,
+)
+
+
+def query_result(rows: int = 500, seed: int = 1):
+    """Build a payload shaped like a cached query result."""
+    rng = random.Random(seed)
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    statuses = ["pending", "paid", "shipped", "cancelled"]
+    return {
+        "total": rows,
+        "page": 1,
+        "items": [
+            {
+                "id": f"01HX{i:022d}",
+                "customer_id": rng.randrange(10_000),
+                "status": rng.choice(statuses),
+                "total": round(rng.uniform(5, 500), 2),
+                "currency": "USD",
+                "created_at": (created + timedelta(minutes=i)).isoformat(),
+                "shipping_address": {
+                    "street": f"{rng.randrange(1, 9999)} Main St",
+                    "city": "Springfield",
+                    "postal_code": f"{rng.randrange(10_000, 99_999)}",
+                },
+                "tags": rng.sample(["gift", "express", "bulk", "promo", "vip"], 2),
+                "notes": None,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+class TestSerializer:
+    """Tests for Serializer."""
+
+    @pytest.mark.parametrize("codec", available_codecs())
+    def test_round_trip(self, codec):
+        serializer = Serializer(codec)
+        payload = query_result(20)
+
+        data = serializer.dumps(payload)
+
+        assert data[0] == MAGIC
+        assert serializer.loads(data) == payload
+
+    @pytest.mark.parametrize(
+        "codec, compression",
+        [(codec, None) for codec in available_codecs()]
+        + [("msgpack", compression) for compression in available_compressors()
+           if "msgpack" in available_codecs()],
+    )
+    def test_query_result_round_trip(self, codec, compression):
+        serializer = Serializer(codec, compression)
+        payload = query_result(500)
+
+        assert serializer.loads(serializer.dumps(payload)) == payload
+
+    @pytest.mark.parametrize("compression", available_compressors())
+    def test_compression_above_threshold(self, compression):
+        serializer = Serializer("pickle", compression, compression_threshold=1024)
+        large = query_result(200)
+
+        small_data = serializer.dumps({"a": 1})
+        large_data = serializer.dumps(large)
+
+        assert small_data[2] == 0
+        assert large_data[2] != 0
+        assert len(large_data) < len(pickle.dumps(large, protocol=5))
+        assert serializer.loads(large_data) == large
+
+    def test_entries_record_their_codec(self):
+        payload = query_result(5)
+        data = Serializer("json").dumps(payload)
+
+        # A serializer configured with another codec still reads the entry
+        assert Serializer("pickle").loads(data) == payload
+
+    def test_reads_entries_without_header(self):
+        assert Serializer("pickle").loads(pickle.dumps({"a": 1})) == {"a": 1}
+        assert Serializer("json").loads(b'{"a": 1}') == {"a": 1}
+
+    def test_pickle_out_of_band_buffers(self):
+        payload = {"blob": bytearray(b"x" * 100_000), "n": 1}
+        serializer = Serializer("pickle")
+
+        assert serializer.loads(serializer.dumps(payload)) == payload
+
+    def test_unsupported_codec(self):
+        with pytest.raises(ValueError):
+            Serializer("yaml")
+
+    def test_unencodable_value(self):
+        with pytest.raises(SerializationError):
+            Serializer("json").dumps({"when": object()})
+
+    def test_corrupt_entry(self):
+        with pytest.raises(SerializationError):
+            Serializer("pickle").loads(bytes([MAGIC, 1, 0]) + b"garbage")
+
+
+class TestFileCacheCodecs:
+    """Tests for FileCache using the codec registry."""
+
+    @pytest.mark.parametrize("codec", available_codecs())
+    def test_get_set(self, tmp_path, codec):
+        cache = FileCache(directory=str(tmp_path), serializer=codec, shards=2)
+        payload = query_result(10)
+
+        assert cache.set("orders:page:1", payload)
+        assert cache.get("orders:page:1") == payload
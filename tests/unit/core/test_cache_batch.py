@@ -0,0 +1,51 @@
+"""
+Tests for reading and writing many entries at once in the core caches.
+"""
+
+import pytest
+
+from uno.core.caching import Cache, QueryCache
+
+
+class TestCacheBatch:
+    """Tests for Cache.get_many and Cache.set_many."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_found_keys(self):
+        cache = Cache(name="test_batch")
+        await cache.set_many({"a": 1, "b": False})
+        await cache.set("expired", 3, ttl=-1)
+
+        assert await cache.get_many(["a", "b", "expired", "missing"]) == {"a": 1, "b": False}
+
+        stats = await cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_many_evicts_to_max_size(self):
+        cache = Cache(name="test_batch_eviction", max_size=2)
+
+        await cache.set_many({"a": 1, "b": 2, "c": 3})
+
+        assert len(await cache.get_many(["a", "b", "c"])) == 2
+
+
+class TestQueryCacheBatch:
+    """Tests for QueryCache.get_many and QueryCache.set_many."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_tags_each_key(self):
+        cache = QueryCache(name="test_query_batch")
+
+        await cache.set_many(
+            {"q:r1": True, "q:r2": False},
+            tags={"q:r1": ["query:q", "record:r1"], "q:r2": ["query:q", "record:r2"]},
+        )
+
+        assert await cache.get_many(["q:r1", "q:r2", "q:r3"]) == {"q:r1": True, "q:r2": False}
+        assert await cache.get_keys_for_tag("query:q") == {"q:r1", "q:r2"}
+
+        await cache.invalidate(tag="record:r1")
+
+        assert await cache.get_many(["q:r1", "q:r2"]) == {"q:r2": False}
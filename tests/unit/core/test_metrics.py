@@ -0,0 +1,146 @@
+"""
+Tests for the lock-free counter and sketch-based histogram metrics.
+"""
+
+import math
+import random
+
+import pytest
+
+from uno.core.monitoring.metrics import (
+    Counter,
+    Histogram,
+    HistogramSnapshot,
+    MetricsRegistry,
+    PrometheusExporter,
+    Timer,
+)
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestCounter:
+    """Tests for Counter."""
+
+    @pytest.mark.asyncio
+    async def test_inc_and_increment(self):
+        counter = Counter("requests")
+        counter.inc()
+        counter.inc(4)
+        await counter.increment(5)
+
+        assert counter.get_value().value == 10
+
+    def test_negative_increment_raises(self):
+        with pytest.raises(ValueError):
+            Counter("requests").inc(-1)
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1.5) for _ in range(50_000)]
+        histogram = Histogram("latency", relative_accuracy=0.01)
+        for value in values:
+            histogram.add(value)
+
+        snapshot = histogram.snapshot()
+        for name, q in (("p50", 0.5), ("p99", 0.99), ("p999", 0.999)):
+            expected = exact_quantile(values, q)
+            assert abs(snapshot.quantiles[name] - expected) <= 0.011 * expected
+
+        assert snapshot.count == len(values)
+        assert snapshot.min == min(values)
+        assert snapshot.max == max(values)
+        assert math.isclose(snapshot.sum, sum(values))
+
+    def test_memory_is_bounded(self):
+        histogram = Histogram("latency", max_size=64)
+        for exponent in range(-6, 12):
+            for step in range(100):
+                histogram.add(10 ** exponent * (1 + step / 100))
+
+        assert len(histogram._positive) <= 64
+        # The highest quantiles keep their accuracy when low buckets collapse
+        assert abs(histogram.quantile(1.0) - 1.99e11) <= 0.011 * 1.99e11
+
+    def test_zero_and_negative_values(self):
+        histogram = Histogram("delta")
+        for value in (-10, -1, 0, 0, 1, 10):
+            histogram.add(value)
+
+        assert histogram.quantile(0) == -10
+        assert histogram.quantile(0.5) == 0
+        assert histogram.quantile(1) == 10
+
+    @pytest.mark.asyncio
+    async def test_statistics(self):
+        histogram = Histogram("latency")
+        for value in range(1, 101):
+            await histogram.observe(value)
+
+        stats = await histogram.get_statistics()
+        assert stats["count"] == 100
+        assert stats["min"] == 1
+        assert stats["max"] == 100
+        assert stats["mean"] == 50.5
+        assert abs(stats["median"] - 50) <= 1
+        assert abs(stats["p99"] - 99) <= 1
+
+    @pytest.mark.asyncio
+    async def test_empty_statistics(self):
+        stats = await Histogram("latency").get_statistics()
+
+        assert stats["count"] == 0
+        assert stats["p999"] == 0.0
+
+    def test_cumulative_buckets(self):
+        histogram = Histogram("size", buckets=[10, 100])
+        for value in (1, 5, 50, 500):
+            histogram.add(value)
+
+        snapshot = histogram.get_value().value
+        assert isinstance(snapshot, HistogramSnapshot)
+        assert snapshot.buckets == [(10, 2), (100, 3), (math.inf, 4)]
+
+
+class TestTimer:
+    """Tests for Timer."""
+
+    @pytest.mark.asyncio
+    async def test_time_records_synchronously(self):
+        timer = Timer("work")
+        with timer.time():
+            pass
+        await timer.record(10)
+
+        stats = await timer.get_statistics()
+        assert stats["count"] == 2
+        assert timer.get_value().value == pytest.approx(stats["mean"])
+
+
+class TestPrometheusExport:
+    """Tests for exporting histograms in Prometheus format."""
+
+    @pytest.mark.asyncio
+    async def test_histogram_buckets(self):
+        registry = MetricsRegistry()
+        histogram = await registry.get_or_create_histogram(
+            "request_size", tags={"route": "/items"}
+        )
+        for value in (1, 30, 300):
+            histogram.add(value)
+
+        text = PrometheusExporter(namespace="uno").format_metrics(
+            [histogram.get_value()]
+        )
+
+        assert 'uno_request_size_bucket{le="25",route="/items"} 1' in text
+        assert 'uno_request_size_bucket{le="+Inf",route="/items"} 3' in text
+        assert 'uno_request_size_count{route="/items"} 3' in text
+        assert 'uno_request_size_sum{route="/items"} 331.0' in text
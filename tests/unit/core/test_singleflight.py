@@ -0,0 +1,176 @@
+"""
+Tests for request coalescing, XFetch early refresh and stale serving in the
+core caches.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from uno.core.caching import Cache, QueryCache
+from uno.core.singleflight import SingleFlight, xfetch_due
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        results = await asyncio.gather(*(group.do("key", load) for _ in range(100)))
+
+        assert results == [1] * 100
+        stats = group.get_stats()
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 99
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        group = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("database unavailable")
+
+        results = await asyncio.gather(*(group.do("key", load) for _ in range(3)),
+                                       return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert group.get_stats()["errors"] == 1
+        assert not group.in_flight("key")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_execution(self):
+        group = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.ensure_future(group.do("key", load))
+        second = asyncio.ensure_future(group.do("key", load))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "value"
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_running_key(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "value"
+
+        assert group.refresh("key", load)
+        await asyncio.sleep(0)
+        assert not group.refresh("key", load)
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert group.get_stats()["background_refreshes"] == 1
+
+
+class TestXFetch:
+    """Tests for the XFetch early refresh decision."""
+
+    def test_never_due_without_expiry_or_compute_time(self):
+        assert not xfetch_due(None, 1.0)
+        assert not xfetch_due(time.time() + 1, 0.0)
+        assert not xfetch_due(time.time() + 1, 1.0, beta=0)
+
+    def test_due_after_expiry(self):
+        now = time.time()
+        assert xfetch_due(now - 1, 0.1, now=now)
+
+    def test_refreshes_become_likelier_near_expiry(self):
+        now = time.time()
+        far = sum(xfetch_due(now + 10, 0.5, now=now) for _ in range(1000))
+        near = sum(xfetch_due(now + 0.1, 0.5, now=now) for _ in range(1000))
+
+        assert far < near
+
+
+class TestCacheGetOrSet:
+    """Tests for Cache.get_or_set."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        cache = Cache(name="test", ttl=60)
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"id": 1}
+
+        results = await asyncio.gather(*(cache.get_or_set("user:1", load) for _ in range(100)))
+
+        assert calls == 1
+        assert all(result == {"id": 1} for result in results)
+        assert (await cache.get_stats())["single_flight"]["coalesced"] == 99
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_value_while_refreshing(self):
+        cache = Cache(name="test", ttl=0.05, stale_ttl=10, xfetch_beta=0)
+        version = 0
+
+        async def load():
+            nonlocal version
+            version += 1
+            return version
+
+        assert await cache.get_or_set("key", load) == 1
+        await asyncio.sleep(0.1)
+
+        # The expired value is returned and reloaded in the background
+        assert await cache.get_or_set("key", load) == 1
+        await asyncio.sleep(0.01)
+        assert await cache.get_or_set("key", load) == 2
+
+        stats = await cache.get_stats()
+        assert stats["stale_hits"] == 1
+        assert await cache.get("key") == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_value_is_not_returned_by_get(self):
+        cache = Cache(name="test", ttl=0.05, stale_ttl=10)
+        await cache.set("key", "value")
+        await asyncio.sleep(0.1)
+
+        assert await cache.get("key") is None
+
+
+class TestQueryCacheGetOrSet:
+    """Tests for QueryCache.get_or_set."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        cache = QueryCache(name="queries", ttl=60)
+        calls = 0
+
+        async def query():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return [1, 2, 3]
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("orders", query, tags=["orders"]) for _ in range(20))
+        )
+
+        assert calls == 1
+        assert results == [[1, 2, 3]] * 20
+        assert await cache.get("orders") == [1, 2, 3]
@@ -0,0 +1,267 @@
+"""
+Tests for the tenant metadata and configuration cache and its use by the
+tenant identification middleware.
+"""
+
+import asyncio
+
+import pytest
+
+from uno.core.errors.base import ErrorCode, UnoError
+from uno.core.errors.result import Failure, Success
+from uno.core.events import DefaultEventBus
+from uno.core.multitenancy.cache import TenantCache, TenantInfo
+from uno.core.multitenancy.domain_services import TenantService
+from uno.core.multitenancy.entities import Tenant
+from uno.core.multitenancy.middleware import TenantIdentificationMiddleware
+from uno.core.multitenancy.events import TenantStatusChanged, TenantUpdated
+
+
+class FakeTenantStore:
+    """Tenant lookups with a fixed latency, counting the calls."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+        self.tenants = {
+            "acme": TenantInfo(id="acme", status="active", slug="acme"),
+            "globex": TenantInfo(id="globex", status="suspended", slug="globex"),
+        }
+
+    async def load(self, tenant_id):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.tenants.get(tenant_id)
+
+
+class TestTenantCache:
+    """Tests for TenantCache."""
+
+    @pytest.mark.asyncio
+    async def test_hits_skip_the_loader(self):
+        store = FakeTenantStore()
+        cache = TenantCache()
+
+        for _ in range(10):
+            tenant = await cache.get_tenant("acme", lambda: store.load("acme"))
+
+        assert tenant.is_active
+        assert store.calls == 1
+        assert cache.get_stats()["hits"] == 9
+
+    @pytest.mark.asyncio
+    async def test_unknown_tenants_are_cached_briefly(self):
+        store = FakeTenantStore()
+        cache = TenantCache(negative_ttl=0.05)
+
+        assert await cache.get_tenant("nope", lambda: store.load("nope")) is None
+        assert await cache.get_tenant("nope", lambda: store.load("nope")) is None
+        assert store.calls == 1
+        assert cache.get_stats()["negative_hits"] == 1
+
+        await asyncio.sleep(0.06)
+        await cache.get_tenant("nope", lambda: store.load("nope"))
+        assert store.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        store = FakeTenantStore()
+        cache = TenantCache(ttl=0.05)
+
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+        await asyncio.sleep(0.06)
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+
+        assert store.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_are_evicted(self):
+        store = FakeTenantStore()
+        cache = TenantCache(max_size=2)
+
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+        await cache.get_tenant("globex", lambda: store.load("globex"))
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+        await cache.get_tenant("initech", lambda: store.load("initech"))
+
+        assert cache.get_stats()["size"] == 2
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+        assert store.calls == 3
+        await cache.get_tenant("globex", lambda: store.load("globex"))
+        assert store.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        store = FakeTenantStore(latency=0.02)
+        cache = TenantCache()
+
+        tenants = await asyncio.gather(
+            *(cache.get_tenant("acme", lambda: store.load("acme")) for _ in range(50))
+        )
+
+        assert all(tenant.id == "acme" for tenant in tenants)
+        assert store.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_loads_started_before_invalidation_are_not_cached(self):
+        store = FakeTenantStore(latency=0.02)
+        cache = TenantCache()
+
+        load = asyncio.ensure_future(cache.get_tenant("acme", lambda: store.load("acme")))
+        await asyncio.sleep(0.005)
+        cache.invalidate("acme")
+        await load
+
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+        assert store.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_status_change_events_invalidate(self):
+        store = FakeTenantStore()
+        cache = TenantCache()
+        event_bus = DefaultEventBus()
+        cache.subscribe(event_bus)
+
+        await cache.get_tenant("acme", lambda: store.load("acme"))
+        await cache.get_config("acme", lambda: asyncio.sleep(0, {"theme": "dark"}))
+
+        store.tenants["acme"] = TenantInfo(id="acme", status="suspended")
+        await event_bus.publish(
+            TenantStatusChanged(tenant_id="acme", status="suspended", previous_status="active")
+        )
+
+        tenant = await cache.get_tenant("acme", lambda: store.load("acme"))
+        assert not tenant.is_active
+        assert cache.get_stats()["size"] == 1
+
+        await event_bus.publish(TenantUpdated(tenant_id="acme"))
+        assert cache.get_stats()["size"] == 0
+        assert cache.get_stats()["invalidations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_by_kind(self):
+        cache = TenantCache()
+
+        await cache.get_tenant("acme", lambda: FakeTenantStore().load("acme"))
+        await cache.get_config("acme", lambda: asyncio.sleep(0, {}))
+        cache.clear(TenantCache.CONFIG)
+
+        assert cache.get_stats()["size"] == 1
+
+
+class TestTenantInfo:
+    """Tests for TenantInfo."""
+
+    def test_from_tenant_unwraps_value_objects(self):
+        class Value:
+            def __init__(self, value):
+                self.value = value
+
+        class Tenant:
+            id = Value("ten_1")
+            status = Value("active")
+            slug = Value("acme")
+            domain = "acme.example.com"
+            tier = "premium"
+
+        info = TenantInfo.from_tenant(Tenant())
+
+        assert info == TenantInfo(
+            id="ten_1", status="active", slug="acme", domain="acme.example.com", tier="premium"
+        )
+        assert info.is_active
+
+
+class FakeTenantService:
+    """Tenant service returning Results, failing transiently on demand."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = []
+
+    async def get_tenant(self, tenant_id):
+        self.calls += 1
+        if self.failures:
+            return Failure(self.failures.pop())
+        if tenant_id == "acme":
+            return Success(TenantInfo(id="acme", status="active"))
+        return Failure(UnoError("Tenant not found", ErrorCode.RESOURCE_NOT_FOUND))
+
+
+class FakeTenantRepository:
+    """Tenant repository holding a single tenant, counting reads."""
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+        self.reads = 0
+
+    async def get_by_id(self, tenant_id):
+        self.reads += 1
+        return Success(self.tenant if str(self.tenant.id.value) == tenant_id else None)
+
+    async def update(self, tenant):
+        self.tenant = tenant
+        return Success(tenant)
+
+
+class TestTenantMiddlewareLookups:
+    """Tests for tenant lookups made by TenantIdentificationMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_load_once(self):
+        service = FakeTenantService()
+        middleware = TenantIdentificationMiddleware(None, service)
+
+        for _ in range(200):
+            assert await middleware._validate_tenant("acme") == "acme"
+
+        assert service.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_tenants_are_cached(self):
+        service = FakeTenantService()
+        middleware = TenantIdentificationMiddleware(None, service)
+
+        assert await middleware._validate_tenant("nope") is None
+        assert await middleware._validate_tenant("nope") is None
+
+        assert service.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_not_cached(self):
+        service = FakeTenantService()
+        service.failures.append(ConnectionError("database unavailable"))
+        middleware = TenantIdentificationMiddleware(None, service)
+
+        assert await middleware._validate_tenant("acme") is None
+        assert await middleware._validate_tenant("acme") == "acme"
+
+        assert service.calls == 2
+        assert middleware.tenant_cache.get_stats()["negative_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_status_changes_evict_the_cached_tenant(self):
+        tenant = Tenant.create(name="Acme", slug="acme")
+        tenant_id = str(tenant.id.value)
+        repository = FakeTenantRepository(tenant)
+        event_bus = DefaultEventBus()
+        published = []
+
+        async def record(event):
+            published.append(event)
+
+        event_bus.subscribe(TenantStatusChanged, record)
+        service = TenantService(tenant_repository=repository, event_bus=event_bus)
+        cache = TenantCache()
+        cache.subscribe(event_bus)
+        middleware = TenantIdentificationMiddleware(None, service, tenant_cache=cache)
+
+        assert await middleware._validate_tenant(tenant_id) == tenant_id
+        result = await service.suspend_tenant(tenant_id)
+
+        assert result.is_success
+        assert [event.status for event in published] == ["suspended"]
+        assert cache.get_stats()["size"] == 0
+        assert await middleware._validate_tenant(tenant_id) is None
+        assert repository.reads == 2
@@ -2,6 +2,7 @@
 Unit tests for the domain event store implementations.
 """
 
+import asyncio
 import pytest
 import uuid
 import json
@@ -11,12 +12,17 @@ from unittest.mock import AsyncMock, MagicMock, patch, Mock
 
 from sqlalchemy import Table, MetaData
 
+from uno.core.errors.base import ConcurrencyError
+
 from uno.domain.core import DomainEvent, Entity, AggregateRoot
 from uno.domain.event_store import (
     EventStore,
     PostgresEventStore, 
     EventSourcedRepository,
+    AggregateSnapshot,
+    SnapshotStore,
 )
+from uno.domain import models
 
 
 class TestEvent(DomainEvent):
@@ -114,8 +120,8 @@ class TestPostgresEventStore:
         # Create event store with explicit schema
         store = PostgresEventStore(TestEvent, schema="public")
 
-        # Save event
-        await store.save_event(test_event)
+        # Save an event outside any aggregate stream
+        await store.save_event(test_event.model_copy(update={"aggregate_id": None}))
 
         # Check that the session was used correctly
         session.execute.assert_called_once()
@@ -129,15 +135,24 @@ class TestPostgresEventStore:
         insert_stmt = call_args.args[0]
         assert "INSERT INTO" in str(insert_stmt).upper()
         assert "domain_events" in str(insert_stmt).lower()
+        assert insert_stmt.compile().params["version"] is None
 
     @pytest.mark.asyncio
-    async def test_save_event_with_metadata(
-        self, test_event, mock_session_factory, mock_session
-    ):
-        """Test saving an event with metadata."""
-        # Configure mock session
-        session = mock_session.__aenter__.return_value
+    async def test_save_event_appends_to_stream(self, test_event, stream_session):
+        """Test saving an aggregate's event numbers it with the next stream version."""
+        store = PostgresEventStore(TestEvent, schema="public")
+
+        await store.save_event(test_event)
 
+        session = stream_session[0]
+        session.commit.assert_called_once()
+        rows = inserted_rows(session)
+        assert [row["version"] for row in rows] == [3]
+        assert rows[0]["aggregate_id"] == "aggregate-123"
+
+    @pytest.mark.asyncio
+    async def test_save_event_with_metadata(self, test_event, stream_session):
+        """Test saving an event with metadata."""
         # Create event store with explicit schema
         store = PostgresEventStore(TestEvent, schema="public")
 
@@ -149,17 +164,15 @@ class TestPostgresEventStore:
         )
 
         # Check that the session was used correctly
-        session.execute.assert_called_once()
+        session = stream_session[0]
         session.commit.assert_called_once()
 
-        # Verify the insert statement
-        call_args = session.execute.call_args
-        assert call_args is not None
-
-        # Insert statement contains correct values
-        insert_stmt = call_args.args[0]
-        assert "INSERT INTO" in str(insert_stmt).upper()
-        assert "domain_events" in str(insert_stmt).lower()
+        # The event is appended to the given aggregate's stream
+        rows = inserted_rows(session)
+        assert len(rows) == 1
+        assert rows[0]["aggregate_id"] == "custom-aggregate-id"
+        assert rows[0]["metadata"] == {"user_id": "user-123", "ip": "127.0.0.1"}
+        assert rows[0]["version"] == 3
 
     @pytest.mark.asyncio
     async def test_get_events_by_aggregate_id(self, mock_session_factory, mock_session):
@@ -309,6 +322,342 @@ class TestPostgresEventStore:
         assert events[0].timestamp > since
 
 
+@pytest.fixture
+def stream_session():
+    """Create mock sessions for appends to a stream at version 2."""
+    sessions = []
+
+    def create_session():
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one.return_value = 2
+        session.execute.return_value = result
+        savepoint = AsyncMock()
+        savepoint.__aexit__.return_value = None
+        session.begin_nested = MagicMock(return_value=savepoint)
+        # The raw connection does not support COPY
+        connection = MagicMock()
+        connection.get_raw_connection = AsyncMock(return_value=MagicMock(spec=[]))
+        session.connection.return_value = connection
+
+        session_context = AsyncMock()
+        session_context.__aenter__.return_value = session
+        session_context.__aexit__.return_value = None
+        sessions.append(session)
+        return session_context
+
+    with patch("uno.domain.event_store.async_session", side_effect=create_session):
+        yield sessions
+
+
+@pytest.fixture
+def advisory_locks():
+    """Create mock sessions sharing Postgres transaction-level advisory locks."""
+    locks: Dict[str, asyncio.Lock] = {}
+
+    def create_session():
+        held = set()
+
+        async def acquire(key):
+            if key not in held:
+                await locks.setdefault(key, asyncio.Lock()).acquire()
+                held.add(key)
+
+        async def execute(statement, params=None):
+            # Let concurrent transactions interleave between statements
+            await asyncio.sleep(0)
+            sql = str(statement)
+            if "pg_advisory_xact_lock" in sql:
+                await acquire(params["key"])
+            result = MagicMock()
+            result.scalar_one.return_value = 0
+            return result
+
+        async def end_transaction(*args):
+            for key in held:
+                locks[key].release()
+            held.clear()
+
+        session = AsyncMock()
+        session.execute.side_effect = execute
+        savepoint = AsyncMock()
+        savepoint.__aexit__.return_value = None
+        session.begin_nested = MagicMock(return_value=savepoint)
+
+        session_context = AsyncMock()
+        session_context.__aenter__.return_value = session
+        session_context.__aexit__.side_effect = end_transaction
+        return session_context
+
+    with patch("uno.domain.event_store.async_session", side_effect=create_session):
+        yield locks
+
+
+def inserted_rows(session):
+    """Get the rows inserted with a mock session."""
+    rows = []
+    for call in session.execute.call_args_list:
+        statement = call.args[0]
+        if "INSERT INTO" in str(statement).upper():
+            rows.extend(dict(row) for row in statement._multi_values[0])
+    return rows
+
+
+class TestPostgresEventStoreAppend:
+    """Test appending event streams to the PostgreSQL event store."""
+
+    def make_events(self, count):
+        return [
+            TestEvent(
+                event_type="test_increment",
+                aggregate_id="aggregate-123",
+                data={"value": i},
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_append_events_in_one_transaction(self, stream_session):
+        store = PostgresEventStore(TestEvent, schema="public")
+
+        version = await store.append_events(
+            "aggregate-123", self.make_events(5), expected_version=2
+        )
+
+        assert version == 7
+        assert len(stream_session) == 1
+        session = stream_session[0]
+        session.commit.assert_called_once()
+
+        rows = inserted_rows(session)
+        assert [row["version"] for row in rows] == [3, 4, 5, 6, 7]
+        assert [row["data"]["version"] for row in rows] == [3, 4, 5, 6, 7]
+        assert all(row["aggregate_id"] == "aggregate-123" for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_append_events_checks_expected_version(self, stream_session):
+        store = PostgresEventStore(TestEvent, schema="public")
+
+        with pytest.raises(ConcurrencyError):
+            await store.append_events(
+                "aggregate-123", self.make_events(2), expected_version=1
+            )
+
+        session = stream_session[0]
+        session.commit.assert_not_called()
+        assert inserted_rows(session) == []
+
+    @pytest.mark.asyncio
+    async def test_large_appends_are_chunked(self, stream_session):
+        store = PostgresEventStore(TestEvent, schema="public", copy_threshold=10)
+
+        version = await store.append_events("aggregate-123", self.make_events(25))
+
+        assert version == 27
+        # COPY is unavailable on the mock, so the rows are inserted in chunks
+        assert len(inserted_rows(stream_session[0])) == 25
+
+    @pytest.mark.asyncio
+    async def test_group_commit_coalesces_concurrent_appends(self, stream_session):
+        store = PostgresEventStore(TestEvent, schema="public", group_commit=True)
+
+        versions = await asyncio.gather(
+            *(
+                store.append_events(f"aggregate-{i}", self.make_events(2))
+                for i in range(20)
+            )
+        )
+
+        assert versions == [4] * 20
+        assert len(stream_session) == 1
+        session = stream_session[0]
+        session.commit.assert_called_once()
+        assert session.begin_nested.call_count == 20
+        assert len(inserted_rows(session)) == 40
+
+    @pytest.mark.asyncio
+    async def test_group_commit_fails_conflicting_appends_alone(self, stream_session):
+        store = PostgresEventStore(TestEvent, schema="public", group_commit=True)
+
+        results = await asyncio.gather(
+            store.append_events("aggregate-1", self.make_events(1), expected_version=2),
+            store.append_events("aggregate-2", self.make_events(1), expected_version=0),
+            return_exceptions=True,
+        )
+
+        assert results[0] == 3
+        assert isinstance(results[1], ConcurrencyError)
+        stream_session[0].commit.assert_called_once()
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_group_commits_do_not_deadlock(self, advisory_locks):
+        # Two processes group-committing overlapping aggregates lock them in
+        # the same order
+        first = PostgresEventStore(TestEvent, schema="public", group_commit=True)
+        second = PostgresEventStore(TestEvent, schema="public", group_commit=True)
+
+        versions = await asyncio.wait_for(
+            asyncio.gather(
+                first.append_events("aggregate-1", self.make_events(1)),
+                first.append_events("aggregate-2", self.make_events(1)),
+                second.append_events("aggregate-2", self.make_events(1)),
+            ),
+            timeout=5,
+        )
+
+        assert versions == [1, 1, 1]
+        assert not any(lock.locked() for lock in advisory_locks.values())
+
+    @pytest.mark.asyncio
+    async def test_appends_only_lock_their_aggregates(self, stream_session):
+        store = PostgresEventStore(TestEvent, schema="public", group_commit=True)
+
+        await asyncio.gather(
+            store.append_events("aggregate-1", self.make_events(1)),
+            store.append_events("aggregate-2", self.make_events(1)),
+        )
+
+        lock_keys = [
+            call.args[1]["key"]
+            for call in stream_session[0].execute.call_args_list
+            if "pg_advisory_xact_lock" in str(call.args[0])
+        ]
+        # No global lock serializes appends to different aggregates
+        assert lock_keys == [
+            "public.domain_events:aggregate-1",
+            "public.domain_events:aggregate-2",
+        ]
+
+
+class RenamedEvent(DomainEvent):
+    """Event decoded into its own class."""
+
+    event_type: str = "test_rename"
+    aggregate_id: str
+    name: str
+
+
+def event_row(event_id, event_type, data, aggregate_id="aggregate-123"):
+    """Build a row as read by PostgresEventStore.stream_events."""
+    return MagicMock(
+        event_id=event_id,
+        event_type=event_type,
+        aggregate_id=aggregate_id,
+        timestamp=datetime(2023, 1, 1, 12, 0, 0),
+        data=data,
+    )
+
+
+@pytest.fixture
+def streamed_rows():
+    """Serve rows to PostgresEventStore.stream_events in pages of two."""
+    rows = []
+    queries = []
+
+    async def partitions():
+        for start in range(0, len(rows), 2):
+            yield rows[start : start + 2]
+
+    async def stream(query):
+        queries.append(query)
+        result = MagicMock()
+        result.partitions = partitions
+        return result
+
+    session = AsyncMock()
+    session.stream = stream
+    session_context = AsyncMock()
+    session_context.__aenter__.return_value = session
+    session_context.__aexit__.return_value = None
+
+    with patch("uno.domain.event_store.async_session", return_value=session_context):
+        yield rows, queries
+
+
+class TestPostgresEventStoreStreaming:
+    """Test streaming reads from the PostgreSQL event store."""
+
+    @pytest.mark.asyncio
+    async def test_stream_events_in_pages(self, streamed_rows):
+        rows, queries = streamed_rows
+        rows.extend(
+            event_row(f"event-{i}", "test_increment", json.dumps({"data": {"value": i}}))
+            for i in range(5)
+        )
+        store = PostgresEventStore(TestEvent, schema="public", page_size=2)
+
+        events = [event async for event in store.stream_events(aggregate_id="aggregate-123")]
+
+        assert [event.event_id for event in events] == [f"event-{i}" for i in range(5)]
+        assert [event.data["value"] for event in events] == list(range(5))
+        assert all(isinstance(event, TestEvent) for event in events)
+        assert queries[0].get_execution_options()["yield_per"] == 2
+
+    @pytest.mark.asyncio
+    async def test_registered_event_types_decode_into_their_class(self, streamed_rows):
+        rows, _ = streamed_rows
+        rows.append(event_row("event-1", "test_rename", json.dumps({"name": "New Name"})))
+        rows.append(event_row("event-2", "test_increment", json.dumps({})))
+        store = PostgresEventStore(TestEvent, schema="public")
+        store.register_event_type(RenamedEvent)
+
+        events = await store.get_events_by_aggregate_id("aggregate-123")
+
+        assert isinstance(events[0], RenamedEvent)
+        assert events[0].name == "New Name"
+        assert type(events[1]) is TestEvent
+
+    @pytest.mark.asyncio
+    async def test_legacy_and_invalid_rows(self, streamed_rows):
+        rows, _ = streamed_rows
+        # Rows once stored their data as a JSON-encoded string
+        rows.append(event_row("event-1", "test_increment", json.dumps(json.dumps({}))))
+        rows.append(event_row("event-2", "test_rename", json.dumps({})))
+        store = PostgresEventStore(TestEvent, schema="public")
+        store.register_event_type(RenamedEvent)
+
+        events = await store.get_events_by_type("test_increment")
+
+        # The rename event lacks its name and is skipped
+        assert [event.event_id for event in events] == ["event-1"]
+
+    @pytest.mark.asyncio
+    async def test_read_feed(self):
+        rows = [
+            event_row("event-1", "test_increment", json.dumps({})),
+            event_row("event-2", "test_rename", json.dumps({})),
+        ]
+        for position, row in enumerate(rows, start=11):
+            row.position = position
+        store = PostgresEventStore(TestEvent, schema="public")
+        store.register_event_type(RenamedEvent)
+        result = MagicMock()
+        result.all.return_value = rows
+        session = AsyncMock()
+        session.execute.return_value = result
+        session_context = AsyncMock()
+        session_context.__aenter__.return_value = session
+
+        with patch("uno.domain.event_store.async_session", return_value=session_context):
+            feed = await store.read_feed(after_position=10, limit=2)
+
+        query = str(session.execute.call_args[0][0])
+        assert (
+            "ORDER BY public.domain_events.transaction_id, public.domain_events.position"
+            in query
+        )
+        # Only events of transactions that can no longer commit are read
+        assert (
+            "public.domain_events.transaction_id < "
+            "pg_snapshot_xmin(pg_current_snapshot())::text::bigint" in query
+        )
+        # Undecodable events keep their position, so readers move past them
+        assert [position for position, _ in feed] == [11, 12]
+        assert feed[0][1].event_id == "event-1"
+        assert feed[1][1] is None
+
+
 class TestEventSourcedRepository:
     """Test the event-sourced repository implementation."""
 
@@ -316,6 +665,12 @@ class TestEventSourcedRepository:
     def mock_event_store(self):
         """Create a mock event store."""
         store = AsyncMock(spec=EventStore)
+        # Stream through the mocked get_events_by_aggregate_id
+        store.stream_events_by_aggregate_id = (
+            lambda *args, **kwargs: EventStore.stream_events_by_aggregate_id(
+                store, *args, **kwargs
+            )
+        )
         return store
 
     @pytest.fixture
@@ -342,8 +697,11 @@ class TestEventSourcedRepository:
         # Save aggregate
         await repository.save(aggregate)
 
-        # Check that events were saved
-        assert mock_event_store.save_event.call_count == 2
+        # Check that the events were appended to the stream in one write
+        mock_event_store.append_events.assert_called_once()
+        aggregate_id, events = mock_event_store.append_events.call_args.args
+        assert aggregate_id == "aggregate-123"
+        assert [e.event_id for e in events] == ["event-123", "event-456"]
 
         # Events should be cleared from aggregate
         assert len(aggregate.clear_events()) == 0
@@ -471,3 +829,186 @@ class TestEventSourcedRepository:
         # Aggregate state should be unchanged
         assert aggregate.name == "Test Aggregate"
         assert aggregate.counter == 0
+
+
+class CounterAggregate(models.AggregateRoot[str]):
+    """Aggregate counting increment events."""
+
+    counter: int = 0
+
+    def apply_test_increment(self, event: TestEvent) -> None:
+        self.counter += 1
+
+
+class InMemoryEventStore(EventStore):
+    """Event store keeping versioned streams in memory."""
+
+    def __init__(self):
+        self.streams: Dict[str, List[TestEvent]] = {}
+        self.reads: List[Any] = []
+
+    async def append_events(self, aggregate_id, events, expected_version=None):
+        stream = self.streams.setdefault(aggregate_id, [])
+        if expected_version is not None and expected_version != len(stream):
+            raise ConcurrencyError(
+                "aggregate", aggregate_id, expected_version, len(stream)
+            )
+        for event in events:
+            stream.append(event.model_copy(update={"version": len(stream) + 1}))
+        return len(stream)
+
+    async def get_events_by_aggregate_id(
+        self, aggregate_id, event_types=None, after_version=None
+    ):
+        self.reads.append(after_version)
+        return [
+            event
+            for event in self.streams.get(aggregate_id, [])
+            if after_version is None or event.version > after_version
+        ]
+
+
+class InMemorySnapshotStore(SnapshotStore):
+    """Snapshot store keeping snapshots in memory."""
+
+    def __init__(self):
+        self.snapshots: Dict[str, AggregateSnapshot] = {}
+
+    async def get_snapshot(self, aggregate_id, aggregate_type):
+        return self.snapshots.get(aggregate_id)
+
+    async def save_snapshot(self, snapshot):
+        self.snapshots[snapshot.aggregate_id] = snapshot
+
+
+def increments(count):
+    return [
+        TestEvent(event_type="test_increment", aggregate_id="counter-1")
+        for _ in range(count)
+    ]
+
+
+class TestEventSourcedRepositorySnapshots:
+    """Test snapshots and the aggregate cache of the event-sourced repository."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_every_interval(self):
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        repository = EventSourcedRepository(
+            CounterAggregate, event_store, snapshot_store=snapshot_store, snapshot_interval=100
+        )
+        aggregate = CounterAggregate(id="counter-1")
+
+        for _ in range(5):
+            for event in increments(50):
+                repository._apply_event(aggregate, event)
+                aggregate.register_event(event)
+            await repository.save(aggregate)
+
+        snapshot = snapshot_store.snapshots["counter-1"]
+        assert snapshot.version == 200
+        assert snapshot.state["counter"] == 200
+
+    @pytest.mark.asyncio
+    async def test_load_replays_events_after_snapshot(self):
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        await event_store.append_events("counter-1", increments(250))
+        snapshot_store.snapshots["counter-1"] = AggregateSnapshot(
+            "counter-1", "CounterAggregate", 200, {"id": "counter-1", "counter": 200}
+        )
+        repository = EventSourcedRepository(
+            CounterAggregate, event_store, snapshot_store=snapshot_store
+        )
+
+        aggregate = await repository.get_by_id("counter-1")
+
+        assert aggregate.counter == 250
+        assert event_store.reads == [200]
+
+    @pytest.mark.asyncio
+    async def test_long_replay_is_snapshotted(self):
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        await event_store.append_events("counter-1", increments(150))
+        repository = EventSourcedRepository(
+            CounterAggregate, event_store, snapshot_store=snapshot_store, snapshot_interval=100
+        )
+
+        aggregate = await repository.get_by_id("counter-1")
+
+        assert aggregate.counter == 150
+        assert snapshot_store.snapshots["counter-1"].version == 150
+
+    @pytest.mark.asyncio
+    async def test_invalid_snapshot_falls_back_to_full_replay(self):
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        await event_store.append_events("counter-1", increments(10))
+        snapshot_store.snapshots["counter-1"] = AggregateSnapshot(
+            "counter-1", "CounterAggregate", 5, {"id": "counter-1", "counter": "many"}
+        )
+        repository = EventSourcedRepository(
+            CounterAggregate, event_store, snapshot_store=snapshot_store
+        )
+
+        aggregate = await repository.get_by_id("counter-1")
+
+        assert aggregate.counter == 10
+        assert event_store.reads == [None]
+
+    @pytest.mark.asyncio
+    async def test_removed_aggregate_is_not_loaded_after_snapshot(self):
+        event_store = InMemoryEventStore()
+        snapshot_store = InMemorySnapshotStore()
+        await event_store.append_events("counter-1", increments(150))
+        repository = EventSourcedRepository(
+            CounterAggregate, event_store, snapshot_store=snapshot_store, snapshot_interval=100
+        )
+
+        aggregate = await repository.get_by_id("counter-1")
+        assert snapshot_store.snapshots["counter-1"].version == 150
+
+        await repository.remove(aggregate)
+
+        deletion = event_store.streams["counter-1"][-1]
+        assert deletion.event_type == "aggregate_deleted"
+        assert deletion.version == 151
+        assert await repository.get("counter-1") is None
+        assert event_store.reads[-1] == 150
+
+    @pytest.mark.asyncio
+    async def test_save_checks_loaded_version(self):
+        event_store = InMemoryEventStore()
+        await event_store.append_events("counter-1", increments(3))
+        repository = EventSourcedRepository(CounterAggregate, event_store)
+        other_repository = EventSourcedRepository(CounterAggregate, event_store)
+
+        aggregate = await repository.get_by_id("counter-1")
+        concurrent = await other_repository.get_by_id("counter-1")
+        concurrent.register_event(increments(1)[0])
+        await other_repository.save(concurrent)
+
+        aggregate.register_event(increments(1)[0])
+        with pytest.raises(ConcurrencyError):
+            await repository.save(aggregate)
+
+        # The stale aggregate is reloaded on next access
+        reloaded = await repository.get("counter-1")
+        assert reloaded is not aggregate
+        assert reloaded.counter == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        event_store = InMemoryEventStore()
+        for i in range(3):
+            await event_store.append_events(f"counter-{i}", increments(1))
+        repository = EventSourcedRepository(CounterAggregate, event_store, cache_size=2)
+
+        for i in range(3):
+            await repository.get(f"counter-{i}")
+
+        assert list(repository._snapshots) == ["counter-1", "counter-2"]
+        await repository.get("counter-0")
+        assert len(event_store.reads) == 4
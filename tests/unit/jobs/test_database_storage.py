@@ -0,0 +1,124 @@
+"""
+Tests for claiming jobs with DatabaseJobStorage.dequeue_batch against a
+mocked session: the generated SQL and the commit or rollback of the claim.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import MetaData
+from sqlalchemy.dialects import postgresql
+
+from uno.jobs.queue.priority import Priority
+from uno.jobs.queue.status import JobStatus
+from uno.jobs.storage import database
+from uno.jobs.storage.database import DatabaseJobStorage
+
+
+def job_row(job_id, priority, created_at):
+    return {
+        "id": job_id,
+        "status": JobStatus.RUNNING.value,
+        "priority": priority.value,
+        "created_at": created_at,
+    }
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    return session
+
+
+@pytest.fixture
+def storage(monkeypatch, session):
+    monkeypatch.setattr(
+        database, "get_db_manager", lambda: SimpleNamespace(metadata=MetaData())
+    )
+    storage = DatabaseJobStorage(session_factory=AsyncMock(return_value=session))
+    # Check the claimed rows as returned rather than as Job objects
+    monkeypatch.setattr(
+        storage,
+        "_job_from_row",
+        lambda row: SimpleNamespace(**{**row, "priority": Priority(row["priority"])}),
+    )
+    return storage
+
+
+def compiled(statement):
+    return statement.compile(dialect=postgresql.dialect())
+
+
+class TestDequeueBatch:
+    """Tests for DatabaseJobStorage.dequeue_batch."""
+
+    @pytest.mark.asyncio
+    async def test_claim_is_one_skip_locked_update(self, storage, session):
+        session.execute.return_value.mappings.return_value = []
+
+        await storage.dequeue_batch("emails", 10)
+
+        statement = compiled(session.execute.await_args.args[0])
+        sql = " ".join(str(statement).split())
+        assert sql.startswith("UPDATE jobs SET status=%(status)s")
+        assert "WHERE jobs.id IN (SELECT jobs.id FROM jobs WHERE jobs.queue_name = " in sql
+        assert "ORDER BY jobs.priority ASC, jobs.created_at ASC" in sql
+        assert sql.endswith("FOR UPDATE SKIP LOCKED) RETURNING " + ", ".join(
+            f"jobs.{column.name}" for column in storage.jobs_table.c
+        ))
+        params = statement.params
+        assert params["status"] == JobStatus.RUNNING.value
+        assert params["queue_name_1"] == "emails"
+        assert params["status_1"] == [JobStatus.PENDING.value]
+        assert params["param_1"] == 10
+        assert params["started_at"] == params["updated_at"]
+
+    @pytest.mark.asyncio
+    async def test_claimed_jobs_are_committed_in_priority_order(self, storage, session):
+        created = datetime(2024, 1, 1)
+        session.execute.return_value.mappings.return_value = [
+            job_row("low", Priority.LOW, created),
+            job_row("high-new", Priority.HIGH, created + timedelta(seconds=1)),
+            job_row("high-old", Priority.HIGH, created),
+        ]
+
+        result = await storage.dequeue_batch("emails", 3)
+
+        assert [job.id for job in result.value] == ["high-old", "high-new", "low"]
+        assert all(job.status == JobStatus.RUNNING.value for job in result.value)
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_claim_is_rolled_back(self, storage, session):
+        session.execute.side_effect = RuntimeError("connection lost")
+
+        result = await storage.dequeue_batch("emails", 3)
+
+        assert not result.is_success
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_claim_is_rolled_back_when_a_row_cannot_be_read(self, storage, session):
+        session.execute.return_value.mappings.return_value = [
+            job_row("ok", Priority.NORMAL, datetime(2024, 1, 1)),
+            {"id": "broken"},
+        ]
+
+        result = await storage.dequeue_batch("emails", 2)
+
+        # Neither job stays marked as running
+        assert not result.is_success
+        session.rollback.assert_awaited_once()
+        session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_nothing_is_claimed_for_an_empty_batch(self, storage, session):
+        result = await storage.dequeue_batch("emails", 0)
+
+        assert result.value == []
+        session.execute.assert_not_awaited()
@@ -0,0 +1,113 @@
+"""
+Tests for claiming jobs from RedisJobStorage, running the dequeue script
+against an in-process fake Redis server.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from uno.jobs.queue.priority import Priority
+from uno.jobs.queue.status import JobStatus
+from uno.jobs.storage.redis import RedisJobStorage, _DEQUEUE_SCRIPT
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = RedisJobStorage(prefix="test:jobs")
+    storage._redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    storage._dequeue_script = storage._redis.register_script(_DEQUEUE_SCRIPT)
+    # Check the claimed hashes as stored rather than as Job objects
+    monkeypatch.setattr(storage, "_deserialize_job", lambda data: data)
+    return storage
+
+
+async def add_pending(storage, job_id, priority, score, queue_name="default"):
+    """Store a pending job the way add_job does."""
+    redis = storage._redis
+    await redis.hset(
+        storage._get_job_key(job_id),
+        mapping={
+            "id": job_id,
+            "queue_name": queue_name,
+            "status": JobStatus.PENDING.value,
+            "priority": priority.value,
+        },
+    )
+    await redis.zadd(storage._get_queue_key(queue_name, priority), {job_id: score})
+    await redis.zadd(storage._get_queue_ready_key(queue_name), {job_id: score})
+    await redis.sadd(storage._get_status_index_key(JobStatus.PENDING), job_id)
+
+
+class TestDequeue:
+    """Tests for the dequeue script."""
+
+    @pytest.mark.asyncio
+    async def test_dequeue_claims_due_jobs_in_priority_order(self, storage):
+        redis = storage._redis
+        await add_pending(storage, "low-1", Priority.LOW, 1)
+        await add_pending(storage, "high-1", Priority.HIGH, 2)
+        await add_pending(storage, "high-2", Priority.HIGH, 3)
+        await add_pending(storage, "later", Priority.CRITICAL, time.time() + 3600)
+
+        jobs = await storage.dequeue("default", "worker-1", batch_size=2)
+
+        assert [job["id"] for job in jobs] == ["high-1", "high-2"]
+        assert all(job["status"] == str(JobStatus.RUNNING.value) for job in jobs)
+        assert all(job["worker_id"] == "worker-1" for job in jobs)
+        assert await redis.smembers(storage._get_status_index_key(JobStatus.RUNNING)) == {
+            "high-1",
+            "high-2",
+        }
+        assert await redis.smembers(storage._get_status_index_key(JobStatus.PENDING)) == {
+            "low-1",
+            "later",
+        }
+        # Claimed jobs no longer signal readiness
+        ready_key = storage._get_queue_ready_key("default")
+        assert set(await redis.zrange(ready_key, 0, -1)) == {"low-1", "later"}
+
+        jobs = await storage.dequeue("default", "worker-2", batch_size=5)
+
+        assert [job["id"] for job in jobs] == ["low-1"]
+        # Only a job scheduled for later is left, so the signals are cleared
+        assert await redis.exists(ready_key) == 0
+        assert await redis.zrange(storage._get_queue_key("default", Priority.CRITICAL), 0, -1) == [
+            "later"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_dequeues_claim_a_job_once(self, storage):
+        await add_pending(storage, "job-1", Priority.NORMAL, 1)
+
+        results = await asyncio.gather(
+            storage.dequeue("default", "worker-1"),
+            storage.dequeue("default", "worker-2"),
+        )
+
+        assert sorted(len(jobs) for jobs in results) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_queue_entries_without_a_job_are_discarded(self, storage):
+        await add_pending(storage, "gone", Priority.NORMAL, 1)
+        await add_pending(storage, "job-1", Priority.NORMAL, 2)
+        await storage._redis.delete(storage._get_job_key("gone"))
+
+        result = await storage.dequeue_batch("default", 2)
+
+        assert result.is_success
+        assert [job["id"] for job in result.value] == ["job-1"]
+        assert "worker_id" not in result.value[0]
+        assert await storage._redis.zcard(storage._get_queue_key("default", Priority.NORMAL)) == 0
+
+    @pytest.mark.asyncio
+    async def test_ready_signals_are_not_repeated(self, storage):
+        ready_key = storage._get_queue_ready_key("default")
+
+        for _ in range(3):
+            assert (await storage.resume_queue("default")).is_success
+
+        assert await storage._redis.zcard(ready_key) == 1
@@ -0,0 +1,229 @@
+"""
+Tests for the Scheduler's in-memory heap of next run times, driven by an
+in-memory storage stand-in.
+"""
+
+import asyncio
+import contextlib
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from uno.jobs.scheduler.scheduler import Scheduler
+
+
+def at(seconds_from_now: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now)
+
+
+class FakeScheduleStorage:
+    """Interval schedules kept in a dict, recording the jobs enqueued."""
+
+    def __init__(self):
+        self.schedules = {}
+        self.enqueued = []
+        self.due_job_calls = 0
+        self.lagging = set()
+        self.triggered = asyncio.Event()
+
+    def add(self, schedule_id, next_run, interval=3600):
+        self.schedules[schedule_id] = {
+            "id": schedule_id,
+            "status": "active",
+            "interval_seconds": interval,
+            "next_run": next_run,
+        }
+
+    async def initialize(self):
+        pass
+
+    async def list_schedules(self, status=None, tags=None):
+        return [
+            dict(schedule)
+            for schedule in self.schedules.values()
+            if status is None or schedule["status"] == status
+        ]
+
+    async def get_schedule(self, schedule_id):
+        schedule = self.schedules.get(schedule_id)
+        return dict(schedule) if schedule else None
+
+    async def get_due_jobs(self, limit=100):
+        self.due_job_calls += 1
+        now = datetime.now(timezone.utc)
+        due = sorted(
+            (schedule for schedule in self.schedules.values()
+             if schedule["status"] == "active" and schedule["next_run"] <= now
+             and schedule["id"] not in self.lagging),
+            key=lambda schedule: schedule["next_run"],
+        )[:limit]
+        for schedule in due:
+            schedule["next_run"] = now + timedelta(seconds=schedule["interval_seconds"])
+        return [
+            (schedule["id"], {"task": "tasks.report", "created_at": now,
+                              "metadata": {"schedule_id": schedule["id"]}})
+            for schedule in due
+        ]
+
+    async def create_job(self, job):
+        return job.id
+
+    async def enqueue(self, queue_name, job):
+        self.enqueued.append(job.metadata["schedule_id"])
+        self.triggered.set()
+        return True
+
+    @contextlib.asynccontextmanager
+    async def create_lock(self, lock_name, timeout=60, owner=None):
+        yield True
+
+
+@pytest.fixture
+def storage():
+    return FakeScheduleStorage()
+
+
+@pytest.fixture
+async def scheduler(storage):
+    scheduler = Scheduler(storage, resync_interval=0, metrics_enabled=False)
+    yield scheduler
+    await scheduler.shutdown()
+
+
+async def wait_for_jobs(storage, count, timeout=2.0):
+    """Wait until the scheduler has enqueued the given number of jobs."""
+    async def enqueued():
+        while len(storage.enqueued) < count:
+            storage.triggered.clear()
+            await storage.triggered.wait()
+
+    await asyncio.wait_for(enqueued(), timeout)
+
+
+class TestScheduleHeap:
+    """Tests for tracking next run times."""
+
+    @pytest.mark.asyncio
+    async def test_due_schedules_pop_in_run_time_order(self, storage):
+        scheduler = Scheduler(storage, resync_interval=0, metrics_enabled=False)
+        storage.add("late", at(-10))
+        storage.add("early", at(-30))
+        storage.add("future", at(3600))
+        storage.add("middle", at(-20))
+
+        await scheduler._load_schedules()
+
+        assert scheduler._pop_due_schedules(time.time()) == ["early", "middle", "late"]
+        assert list(scheduler._schedule_times) == ["future"]
+
+    @pytest.mark.asyncio
+    async def test_rescheduled_entries_skip_stale_heap_entries(self, storage):
+        scheduler = Scheduler(storage, resync_interval=0, metrics_enabled=False)
+        now = time.time()
+
+        scheduler._set_next_run("a", now - 5)
+        scheduler._set_next_run("a", now + 60)
+        scheduler._set_next_run("b", now - 1)
+
+        assert scheduler._pop_due_schedules(now) == ["b"]
+        assert scheduler._next_run_time() == now + 60
+
+    @pytest.mark.asyncio
+    async def test_paused_and_deleted_schedules_are_not_tracked(self, storage):
+        scheduler = Scheduler(storage, resync_interval=0, metrics_enabled=False)
+        now = time.time()
+        scheduler._set_next_run("paused", now + 10)
+        scheduler._set_next_run("deleted", now + 20)
+
+        scheduler._track_schedule("paused", {"status": "paused", "next_run": at(10)})
+        scheduler._track_schedule("deleted", None)
+
+        assert scheduler._next_run_time() is None
+
+    @pytest.mark.asyncio
+    async def test_run_due_schedules_tracks_the_next_run(self, storage):
+        scheduler = Scheduler(storage, resync_interval=0, metrics_enabled=False)
+        storage.add("report", at(-1), interval=60)
+        await scheduler._load_schedules()
+
+        await scheduler._run_due_schedules(time.time())
+
+        assert storage.enqueued == ["report"]
+        next_run = scheduler._schedule_times["report"]
+        assert next_run == storage.schedules["report"]["next_run"].timestamp()
+        assert next_run > time.time() + 50
+
+    @pytest.mark.asyncio
+    async def test_schedules_storage_does_not_report_are_retried_later(self, storage):
+        scheduler = Scheduler(
+            storage, resync_interval=0, metrics_enabled=False, check_interval=30
+        )
+        storage.add("report", at(-1))
+        storage.lagging.add("report")
+        await scheduler._load_schedules()
+        now = time.time()
+
+        await scheduler._run_due_schedules(now)
+
+        assert storage.enqueued == []
+        assert scheduler._schedule_times["report"] == now + 30
+
+    @pytest.mark.asyncio
+    async def test_resync_defaults_to_check_interval(self, storage):
+        scheduler = Scheduler(storage, metrics_enabled=False, check_interval=30)
+        await scheduler._load_schedules()
+
+        assert scheduler.resync_interval == 30
+        assert 29 < scheduler._seconds_until_wakeup() <= 30
+
+        scheduler = Scheduler(storage, resync_interval=0, metrics_enabled=False)
+        await scheduler._load_schedules()
+
+        assert scheduler.resync_interval is None
+        assert scheduler._seconds_until_wakeup() is None
+
+
+class TestSchedulerLoop:
+    """Tests for the scheduler loop waking up for due schedules."""
+
+    @pytest.mark.asyncio
+    async def test_schedules_run_in_due_order(self, storage, scheduler):
+        storage.add("second", at(0.2))
+        storage.add("first", at(0.05))
+        storage.add("later", at(3600))
+
+        await scheduler.start()
+        await wait_for_jobs(storage, 2)
+
+        assert storage.enqueued == ["first", "second"]
+        # The loop sleeps until each schedule is due instead of polling storage
+        assert storage.due_job_calls <= 2
+
+    @pytest.mark.asyncio
+    async def test_notified_changes_wake_the_loop(self, storage, scheduler):
+        storage.add("report", at(3600))
+        await scheduler.start()
+        await asyncio.sleep(0.05)
+
+        storage.schedules["report"]["next_run"] = at(-1)
+        await scheduler.notify_schedule_changed("report")
+        await wait_for_jobs(storage, 1)
+
+        assert storage.enqueued == ["report"]
+        assert scheduler._next_run_time() > time.time() + 3000
+
+    @pytest.mark.asyncio
+    async def test_removed_schedules_do_not_run(self, storage, scheduler):
+        storage.add("removed", at(0.05))
+        storage.add("kept", at(0.1))
+        await scheduler.start()
+        await asyncio.sleep(0.01)
+
+        del storage.schedules["removed"]
+        await scheduler.notify_schedule_changed("removed")
+        await wait_for_jobs(storage, 1)
+        await asyncio.sleep(0.1)
+
+        assert storage.enqueued == ["kept"]
+        assert "removed" not in scheduler._schedule_times
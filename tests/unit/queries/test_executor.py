@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import time
 from typing import List, Dict, Any, Optional
@@ -167,6 +168,72 @@ class TestQueryExecutor:
         # Verify cache was not accessed for force refresh
         assert mock_cache.get.call_count == 1
 
+    async def test_concurrent_misses_share_one_load(self, executor, mock_query):
+        """Test concurrent cache misses without a session run the query once."""
+        calls = []
+
+        async def _execute_query_fresh_mock(query, session=None):
+            calls.append(session)
+            await asyncio.sleep(0.01)
+            return Success(["r1"])
+
+        executor._execute_query_fresh = _execute_query_fresh_mock
+        query_cache = QueryCache(name="test_single_flight")
+
+        with patch.object(executor, 'get_query_cache', return_value=query_cache):
+            results = await asyncio.gather(
+                *(executor.execute_query(mock_query) for _ in range(5))
+            )
+
+        assert all(result.value == ["r1"] for result in results)
+        assert calls == [None]
+
+    async def test_callers_with_sessions_are_not_coalesced(self, executor, mock_query):
+        """Test a caller's session is used only for that caller's query."""
+        calls = []
+
+        async def _execute_query_fresh_mock(query, session=None):
+            calls.append(session)
+            await asyncio.sleep(0.01)
+            return Success(["r1"])
+
+        executor._execute_query_fresh = _execute_query_fresh_mock
+        query_cache = QueryCache(name="test_single_flight_sessions")
+        sessions = [MagicMock(spec=AsyncSession) for _ in range(3)]
+
+        with patch.object(executor, 'get_query_cache', return_value=query_cache):
+            await asyncio.gather(
+                *(executor.execute_query(mock_query, session) for session in sessions)
+            )
+
+        assert calls == sessions
+
+    async def test_stale_results_are_refreshed_in_the_background(self, executor, mock_query):
+        """Test cached results are re-executed without a session once stale."""
+        calls = []
+
+        async def _execute_query_fresh_mock(query, session=None):
+            calls.append(session)
+            return Success([f"r{len(calls)}"])
+
+        executor._execute_query_fresh = _execute_query_fresh_mock
+        executor.cache_ttl = 0
+        query_cache = QueryCache(name="test_refresh")
+        session = MagicMock(spec=AsyncSession)
+        session.get.return_value = None
+
+        with patch.object(executor, 'get_query_cache', return_value=query_cache):
+            first = await executor.execute_query(mock_query, session)
+            await asyncio.sleep(0.01)
+            stale = await executor.execute_query(mock_query)
+            await asyncio.sleep(0.01)
+
+        cache_key = executor._generate_query_cache_key(mock_query)
+        assert first.value == ["r1"]
+        assert stale.value == ["r1"]
+        assert calls == [session, None]
+        assert (await query_cache.cache.get(cache_key))["result"] == ["r2"]
+
     async def test_execute_query_values(self, executor, mock_session, mock_query, mock_query_value, mock_path):
         """Test executing query values."""
         # Setup
@@ -398,4 +465,359 @@ class TestQueryExecutor:
             
             # Assert something was returned for each lookup type
             assert isinstance(result, list)
-            assert result == ['record1']
\ No newline at end of file
+            assert result == ['record1']
+    async def test_and_subqueries_run_most_selective_first(self, executor, mock_session):
+        """Test AND sub-queries are ordered by estimated cardinality and share candidates."""
+        from uno.enums import Match
+
+        results = {
+            "broad": {"r1", "r2", "r3", "r4"},
+            "narrow": {"r2", "r3"},
+            "medium": {"r1", "r2", "r3"},
+        }
+        estimates = {"broad": 1000.0, "narrow": 2.0, "medium": 50.0}
+        calls = []
+
+        async def _estimate_mock(query, session):
+            return estimates[query.id]
+
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            calls.append((query.id, candidate_ids))
+            ids = results[query.id]
+            if candidate_ids is not None:
+                ids = ids & set(candidate_ids)
+            return Success(list(ids))
+
+        executor._estimate_query_cardinality = _estimate_mock
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        sub_queries = [MockQuery(id=qid) for qid in ("broad", "narrow", "medium")]
+        result = await executor._execute_sub_queries(
+            "parent", sub_queries, "include", Match.AND, mock_session
+        )
+
+        assert sorted(result) == ["r2", "r3"]
+        assert calls[0] == ("narrow", None)
+        assert [qid for qid, _ in calls[1:]] == ["medium", "broad"]
+        assert all(sorted(candidates) == ["r2", "r3"] for _, candidates in calls[1:])
+
+    async def test_and_subqueries_early_termination(self, executor, mock_session):
+        """Test AND sub-queries stop when the most selective branch is empty."""
+        from uno.enums import Match
+
+        calls = []
+
+        async def _estimate_mock(query, session):
+            return 0.0 if query.id == "empty" else 10.0
+
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            calls.append(query.id)
+            return Success([] if query.id == "empty" else ["r1"])
+
+        executor._estimate_query_cardinality = _estimate_mock
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        sub_queries = [MockQuery(id="full"), MockQuery(id="empty")]
+        result = await executor._execute_sub_queries(
+            "parent", sub_queries, "include", Match.AND, mock_session
+        )
+
+        assert result == []
+        assert calls == ["empty"]
+
+    async def test_branches_share_the_callers_session(self, executor, mock_session):
+        """Test sub-query branches run in order on the caller's session."""
+        from uno.enums import Match
+
+        calls = []
+
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            calls.append((query.id, session))
+            return Success([f"r-{query.id}"])
+
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        sub_queries = [MockQuery(id="a"), MockQuery(id="b"), MockQuery(id="c")]
+        result = await executor._execute_sub_queries(
+            "parent", sub_queries, "include", Match.OR, mock_session
+        )
+
+        assert sorted(result) == ["r-a", "r-b", "r-c"]
+        assert calls == [(qid, mock_session) for qid in ("a", "b", "c")]
+
+    async def test_table_row_estimates_expire(self, executor, mock_session, monkeypatch):
+        """Test pg_class row estimates are read again once their TTL passes."""
+        from uno.queries import executor as executor_module
+
+        mock_session.execute.return_value.scalar.return_value = 100.0
+        assert await executor._get_table_row_estimate("order", mock_session) == 100.0
+
+        mock_session.execute.return_value.scalar.return_value = 5000.0
+        assert await executor._get_table_row_estimate("order", mock_session) == 100.0
+
+        monkeypatch.setattr(executor_module, "TABLE_ROW_ESTIMATE_TTL", 0)
+        assert await executor._get_table_row_estimate("order", mock_session) == 5000.0
+
+    def test_candidate_pushdown_support(self, executor):
+        """Test candidate pushdown is disabled where values and sub-queries combine."""
+        leaf = MockQuery(id="leaf", query_values=[object()], sub_queries=[])
+        mixed = MockQuery(id="mixed", query_values=[object()], sub_queries=[leaf])
+        nested = MockQuery(id="nested", query_values=[], sub_queries=[leaf])
+
+        assert executor._supports_candidate_pushdown(leaf)
+        assert executor._supports_candidate_pushdown(nested)
+        assert not executor._supports_candidate_pushdown(mixed)
+
+    async def test_apply_record_change_patches_cached_results(self, executor, mock_session, mock_query, mock_query_value):
+        """Test a record change patches cached query results instead of invalidating them."""
+        from uno.enums import SQLOperation
+
+        mock_query.query_values = [mock_query_value]
+        query_cache = QueryCache(name="test_query_results")
+        cache_key = executor._generate_query_cache_key(mock_query)
+        await query_cache.set(
+            key=cache_key,
+            result=["record1", "record2"],
+            tags=[f"meta_type:{mock_query.query_meta_type_id}"],
+            ttl=300,
+        )
+        executor._register_cached_query(cache_key, mock_query)
+
+        async def _get_query_cache():
+            return query_cache
+
+        async def _invalidate_record(record_id):
+            return 0
+
+        executor.get_query_cache = _get_query_cache
+        executor.invalidate_cache_for_record = _invalidate_record
+
+        with patch.object(executor, '_check_record_direct', return_value=Success(True)):
+            stats = await executor.apply_record_change(
+                "test_entity", "record3", SQLOperation.INSERT, mock_session
+            )
+
+        assert stats == {"patched": 1, "unchanged": 0, "invalidated": 0}
+        assert await query_cache.get(cache_key) == ["record1", "record2", "record3"]
+
+        stats = await executor.apply_record_change(
+            "test_entity", "record1", SQLOperation.DELETE, mock_session
+        )
+
+        assert stats["patched"] == 1
+        assert await query_cache.get(cache_key) == ["record2", "record3"]
+
+    async def test_invalidate_query_path(self, executor, mock_query, mock_query_value):
+        """Test a query path's templates and the results of queries using it are dropped."""
+        mock_query.query_values = [mock_query_value]
+        other_query = MockQuery(
+            id="other-query-id", query_meta_type_id="test_entity", query_values=[], sub_queries=[]
+        )
+        query_cache = QueryCache(name="test_query_results")
+        for query, result in ((mock_query, ["record1"]), (other_query, ["record2"])):
+            cache_key = executor._generate_query_cache_key(query)
+            await query_cache.set(key=cache_key, result=result, ttl=300)
+            executor._register_cached_query(cache_key, query)
+        executor._template_cache.get_or_build(("test-path-id", "cypher"), lambda: "SELECT 1")
+        executor._template_cache.get_or_build(("other-path-id", "cypher"), lambda: "SELECT 2")
+
+        async def _get_query_cache():
+            return query_cache
+
+        executor.get_query_cache = _get_query_cache
+
+        assert await executor.invalidate_query_path("test-path-id") == 2
+
+        assert len(executor._template_cache) == 1
+        assert await query_cache.get(executor._generate_query_cache_key(mock_query)) is None
+        assert await query_cache.get(executor._generate_query_cache_key(other_query)) == ["record2"]
+        assert list(executor._cached_queries) == [executor._generate_query_cache_key(other_query)]
+
+    async def test_apply_record_change_invalidates_traversing_queries(self, executor, mock_session, mock_query):
+        """Test queries whose paths traverse the changed meta type are invalidated."""
+        from uno.enums import SQLOperation
+
+        query_cache = QueryCache(name="test_query_results")
+        cache_key = executor._generate_query_cache_key(mock_query)
+        await query_cache.set(
+            key=cache_key,
+            result=["record1"],
+            tags=["meta_type:test_entity", "path_target:test_target"],
+            ttl=300,
+        )
+        executor._register_cached_query(cache_key, mock_query)
+
+        async def _get_query_cache():
+            return query_cache
+
+        async def _invalidate_record(record_id):
+            return 0
+
+        executor.get_query_cache = _get_query_cache
+        executor.invalidate_cache_for_record = _invalidate_record
+
+        stats = await executor.apply_record_change(
+            "test_target", "target1", SQLOperation.UPDATE, mock_session
+        )
+
+        assert stats["invalidated"] == 1
+        assert await query_cache.get(cache_key) is None
+
+    async def test_apply_record_change_invalidates_expired_and_complex_queries(self, executor, mock_session, mock_query, mock_query_value):
+        """Test expired entries and queries that need a full re-run are invalidated, not checked."""
+        from uno.enums import SQLOperation
+
+        query_cache = QueryCache(name="test_query_results")
+
+        expired_query = MockQuery(
+            id="expired-query",
+            query_meta_type_id="test_entity",
+            query_values=[mock_query_value],
+            sub_queries=[],
+        )
+        complex_query = MockQuery(
+            id="complex-query",
+            query_meta_type_id="test_entity",
+            query_values=[mock_query_value],
+            sub_queries=[mock_query],
+        )
+        expired_key = executor._generate_query_cache_key(expired_query)
+        complex_key = executor._generate_query_cache_key(complex_query)
+        # Past its TTL but still served until the stale TTL runs out
+        await query_cache.set(key=expired_key, result=["record1"], ttl=-1)
+        await query_cache.set(key=complex_key, result=["record1"], ttl=300)
+        executor._register_cached_query(expired_key, expired_query)
+        executor._register_cached_query(complex_key, complex_query)
+
+        async def _get_query_cache():
+            return query_cache
+
+        async def _invalidate_record(record_id):
+            return 0
+
+        executor.get_query_cache = _get_query_cache
+        executor.invalidate_cache_for_record = _invalidate_record
+
+        with patch.object(executor, '_check_record_direct') as direct_check, \
+             patch.object(executor, 'execute_query_ids') as full_query:
+            stats = await executor.apply_record_change(
+                "test_entity", "record2", SQLOperation.UPDATE, mock_session
+            )
+            direct_check.assert_not_called()
+            full_query.assert_not_called()
+
+        assert stats == {"patched": 0, "unchanged": 0, "invalidated": 2}
+        assert await query_cache.get(expired_key) is None
+        assert await query_cache.get(complex_key) is None
+        assert expired_key not in executor._cached_queries
+        assert complex_key not in executor._cached_queries
+
+    async def test_check_records_match_queries_batches_per_query(self, executor, mock_session):
+        """Test each query is executed once for all records with candidate IDs bound."""
+        calls = []
+
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            calls.append((query.id, list(candidate_ids)))
+            return Success(["r1", "r3"] if query.id == "q1" else ["r2"])
+
+        executor.cache_enabled = False
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        queries = [
+            MockQuery(id="q1", query_values=[], sub_queries=[]),
+            MockQuery(id="q2", query_values=[], sub_queries=[]),
+        ]
+        result = await executor.check_records_match_queries(
+            queries, ["r1", "r2", "r3"], mock_session
+        )
+
+        assert result.is_success
+        matrix = result.value
+        assert matrix.shape == (2, 3)
+        assert matrix.matching_records(0) == ["r1", "r3"]
+        assert matrix.matching_records(1) == ["r2"]
+        assert matrix.matching_queries("r2") == ["q2"]
+        assert calls == [("q1", ["r1", "r2", "r3"]), ("q2", ["r1", "r2", "r3"])]
+
+    async def test_check_records_match_queries_runs_unrestricted_queries_once(self, executor, mock_session):
+        """Test queries without candidate pushdown are not re-run per chunk."""
+        calls = []
+
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            calls.append((query.id, len(candidate_ids)))
+            return Success(["r0", "r4"])
+
+        executor.cache_enabled = False
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        leaf = MockQuery(id="leaf", query_values=[object()], sub_queries=[])
+        restricted = MockQuery(id="restricted", query_values=[object()], sub_queries=[])
+        unrestricted = MockQuery(id="unrestricted", query_values=[object()], sub_queries=[leaf])
+        record_ids = [f"r{i}" for i in range(5)]
+
+        with patch("uno.queries.executor.MAX_PUSHDOWN_IDS", 2):
+            result = await executor.check_records_match_queries(
+                [restricted, unrestricted], record_ids, mock_session
+            )
+
+        assert calls == [
+            ("restricted", 2), ("restricted", 2), ("restricted", 1), ("unrestricted", 5),
+        ]
+        assert result.value.matching_records(0) == ["r0", "r4"]
+        assert result.value.matching_records(1) == ["r0", "r4"]
+
+    async def test_check_records_match_queries_uses_record_cache(self, executor, mock_session, mock_query):
+        """Test cached record matches are reused and new results are cached."""
+        record_cache = QueryCache(name="test_record_matches")
+        await record_cache.set(
+            key=executor._generate_record_cache_key(mock_query, "r1"),
+            result=True,
+            ttl=300,
+        )
+        calls = []
+
+        async def _get_record_cache():
+            return record_cache
+
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            calls.append(list(candidate_ids))
+            return Success([])
+
+        executor.get_record_cache = _get_record_cache
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        result = await executor.check_records_match_queries(
+            [mock_query], ["r1", "r2"], mock_session
+        )
+
+        assert result.value.to_dict() == {"test-query-id": {"r1": True, "r2": False}}
+        assert calls == [["r2"]]
+        assert await record_cache.get(
+            executor._generate_record_cache_key(mock_query, "r2")
+        ) is False
+        assert await record_cache.get_keys_for_tag("record:r2") == {
+            executor._generate_record_cache_key(mock_query, "r2")
+        }
+
+    async def test_check_records_match_queries_records_errors(self, executor, mock_session):
+        """Test a failing query is reported without affecting other rows."""
+        async def _execute_query_ids_mock(query, session, candidate_ids=None):
+            if query.id == "bad":
+                return Failure(QueryExecutionError(reason="boom", query_id="bad"))
+            return Success(["r1"])
+
+        executor.cache_enabled = False
+        executor._execute_query_ids = _execute_query_ids_mock
+
+        result = await executor.check_records_match_queries(
+            [
+                MockQuery(id="bad", query_values=[], sub_queries=[]),
+                MockQuery(id="good", query_values=[], sub_queries=[]),
+            ],
+            ["r1"],
+            mock_session,
+        )
+
+        matrix = result.value
+        assert 0 in matrix.errors
+        assert matrix.matching_records(1) == ["r1"]
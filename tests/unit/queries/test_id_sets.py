@@ -0,0 +1,134 @@
+import pickle
+
+import pytest
+
+from uno.queries.id_sets import (
+    IdBitmap,
+    IdDictionary,
+    QueryMatchMatrix,
+    get_id_dictionary,
+    to_id_list,
+)
+
+
+class TestIdBitmap:
+    """Tests for the compact record ID sets used by the QueryExecutor."""
+
+    @pytest.fixture
+    def dictionary(self):
+        return IdDictionary("test_entity")
+
+    def test_from_ids_round_trip(self, dictionary):
+        ids = [f"id{i}" for i in range(100)]
+        bitmap = IdBitmap.from_ids(dictionary, ids)
+
+        assert len(bitmap) == 100
+        assert bitmap.to_list() == ids
+        assert "id42" in bitmap
+        assert "missing" not in bitmap
+
+    def test_set_operations(self, dictionary):
+        evens = IdBitmap.from_ids(dictionary, [f"id{i}" for i in range(0, 60, 2)])
+        threes = IdBitmap.from_ids(dictionary, [f"id{i}" for i in range(0, 60, 3)])
+
+        assert set(evens & threes) == {f"id{i}" for i in range(0, 60, 6)}
+        assert set(evens | threes) == {
+            f"id{i}" for i in range(60) if i % 2 == 0 or i % 3 == 0
+        }
+        assert set(evens - threes) == {
+            f"id{i}" for i in range(0, 60, 2) if i % 3 != 0
+        }
+
+    def test_operations_accept_plain_collections(self, dictionary):
+        bitmap = IdBitmap.from_ids(dictionary, ["a", "b", "c"])
+
+        assert set(bitmap & ["b", "c", "d"]) == {"b", "c"}
+        assert set(bitmap | {"d"}) == {"a", "b", "c", "d"}
+
+    def test_operations_across_dictionaries(self, dictionary):
+        left = IdBitmap.from_ids(dictionary, ["a", "b"])
+        right = IdBitmap.from_ids(IdDictionary("test_entity"), ["b", "c"])
+
+        assert set(left & right) == {"b"}
+
+    def test_empty_bitmap(self, dictionary):
+        bitmap = IdBitmap.from_ids(dictionary, [])
+
+        assert not bitmap
+        assert len(bitmap) == 0
+        assert bitmap.to_list() == []
+
+    def test_compressed_serialization(self, dictionary):
+        bitmap = IdBitmap.from_ids(dictionary, [f"id{i}" for i in range(1000)])
+        restored = IdBitmap.from_bytes(dictionary, bitmap.to_bytes())
+
+        assert restored == bitmap
+
+    def test_pickle_uses_shared_dictionary(self):
+        dictionary = get_id_dictionary("test_pickled_entity")
+        bitmap = IdBitmap.from_ids(dictionary, [f"id{i}" for i in range(1000)])
+
+        restored = pickle.loads(pickle.dumps(bitmap))
+
+        assert restored.dictionary is dictionary
+        assert restored == bitmap
+
+    def test_full_dictionary_is_replaced(self, monkeypatch):
+        from uno.queries import id_sets
+
+        monkeypatch.setattr(id_sets, "MAX_DICTIONARY_IDS", 10)
+        dictionary = get_id_dictionary("test_replaced_entity")
+        bitmap = IdBitmap.from_ids(dictionary, [f"id{i}" for i in range(11)])
+
+        replacement = get_id_dictionary("test_replaced_entity")
+
+        assert replacement is not dictionary
+        assert len(replacement) == 0
+        assert bitmap.to_list() == [f"id{i}" for i in range(11)]
+        assert set(bitmap & IdBitmap.from_ids(replacement, ["id3", "x"])) == {"id3"}
+
+        restored = pickle.loads(pickle.dumps(bitmap))
+        assert restored.dictionary is replacement
+        assert restored == bitmap
+
+    def test_least_recently_used_dictionaries_are_dropped(self, monkeypatch):
+        from collections import OrderedDict
+
+        from uno.queries import id_sets
+
+        monkeypatch.setattr(id_sets, "MAX_ID_DICTIONARIES", 2)
+        monkeypatch.setattr(id_sets, "_id_dictionaries", OrderedDict())
+        first = get_id_dictionary("a")
+        get_id_dictionary("b")
+        assert get_id_dictionary("a") is first
+
+        get_id_dictionary("c")
+
+        assert list(id_sets._id_dictionaries) == ["a", "c"]
+
+    def test_to_id_list(self, dictionary):
+        bitmap = IdBitmap.from_ids(dictionary, ["a", "b"])
+
+        assert to_id_list(bitmap) == ["a", "b"]
+        assert sorted(to_id_list({"a", "b"})) == ["a", "b"]
+        assert to_id_list(["a"]) == ["a"]
+
+
+class TestQueryMatchMatrix:
+    """Tests for the compact query/record match matrix."""
+
+    def test_set_and_lookup(self):
+        matrix = QueryMatchMatrix(["q1", "q2"], ["a", "b", "c"])
+        matrix.set(0, "a")
+        matrix.set(0, "c")
+        matrix.set(1, "b")
+        matrix.set(0, "c", False)
+
+        assert matrix[0, "a"]
+        assert not matrix[0, 2]
+        assert matrix.matching_records(0) == ["a"]
+        assert matrix.matching_queries("b") == ["q2"]
+        assert matrix.to_dict() == {
+            "q1": {"a": True, "b": False, "c": False},
+            "q2": {"a": False, "b": True, "c": False},
+        }
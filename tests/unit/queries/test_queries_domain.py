@@ -1037,6 +1037,47 @@ class TestQueryPathService:
         assert all(qp.source_meta_type_id == meta_type_id for qp in result.value)
         mock_repository.find_by_meta_type_id.assert_called_once_with(meta_type_id, None)
 
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate_query_path(self, service, mock_repository):
+        """Test updating or deleting a query path invalidates what was built from it."""
+        # Arrange
+        query_path = QueryPath(
+            id=TEST_QUERY_PATH_ID,
+            source_meta_type_id=TEST_SOURCE_META_TYPE_ID,
+            target_meta_type_id=TEST_TARGET_META_TYPE_ID,
+            cypher_path=TEST_CYPHER_PATH,
+            data_type=TEST_DATA_TYPE
+        )
+        mock_repository.exists.return_value = True
+        mock_repository.update.return_value = query_path
+        mock_repository.remove_by_id.return_value = True
+        service.query_executor = Mock()
+        service.query_executor.invalidate_query_path = AsyncMock(return_value=1)
+
+        # Act
+        await service.save(query_path)
+        await service.delete(query_path)
+        await service.delete_by_id(TEST_QUERY_PATH_ID)
+
+        # Assert
+        assert service.query_executor.invalidate_query_path.await_count == 3
+        service.query_executor.invalidate_query_path.assert_awaited_with(TEST_QUERY_PATH_ID)
+
+    @pytest.mark.asyncio
+    async def test_failed_delete_does_not_invalidate_query_path(self, service, mock_repository):
+        """Test a failed delete leaves the query path's templates in place."""
+        # Arrange
+        mock_repository.remove_by_id.return_value = False
+        service.query_executor = Mock()
+        service.query_executor.invalidate_query_path = AsyncMock()
+
+        # Act
+        deleted = await service.delete_by_id(TEST_QUERY_PATH_ID)
+
+        # Assert
+        assert not deleted
+        service.query_executor.invalidate_query_path.assert_not_awaited()
+
 
 class TestQueryValueService:
     """Tests for the QueryValueService."""
@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+import pytest
+
+from uno.queries.templates import QueryTemplateCache
+
+
+class TestQueryTemplateCache:
+    """Tests for the parameterized SQL template cache."""
+
+    @pytest.fixture
+    def cache(self):
+        return QueryTemplateCache(max_size=2)
+
+    def test_builds_once_per_key(self, cache):
+        builder = Mock(return_value="SELECT id FROM test WHERE id = ANY(:ids)")
+
+        first = cache.get_or_build(("path-1", "standard"), builder)
+        second = cache.get_or_build(("path-1", "standard"), builder)
+
+        assert first is second
+        builder.assert_called_once()
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_statement_keeps_bind_parameters(self, cache):
+        statement = cache.get_or_build(
+            ("path-1", "direct"), lambda: "SELECT id FROM test WHERE id = :value_id"
+        )
+
+        assert "value_id" in statement._bindparams
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.get_or_build(("a",), lambda: "SELECT 1")
+        cache.get_or_build(("b",), lambda: "SELECT 2")
+        cache.get_or_build(("a",), lambda: "SELECT 1")
+        cache.get_or_build(("c",), lambda: "SELECT 3")
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)) is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate_path(self, cache):
+        cache.get_or_build(("path-1", "standard"), lambda: "SELECT 1")
+        cache.get_or_build(("path-2", "standard"), lambda: "SELECT 2")
+
+        assert cache.invalidate_path("path-1") == 1
+        assert cache.get(("path-1", "standard")) is None
+        assert cache.get(("path-2", "standard")) is not None
+
+    def test_clear(self, cache):
+        cache.get_or_build(("a",), lambda: "SELECT 1")
+
+        assert cache.clear() == 1
+        assert len(cache) == 0
@@ -298,4 +298,130 @@ async def test_hybrid_read_model_repository(db_provider, redis_cache, monkeypatc
 # Mock class to help with monkeypatching
 class AsyncContextManagerMockProtocol:
     async def fetchrow(self, query, *args):
-        pass
\ No newline at end of file
+        pass
+
+class RecordingConnection:
+    """Connection recording the statements of a batch save."""
+    
+    def __init__(self, copy: bool = True):
+        self.statements = []
+        self.copied = []
+        if copy:
+            self.copy_records_to_table = self._copy_records_to_table
+    
+    async def execute(self, query, *args):
+        self.statements.append((query, args))
+        return "INSERT 0 1"
+    
+    async def _copy_records_to_table(self, table_name, records, columns):
+        self.copied.append((table_name, list(records), columns))
+    
+    def transaction(self):
+        class Transaction:
+            async def __aenter__(self_tx):
+                return self_tx
+            
+            async def __aexit__(self_tx, exc_type, exc_val, exc_tb):
+                return False
+        return Transaction()
+
+
+class RecordingDatabaseProvider:
+    """Database provider handing out a single recording connection."""
+    
+    def __init__(self, conn):
+        self.conn = conn
+    
+    def async_connection(self):
+        conn = self.conn
+        
+        class ConnectionContext:
+            async def __aenter__(self_cm):
+                return conn
+            
+            async def __aexit__(self_cm, exc_type, exc_val, exc_tb):
+                return False
+        return ConnectionContext()
+
+
+def make_models(count, version=1):
+    now = datetime.now(UTC)
+    return [
+        TestReadModel(
+            id=ReadModelId(value=f"model-{i}"),
+            version=version,
+            created_at=now,
+            updated_at=now,
+            data={"value": i},
+            metadata={}
+        )
+        for i in range(count)
+    ]
+
+@pytest.mark.asyncio
+async def test_postgres_read_model_repository_batch_save_unnest():
+    """Test that small batches are upserted in one UNNEST statement."""
+    conn = RecordingConnection()
+    repo = PostgresReadModelRepository(
+        model_type=TestReadModel,
+        db_provider=RecordingDatabaseProvider(conn),
+        table_name="test_read_models",
+        copy_threshold=100
+    )
+    # The last model with a given ID wins
+    models = make_models(3) + make_models(1, version=2)
+    
+    result = await repo.batch_save(models)
+    
+    assert result.is_success()
+    assert not conn.copied
+    assert len(conn.statements) == 1
+    query, args = conn.statements[0]
+    assert "UNNEST" in query and "ON CONFLICT (id)" in query
+    assert args[0] == ["model-0", "model-1", "model-2"]
+    assert args[1] == [2, 1, 1]
+    assert [json.loads(data) for data in args[4]] == [{"value": 0}, {"value": 1}, {"value": 2}]
+    
+    stats = repo.get_batch_stats()
+    assert stats["batches"] == 1
+    assert stats["rows"] == 3
+    assert stats["last_method"] == "unnest"
+    assert stats["rows_per_second"] > 0
+
+@pytest.mark.asyncio
+async def test_postgres_read_model_repository_batch_save_copy():
+    """Test that large batches are copied into a temporary table and merged."""
+    conn = RecordingConnection()
+    repo = PostgresReadModelRepository(
+        model_type=TestReadModel,
+        db_provider=RecordingDatabaseProvider(conn),
+        table_name="test_read_models",
+        copy_threshold=100
+    )
+    
+    result = await repo.batch_save(make_models(250))
+    
+    assert result.is_success()
+    table_name, records, columns = conn.copied[0]
+    assert table_name == "test_read_models_batch"
+    assert len(records) == 250
+    assert columns == list(PostgresReadModelRepository.BATCH_COLUMNS)
+    assert "CREATE TEMPORARY TABLE" in conn.statements[0][0]
+    assert "FROM test_read_models_batch" in conn.statements[1][0]
+    assert repo.get_batch_stats()["last_method"] == "copy"
+
+@pytest.mark.asyncio
+async def test_postgres_read_model_repository_batch_save_without_copy():
+    """Test that large batches are upserted in chunks when COPY is unavailable."""
+    conn = RecordingConnection(copy=False)
+    repo = PostgresReadModelRepository(
+        model_type=TestReadModel,
+        db_provider=RecordingDatabaseProvider(conn),
+        table_name="test_read_models",
+        copy_threshold=100
+    )
+    
+    result = await repo.batch_save(make_models(250))
+    
+    assert result.is_success()
+    assert [len(args[0]) for _, args in conn.statements] == [100, 100, 50]
@@ -0,0 +1,219 @@
+"""
+Unit tests for catch-up subscriptions to the global event feed.
+
+These tests use an in-memory feed to verify that subscriptions process events
+in batches, resume from their checkpoint and wake up on notifications.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from uno.domain.events import DomainEvent
+from uno.read_model.projector import Projection, ProgressTracker, Projector
+from uno.read_model.subscription import CatchUpSubscription
+
+
+class FeedEvent(DomainEvent):
+    """Event stored in the test feed."""
+
+    __test__ = False
+
+    number: int
+
+
+class InMemoryFeedStore:
+    """Event store exposing an in-memory global feed."""
+
+    def __init__(self, notifications: bool = True):
+        self.events: List[FeedEvent] = []
+        self.reads: List[Tuple[int, int]] = []
+        self.notifications = notifications
+        self.listeners: List[Callable[[str], None]] = []
+
+    def append(self, count: int) -> None:
+        for _ in range(count):
+            self.events.append(FeedEvent(number=len(self.events) + 1))
+        for listener in self.listeners:
+            listener("{}")
+
+    async def read_feed(self, after_position: int = 0, limit: Optional[int] = None):
+        self.reads.append((after_position, limit))
+        feed = list(enumerate(self.events, start=1))[after_position:]
+        return feed[:limit]
+
+    @asynccontextmanager
+    async def listen(self, callback: Callable[[str], None]):
+        if not self.notifications:
+            yield False
+            return
+        self.listeners.append(callback)
+        try:
+            yield True
+        finally:
+            self.listeners.remove(callback)
+
+
+class InMemoryProgressRepository:
+    """Progress repository keeping checkpoints in memory."""
+
+    def __init__(self):
+        self.checkpoints: Dict[str, Tuple[int, datetime]] = {}
+        self.saves = 0
+
+    async def save_progress(self, projection_id: str, position: int, timestamp: datetime) -> None:
+        self.checkpoints[projection_id] = (position, timestamp)
+        self.saves += 1
+
+    async def load_progress(self, projection_id: str) -> Optional[Tuple[int, datetime]]:
+        return self.checkpoints.get(projection_id)
+
+
+class FailingProjection(Projection):
+    """Projection failing on one event number."""
+
+    __test__ = False
+
+    def __init__(self, fail_on: int):
+        super().__init__(MagicMock, FeedEvent, MagicMock())
+        self.fail_on = fail_on
+        self.applied: List[int] = []
+
+    async def apply(self, event):
+        if event.number == self.fail_on:
+            raise RuntimeError("projection failed")
+        self.applied.append(event.number)
+        return None
+
+
+def subscription(store, repository, handled, batch_size=100, poll_interval=5.0):
+    async def handler(event):
+        handled.append(event.number)
+
+    return CatchUpSubscription(
+        event_store=store,
+        handler=handler,
+        progress_tracker=ProgressTracker("feed-test", repository),
+        batch_size=batch_size,
+        poll_interval=poll_interval,
+    )
+
+
+async def wait_until(condition, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestCatchUpSubscription:
+    """Tests for CatchUpSubscription."""
+
+    @pytest.mark.asyncio
+    async def test_catch_up_in_batches(self):
+        store = InMemoryFeedStore()
+        store.append(250)
+        repository = InMemoryProgressRepository()
+        handled = []
+        sub = subscription(store, repository, handled)
+
+        assert await sub.catch_up() == 250
+
+        assert handled == list(range(1, 251))
+        assert [after for after, _ in store.reads] == [0, 100, 200]
+        assert repository.checkpoints["feed-test"][0] == 250
+        assert repository.saves == 3
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self):
+        store = InMemoryFeedStore()
+        store.append(30)
+        repository = InMemoryProgressRepository()
+        handled = []
+
+        first = subscription(store, repository, handled)
+        await first.start()
+        await wait_until(lambda: len(handled) == 30)
+        await first.stop()
+
+        store.append(5)
+        handled.clear()
+        second = subscription(store, repository, handled)
+        await second.start()
+        await wait_until(lambda: len(handled) == 5)
+        await second.stop()
+
+        assert handled == [31, 32, 33, 34, 35]
+        assert repository.checkpoints["feed-test"][0] == 35
+
+    @pytest.mark.asyncio
+    async def test_wakes_up_on_notification(self):
+        store = InMemoryFeedStore()
+        handled = []
+        # Polling alone would not pick up the new events during the test
+        sub = subscription(store, InMemoryProgressRepository(), handled, poll_interval=60)
+        await sub.start()
+        await wait_until(lambda: store.listeners and store.reads)
+
+        store.append(3)
+        await wait_until(lambda: len(handled) == 3)
+        await sub.stop()
+
+        assert handled == [1, 2, 3]
+        assert not store.listeners
+
+    @pytest.mark.asyncio
+    async def test_polls_without_notifications(self):
+        store = InMemoryFeedStore(notifications=False)
+        handled = []
+        sub = subscription(store, InMemoryProgressRepository(), handled, poll_interval=0.01)
+        await sub.start()
+        await wait_until(lambda: store.reads)
+
+        store.append(2)
+        await wait_until(lambda: len(handled) == 2)
+        await sub.stop()
+
+        assert handled == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_skips_undecodable_events(self):
+        store = InMemoryFeedStore()
+        store.append(3)
+        repository = InMemoryProgressRepository()
+        handled = []
+        sub = subscription(store, repository, handled)
+
+        original = store.read_feed
+
+        async def read_feed(after_position=0, limit=None):
+            return [(position, None if position == 2 else event)
+                    for position, event in await original(after_position, limit)]
+
+        store.read_feed = read_feed
+        await sub.catch_up()
+
+        assert handled == [1, 3]
+        assert repository.checkpoints["feed-test"][0] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_projection_is_not_checkpointed(self):
+        store = InMemoryFeedStore()
+        store.append(3)
+        repository = InMemoryProgressRepository()
+        projection = FailingProjection(fail_on=2)
+        projector = Projector(event_bus=MagicMock(), event_store=store)
+        projector.register_projection(projection)
+        sub = projector.subscribe_to_feed("feed-test", repository)
+
+        await sub.start()
+        await wait_until(lambda: not sub.running)
+        await sub.stop()
+
+        # The subscription stops before the failed event, to retry it on restart
+        assert projection.applied == [1]
+        assert repository.checkpoints["feed-test"][0] == 1
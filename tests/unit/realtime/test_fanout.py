@@ -0,0 +1,266 @@
+"""
+Tests for serialize-once broadcast fan-out over WebSocket and SSE connections.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from uno.realtime.fanout import EnqueueResult, FanoutMetrics, OverflowPolicy, SendQueue
+from uno.realtime.sse.event import Event
+from uno.realtime.sse.manager import SSEManager
+from uno.realtime.websocket.connection import ConnectionState, WebSocketConnection
+from uno.realtime.websocket.manager import WebSocketManager
+from uno.realtime.websocket.message import Message, MessageType
+
+
+class FakeSocket:
+    """WebSocket sender recording the frames written to it."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+
+    async def send_text(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+class FakeWriter:
+    """SSE writer recording the text written to it."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.written = []
+
+    async def write(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.written.append(data)
+
+    async def flush(self):
+        pass
+
+
+def add_websocket(manager, client_id, delay=0.0):
+    connection = WebSocketConnection(
+        FakeSocket(delay),
+        client_id=client_id,
+        auto_ping=False,
+        send_queue_size=manager.send_queue_size,
+        overflow_policy=manager.overflow_policy,
+        metrics=manager.fanout_metrics,
+    )
+    connection.state = ConnectionState.CONNECTED
+    manager.connections[client_id] = connection
+    return connection
+
+
+class TestSendQueue:
+    """Tests for the bounded per-connection send queue."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        queue = SendQueue(maxsize=2)
+
+        assert queue.offer("a") is EnqueueResult.QUEUED
+        assert queue.offer("b") is EnqueueResult.QUEUED
+        assert queue.offer("c") is EnqueueResult.EVICTED
+
+        assert [(await queue.get())[0] for _ in range(2)] == ["b", "c"]
+        assert queue.dropped == 1
+
+    def test_drop_newest(self):
+        queue = SendQueue(maxsize=1, policy=OverflowPolicy.DROP_NEWEST)
+
+        assert queue.offer("a") is EnqueueResult.QUEUED
+        assert queue.offer("b") is EnqueueResult.DROPPED
+        assert len(queue) == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesce_replaces_pending_frame_in_place(self):
+        queue = SendQueue(maxsize=4)
+        queue.offer("order-1 v1", key="order-1")
+        queue.offer("other")
+
+        assert queue.offer("order-1 v2", key="order-1") is EnqueueResult.COALESCED
+        assert [(await queue.get())[0] for _ in range(2)] == ["order-1 v2", "other"]
+
+        # Once sent, the key no longer coalesces
+        assert queue.offer("order-1 v3", key="order-1") is EnqueueResult.QUEUED
+
+    def test_metrics(self):
+        metrics = FanoutMetrics()
+        metrics.record_broadcast(
+            [EnqueueResult.QUEUED, EnqueueResult.EVICTED, EnqueueResult.DROPPED],
+            0.002,
+        )
+        metrics.record_delivery(0.01)
+
+        stats = metrics.get_stats()
+        assert stats["recipients"] == 3
+        assert stats["queued"] == 2
+        assert stats["dropped"] == 2
+        assert stats["fanout_seconds"]["max"] == 0.002
+        assert stats["delivery_seconds"]["count"] == 1
+
+
+class TestWebSocketBroadcast:
+    """Tests for WebSocketManager broadcasts."""
+
+    @pytest.mark.asyncio
+    async def test_message_is_encoded_once(self, monkeypatch):
+        manager = WebSocketManager(auto_ping=False)
+        sockets = [add_websocket(manager, f"c{i}").socket for i in range(3)]
+
+        calls = []
+        original = Message.to_json
+        monkeypatch.setattr(Message, "to_json", lambda self: calls.append(1) or original(self))
+
+        message = Message(type=MessageType.EVENT, payload={"n": 1})
+        assert await manager.broadcast(message) == 3
+        await asyncio.sleep(0.01)
+
+        assert len(calls) == 1
+        assert all(socket.sent == [original(message)] for socket in sockets)
+        assert manager.get_fanout_stats()["delivery_seconds"]["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_broadcast(self):
+        manager = WebSocketManager(auto_ping=False, send_queue_size=2)
+        fast = add_websocket(manager, "fast")
+        slow = add_websocket(manager, "slow", delay=10)
+
+        start = time.perf_counter()
+        for i in range(5):
+            await manager.broadcast(Message(type=MessageType.EVENT, payload={"n": i}))
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.01)
+
+        assert elapsed < 1
+        assert len(fast.socket.sent) == 5
+        assert len(slow.send_queue) == 2
+        assert manager.get_fanout_stats()["dropped"] == 2
+
+        slow.send_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_fan_out_to_many_connections(self):
+        manager = WebSocketManager(auto_ping=False)
+        slow = add_websocket(manager, "slow", delay=10)
+        fast = [add_websocket(manager, f"c{i}") for i in range(100)]
+
+        queued = await manager.broadcast(Message(type=MessageType.EVENT, payload={"n": 1}))
+        await asyncio.sleep(0.05)
+
+        assert queued == 101
+        assert all(len(connection.socket.sent) == 1 for connection in fast)
+        assert slow.socket.sent == []
+        assert manager.get_fanout_stats()["delivery_seconds"]["count"] == 100
+
+        for connection in manager.connections.values():
+            connection.send_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes_slow_client(self):
+        manager = WebSocketManager(
+            auto_ping=False, send_queue_size=1, overflow_policy=OverflowPolicy.DISCONNECT
+        )
+        slow = add_websocket(manager, "slow", delay=10)
+
+        for i in range(3):
+            await manager.broadcast(Message(type=MessageType.EVENT, payload={"n": i}))
+        await asyncio.sleep(0.2)
+
+        assert slow.state == ConnectionState.DISCONNECTED
+
+    @pytest.mark.asyncio
+    async def test_slow_client_is_closed_once(self):
+        manager = WebSocketManager(
+            auto_ping=False, send_queue_size=1, overflow_policy=OverflowPolicy.DISCONNECT
+        )
+        slow = add_websocket(manager, "slow", delay=10)
+
+        slow.enqueue_frame("a")
+        await asyncio.sleep(0)
+        slow.enqueue_frame("b")
+        slow.enqueue_frame("c")
+        close_task = slow.close_task
+        slow.enqueue_frame("d")
+
+        assert close_task is not None
+        assert slow.close_task is close_task
+        await close_task
+        assert slow.state == ConnectionState.DISCONNECTED
+
+    @pytest.mark.asyncio
+    async def test_send_message_is_written_after_queued_frames(self):
+        manager = WebSocketManager(auto_ping=False)
+        connection = add_websocket(manager, "c0")
+
+        connection.enqueue_frame("queued")
+        await connection.send_message(Message(type=MessageType.PING))
+        await asyncio.sleep(0.01)
+
+        assert connection.socket.sent[0] == "queued"
+        assert len(connection.socket.sent) == 2
+
+        connection.send_task.cancel()
+
+
+class TestSSEBroadcast:
+    """Tests for SSEManager broadcasts."""
+
+    @pytest.mark.asyncio
+    async def test_event_is_encoded_once_and_coalesced(self, monkeypatch):
+        manager = SSEManager(keep_alive=False)
+        writers = [FakeWriter(), FakeWriter()]
+        for i, writer in enumerate(writers):
+            await manager.create_connection(object(), writer, client_id=f"c{i}")
+
+        calls = []
+        original = Event.to_sse_format
+        monkeypatch.setattr(
+            Event, "to_sse_format", lambda self: calls.append(1) or original(self)
+        )
+
+        first = Event(data={"status": "new"}, id="1")
+        second = Event(data={"status": "paid"}, id="2")
+        assert await manager.broadcast_event(first, coalesce_key="order-1") == 2
+        assert await manager.broadcast_event(second, coalesce_key="order-1") == 2
+        await asyncio.sleep(0.05)
+
+        assert len(calls) == 2
+        assert all(writer.written == [original(second)] for writer in writers)
+        assert manager.get_fanout_stats()["coalesced"] == 2
+
+        for i in range(2):
+            await manager.close_connection(f"c{i}")
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_is_skipped_while_events_are_pending(self):
+        manager = SSEManager(keep_alive=False, send_queue_size=1)
+        writer = FakeWriter(delay=10)
+        connection = await manager.create_connection(object(), writer, client_id="c0")
+        connection._keep_alive_interval = 0.01
+
+        connection.enqueue_frame("first")
+        await asyncio.sleep(0)
+        connection.enqueue_frame("second")
+        keep_alive = asyncio.create_task(connection._keep_alive_loop())
+        await asyncio.sleep(0.05)
+
+        assert connection._send_queue.dropped == 0
+        assert (await connection._send_queue.get())[0] == "second"
+
+        keep_alive.cancel()
+        await manager.close_connection("c0")
@@ -0,0 +1,176 @@
+"""
+Tests for the inverted index over realtime query subscriptions.
+"""
+
+import pytest
+
+from uno.realtime.subscriptions.index import QuerySubscriptionIndex
+from uno.realtime.subscriptions.store import InMemorySubscriptionStore
+from uno.realtime.subscriptions.subscription import (
+    SubscriptionStatus,
+    SubscriptionType,
+    create_query_subscription,
+    create_resource_type_subscription,
+    create_topic_subscription,
+    match_query_value,
+)
+
+
+class TestMatchQueryValue:
+    """Tests for query parameter matching."""
+
+    @pytest.mark.parametrize(
+        "event_value,value,result",
+        [
+            ("paid", "paid", True),
+            ("paid", "new", False),
+            (10, {"operator": "gte", "value": 10}, True),
+            (9, {"operator": "gte", "value": 10}, False),
+            (5, {"operator": "between", "value": [1, 10]}, True),
+            ("eu", {"operator": "in", "value": ["eu", "us"]}, True),
+            ("x", {"operator": "gt", "value": 1}, False),
+            (None, {"operator": "lt", "value": 1}, False),
+            ({"a": 1}, {"a": 1}, True),
+        ],
+    )
+    def test_operators(self, event_value, value, result):
+        assert match_query_value(event_value, value) is result
+
+
+class TestQuerySubscriptionIndex:
+    """Tests for candidate lookup."""
+
+    def test_equality_postings(self):
+        index = QuerySubscriptionIndex()
+        paid = create_query_subscription("u1", {"status": "paid"})
+        new = create_query_subscription("u2", {"status": "new"})
+        index.add(paid)
+        index.add(new)
+
+        assert index.candidates({"status": "paid", "total": 5}) == [paid.id]
+        assert index.candidates({"total": 5}) == []
+
+    def test_in_parameters_post_every_value(self):
+        index = QuerySubscriptionIndex()
+        subscription = create_query_subscription(
+            "u1", {"region": {"operator": "in", "value": ["eu", "us"]}}
+        )
+        index.add(subscription)
+
+        assert index.candidates({"region": "us"}) == [subscription.id]
+        assert index.candidates({"region": "apac"}) == []
+
+    def test_range_bounds(self):
+        index = QuerySubscriptionIndex()
+        above = create_query_subscription("u1", {"total": {"operator": "gt", "value": 100}})
+        below = create_query_subscription("u2", {"total": {"operator": "lte", "value": 10}})
+        index.add(above)
+        index.add(below)
+
+        assert index.candidates({"total": 500}) == [above.id]
+        assert index.candidates({"total": 5}) == [below.id]
+        assert index.candidates({"total": 50}) == []
+
+    def test_unindexable_subscriptions_are_always_candidates(self):
+        index = QuerySubscriptionIndex()
+        subscription = create_query_subscription(
+            "u1", {"tags": ["a", "b"], "status": {"operator": "neq", "value": "new"}}
+        )
+        index.add(subscription)
+
+        assert index.candidates({}) == [subscription.id]
+        assert index.get_stats()["unindexed"] == 1
+
+    def test_reindex_and_remove(self):
+        index = QuerySubscriptionIndex()
+        subscription = create_query_subscription("u1", {"status": "paid"})
+        index.add(subscription)
+
+        subscription.query = {"status": "new"}
+        index.add(subscription)
+
+        assert index.candidates({"status": "paid"}) == []
+        assert index.candidates({"status": "new"}) == [subscription.id]
+
+        assert index.remove(subscription.id)
+        assert index.candidates({"status": "new"}) == []
+        assert len(index) == 0
+        assert index.get_stats()["posted_fields"] == 0
+
+
+class TestInMemoryStoreMatching:
+    """Tests for get_matching_event on the in-memory store."""
+
+    @pytest.mark.asyncio
+    async def test_matches_each_subscription_once(self):
+        store = InMemorySubscriptionStore()
+        by_type = create_resource_type_subscription("u1", "order")
+        by_topic = create_topic_subscription("u1", "orders")
+        by_query = create_query_subscription(
+            "u1", {"resource_type": "order", "total": {"operator": "gte", "value": 100}}
+        )
+        for subscription in (by_type, by_topic, by_query):
+            await store.save(subscription)
+
+        matches = await store.get_matching_event(
+            {"resource_type": "order", "topic": "orders", "total": 150}
+        )
+
+        assert [subscription.id for subscription in matches] == [
+            by_type.id,
+            by_topic.id,
+            by_query.id,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_updates_and_deletes_are_indexed(self):
+        store = InMemorySubscriptionStore()
+        subscription = create_query_subscription("u1", {"status": "paid"})
+        await store.save(subscription)
+
+        subscription.query = {"status": "shipped"}
+        await store.update(subscription)
+        assert await store.get_matching_event({"status": "paid"}) == []
+        assert await store.get_matching_event({"status": "shipped"}) == [subscription]
+
+        subscription.update_status(SubscriptionStatus.PAUSED)
+        assert await store.get_matching_event({"status": "shipped"}) == []
+
+        await store.delete(subscription.id)
+        assert await store.get_matching_event({"status": "shipped"}, active_only=False) == []
+
+    @pytest.mark.asyncio
+    async def test_index_agrees_with_full_scan(self):
+        store = InMemorySubscriptionStore()
+        queries = [
+            {"resource_id": "order-1"},
+            {"customer_id": "customer-2", "status": "paid"},
+            {"customer_id": "customer-2", "total": {"operator": "gte", "value": 50}},
+            {"total": {"operator": "between", "value": [10, 20]}},
+            {"region": {"operator": "in", "value": ["eu", "us"]}},
+            {"tags": {"a": 1}},
+        ]
+        for i in range(300):
+            await store.save(create_query_subscription(f"user-{i}", queries[i % len(queries)]))
+        events = [
+            {
+                "resource_id": f"order-{i % 3}",
+                "customer_id": f"customer-{i % 4}",
+                "status": "paid" if i % 2 else "new",
+                "total": i * 7 % 100,
+                "region": ["eu", "us", "apac"][i % 3],
+                "tags": {"a": i % 2},
+            }
+            for i in range(40)
+        ]
+
+        for event in events:
+            scanned = [
+                subscription.id
+                for subscription in store._subscriptions.values()
+                if subscription.type == SubscriptionType.QUERY
+                and subscription.is_active()
+                and subscription.matches_event(event)
+            ]
+            indexed = [subscription.id for subscription in await store.get_matching_event(event)]
+            assert indexed == scanned
@@ -0,0 +1,237 @@
+"""
+Tests for batched audit log writing: FileLogStorage batches and the
+buffered storage with its overflow policies.
+"""
+
+import threading
+import time
+
+import pytest
+
+from uno.security.audit.event import SecurityEvent
+from uno.security.audit.logger import AuditLogger, BufferedLogStorage, FileLogStorage
+from uno.security.config import AuditingConfig, AuditLogStorage, AuditOverflowPolicy
+
+
+def login_event(i: int) -> SecurityEvent:
+    return SecurityEvent(event_type="login", user_id=f"user-{i}", ip_address="10.0.0.1")
+
+
+class RecordingStorage:
+    """Storage recording batches, optionally blocking writes until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def log_events(self, events):
+        self.release.wait()
+        self.batches.append(list(events))
+
+    def get_events(self, *args):
+        return [event for batch in self.batches for event in batch]
+
+
+class TestFileLogStorage:
+    """Tests for FileLogStorage."""
+
+    def test_log_events_appends_lines(self, tmp_path):
+        storage = FileLogStorage(str(tmp_path / "audit.log"), fsync=True)
+        storage.log_events([login_event(i) for i in range(3)])
+        storage.log_event(login_event(3))
+
+        events = storage.get_events()
+
+        assert sorted(event.user_id for event in events) == [f"user-{i}" for i in range(4)]
+
+    def test_batches_larger_than_iov_max(self, tmp_path):
+        storage = FileLogStorage(str(tmp_path / "audit.log"))
+        storage.log_events([login_event(i) for i in range(2500)])
+
+        assert len((tmp_path / "audit.log").read_text().splitlines()) == 2500
+
+
+class TestBufferedLogStorage:
+    """Tests for BufferedLogStorage."""
+
+    def test_events_are_written_in_batches(self):
+        backend = RecordingStorage()
+        storage = BufferedLogStorage(backend, batch_size=100, flush_interval=10)
+
+        for i in range(250):
+            storage.log_event(login_event(i))
+        assert storage.flush(timeout=5)
+        storage.close()
+
+        assert [len(batch) for batch in backend.batches] == [100, 100, 50]
+        stats = storage.get_stats()
+        assert stats["written"] == 250
+        assert stats["buffered"] == 0
+
+    def test_flush_interval_writes_partial_batches(self):
+        backend = RecordingStorage()
+        storage = BufferedLogStorage(backend, batch_size=100, flush_interval=0.05)
+
+        storage.log_event(login_event(1))
+        time.sleep(0.2)
+
+        assert len(backend.batches) == 1
+        storage.close()
+
+    def test_close_writes_buffered_events(self):
+        backend = RecordingStorage()
+        storage = BufferedLogStorage(backend, batch_size=100, flush_interval=10)
+        for i in range(10):
+            storage.log_event(login_event(i))
+
+        storage.close()
+
+        assert sum(len(batch) for batch in backend.batches) == 10
+
+    @pytest.mark.parametrize(
+        "policy, kept",
+        [
+            (AuditOverflowPolicy.DROP_NEWEST, ["user-0", "user-1"]),
+            (AuditOverflowPolicy.DROP_OLDEST, ["user-3", "user-4"]),
+        ],
+    )
+    def test_drop_policies(self, policy, kept):
+        backend = RecordingStorage()
+        backend.release.clear()
+        storage = BufferedLogStorage(backend, capacity=2, batch_size=1, flush_interval=10,
+                                     overflow_policy=policy)
+
+        # The first event is taken by the writer, which then blocks
+        storage.log_event(SecurityEvent(event_type="login", user_id="first"))
+        time.sleep(0.05)
+        for i in range(5):
+            storage.log_event(login_event(i))
+
+        assert storage.get_stats()["dropped"] == 3
+        backend.release.set()
+        storage.close()
+        assert [event.user_id for event in backend.get_events()] == ["first", *kept]
+
+    def test_block_policy_applies_back_pressure(self):
+        backend = RecordingStorage()
+        backend.release.clear()
+        storage = BufferedLogStorage(backend, capacity=1, batch_size=1, flush_interval=10,
+                                     overflow_policy=AuditOverflowPolicy.BLOCK,
+                                     block_timeout=0.05)
+
+        storage.log_event(login_event(0))
+        time.sleep(0.05)
+        storage.log_event(login_event(1))
+        # The buffer is full; the caller waits block_timeout, then drops the event
+        storage.log_event(login_event(2))
+
+        stats = storage.get_stats()
+        assert stats["blocked"] == 1
+        assert stats["dropped"] == 1
+        backend.release.set()
+        storage.close()
+
+    def test_failed_writes_are_retried(self):
+        backend = RecordingStorage()
+        failures = [RuntimeError("disk full")]
+        write = backend.log_events
+
+        def flaky(events):
+            if failures:
+                raise failures.pop()
+            write(events)
+
+        backend.log_events = flaky
+        storage = BufferedLogStorage(backend, batch_size=10, flush_interval=0.01)
+        for i in range(5):
+            storage.log_event(login_event(i))
+
+        assert storage.flush(timeout=5)
+        storage.close()
+        assert storage.get_stats()["errors"] == 1
+        assert len(backend.get_events()) == 5
+
+    def test_events_that_cannot_be_written_are_dropped(self):
+        backend = RecordingStorage()
+        write = backend.log_events
+
+        def reject_poison(events):
+            if any(event.user_id == "poison" for event in events):
+                raise ValueError("duplicate event_id")
+            write(events)
+
+        backend.log_events = reject_poison
+        storage = BufferedLogStorage(backend, batch_size=8, flush_interval=0.01, max_retries=2)
+        for i in range(3):
+            storage.log_event(login_event(i))
+        storage.log_event(SecurityEvent(event_type="login", user_id="poison"))
+        for i in range(3, 8):
+            storage.log_event(login_event(i))
+
+        assert storage.flush(timeout=5)
+        # Later events are not held up by the poison event
+        storage.log_event(login_event(8))
+        assert storage.flush(timeout=5)
+        storage.close()
+
+        stats = storage.get_stats()
+        assert stats["written"] == 9
+        assert stats["dropped"] == 1
+        assert stats["rejected"] == 1
+        assert sorted(event.user_id for event in backend.get_events()) == [
+            f"user-{i}" for i in range(9)
+        ]
+
+    def test_new_events_are_dropped_when_full_by_default(self):
+        backend = RecordingStorage()
+        backend.release.clear()
+        storage = BufferedLogStorage(backend, capacity=1, batch_size=1, flush_interval=10)
+
+        storage.log_event(login_event(0))
+        time.sleep(0.05)
+        storage.log_event(login_event(1))
+        storage.log_event(login_event(2))
+
+        stats = storage.get_stats()
+        assert stats["blocked"] == 0
+        assert stats["dropped"] == 1
+        backend.release.set()
+        storage.close()
+
+
+class TestAuditLogger:
+    """Tests for AuditLogger with buffering enabled."""
+
+    def test_buffered_file_logging(self, tmp_path):
+        config = AuditingConfig(
+            storage=AuditLogStorage.FILE,
+            storage_path=str(tmp_path / "audit.log"),
+            buffered=True,
+            flush_interval=10,
+        )
+        audit = AuditLogger(config)
+
+        for i in range(20):
+            audit.log_event(login_event(i))
+
+        assert len(audit.get_events(user_id="user-7")) == 1
+        assert audit.get_stats()["written"] == 20
+        audit.close()
+
+
+def test_buffered_file_logging_writes_full_batches(tmp_path):
+    """Buffered logging writes one fsynced batch per batch_size events."""
+    rounds = 500
+    buffered = BufferedLogStorage(FileLogStorage(str(tmp_path / "buffered.log"), fsync=True),
+                                  capacity=rounds, batch_size=100, flush_interval=10)
+
+    for i in range(rounds):
+        buffered.log_event(login_event(i))
+    buffered.close()
+
+    stats = buffered.get_stats()
+    assert stats["written"] == rounds
+    assert stats["flushes"] == 5
+    assert stats["dropped"] == 0
+    assert len((tmp_path / "buffered.log").read_text().splitlines()) == rounds
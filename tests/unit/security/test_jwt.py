@@ -0,0 +1,145 @@
+"""
+Tests for JWT validation: the in-process cache of validated tokens, the
+blacklist filter and precomputed verification keys.
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from uno.security.auth.jwt import JWTAuth, JWTConfig, TokenType
+from uno.security.auth.token_cache import (
+    BloomFilter,
+    MemoryTokenCache,
+    TokenCacheConfig,
+    VerifiedTokenCache,
+)
+
+SECRET = "test-secret-key-that-is-long-enough-for-hs256"
+
+
+@pytest.fixture
+def auth():
+    token_cache = MemoryTokenCache(TokenCacheConfig(blacklist_enabled=True))
+    return JWTAuth(JWTConfig(SECRET, issuer="uno", audience="api"), token_cache=token_cache)
+
+
+class TestDecodeToken:
+    """Tests for JWTAuth.decode_token."""
+
+    def test_validated_tokens_are_served_from_cache(self, auth):
+        token = auth.create_access_token("user-1", {"roles": ["admin"], "plan": "pro"})
+
+        first = auth.decode_token(token)
+        second = auth.decode_token(token)
+
+        assert second is first
+        assert first.sub == "user-1"
+        assert first.roles == ["admin"]
+        assert first.custom_claims == {"plan": "pro"}
+        assert first.token_type == TokenType.ACCESS
+        assert auth.verified_tokens.get_stats()["hits"] == 1
+
+    def test_revoked_token_is_rejected_when_cached(self, auth):
+        token = auth.create_access_token("user-1")
+        auth.decode_token(token)
+
+        assert auth.revoke_token(token)
+
+        with pytest.raises(jwt.InvalidTokenError, match="revoked"):
+            auth.decode_token(token)
+
+    def test_expired_token_is_rejected(self, auth):
+        token = auth.create_access_token("user-1", expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(jwt.ExpiredSignatureError):
+            auth.decode_token(token)
+
+    def test_tampered_token_is_rejected(self, auth):
+        token = auth.create_access_token("user-1")
+        auth.decode_token(token)
+        header, payload, signature = token.split(".")
+
+        with pytest.raises(jwt.InvalidTokenError):
+            auth.decode_token(f"{header}.{payload}.{signature[:-4]}AAAA")
+
+    def test_wrong_audience_is_rejected(self, auth):
+        other = JWTAuth(JWTConfig(SECRET, issuer="uno", audience="admin"))
+        token = other.create_access_token("user-1")
+
+        with pytest.raises(jwt.InvalidAudienceError):
+            auth.decode_token(token)
+
+    def test_asymmetric_keys_are_parsed_once(self):
+        pytest.importorskip("cryptography")
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+
+        private_pem = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        auth = JWTAuth(JWTConfig(private_pem, algorithm="ES256"))
+
+        assert isinstance(auth._verification_key, ec.EllipticCurvePublicKey)
+        assert auth.decode_token(auth.create_access_token("user-1")).sub == "user-1"
+
+
+class TestVerifiedTokenCache:
+    """Tests for VerifiedTokenCache."""
+
+    def test_entries_expire_with_the_token(self):
+        cache = VerifiedTokenCache(max_size=10, ttl=300)
+        now = time.time()
+        cache.set("token", "data", expires_at=now + 5)
+
+        assert cache.get("token", now) == "data"
+        assert cache.get("token", now + 6) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = VerifiedTokenCache(max_size=2, ttl=300)
+        expires_at = time.time() + 60
+        cache.set("a", 1, expires_at)
+        cache.set("b", 2, expires_at)
+        cache.get("a")
+        cache.set("c", 3, expires_at)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(bloom.might_contain(item) for item in items)
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(bloom.might_contain(f"other-{i}") for i in range(10_000))
+
+        assert false_positives < 300
+
+
+def test_repeated_decodes_verify_the_signature_once(auth):
+    """Repeated validation of a token is served without a full jwt.decode."""
+    token = auth.create_access_token("user-1", {"roles": ["admin"], "tenant_id": "t1"})
+
+    with patch("uno.security.auth.jwt.jwt.decode", wraps=jwt.decode) as decode:
+        for _ in range(100):
+            assert auth.decode_token(token).sub == "user-1"
+
+    assert decode.call_count == 1
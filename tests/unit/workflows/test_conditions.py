@@ -0,0 +1,321 @@
+"""
+Tests for compiled workflow condition evaluation.
+"""
+
+import logging
+from datetime import datetime, time, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from uno.workflows.conditions import (
+    ComparisonOperator,
+    CompositeEvaluator,
+    ConditionError,
+    FieldValueEvaluator,
+    LogicalOperator,
+    TimeBasedEvaluator,
+    TimeOperator,
+    compile_conditions,
+    compile_path,
+    get_evaluator,
+    get_evaluator_registry,
+)
+from uno.workflows.engine import WorkflowEventModel
+from uno.workflows.models import WorkflowConditionType, WorkflowDBEvent
+
+
+logger = logging.getLogger(__name__)
+
+
+def make_event(payload, operation=WorkflowDBEvent.INSERT):
+    return WorkflowEventModel(
+        table_name="order",
+        schema_name="public",
+        operation=operation,
+        timestamp=0.0,
+        payload=payload,
+    )
+
+
+def make_condition(condition_type, config, condition_id="cond"):
+    return SimpleNamespace(
+        id=condition_id,
+        workflow_id="wf",
+        condition_type=condition_type,
+        condition_config=config,
+        query_id=None,
+        name=condition_id,
+    )
+
+
+@pytest.fixture
+def registered_evaluators():
+    registry = get_evaluator_registry()
+    saved = dict(registry.evaluators)
+    registry.evaluators.clear()
+    registry.register(WorkflowConditionType.FIELD_VALUE, FieldValueEvaluator(logger=logger))
+    registry.register(WorkflowConditionType.TIME_BASED, TimeBasedEvaluator(logger=logger))
+    registry.register(
+        "composite", CompositeEvaluator(registry.evaluators, logger=logger)
+    )
+    yield registry
+    registry.evaluators.clear()
+    registry.evaluators.update(saved)
+
+
+class TestCompiledFieldConditions:
+    """Tests for compiled field value conditions."""
+
+    def test_compile_path(self):
+        get = compile_path("customer.address.country")
+
+        assert get({"customer": {"address": {"country": "NZ"}}}) == "NZ"
+        assert get({"customer": {"address": "n/a"}}) is None
+        assert get({}) is None
+        assert compile_path("total")({"total": 5}) == 5
+
+    @pytest.mark.parametrize(
+        "operator,expected,actual,result",
+        [
+            (ComparisonOperator.EQUAL, 5, 5, True),
+            (ComparisonOperator.GREATER_THAN, 5, 6, True),
+            (ComparisonOperator.BETWEEN, [1, 3], 2, True),
+            (ComparisonOperator.MATCHES, r"^A\d+", "A12", True),
+            (ComparisonOperator.IN, ["a", "b"], "c", False),
+            (ComparisonOperator.IS_NULL, None, None, True),
+            (ComparisonOperator.EQUAL, None, None, False),
+        ],
+    )
+    def test_compiled_operators(self, operator, expected, actual, result):
+        predicate = FieldValueEvaluator(logger=logger).compile_config(
+            {"field": "value", "operator": operator, "value": expected}
+        )
+
+        assert predicate({"value": actual}, None) is result
+
+    def test_invalid_configuration_raises(self):
+        evaluator = FieldValueEvaluator(logger=logger)
+
+        with pytest.raises(ConditionError):
+            evaluator.compile_config({})
+        with pytest.raises(ConditionError):
+            evaluator.compile_config(
+                {"field": "x", "operator": ComparisonOperator.BETWEEN, "value": 1}
+            )
+
+    @pytest.mark.asyncio
+    async def test_evaluate_uses_compiled_predicate(self):
+        evaluator = FieldValueEvaluator(logger=logger)
+        condition = make_condition(
+            WorkflowConditionType.FIELD_VALUE,
+            {"field": "order.total", "operator": "gte", "value": 100},
+        )
+
+        assert (await evaluator.evaluate(condition, make_event({"order": {"total": 150}}), {})).value
+        assert not (await evaluator.evaluate(condition, make_event({"order": {"total": 50}}), {})).value
+
+
+class TestCompiledTimeConditions:
+    """Tests for compiled time-based conditions."""
+
+    def test_datetimes_are_parsed_at_compile_time(self):
+        predicate = TimeBasedEvaluator(logger=logger).compile_config(
+            {"operator": TimeOperator.BEFORE, "datetime": "2030-01-01T00:00:00Z"}
+        )
+
+        assert predicate({}, datetime(2029, 12, 31, tzinfo=timezone.utc))
+        assert not predicate({}, datetime(2030, 1, 2, tzinfo=timezone.utc))
+
+    def test_business_hours_override_is_per_condition(self):
+        evaluator = TimeBasedEvaluator(logger=logger)
+        predicate = evaluator.compile_config(
+            {
+                "operator": TimeOperator.IN_BUSINESS_HOURS,
+                "business_hours": {"start": time(0, 0), "end": time(23, 59), "weekdays": [5]},
+            }
+        )
+
+        saturday_night = datetime(2024, 6, 1, 22, 0, tzinfo=timezone.utc)
+        assert predicate({}, saturday_night)
+        assert not evaluator._is_business_hours(saturday_night)
+
+
+class TestConditionPlan:
+    """Tests for compiled workflow condition plans."""
+
+    @pytest.mark.asyncio
+    async def test_composite_conditions_compile(self, registered_evaluators):
+        condition = make_condition(
+            "composite",
+            {
+                "operator": LogicalOperator.OR,
+                "conditions": [
+                    {"config": {"field": "status", "value": "paid"}},
+                    {"config": {"field": "total", "operator": "gt", "value": 1000}},
+                ],
+            },
+        )
+        plan = compile_conditions([condition])
+
+        assert plan.is_compiled
+        results = await plan.evaluate_batch(
+            [
+                make_event({"status": "paid", "total": 1}),
+                make_event({"status": "new", "total": 5000}),
+                make_event({"status": "new", "total": 1}),
+            ],
+            {},
+        )
+        assert [result.value for result in results] == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_batch_stops_at_first_unmet_condition(self, registered_evaluators):
+        plan = compile_conditions(
+            [
+                make_condition(
+                    WorkflowConditionType.FIELD_VALUE,
+                    {"field": "total", "operator": "gt", "value": 10},
+                    "first",
+                ),
+                make_condition(
+                    WorkflowConditionType.FIELD_VALUE,
+                    {"field": "status", "value": "paid"},
+                    "second",
+                ),
+            ]
+        )
+
+        results = await plan.evaluate_batch(
+            [
+                make_event({"total": 20, "status": "paid"}),
+                make_event({"total": 5, "status": "paid"}),
+                make_event({"total": 20, "status": "new"}),
+            ],
+            {},
+        )
+
+        assert [result.value for result in results] == [True, False, False]
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_per_event_evaluation(self, registered_evaluators):
+        conditions = [
+            make_condition(
+                WorkflowConditionType.FIELD_VALUE,
+                {"field": "order.total", "operator": "gte", "value": 10},
+                "total",
+            ),
+            make_condition(
+                WorkflowConditionType.TIME_BASED,
+                {
+                    "operator": TimeOperator.BETWEEN,
+                    "start_datetime": "2000-01-01T00:00:00Z",
+                    "end_datetime": "2100-01-01T00:00:00Z",
+                },
+                "window",
+            ),
+            make_condition(
+                "composite",
+                {
+                    "operator": LogicalOperator.OR,
+                    "conditions": [
+                        {"config": {"field": "order.customer.tier", "value": "gold"}},
+                        {"config": {"field": "order.region", "operator": "in",
+                                    "value": ["eu", "us"]}},
+                    ],
+                },
+                "composite",
+            ),
+        ]
+        events = [
+            make_event(
+                {
+                    "order": {
+                        "total": i % 20,
+                        "region": ["eu", "us", "apac"][i % 3],
+                        "customer": {"tier": ["gold", "silver"][i % 2]},
+                    }
+                }
+            )
+            for i in range(60)
+        ]
+
+        expected = []
+        for event in events:
+            matched = True
+            for condition in conditions:
+                result = await get_evaluator(condition.condition_type).evaluate(
+                    condition, event, {}
+                )
+                if result.is_failure or not result.value:
+                    matched = False
+                    break
+            expected.append(matched)
+
+        plan = compile_conditions(conditions)
+        results = await plan.evaluate_batch(events, {})
+
+        assert plan.is_compiled
+        assert [result.value for result in results] == expected
+        assert any(expected) and not all(expected)
+
+    @pytest.mark.asyncio
+    async def test_invalid_condition_fails(self, registered_evaluators):
+        plan = compile_conditions(
+            [make_condition(WorkflowConditionType.FIELD_VALUE, {"operator": "eq"})]
+        )
+
+        result = await plan.evaluate(make_event({}), {})
+
+        assert result.is_failure
+        assert isinstance(result.error, ConditionError)
+
+    @pytest.mark.asyncio
+    async def test_uncompilable_conditions_use_fallback(self, registered_evaluators):
+        calls = []
+
+        async def fallback(condition, event, context):
+            from uno.core.errors.result import Success
+
+            calls.append(condition.id)
+            return Success(event.payload.get("role") == "admin")
+
+        plan = compile_conditions(
+            [make_condition(WorkflowConditionType.ROLE_BASED, {"roles": ["admin"]}, "role")],
+            fallback,
+        )
+
+        assert not plan.is_compiled
+        results = await plan.evaluate_batch(
+            [make_event({"role": "admin"}), make_event({"role": "user"})], {}
+        )
+        assert [result.value for result in results] == [True, False]
+        assert calls == ["role", "role"]
+
+    @pytest.mark.asyncio
+    async def test_query_match_checks_the_batch_at_once(self, registered_evaluators, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from uno.core.errors.result import Success
+        from uno.queries import domain_provider
+        from uno.workflows.conditions import QueryMatchEvaluator
+
+        query_service = MagicMock()
+        query_service.check_records_match = AsyncMock(
+            return_value=Success({"q1": {"r1": True, "r2": False}})
+        )
+        monkeypatch.setattr(domain_provider, "get_query_service", lambda: query_service)
+        get_evaluator_registry().register(
+            WorkflowConditionType.QUERY_MATCH,
+            QueryMatchEvaluator(db_manager=object(), logger=logger),
+        )
+        condition = make_condition(WorkflowConditionType.QUERY_MATCH, {}, "query")
+        condition.query_id = "q1"
+
+        plan = compile_conditions([condition])
+        results = await plan.evaluate_batch(
+            [make_event({"id": "r1"}), make_event({"id": "r2"}), make_event({})], {}
+        )
+
+        assert [result.value for result in results] == [True, False, False]
+        query_service.check_records_match.assert_awaited_once_with(["q1"], ["r1", "r2"])
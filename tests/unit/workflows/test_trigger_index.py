@@ -0,0 +1,329 @@
+"""
+Tests for the in-process workflow trigger index.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from uno.workflows.models import WorkflowDBEvent, WorkflowStatus
+from uno.workflows.trigger_index import (
+    WorkflowTriggerIndex,
+    WorkflowDefinitionChangedEvent,
+    compile_field_conditions,
+)
+
+
+# Lightweight stand-ins with the attributes the index reads
+def make_workflow(workflow_id, *triggers):
+    return SimpleNamespace(
+        id=workflow_id,
+        name=workflow_id,
+        status=WorkflowStatus.ACTIVE,
+        triggers=list(triggers),
+        conditions=[],
+        actions=[],
+        recipients=[],
+    )
+
+
+def make_trigger(
+    trigger_id,
+    workflow_id,
+    operation=WorkflowDBEvent.INSERT,
+    field_conditions=None,
+    priority=100,
+    is_active=True,
+):
+    return SimpleNamespace(
+        id=trigger_id,
+        workflow_id=workflow_id,
+        entity_type="order",
+        operation=operation,
+        field_conditions=field_conditions or {},
+        priority=priority,
+        is_active=is_active,
+    )
+
+
+class TestCompileFieldConditions:
+    """Tests for compiled trigger field conditions."""
+
+    def test_empty_conditions_match_everything(self):
+        assert compile_field_conditions({})({"anything": 1})
+
+    def test_equality_and_operators(self):
+        predicate = compile_field_conditions(
+            {
+                "status": "paid",
+                "total": {"operator": "gte", "value": 100},
+                "region": {"operator": "in", "value": ["eu", "us"]},
+            }
+        )
+
+        assert predicate({"status": "paid", "total": 100, "region": "eu"})
+        assert not predicate({"status": "new", "total": 100, "region": "eu"})
+        assert not predicate({"status": "paid", "total": 99, "region": "eu"})
+        assert not predicate({"status": "paid", "total": 100, "region": "apac"})
+        assert not predicate({"status": "paid", "total": 100})
+
+    def test_unknown_operator_only_requires_field(self):
+        predicate = compile_field_conditions({"total": {"operator": "between", "value": 1}})
+
+        assert predicate({"total": 0})
+        assert not predicate({})
+
+
+class TestWorkflowTriggerIndex:
+    """Tests for the trigger index used by the WorkflowEngine."""
+
+    def test_match_by_entity_type_and_operation(self):
+        index = WorkflowTriggerIndex()
+        index.rebuild(
+            [
+                make_workflow("wf1", make_trigger("t1", "wf1", priority=20)),
+                make_workflow("wf2", make_trigger("t2", "wf2", priority=10)),
+                make_workflow(
+                    "wf3", make_trigger("t3", "wf3", operation=WorkflowDBEvent.DELETE)
+                ),
+            ]
+        )
+
+        matches = index.match("order", WorkflowDBEvent.INSERT, {})
+
+        assert [trigger.id for _, trigger in matches] == ["t2", "t1"]
+        assert index.match("customer", WorkflowDBEvent.INSERT, {}) == []
+
+    def test_update_events_use_new_values(self):
+        index = WorkflowTriggerIndex()
+        index.rebuild(
+            [
+                make_workflow(
+                    "wf1",
+                    make_trigger(
+                        "t1",
+                        "wf1",
+                        operation=WorkflowDBEvent.UPDATE,
+                        field_conditions={"status": "paid"},
+                    ),
+                )
+            ]
+        )
+
+        payload = {"old": {"status": "new"}, "new": {"status": "paid"}}
+        assert len(index.match("order", WorkflowDBEvent.UPDATE, payload)) == 1
+
+    def test_inactive_triggers_are_not_indexed(self):
+        index = WorkflowTriggerIndex()
+        index.rebuild([make_workflow("wf1", make_trigger("t1", "wf1", is_active=False))])
+
+        assert index.match("order", WorkflowDBEvent.INSERT, {}) == []
+
+    def test_invalidate_marks_workflow_pending(self):
+        index = WorkflowTriggerIndex()
+        index.rebuild([make_workflow("wf1", make_trigger("t1", "wf1"))])
+
+        index.invalidate("wf1")
+
+        assert index.match("order", WorkflowDBEvent.INSERT, {}) == []
+        assert index.pending_workflow_ids == {"wf1"}
+
+        index.add_workflow(make_workflow("wf1", make_trigger("t1", "wf1")))
+
+        assert index.pending_workflow_ids == set()
+        assert len(index.match("order", WorkflowDBEvent.INSERT, {})) == 1
+
+    def test_invalidations_during_a_reload_stay_pending(self):
+        index = WorkflowTriggerIndex()
+        index.rebuild([])
+        index.invalidate("wf1")
+        index.invalidate("wf2")
+
+        generation = index.generation
+        workflow_ids = list(index.pending_workflow_ids)
+        # wf1 changes again while the pending workflows are loaded
+        index.invalidate("wf1")
+        reloaded = index.reload(
+            [
+                make_workflow("wf1", make_trigger("t1", "wf1")),
+                make_workflow("wf2", make_trigger("t2", "wf2")),
+            ],
+            workflow_ids,
+            generation,
+        )
+
+        assert [workflow.id for workflow in reloaded] == ["wf2"]
+        assert index.pending_workflow_ids == {"wf1"}
+        assert [trigger.id for _, trigger in index.match("order", WorkflowDBEvent.INSERT, {})] == ["t2"]
+
+    def test_invalidations_during_a_rebuild_stay_pending(self):
+        index = WorkflowTriggerIndex()
+        index.invalidate("wf0")
+
+        generation = index.generation
+        index.invalidate("wf1")
+        index.rebuild(
+            [
+                make_workflow("wf0", make_trigger("t0", "wf0")),
+                make_workflow("wf1", make_trigger("t1", "wf1")),
+            ],
+            generation,
+        )
+
+        assert index.is_loaded
+        assert index.pending_workflow_ids == {"wf1"}
+        assert [trigger.id for _, trigger in index.match("order", WorkflowDBEvent.INSERT, {})] == ["t0"]
+
+        generation = index.generation
+        index.invalidate_all()
+        index.rebuild([], generation)
+
+        assert not index.is_loaded
+
+    def test_invalidate_all_and_ttl(self):
+        index = WorkflowTriggerIndex(ttl=0)
+        assert not index.is_loaded
+
+        index.rebuild([])
+        assert not index.is_loaded
+
+        index = WorkflowTriggerIndex()
+        index.rebuild([])
+        assert index.is_loaded
+        index.invalidate_all()
+        assert not index.is_loaded
+
+
+class TestWorkflowEngineTriggerIndex:
+    """Tests for event dispatch through the WorkflowEngine trigger index."""
+
+    @pytest.fixture
+    def engine(self):
+        from uno.workflows.engine import WorkflowEngine
+
+        engine = WorkflowEngine(db_manager=MagicMock())
+        engine._load_active_workflows = AsyncMock(
+            return_value=[make_workflow("wf1", make_trigger("t1", "wf1"))]
+        )
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_index_is_loaded_once(self, engine):
+        from uno.workflows.engine import WorkflowEventModel
+
+        event = WorkflowEventModel(
+            table_name="order",
+            schema_name="public",
+            operation=WorkflowDBEvent.INSERT,
+            timestamp=0.0,
+            payload={},
+        )
+
+        first = await engine._find_matching_workflows(event)
+        second = await engine._find_matching_workflows(event)
+
+        assert [trigger.id for _, trigger in first] == ["t1"]
+        assert [trigger.id for _, trigger in second] == ["t1"]
+        engine._load_active_workflows.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_definition_change_reloads_workflow(self, engine):
+        from uno.workflows.engine import WorkflowEventModel
+
+        event = WorkflowEventModel(
+            table_name="order",
+            schema_name="public",
+            operation=WorkflowDBEvent.INSERT,
+            timestamp=0.0,
+            payload={},
+        )
+        await engine._find_matching_workflows(event)
+
+        await engine.handle_definition_change(
+            WorkflowDefinitionChangedEvent(workflow_id="wf1", change_type="deactivated")
+        )
+        engine._load_active_workflows.return_value = []
+
+        assert await engine._find_matching_workflows(event) == []
+        assert engine.trigger_index.pending_workflow_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_definition_change_during_reload_is_not_lost(self, engine):
+        from uno.workflows.engine import WorkflowEventModel
+
+        event = WorkflowEventModel(
+            table_name="order",
+            schema_name="public",
+            operation=WorkflowDBEvent.INSERT,
+            timestamp=0.0,
+            payload={},
+        )
+        await engine._find_matching_workflows(event)
+        engine.invalidate_workflow("wf1")
+
+        async def load_while_deactivated(session, workflow_ids=None):
+            # wf1 is deactivated after the reload query read it
+            engine.invalidate_workflow("wf1")
+            return [make_workflow("wf1", make_trigger("t1", "wf1"))]
+
+        engine._load_active_workflows.side_effect = load_while_deactivated
+        assert await engine._find_matching_workflows(event) == []
+
+        engine._load_active_workflows.side_effect = None
+        engine._load_active_workflows.return_value = []
+        assert await engine._find_matching_workflows(event) == []
+        assert engine.trigger_index.pending_workflow_ids == set()
+
+
+class TestWorkflowComponentServices:
+    """Tests for definition change events published by component services."""
+
+    @pytest.fixture
+    def event_bus(self, monkeypatch):
+        from uno.workflows import domain_services
+
+        event_bus = MagicMock()
+        event_bus.publish = AsyncMock()
+        monkeypatch.setattr(domain_services, "get_event_bus", lambda: event_bus)
+        return event_bus
+
+    @pytest.fixture
+    def service(self):
+        from uno.workflows.domain_services import WorkflowTriggerService
+
+        repository = MagicMock()
+        repository.get = AsyncMock(return_value=make_trigger("t1", "wf1"))
+        repository.exists = AsyncMock(return_value=True)
+        repository.update = AsyncMock(side_effect=lambda entity: entity)
+        repository.remove = AsyncMock()
+        repository.remove_by_id = AsyncMock(return_value=True)
+        return WorkflowTriggerService(repository=repository)
+
+    def published(self, event_bus):
+        return [
+            (call.args[0].workflow_id, call.args[0].change_type)
+            for call in event_bus.publish.await_args_list
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update_publishes_definition_change(self, service, event_bus):
+        await service.save(make_trigger("t1", "wf1"))
+
+        assert self.published(event_bus) == [("wf1", "trigger_updated")]
+
+    @pytest.mark.asyncio
+    async def test_delete_publishes_definition_change(self, service, event_bus):
+        await service.delete(make_trigger("t1", "wf1"))
+        await service.delete_by_id("t1")
+
+        assert self.published(event_bus) == [
+            ("wf1", "trigger_deleted"),
+            ("wf1", "trigger_deleted"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_delete_publishes_nothing(self, service, event_bus):
+        service.repository.remove_by_id.return_value = False
+
+        assert not await service.delete_by_id("t1")
+        event_bus.publish.assert_not_awaited()